@@ -29,6 +29,8 @@ class TokenAdmin(admin.ModelAdmin):
     # autocomplete_fields = ['user']
 
     form = TokenAdminForm
+    list_display = ["user", "last_used_at", "use_count"]
+    readonly_fields = ["last_used_at", "use_count"]
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == "user":
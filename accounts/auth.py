@@ -14,7 +14,7 @@ from django.http import JsonResponse
 
 from course_management.observability import record_event
 
-from .models import Token
+from .token_auth import resolve_token_user
 
 
 User = get_user_model()
@@ -207,10 +207,8 @@ def token_required(f):
         token_key = request.headers.get("Authorization")
         if token_key:
             token_key = token_key.replace("Token ", "", 1)
-            try:
-                token = Token.objects.get(key=token_key)
-                request.user = token.user
-            except Token.DoesNotExist:
+            user = resolve_token_user(token_key)
+            if user is None:
                 record_event(
                     "api.auth_failed",
                     request=request,
@@ -219,6 +217,7 @@ def token_required(f):
                 payload = {"error": "Invalid token"}
                 response = JsonResponse(payload, status=401)
                 return response
+            request.user = user
         else:
             record_event(
                 "api.auth_failed",
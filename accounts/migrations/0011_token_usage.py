@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 01:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_remove_customuser_email_course_updates_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='token',
+            name='last_used_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='token',
+            name='use_count',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -82,6 +82,9 @@ class CustomUser(AbstractUser):
 class Token(models.Model):
     key = models.CharField(max_length=40, primary_key=True)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+    # Written in batches by accounts.token_auth, not on every request.
+    last_used_at = models.DateTimeField(null=True, blank=True, editable=False)
+    use_count = models.PositiveBigIntegerField(default=0, editable=False)
 
     def save(self, *args, **kwargs):
         if not self.key:
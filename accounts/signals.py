@@ -3,10 +3,11 @@ from django.contrib.auth.signals import (
     user_logged_out,
     user_login_failed,
 )
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from accounts.models import CustomUser
+from accounts.models import CustomUser, Token
+from accounts.token_auth import token_user_cache
 from course_management.observability import record_event
 
 
@@ -66,3 +67,15 @@ def record_user_created(sender, instance, created, **kwargs):
             "is_superuser": instance.is_superuser,
         },
     )
+
+
+@receiver([post_save, post_delete], sender=Token)
+def evict_cached_token(sender, instance, **kwargs):
+    token_user_cache.invalidate_key(instance.key)
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def evict_cached_tokens_for_user(sender, instance, **kwargs):
+    # Deactivation and permission changes must reach token-authenticated
+    # requests without waiting for the cache TTL.
+    token_user_cache.invalidate_user(instance.id)
@@ -0,0 +1,110 @@
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from accounts.models import CustomUser, Token
+from accounts.token_auth import (
+    TokenUserCache,
+    flush_token_usage,
+    resolve_token_user,
+    token_user_cache,
+)
+
+
+class TokenUserCacheTestCase(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="staff",
+            email="staff@example.com",
+            is_staff=True,
+        )
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TokenUserCache(ttl_seconds=60, max_size=2)
+        cache.set("first", self.user)
+        cache.set("second", self.user)
+        cache.get("first")
+
+        cache.set("third", self.user)
+
+        self.assertIsNotNone(cache.get("first"))
+        self.assertIsNone(cache.get("second"))
+        self.assertIsNotNone(cache.get("third"))
+
+    def test_zero_ttl_disables_caching(self):
+        cache = TokenUserCache(ttl_seconds=0, max_size=2)
+
+        cache.set("first", self.user)
+
+        self.assertIsNone(cache.get("first"))
+
+    def test_cached_users_are_copies(self):
+        cache = TokenUserCache(ttl_seconds=60, max_size=2)
+        cache.set("first", self.user)
+
+        cached_user = cache.get("first")
+        cached_user.request_scoped_flag = True
+
+        self.assertFalse(
+            hasattr(cache.get("first"), "request_scoped_flag")
+        )
+
+
+class TokenAuthTestCase(TestCase):
+    def setUp(self):
+        token_user_cache.clear()
+        # Discard usage recorded by earlier tests.
+        flush_token_usage()
+        self.user = CustomUser.objects.create(
+            username="staff",
+            email="staff@example.com",
+            is_staff=True,
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client = Client()
+        self.client.defaults["HTTP_AUTHORIZATION"] = (
+            f"Token {self.token.key}"
+        )
+
+    def api_get(self):
+        return self.client.get(reverse("api_datamailer_send_audits"))
+
+    def test_token_user_is_resolved_once(self):
+        with self.assertNumQueries(1):
+            user = resolve_token_user(self.token.key)
+        self.assertEqual(user, self.user)
+
+        with self.assertNumQueries(0):
+            user = resolve_token_user(self.token.key)
+        self.assertEqual(user, self.user)
+
+    def test_deleted_token_is_rejected(self):
+        self.assertEqual(self.api_get().status_code, 200)
+
+        self.token.delete()
+
+        response = self.api_get()
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["error"], "Invalid token")
+
+    def test_deactivated_user_is_rejected(self):
+        self.assertEqual(self.api_get().status_code, 200)
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.api_get().status_code, 401)
+
+    def test_usage_is_written_in_one_update_per_token(self):
+        for _ in range(3):
+            self.assertEqual(self.api_get().status_code, 200)
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.use_count, 0)
+        self.assertIsNone(self.token.last_used_at)
+
+        with self.assertNumQueries(1):
+            flushed_count = flush_token_usage()
+
+        self.assertEqual(flushed_count, 1)
+        self.token.refresh_from_db()
+        self.assertEqual(self.token.use_count, 3)
+        self.assertIsNotNone(self.token.last_used_at)
@@ -0,0 +1,207 @@
+"""In-process token resolution cache and coalesced token usage tracking.
+
+``token_required`` runs on every API call, and automation scripts make
+thousands of them on scoring days. Resolving a token used to cost a token
+query plus a lazy user query, and recording usage would cost a write.
+
+- ``TokenUserCache`` maps token keys to users for a short TTL with LRU
+  eviction. Signals in ``accounts/signals.py`` evict entries when a token
+  is saved or deleted or its user changes; other worker processes see such
+  changes once their entry expires (``API_TOKEN_CACHE_TTL_SECONDS``).
+- ``TokenUsageTracker`` counts uses in memory and writes one UPDATE per
+  used token every ``API_TOKEN_USAGE_FLUSH_SECONDS`` from a background
+  thread, the way ``BufferedEventBackend`` flushes observability events.
+  Uses recorded after the last flush of a killed process are lost.
+"""
+
+import atexit
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic, sleep
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Token
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_TTL_SECONDS = 60
+DEFAULT_TOKEN_CACHE_SIZE = 1024
+DEFAULT_TOKEN_USAGE_FLUSH_SECONDS = 60
+
+
+class TokenUserCache:
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Each request gets its own copy so attributes set on request.user
+        # never leak into later requests.
+        return copy.copy(user)
+
+    def set(self, key, user) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        expires_at = monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (copy.copy(user), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_key(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_user(self, user_id) -> None:
+        with self._lock:
+            stale_keys = []
+            for key, (user, _) in self._entries.items():
+                if user.id == user_id:
+                    stale_keys.append(key)
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@dataclass
+class TokenUsage:
+    count: int
+    last_used_at: object
+
+
+class TokenUsageTracker:
+    def __init__(self, flush_interval: float, background: bool):
+        self.flush_interval = flush_interval
+        self.background = background
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def record(self, key) -> None:
+        if self.background:
+            self._ensure_worker()
+        now = timezone.now()
+        with self._lock:
+            usage = self._pending.get(key)
+            if usage is None:
+                self._pending[key] = TokenUsage(count=1, last_used_at=now)
+                return
+            usage.count += 1
+            usage.last_used_at = now
+
+    def flush(self) -> int:
+        """Write pending usage, one UPDATE per token; return tokens written."""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+        for key, usage in pending.items():
+            Token.objects.filter(key=key).update(
+                last_used_at=usage.last_used_at,
+                use_count=F("use_count") + usage.count,
+            )
+        return len(pending)
+
+    def _ensure_worker(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None:
+                return
+            if self._pid is not None:
+                # Forked worker: the parent's pending usage is its own.
+                self._pending.clear()
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run,
+                name="token-usage",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            sleep(self.flush_interval)
+            self.flush_and_close()
+
+    def flush_and_close(self) -> None:
+        """Flush outside a request, then close this thread's connection."""
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Failed to write token usage")
+        finally:
+            connection.close()
+
+
+token_user_cache = TokenUserCache(
+    ttl_seconds=getattr(
+        settings,
+        "API_TOKEN_CACHE_TTL_SECONDS",
+        DEFAULT_TOKEN_CACHE_TTL_SECONDS,
+    ),
+    max_size=getattr(
+        settings,
+        "API_TOKEN_CACHE_SIZE",
+        DEFAULT_TOKEN_CACHE_SIZE,
+    ),
+)
+token_usage_tracker = TokenUsageTracker(
+    flush_interval=getattr(
+        settings,
+        "API_TOKEN_USAGE_FLUSH_SECONDS",
+        DEFAULT_TOKEN_USAGE_FLUSH_SECONDS,
+    ),
+    background=getattr(settings, "API_TOKEN_USAGE_BACKGROUND_FLUSH", True),
+)
+
+
+def resolve_token_user(key):
+    """Return the active user owning ``key``, or ``None``."""
+    user = token_user_cache.get(key)
+    if user is None:
+        token = Token.objects.select_related("user").filter(key=key).first()
+        if token is None:
+            return None
+        user = token.user
+        token_user_cache.set(key, user)
+    if not user.is_active:
+        return None
+    token_usage_tracker.record(key)
+    return user
+
+
+def flush_token_usage() -> int:
+    return token_usage_tracker.flush()
+
+
+def _flush_token_usage_at_exit() -> None:
+    if token_usage_tracker.background:
+        token_usage_tracker.flush_and_close()
+
+
+atexit.register(_flush_token_usage_at_exit)
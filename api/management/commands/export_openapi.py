@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from api.openapi.document import OPENAPI_ARTIFACT_PATH, write_openapi_artifact
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the OpenAPI spec and write it as the static artifact served "
+        "by /api/openapi.json. Run it after changing API routes or schemas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=str(OPENAPI_ARTIFACT_PATH),
+            help=f"Where to write the spec. Defaults to {OPENAPI_ARTIFACT_PATH}.",
+        )
+
+    def handle(self, *args, **options):
+        path = write_openapi_artifact(options["output"])
+        self.stdout.write(f"Wrote OpenAPI spec to {path}")
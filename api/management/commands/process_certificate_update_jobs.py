@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from api.views.enrollment_certificate_job_runs import (
+    process_certificate_update_jobs,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run pending certificate update jobs and resume stale running "
+        "ones. Jobs normally run in a background thread; schedule this as "
+        "the fallback."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=10,
+            help="Maximum number of jobs to run.",
+        )
+
+    def handle(self, *args, **options):
+        result = process_certificate_update_jobs(limit=options["limit"])
+        message = (
+            "Processed {processed} certificate update job(s): "
+            "{succeeded} succeeded, {failed} failed."
+        ).format(**result)
+        self.stdout.write(message)
@@ -0,0 +1,53 @@
+from ..primitives import (
+    OperationData,
+    operation,
+    ref,
+    request_body,
+    response,
+)
+
+
+COURSE_BULK_REQUEST_REF = ref("CourseBulkRequest")
+COURSE_BULK_RESPONSE_REF = ref("CourseBulkResponse")
+ERROR_REF = ref("Error")
+COURSE_BULK_SUCCESS_RESPONSE = response(
+    "Per-item results",
+    COURSE_BULK_RESPONSE_REF,
+)
+COURSE_BULK_INVALID_RESPONSE = response(
+    "Invalid request or items; nothing was written",
+    ERROR_REF,
+)
+STAFF_TOKEN_REQUIRED_RESPONSE = response("Staff token required", ERROR_REF)
+COURSE_NOT_FOUND_RESPONSE = response("Course not found", ERROR_REF)
+
+COURSE_BULK_RESPONSES = {
+    "200": COURSE_BULK_SUCCESS_RESPONSE,
+    "400": COURSE_BULK_INVALID_RESPONSE,
+    "403": STAFF_TOKEN_REQUIRED_RESPONSE,
+    "404": COURSE_NOT_FOUND_RESPONSE,
+}
+COURSE_BULK_BODY = request_body(COURSE_BULK_REQUEST_REF)
+COURSE_BULK_DESCRIPTION = (
+    "Creates homeworks (with inline questions), projects and questions, "
+    "and updates questions by id, in one transaction. Every item is "
+    "validated first; if any is invalid the response lists each failure "
+    "in details.errors as CourseBulkError objects and nothing is written. "
+    "Questions always require text here, inline ones included. At most "
+    "5000 items per request."
+)
+COURSE_BULK_DATA = OperationData(
+    "api_course_bulk",
+    ["Courses"],
+    "Bulk create homeworks, projects and questions",
+    COURSE_BULK_RESPONSES,
+    body=COURSE_BULK_BODY,
+    description=COURSE_BULK_DESCRIPTION,
+)
+COURSE_BULK_OPERATION = operation(COURSE_BULK_DATA)
+
+BULK_PATHS_BY_URL_NAME = {
+    "api_course_bulk": {
+        "post": COURSE_BULK_OPERATION,
+    },
+}
@@ -1,3 +1,4 @@
+from .bulk import BULK_PATHS_BY_URL_NAME
 from .homeworks import HOMEWORK_PATHS_BY_URL_NAME
 from .projects import PROJECT_PATHS_BY_URL_NAME
 from .questions import QUESTION_PATHS_BY_URL_NAME
@@ -7,3 +8,4 @@ CONTENT_PATHS_BY_URL_NAME = {}
 CONTENT_PATHS_BY_URL_NAME.update(HOMEWORK_PATHS_BY_URL_NAME)
 CONTENT_PATHS_BY_URL_NAME.update(PROJECT_PATHS_BY_URL_NAME)
 CONTENT_PATHS_BY_URL_NAME.update(QUESTION_PATHS_BY_URL_NAME)
+CONTENT_PATHS_BY_URL_NAME.update(BULK_PATHS_BY_URL_NAME)
@@ -0,0 +1,79 @@
+from ..primitives import array_of, ref
+
+
+QUESTION_CREATE_REF = ref("QuestionCreate")
+QUESTION_PATCH_REF = ref("QuestionPatch")
+STATUS_SCHEMA = {"type": "string", "enum": ["created", "updated"]}
+BULK_QUESTION_CREATE_ALLOF = [
+    QUESTION_CREATE_REF,
+    {
+        "type": "object",
+        "required": ["homework"],
+        "properties": {
+            "homework": {
+                "type": "string",
+                "description": (
+                    "Slug of an existing homework or of one created in "
+                    "the same request"
+                ),
+            },
+        },
+    },
+]
+BULK_QUESTION_UPDATE_ALLOF = [
+    QUESTION_PATCH_REF,
+    {
+        "type": "object",
+        "required": ["id"],
+        "properties": {"id": {"type": "integer"}},
+    },
+]
+
+
+def bulk_result_schema(item_name):
+    return {
+        "type": "object",
+        "required": ["index", "status", item_name],
+        "properties": {
+            "index": {"type": "integer"},
+            "status": STATUS_SCHEMA,
+            item_name: ref(item_name.capitalize()),
+        },
+    }
+
+
+BULK_SCHEMAS = {
+    "CourseBulkQuestion": {
+        "oneOf": [
+            {"allOf": BULK_QUESTION_CREATE_ALLOF},
+            {"allOf": BULK_QUESTION_UPDATE_ALLOF},
+        ],
+    },
+    "CourseBulkRequest": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "homeworks": array_of(ref("HomeworkCreate")),
+            "projects": array_of(ref("ProjectCreate")),
+            "questions": array_of(ref("CourseBulkQuestion")),
+        },
+    },
+    "CourseBulkResponse": {
+        "type": "object",
+        "required": ["homeworks", "projects", "questions"],
+        "properties": {
+            "homeworks": array_of(bulk_result_schema("homework")),
+            "projects": array_of(bulk_result_schema("project")),
+            "questions": array_of(bulk_result_schema("question")),
+        },
+    },
+    "CourseBulkError": {
+        "type": "object",
+        "required": ["section", "index", "error"],
+        "properties": {
+            "section": {"type": "string"},
+            "index": {"type": "integer"},
+            "error": {"type": "string"},
+        },
+    },
+}
@@ -1,3 +1,4 @@
+from .bulk import BULK_SCHEMAS
 from .enums import CONTENT_ENUM_SCHEMAS
 from .homeworks import HOMEWORK_SCHEMAS
 from .projects import PROJECT_SCHEMAS
@@ -9,3 +10,4 @@ CONTENT_SCHEMAS.update(HOMEWORK_SCHEMAS)
 CONTENT_SCHEMAS.update(PROJECT_SCHEMAS)
 CONTENT_SCHEMAS.update(QUESTION_SCHEMAS)
 CONTENT_SCHEMAS.update(CONTENT_ENUM_SCHEMAS)
+CONTENT_SCHEMAS.update(BULK_SCHEMAS)
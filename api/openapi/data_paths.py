@@ -86,11 +86,30 @@ HOMEWORK_SUBMISSIONS_EXPORT_RESPONSES = {
     "200": HOMEWORK_SUBMISSIONS_EXPORT_SUCCESS_RESPONSE,
     "404": COURSE_OR_HOMEWORK_NOT_FOUND_RESPONSE,
 }
+HOMEWORK_SUBMISSIONS_EXPORT_PARAMETERS = [
+    {
+        "name": "format",
+        "in": "query",
+        "required": False,
+        "schema": {
+            "type": "string",
+            "enum": ["json", "ndjson"],
+            "default": "json",
+        },
+    },
+]
+HOMEWORK_SUBMISSIONS_EXPORT_DESCRIPTION = (
+    "Streams the export. format=json returns one object with course, "
+    "homework and a submissions array; format=ndjson returns the course "
+    "and homework object on the first line, then one submission per line."
+)
 HOMEWORK_SUBMISSIONS_EXPORT_DATA = OperationData(
     "api_homework_submissions_export",
     ["Course Data"],
     "Export homework submissions",
     HOMEWORK_SUBMISSIONS_EXPORT_RESPONSES,
+    parameters=HOMEWORK_SUBMISSIONS_EXPORT_PARAMETERS,
+    description=HOMEWORK_SUBMISSIONS_EXPORT_DESCRIPTION,
 )
 HOMEWORK_SUBMISSIONS_EXPORT_OPERATION = operation(HOMEWORK_SUBMISSIONS_EXPORT_DATA)
 
@@ -110,6 +129,106 @@ PROJECT_SUBMISSIONS_EXPORT_DATA = OperationData(
 )
 PROJECT_SUBMISSIONS_EXPORT_OPERATION = operation(PROJECT_SUBMISSIONS_EXPORT_DATA)
 
+COURSE_COLUMNAR_EXPORT_CONTENT = {
+    "application/vnd.apache.parquet": {
+        "schema": {"type": "string", "format": "binary"},
+    },
+    "application/vnd.apache.arrow.stream": {
+        "schema": {"type": "string", "format": "binary"},
+    },
+}
+COURSE_COLUMNAR_EXPORT_SUCCESS_RESPONSE = content_response(
+    "Columnar course data export",
+    COURSE_COLUMNAR_EXPORT_CONTENT,
+)
+COURSE_COLUMNAR_EXPORT_RESPONSES = {
+    "200": COURSE_COLUMNAR_EXPORT_SUCCESS_RESPONSE,
+    "400": INVALID_REQUEST_RESPONSE,
+    "404": schema_response("Course or dataset not found", "Error"),
+}
+COURSE_COLUMNAR_EXPORT_PARAMETERS = [
+    {
+        "name": "format",
+        "in": "query",
+        "required": False,
+        "schema": {
+            "type": "string",
+            "enum": ["parquet", "arrow"],
+            "default": "parquet",
+        },
+    },
+]
+COURSE_COLUMNAR_EXPORT_DESCRIPTION = (
+    "Exports one course table as a Parquet file or an Arrow IPC stream. "
+    "dataset is one of homework-submissions, answers, "
+    "project-submissions, peer-reviews or enrollments. Rows are written "
+    "in chunks, one row group or record batch per chunk."
+)
+COURSE_COLUMNAR_EXPORT_DATA = OperationData(
+    "api_course_columnar_export",
+    ["Course Data"],
+    "Export course data in a columnar format",
+    COURSE_COLUMNAR_EXPORT_RESPONSES,
+    parameters=COURSE_COLUMNAR_EXPORT_PARAMETERS,
+    description=COURSE_COLUMNAR_EXPORT_DESCRIPTION,
+)
+COURSE_COLUMNAR_EXPORT_OPERATION = operation(COURSE_COLUMNAR_EXPORT_DATA)
+
+COURSE_CHANGES_SUCCESS_RESPONSE = response("Course change feed page", JSON)
+COURSE_CHANGES_EXPIRED_CURSOR_RESPONSE = schema_response(
+    "Cursor predates the retained change log",
+    "Error",
+)
+COURSE_CHANGES_RESPONSES = {
+    "200": COURSE_CHANGES_SUCCESS_RESPONSE,
+    "400": INVALID_REQUEST_RESPONSE,
+    "404": COURSE_NOT_FOUND_RESPONSE,
+    "410": COURSE_CHANGES_EXPIRED_CURSOR_RESPONSE,
+}
+COURSE_CHANGES_PARAMETERS = [
+    {
+        "name": "cursor",
+        "in": "query",
+        "required": False,
+        "schema": {"type": "integer", "default": 0},
+    },
+    {
+        "name": "limit",
+        "in": "query",
+        "required": False,
+        "schema": {"type": "integer", "default": 500, "maximum": 5000},
+    },
+    {
+        "name": "types",
+        "in": "query",
+        "required": False,
+        "description": (
+            "Comma-separated subset of homework_submission, "
+            "project_submission and enrollment"
+        ),
+        "schema": {"type": "string"},
+    },
+]
+COURSE_CHANGES_DESCRIPTION = (
+    "Lists submission, project submission and enrollment changes "
+    "(including score and certificate updates) after cursor, oldest "
+    "first. Pass next_cursor back as cursor to fetch the following page; "
+    "has_more tells whether one exists. Each change carries the row's "
+    "current data, or null once the row is deleted. The feed trails real "
+    "time by a few minutes so late-committed changes are not skipped. A "
+    "cursor older than the retained log returns 410; re-sync from the "
+    "full exports and restart with cursor 0."
+)
+COURSE_CHANGES_DATA = OperationData(
+    "api_course_changes",
+    ["Course Data"],
+    "Get course change feed",
+    COURSE_CHANGES_RESPONSES,
+    parameters=COURSE_CHANGES_PARAMETERS,
+    description=COURSE_CHANGES_DESCRIPTION,
+)
+COURSE_CHANGES_OPERATION = operation(COURSE_CHANGES_DATA)
+
 COURSE_GRADUATES_SUCCESS_RESPONSE = schema_response(
     "Course graduates",
     "Graduates",
@@ -139,7 +258,8 @@ COURSE_CERTIFICATES_BODY = schema_request_body("CertificateUpdateRequest")
 COURSE_CERTIFICATES_DESCRIPTION = (
     "Updates many enrollment certificate URLs in one request. "
     "The response includes per-entry errors for missing users, "
-    "unenrolled users, and invalid entries."
+    "unenrolled users, and invalid entries. For drops of thousands of "
+    "rows, queue a certificate update job instead."
 )
 COURSE_CERTIFICATES_DATA = OperationData(
     "api_course_certificates",
@@ -151,6 +271,69 @@ COURSE_CERTIFICATES_DATA = OperationData(
 )
 COURSE_CERTIFICATES_OPERATION = operation(COURSE_CERTIFICATES_DATA)
 
+COURSE_CERTIFICATE_JOB_RESPONSE = schema_response(
+    "Certificate update job",
+    "CertificateUpdateJob",
+)
+COURSE_CERTIFICATE_JOBS_RESPONSES = {
+    "202": COURSE_CERTIFICATE_JOB_RESPONSE,
+    "400": INVALID_REQUEST_RESPONSE,
+    "404": COURSE_NOT_FOUND_RESPONSE,
+}
+COURSE_CERTIFICATE_JOBS_FILE_SCHEMA = {
+    "type": "object",
+    "required": ["file"],
+    "properties": {
+        "file": {
+            "type": "string",
+            "format": "binary",
+            "description": (
+                "JSON Lines file with one "
+                "{email, certificate_path} object per line."
+            ),
+        },
+    },
+}
+COURSE_CERTIFICATE_JOBS_BODY = schema_request_body(
+    "CertificateUpdateRequest"
+)
+COURSE_CERTIFICATE_JOBS_BODY["content"]["multipart/form-data"] = {
+    "schema": COURSE_CERTIFICATE_JOBS_FILE_SCHEMA,
+}
+COURSE_CERTIFICATE_JOBS_DESCRIPTION = (
+    "Queues a bulk certificate URL update and returns 202 with a job to "
+    "poll. Send the same JSON body as the certificates endpoint, or "
+    "upload a JSON Lines file for large drops. Updates are applied in "
+    "chunks, and learners who get their first certificate are notified "
+    "in batched recipient-list sends."
+)
+COURSE_CERTIFICATE_JOBS_DATA = OperationData(
+    "api_course_certificate_jobs",
+    ["Course Data"],
+    "Queue a bulk certificate update job",
+    COURSE_CERTIFICATE_JOBS_RESPONSES,
+    body=COURSE_CERTIFICATE_JOBS_BODY,
+    description=COURSE_CERTIFICATE_JOBS_DESCRIPTION,
+)
+COURSE_CERTIFICATE_JOBS_OPERATION = operation(COURSE_CERTIFICATE_JOBS_DATA)
+
+COURSE_CERTIFICATE_JOB_RESPONSES = {
+    "200": COURSE_CERTIFICATE_JOB_RESPONSE,
+    "404": schema_response("Course or job not found", "Error"),
+}
+COURSE_CERTIFICATE_JOB_DESCRIPTION = (
+    "Returns a certificate update job's status, progress counts, and "
+    "per-entry errors. Poll until status is succeeded or failed."
+)
+COURSE_CERTIFICATE_JOB_DATA = OperationData(
+    "api_course_certificate_job",
+    ["Course Data"],
+    "Get a certificate update job",
+    COURSE_CERTIFICATE_JOB_RESPONSES,
+    description=COURSE_CERTIFICATE_JOB_DESCRIPTION,
+)
+COURSE_CERTIFICATE_JOB_OPERATION = operation(COURSE_CERTIFICATE_JOB_DATA)
+
 DATAMAILER_EVENTS_SUCCESS_RESPONSE = schema_response(
     "Datamailer event accepted",
     "DatamailerEventAccepted",
@@ -188,6 +371,7 @@ DATAMAILER_SEND_AUDITS_SUCCESS_RESPONSE = schema_response(
 )
 DATAMAILER_SEND_AUDITS_RESPONSES = {
     "200": DATAMAILER_SEND_AUDITS_SUCCESS_RESPONSE,
+    "400": INVALID_REQUEST_RESPONSE,
 }
 DATAMAILER_SEND_AUDITS_PARAMETERS = [
     {
@@ -208,6 +392,13 @@ DATAMAILER_SEND_AUDITS_PARAMETERS = [
         "required": False,
         "schema": {"type": "string"},
     },
+    {
+        "name": "cursor",
+        "in": "query",
+        "required": False,
+        "description": "next_cursor from the previous page",
+        "schema": {"type": "string"},
+    },
     {
         "name": "limit",
         "in": "query",
@@ -221,7 +412,8 @@ DATAMAILER_SEND_AUDITS_DESCRIPTION = (
     "Each row's response_payload carries the message summary and, when the "
     "send ran with Datamailer's dry_run flag, the rendered subject/bodies. "
     "Used by the e2e smoke suite to verify the rendered email over HTTP "
-    "without delivering anything. Ordered newest first."
+    "without delivering anything. Ordered newest first; pass next_cursor "
+    "back as cursor to fetch the following page."
 )
 DATAMAILER_SEND_AUDITS_DATA = OperationData(
     "api_datamailer_send_audits",
@@ -249,12 +441,24 @@ DATA_PATHS_BY_URL_NAME = {
     "api_project_submissions_export": {
         "get": PROJECT_SUBMISSIONS_EXPORT_OPERATION,
     },
+    "api_course_columnar_export": {
+        "get": COURSE_COLUMNAR_EXPORT_OPERATION,
+    },
+    "api_course_changes": {
+        "get": COURSE_CHANGES_OPERATION,
+    },
     "api_course_graduates": {
         "get": COURSE_GRADUATES_OPERATION,
     },
     "api_course_certificates": {
         "post": COURSE_CERTIFICATES_OPERATION,
     },
+    "api_course_certificate_jobs": {
+        "post": COURSE_CERTIFICATE_JOBS_OPERATION,
+    },
+    "api_course_certificate_job": {
+        "get": COURSE_CERTIFICATE_JOB_OPERATION,
+    },
     "api_datamailer_events": {
         "post": DATAMAILER_EVENTS_OPERATION,
     },
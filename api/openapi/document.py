@@ -0,0 +1,125 @@
+"""Precomputed OpenAPI document served from memory.
+
+Building the spec walks every URL pattern, reverses it with sample kwargs
+and deep-copies schema fragments, and agents fetch the resulting ~80 KB of
+JSON again and again. The ``export_openapi`` command writes the built spec
+to ``openapi.json`` next to this module (the Docker build runs it after
+``collectstatic``), and ``api.tests.test_openapi`` checks the committed
+copy against a live build.
+
+Each process loads the document once: from the artifact when it exists,
+from a live build otherwise. It keeps the JSON body, its gzipped copy and
+an ETag in memory.
+
+``info.version`` comes from the ``VERSION`` environment variable of the
+running deploy, so the artifact leaves it out and it is filled in on load.
+"""
+
+import gzip
+import hashlib
+import json
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import get_conditional_response, patch_vary_headers
+
+from accounts.auth import token_required
+
+from .spec import build_openapi_spec
+
+OPENAPI_ARTIFACT_PATH = Path(__file__).resolve().parent / "openapi.json"
+
+
+@dataclass(frozen=True)
+class OpenAPIDocument:
+    body: bytes
+    gzip_body: bytes
+    etag: str
+
+
+_document = None
+
+
+def openapi_artifact_spec(spec):
+    """Return ``spec`` without the deploy-specific ``info.version``."""
+    artifact_spec = deepcopy(spec)
+    artifact_spec["info"].pop("version", None)
+    return artifact_spec
+
+
+def openapi_artifact_json(spec):
+    return json.dumps(openapi_artifact_spec(spec), indent=2) + "\n"
+
+
+def write_openapi_artifact(path=OPENAPI_ARTIFACT_PATH):
+    path = Path(path)
+    path.write_text(openapi_artifact_json(build_openapi_spec()))
+    return path
+
+
+def read_openapi_artifact(path=OPENAPI_ARTIFACT_PATH):
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def load_openapi_spec(path=OPENAPI_ARTIFACT_PATH):
+    spec = read_openapi_artifact(path)
+    if spec is None:
+        return build_openapi_spec()
+    spec["info"]["version"] = settings.VERSION
+    return spec
+
+
+def build_openapi_document(spec):
+    body = json.dumps(spec).encode()
+    digest = hashlib.sha256(body).hexdigest()
+    # Weak, because the same tag covers the plain and the gzipped body.
+    etag = f'W/"{digest}"'
+    return OpenAPIDocument(
+        body=body,
+        gzip_body=gzip.compress(body, mtime=0),
+        etag=etag,
+    )
+
+
+def openapi_document():
+    global _document
+    if _document is None:
+        _document = build_openapi_document(load_openapi_spec())
+    return _document
+
+
+def clear_openapi_document():
+    global _document
+    _document = None
+
+
+@token_required
+def openapi_json_view(request):
+    document = openapi_document()
+    not_modified = get_conditional_response(request, etag=document.etag)
+    if not_modified is not None:
+        not_modified["ETag"] = document.etag
+        return not_modified
+
+    accept_encoding = request.headers.get("Accept-Encoding", "")
+    if re_accepts_gzip.search(accept_encoding):
+        response = HttpResponse(
+            document.gzip_body,
+            content_type="application/json",
+        )
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(
+            document.body,
+            content_type="application/json",
+        )
+    response["ETag"] = document.etag
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -1,4 +1,6 @@
-from .primitives import JSON, array_of, ref
+from courses.models.course import CertificateUpdateJob
+
+from .primitives import JSON, array_of, enum_schema, ref
 
 CERTIFICATE_UPDATE_REF = ref("CertificateUpdate")
 CERTIFICATE_UPDATE_ARRAY = array_of(CERTIFICATE_UPDATE_REF)
@@ -73,6 +75,30 @@ INTEGRATION_SCHEMAS = {
             "errors": CERTIFICATE_UPDATE_ERROR_ARRAY,
         },
     },
+    "CertificateUpdateJob": {
+        "type": "object",
+        "required": ["id", "course", "status"],
+        "properties": {
+            "id": {"type": "integer"},
+            "course": {"type": "string"},
+            "status": enum_schema(CertificateUpdateJob.Status),
+            "total_count": {"type": "integer"},
+            "processed_count": {"type": "integer"},
+            "updated_count": {"type": "integer"},
+            "error_count": {"type": "integer"},
+            "errors": CERTIFICATE_UPDATE_ERROR_ARRAY,
+            "last_error": {"type": "string"},
+            "created_at": {"type": "string", "format": "date-time"},
+            "started_at": {
+                "type": ["string", "null"],
+                "format": "date-time",
+            },
+            "finished_at": {
+                "type": ["string", "null"],
+                "format": "date-time",
+            },
+        },
+    },
     "DatamailerEvent": {
         "type": "object",
         "required": ["event_id", "event_type", "email"],
@@ -136,10 +162,12 @@ INTEGRATION_SCHEMAS = {
     },
     "DatamailerSendAudits": {
         "type": "object",
-        "required": ["audits", "count"],
+        "required": ["audits", "count", "next_cursor", "has_more"],
         "properties": {
             "audits": array_of(ref("DatamailerSendAudit")),
             "count": {"type": "integer"},
+            "next_cursor": {"type": ["string", "null"]},
+            "has_more": {"type": "boolean"},
         },
     },
 }
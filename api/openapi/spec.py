@@ -1,10 +1,8 @@
 from copy import deepcopy
 
 from django.conf import settings
-from django.http import JsonResponse
 from django.urls import reverse
 
-from accounts.auth import token_required
 from .paths import PATHS_BY_URL_NAME
 from .primitives import auth_required
 from .schemas import SCHEMAS
@@ -209,10 +207,3 @@ def build_openapi_spec():
         "x-route-coverage": route_coverage_data,
         "components": components,
     }
-
-
-@token_required
-def openapi_json_view(request):
-    spec = build_openapi_spec()
-    response = JsonResponse(spec)
-    return response
@@ -0,0 +1,146 @@
+import io
+from unittest import mock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.test import Client, TestCase
+from django.utils import timezone
+
+from accounts.models import CustomUser, Token
+from api.views.columnar_exports import (
+    COLUMNAR_DATASETS,
+    columnar_row_chunks,
+)
+from courses.models import (
+    Answer,
+    Course,
+    Enrollment,
+    Homework,
+    Question,
+    Submission,
+)
+
+
+class ColumnarExportAPITestCase(TestCase):
+    def setUp(self):
+        self.staff = CustomUser.objects.create(
+            username="staff",
+            email="staff@example.com",
+            is_staff=True,
+        )
+        self.token = Token.objects.create(user=self.staff)
+        self.client = Client()
+        self.client.defaults["HTTP_AUTHORIZATION"] = (
+            f"Token {self.token.key}"
+        )
+        self.course = Course.objects.create(
+            title="Test Course",
+            slug="test-course",
+        )
+        self.homework = Homework.objects.create(
+            course=self.course,
+            slug="hw1",
+            title="Homework 1",
+            due_date=timezone.now(),
+        )
+        self.question = Question.objects.create(
+            homework=self.homework,
+            text="Question",
+        )
+        for index in range(5):
+            self.create_submission(index)
+
+    def create_submission(self, index):
+        student = CustomUser.objects.create(
+            username=f"student{index}",
+            email=f"student{index}@example.com",
+        )
+        enrollment = Enrollment.objects.create(
+            student=student,
+            course=self.course,
+        )
+        submission = Submission.objects.create(
+            homework=self.homework,
+            student=student,
+            enrollment=enrollment,
+            learning_in_public_links=[f"https://example.com/{index}"],
+            total_score=index,
+        )
+        Answer.objects.create(
+            submission=submission,
+            question=self.question,
+            answer_text=str(index),
+        )
+        return submission
+
+    def export_url(self, dataset):
+        return f"/api/courses/{self.course.slug}/exports/{dataset}"
+
+    def test_export_requires_token(self):
+        response = Client().get(self.export_url("answers"))
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_unknown_dataset_returns_404(self):
+        response = self.client.get(self.export_url("leaderboard"))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("homework-submissions", response.json()["error"])
+
+    def test_unknown_format_returns_400(self):
+        response = self.client.get(
+            self.export_url("answers"),
+            {"format": "csv"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_row_chunks_are_keyset_ordered(self):
+        dataset = COLUMNAR_DATASETS["homework-submissions"]
+
+        with self.assertNumQueries(3):
+            chunks = list(columnar_row_chunks(dataset, self.course, 2))
+
+        chunk_sizes = []
+        for chunk in chunks:
+            chunk_sizes.append(len(chunk))
+        self.assertEqual(chunk_sizes, [2, 2, 1])
+        scores = []
+        for chunk in chunks:
+            for row in chunk:
+                scores.append(row[dataset.fields.index("total_score")])
+        self.assertEqual(scores, [0, 1, 2, 3, 4])
+
+    def test_parquet_export_round_trips(self):
+        with mock.patch("api.views.columnar_exports.EXPORT_CHUNK_SIZE", 2):
+            response = self.client.get(
+                self.export_url("homework-submissions")
+            )
+            content = b"".join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        parquet_file = pq.ParquetFile(io.BytesIO(content))
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual(
+            table.column("total_score").to_pylist(),
+            [0, 1, 2, 3, 4],
+        )
+        self.assertEqual(
+            table.column("learning_in_public_links")[0].as_py(),
+            '["https://example.com/0"]',
+        )
+
+    def test_arrow_export_round_trips(self):
+        response = self.client.get(
+            self.export_url("answers"),
+            {"format": "arrow"},
+        )
+        content = b"".join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        table = pa.ipc.open_stream(content).read_all()
+        self.assertEqual(
+            table.column("answer_text").to_pylist(),
+            ["0", "1", "2", "3", "4"],
+        )
@@ -0,0 +1,275 @@
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import CustomUser, Token
+from accounts.token_auth import token_user_cache
+from courses.models import (
+    Course,
+    CourseCatalogStats,
+    Homework,
+    Project,
+    Question,
+)
+from courses.models.homework import HomeworkState
+
+
+class CourseBulkAPITestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create(
+            username="staff",
+            email="staff@example.com",
+            is_staff=True,
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client = Client()
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Token {self.token.key}"
+        self.course = Course.objects.create(
+            title="Test Course",
+            slug="test-course",
+        )
+        self.homework = Homework.objects.create(
+            course=self.course,
+            title="HW1",
+            slug="hw1",
+            due_date=timezone.now(),
+            state=HomeworkState.CLOSED.value,
+        )
+        self.question = Question.objects.create(
+            homework=self.homework,
+            text="Old text",
+        )
+
+    def bulk_url(self):
+        return f"/api/courses/{self.course.slug}/bulk/"
+
+    def post_bulk(self, payload, client=None):
+        client = client or self.client
+        return client.post(
+            self.bulk_url(),
+            json.dumps(payload),
+            content_type="application/json",
+        )
+
+    def homework_item(self, slug, question_count=0):
+        questions = []
+        for index in range(question_count):
+            questions.append({"text": f"{slug} question {index}"})
+        return {
+            "name": f"Homework {slug}",
+            "slug": slug,
+            "due_date": "2026-04-01T23:59:59Z",
+            "questions": questions,
+        }
+
+    def test_requires_staff_token(self):
+        student = CustomUser.objects.create(
+            username="student",
+            email="student@example.com",
+        )
+        student_token = Token.objects.create(user=student)
+        client = Client()
+        client.defaults["HTTP_AUTHORIZATION"] = f"Token {student_token.key}"
+
+        response = self.post_bulk(
+            {"homeworks": [self.homework_item("hw2")]},
+            client=client,
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_creates_and_updates_in_one_request(self):
+        payload = {
+            "homeworks": [self.homework_item("hw2", question_count=2)],
+            "projects": [
+                {
+                    "name": "Project 1",
+                    "submission_due_date": "2026-05-01T23:59:59Z",
+                    "peer_review_due_date": "2026-05-08T23:59:59Z",
+                }
+            ],
+            "questions": [
+                {"homework": "hw1", "text": "New question"},
+                {"homework": "hw2", "text": "Added to new homework"},
+                {"id": self.question.id, "text": "New text"},
+            ],
+        }
+
+        response = self.post_bulk(payload)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["homeworks"][0]["status"], "created")
+        self.assertEqual(data["homeworks"][0]["homework"]["slug"], "hw2")
+        self.assertEqual(
+            data["homeworks"][0]["homework"]["questions_count"],
+            2,
+        )
+        self.assertEqual(data["projects"][0]["project"]["slug"], "project-1")
+        statuses = []
+        for result in data["questions"]:
+            statuses.append(result["status"])
+        self.assertEqual(statuses, ["created", "created", "updated"])
+
+        new_homework = Homework.objects.get(course=self.course, slug="hw2")
+        self.assertEqual(new_homework.question_set.count(), 3)
+        self.assertEqual(self.homework.question_set.count(), 2)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.text, "New text")
+        self.assertTrue(
+            Project.objects.filter(course=self.course, slug="project-1")
+            .exists()
+        )
+        stats = CourseCatalogStats.objects.get(course=self.course)
+        self.assertEqual(stats.homework_count, 2)
+        self.assertEqual(stats.project_count, 1)
+
+    def test_invalid_item_rejects_whole_batch(self):
+        payload = {
+            "homeworks": [
+                self.homework_item("hw2"),
+                self.homework_item("hw1"),
+            ],
+            "questions": [
+                {"homework": "hw1", "text": "Valid"},
+                {"homework": "missing", "text": "Unknown homework"},
+                {"homework": "hw1"},
+                {"id": self.question.id, "answer_count": 3},
+            ],
+        }
+
+        response = self.post_bulk(payload)
+
+        self.assertEqual(response.status_code, 400)
+        data = response.json()
+        self.assertEqual(data["code"], "bulk_validation_failed")
+        errors = []
+        for error in data["details"]["errors"]:
+            errors.append((error["section"], error["index"]))
+        self.assertEqual(
+            errors,
+            [
+                ("homeworks", 1),
+                ("questions", 1),
+                ("questions", 2),
+                ("questions", 3),
+            ],
+        )
+        self.assertFalse(
+            Homework.objects.filter(course=self.course, slug="hw2").exists()
+        )
+        self.assertEqual(self.homework.question_set.count(), 1)
+
+    def test_non_integer_question_id_is_a_validation_error(self):
+        payload = {
+            "questions": [
+                {"id": [self.question.id], "text": "New text"},
+                {"id": "1", "text": "New text"},
+            ],
+        }
+
+        response = self.post_bulk(payload)
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["details"]["errors"]
+        self.assertEqual([error["index"] for error in errors], [0, 1])
+
+    def test_invalid_question_field_values_are_validation_errors(self):
+        other_question = Question.objects.create(
+            homework=self.homework,
+            text="Other text",
+        )
+        payload = {
+            "homeworks": [
+                {
+                    **self.homework_item("hw2"),
+                    "questions": [{"text": "Q", "possible_answers": [1]}],
+                },
+            ],
+            "questions": [
+                {"homework": "hw1", "text": "Q", "question_type": "XX"},
+                {"homework": "hw1", "text": "Q", "answer_type": "NUM"},
+                {"id": self.question.id, "scores_for_correct_answer": "2"},
+                {"id": other_question.id, "possible_answers": ["a", None]},
+            ],
+        }
+
+        response = self.post_bulk(payload)
+
+        self.assertEqual(response.status_code, 400)
+        data = response.json()
+        self.assertEqual(data["code"], "bulk_validation_failed")
+        errors = []
+        for error in data["details"]["errors"]:
+            errors.append((error["section"], error["index"], error["error"]))
+        self.assertEqual(
+            errors,
+            [
+                (
+                    "homeworks",
+                    0,
+                    "questions[0]: possible_answers must be a list of strings",
+                ),
+                ("questions", 0, "Invalid question_type: XX"),
+                ("questions", 1, "Invalid answer_type: NUM"),
+                (
+                    "questions",
+                    2,
+                    "scores_for_correct_answer must be an integer",
+                ),
+                (
+                    "questions",
+                    3,
+                    "possible_answers must be a list of strings",
+                ),
+            ],
+        )
+
+    def test_duplicate_slugs_in_batch_are_rejected(self):
+        payload = {
+            "homeworks": [
+                self.homework_item("hw2"),
+                self.homework_item("hw2"),
+            ],
+        }
+
+        response = self.post_bulk(payload)
+
+        self.assertEqual(response.status_code, 400)
+        error = response.json()["details"]["errors"][0]
+        self.assertEqual(error["index"], 1)
+        self.assertIn("already exists", error["error"])
+
+    def test_empty_request_returns_400(self):
+        response = self.post_bulk({"questions": []})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["code"], "invalid_bulk_request")
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def import_queries(slug, question_count):
+            payload = {
+                "homeworks": [
+                    self.homework_item(slug, question_count=question_count)
+                ],
+                "questions": [
+                    {"homework": "hw1", "text": f"{slug} extra"},
+                    {"id": self.question.id, "text": slug},
+                ],
+            }
+            # Count the token lookup on every call, not only the first.
+            token_user_cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.post_bulk(payload)
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        small_import = import_queries("hw2", 2)
+        large_import = import_queries("hw3", 50)
+
+        self.assertEqual(small_import, large_import)
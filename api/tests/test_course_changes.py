@@ -0,0 +1,282 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.admin.sites import site as admin_site
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import CustomUser, Token
+from courses.change_log import deferred_change_log, record_changes
+from courses.leaderboard import update_leaderboard
+from courses.models import (
+    ChangeLogEntry,
+    ChangeObjectType,
+    Course,
+    Enrollment,
+    Homework,
+    Submission,
+)
+
+
+@override_settings(COURSE_CHANGES_SAFETY_LAG_SECONDS=0)
+class CourseChangeFeedAPITestCase(TestCase):
+    def setUp(self):
+        self.staff = CustomUser.objects.create(
+            username="staff",
+            email="staff@example.com",
+            is_staff=True,
+        )
+        self.token = Token.objects.create(user=self.staff)
+        self.client = Client()
+        self.client.defaults["HTTP_AUTHORIZATION"] = (
+            f"Token {self.token.key}"
+        )
+        self.course = Course.objects.create(
+            title="Test Course",
+            slug="test-course",
+        )
+        self.homework = Homework.objects.create(
+            course=self.course,
+            slug="hw1",
+            title="Homework 1",
+            due_date=timezone.now(),
+        )
+
+    def changes_url(self):
+        return f"/api/courses/{self.course.slug}/changes"
+
+    def get_changes(self, **params):
+        response = self.client.get(self.changes_url(), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def create_enrollment(self, index):
+        student = CustomUser.objects.create(
+            username=f"student{index}",
+            email=f"student{index}@example.com",
+        )
+        return Enrollment.objects.create(
+            student=student,
+            course=self.course,
+        )
+
+    def create_submission(self, enrollment):
+        return Submission.objects.create(
+            homework=self.homework,
+            student=enrollment.student,
+            enrollment=enrollment,
+        )
+
+    def test_changes_require_token(self):
+        response = Client().get(self.changes_url())
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_feed_returns_changes_after_cursor(self):
+        enrollment = self.create_enrollment(1)
+        submission = self.create_submission(enrollment)
+
+        page = self.get_changes()
+
+        changes = page["changes"]
+        self.assertEqual(len(changes), 2)
+        self.assertEqual(changes[0]["type"], "enrollment")
+        self.assertEqual(changes[0]["id"], enrollment.id)
+        self.assertEqual(changes[0]["action"], "upsert")
+        self.assertEqual(
+            changes[0]["data"]["student_id"],
+            enrollment.student_id,
+        )
+        self.assertEqual(changes[1]["type"], "homework_submission")
+        self.assertEqual(changes[1]["id"], submission.id)
+        self.assertFalse(page["has_more"])
+
+        next_page = self.get_changes(cursor=page["next_cursor"])
+
+        self.assertEqual(next_page["changes"], [])
+        self.assertEqual(next_page["next_cursor"], page["next_cursor"])
+
+    def test_deleted_rows_are_logged_without_data(self):
+        enrollment = self.create_enrollment(1)
+        submission = self.create_submission(enrollment)
+        cursor = self.get_changes()["next_cursor"]
+        submission_id = submission.id
+
+        submission.delete()
+
+        changes = self.get_changes(cursor=cursor)["changes"]
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]["id"], submission_id)
+        self.assertEqual(changes[0]["action"], "delete")
+        self.assertIsNone(changes[0]["data"])
+
+    def test_homework_delete_logs_submissions_without_loading_homework(self):
+        submission_ids = []
+        for index in range(3):
+            enrollment = self.create_enrollment(index)
+            submission_ids.append(self.create_submission(enrollment).id)
+        cursor = self.get_changes()["next_cursor"]
+        homeworks = Homework.objects.filter(id=self.homework.id)
+        homework_admin = admin_site._registry[Homework]
+
+        with CaptureQueriesContext(connection) as queries:
+            homework_admin.delete_queryset(None, homeworks)
+
+        homework_selects = []
+        change_log_inserts = []
+        for query in queries.captured_queries:
+            sql = query["sql"]
+            if sql.startswith("SELECT") and 'FROM "courses_homework"' in sql:
+                homework_selects.append(sql)
+            if sql.startswith('INSERT INTO "courses_changelogentry"'):
+                change_log_inserts.append(sql)
+        self.assertEqual(len(homework_selects), 1)
+        self.assertEqual(len(change_log_inserts), 1)
+        changes = self.get_changes(cursor=cursor)["changes"]
+        self.assertEqual(
+            sorted((change["id"], change["action"]) for change in changes),
+            [(submission_id, "delete") for submission_id in submission_ids],
+        )
+
+    def test_feed_pages_with_limit(self):
+        for index in range(3):
+            self.create_enrollment(index)
+
+        page = self.get_changes(limit=2)
+
+        self.assertEqual(len(page["changes"]), 2)
+        self.assertTrue(page["has_more"])
+        next_page = self.get_changes(cursor=page["next_cursor"], limit=2)
+        self.assertEqual(len(next_page["changes"]), 1)
+        self.assertFalse(next_page["has_more"])
+
+    def test_feed_filters_by_type(self):
+        enrollment = self.create_enrollment(1)
+        self.create_submission(enrollment)
+
+        changes = self.get_changes(types="homework_submission")["changes"]
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]["type"], "homework_submission")
+
+    def test_unknown_type_returns_400(self):
+        response = self.client.get(self.changes_url(), {"types": "answers"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_leaderboard_update_logs_changed_enrollments_only(self):
+        scored_enrollment = self.create_enrollment(1)
+        self.create_enrollment(2)
+        submission = self.create_submission(scored_enrollment)
+        Submission.objects.filter(id=submission.id).update(total_score=10)
+        update_leaderboard(self.course)
+        cursor = self.get_changes()["next_cursor"]
+
+        Submission.objects.filter(id=submission.id).update(total_score=12)
+        update_leaderboard(self.course)
+
+        changes = self.get_changes(cursor=cursor)["changes"]
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]["id"], scored_enrollment.id)
+        self.assertEqual(changes[0]["data"]["total_score"], 12)
+
+    def test_prune_command_deletes_old_entries(self):
+        self.create_enrollment(1)
+        self.create_enrollment(2)
+        old_entry = ChangeLogEntry.objects.first()
+        old_entry.occurred_at = timezone.now() - timedelta(days=100)
+        old_entry.save()
+
+        call_command("prune_change_log", stdout=StringIO())
+
+        self.assertFalse(
+            ChangeLogEntry.objects.filter(id=old_entry.id).exists()
+        )
+        self.assertEqual(ChangeLogEntry.objects.count(), 1)
+
+    @override_settings(COURSE_CHANGES_SAFETY_LAG_SECONDS=300)
+    def test_feed_holds_back_entries_inside_the_safety_lag(self):
+        self.create_enrollment(1)
+        self.create_enrollment(2)
+        settled = ChangeLogEntry.objects.order_by("id").first()
+        settled.occurred_at = timezone.now() - timedelta(minutes=10)
+        settled.save()
+
+        page = self.get_changes()
+
+        cursors = [change["cursor"] for change in page["changes"]]
+        self.assertEqual(cursors, [settled.id])
+        self.assertEqual(page["next_cursor"], settled.id)
+        self.assertFalse(page["has_more"])
+
+    def test_feed_does_not_pass_an_entry_inside_the_safety_lag(self):
+        self.create_enrollment(1)
+        self.create_enrollment(2)
+        late = ChangeLogEntry.objects.order_by("id").first()
+        # A long transaction logged the lower id but committed last.
+        late.occurred_at = timezone.now() + timedelta(minutes=1)
+        late.save()
+
+        page = self.get_changes()
+
+        self.assertEqual(page["changes"], [])
+        self.assertEqual(page["next_cursor"], 0)
+
+    def test_cursor_older_than_pruned_entries_returns_410(self):
+        self.create_enrollment(1)
+        self.create_enrollment(2)
+        self.create_enrollment(3)
+        first, second, _ = ChangeLogEntry.objects.order_by("id")
+        ChangeLogEntry.objects.filter(id__lte=second.id).delete()
+
+        response = self.client.get(
+            self.changes_url(),
+            {"cursor": first.id},
+        )
+
+        self.assertEqual(response.status_code, 410)
+        page = self.get_changes(cursor=second.id)
+        self.assertEqual(len(page["changes"]), 1)
+
+    def test_quiet_course_cursor_survives_pruning_other_courses(self):
+        other_course = Course.objects.create(
+            title="Other Course",
+            slug="other-course",
+        )
+        self.create_enrollment(1)
+        page = self.get_changes()
+        record_changes(other_course.id, ChangeObjectType.ENROLLMENT, [1, 2])
+        first_other, second_other = ChangeLogEntry.objects.filter(
+            course_id=other_course.id,
+        ).order_by("id")
+
+        quiet_page = self.get_changes(cursor=page["next_cursor"])
+        ChangeLogEntry.objects.filter(id__lt=second_other.id).delete()
+
+        self.assertEqual(quiet_page["changes"], [])
+        self.assertEqual(quiet_page["next_cursor"], second_other.id)
+        next_page = self.get_changes(cursor=quiet_page["next_cursor"])
+        self.assertEqual(next_page["changes"], [])
+
+    def test_deferred_change_log_inserts_entries_on_exit(self):
+        with deferred_change_log():
+            self.create_enrollment(1)
+            record_changes(self.course.id, ChangeObjectType.ENROLLMENT, [1])
+            self.assertFalse(ChangeLogEntry.objects.exists())
+
+        self.assertEqual(ChangeLogEntry.objects.count(), 2)
+
+    def test_deferred_change_log_drops_entries_on_error(self):
+        with self.assertRaises(ValueError):
+            with deferred_change_log():
+                record_changes(
+                    self.course.id,
+                    ChangeObjectType.ENROLLMENT,
+                    [1],
+                )
+                raise ValueError("scoring failed")
+
+        self.assertFalse(ChangeLogEntry.objects.exists())
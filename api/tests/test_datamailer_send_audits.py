@@ -1,6 +1,15 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import Client, TestCase
+from django.utils import timezone
 
 from accounts.models import CustomUser, Token
+from course_management.datamailer.sync.audit import (
+    DatamailerSendAuditData,
+    record_datamailer_send_audit,
+)
 from data.models import (
     DatamailerSendAudit,
     DatamailerSendAuditStatus,
@@ -45,6 +54,7 @@ class DatamailerSendAuditsAPITestCase(TestCase):
         return DatamailerSendAudit.objects.create(
             send_type=DatamailerSendAuditType.TRANSACTIONAL,
             status=DatamailerSendAuditStatus.SUCCEEDED,
+            recipient_email=email.lower(),
             template_key=template_key,
             idempotency_key=idempotency_key,
             response_payload=response_payload,
@@ -196,3 +206,87 @@ class DatamailerSendAuditsAPITestCase(TestCase):
         self.assertEqual(audit["would_deliver"], True)
         self.assertIn("/homework/", audit["rendered"]["html_body"])
         self.assertEqual(audit["rendered"]["text_body"], "Update: /homework/hw-1")
+
+    def test_recorded_audit_is_found_by_email(self):
+        data = DatamailerSendAuditData(
+            send_type=DatamailerSendAuditType.TRANSACTIONAL,
+            payload={"idempotency_key": "hw:1"},
+            response={"message": {"email": "Student@Example.com"}},
+        )
+        audit = record_datamailer_send_audit(data)
+
+        self.assertEqual(audit.recipient_email, "student@example.com")
+        response = self.client.get(
+            SEND_AUDITS_URL,
+            {"email": "student@example.com"},
+            **self._auth(),
+        )
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_pages_with_cursor(self):
+        now = timezone.now()
+        for index in range(3):
+            audit = self._create_audit(
+                email="student@example.com",
+                template_key="homework-submission-confirmation",
+                idempotency_key=f"hw:{index}",
+            )
+            audit.occurred_at = now - timedelta(minutes=index)
+            audit.save()
+
+        response = self.client.get(
+            SEND_AUDITS_URL,
+            {"limit": 2},
+            **self._auth(),
+        )
+        body = response.json()
+
+        self.assertEqual(body["count"], 2)
+        self.assertTrue(body["has_more"])
+        response = self.client.get(
+            SEND_AUDITS_URL,
+            {"limit": 2, "cursor": body["next_cursor"]},
+            **self._auth(),
+        )
+        next_body = response.json()
+        self.assertEqual(next_body["count"], 1)
+        self.assertEqual(next_body["audits"][0]["idempotency_key"], "hw:2")
+        self.assertFalse(next_body["has_more"])
+        self.assertIsNone(next_body["next_cursor"])
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get(
+            SEND_AUDITS_URL,
+            {"cursor": "not-a-cursor"},
+            **self._auth(),
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_backfill_command_fills_recipient_email(self):
+        audit = self._create_audit(
+            email="Student@Example.com",
+            template_key="homework-submission-confirmation",
+            idempotency_key="hw:1",
+        )
+        DatamailerSendAudit.objects.filter(id=audit.id).update(
+            recipient_email=""
+        )
+        list_audit = self._create_failed_audit(
+            idempotency_key="deadline-reminder:project:72:24h",
+            error="Read timed out",
+        )
+
+        stdout = StringIO()
+        call_command(
+            "backfill_datamailer_send_audit_recipients",
+            "--batch-size",
+            "1",
+            stdout=stdout,
+        )
+
+        self.assertIn("Send audits updated: 1", stdout.getvalue())
+        audit.refresh_from_db()
+        self.assertEqual(audit.recipient_email, "student@example.com")
+        list_audit.refresh_from_db()
+        self.assertEqual(list_audit.recipient_email, "")
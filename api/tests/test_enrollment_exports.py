@@ -38,7 +38,7 @@ class EnrollmentExportSuccessAPITestCase(EnrollmentExportsAPITestBase):
 
         with patch(
             "api.views.enrollment_certificates."
-            "send_certificate_availability_notification"
+            "queue_certificate_availability_notifications"
         ) as send_notification:
             with self.captureOnCommitCallbacks(execute=True):
                 payload = self.single_certificate_payload()
@@ -46,4 +46,7 @@ class EnrollmentExportSuccessAPITestCase(EnrollmentExportsAPITestBase):
 
         self.assert_single_certificate_response(response, enrollment)
         self.assert_certificate_url(enrollment, "/certificates/student.pdf")
-        send_notification.assert_called_once_with(enrollment)
+        send_notification.assert_called_once_with(
+            self.course,
+            [enrollment],
+        )
@@ -1,6 +1,13 @@
-from django.test import Client, TestCase
+import gzip
+
+from django.test import Client, TestCase, override_settings
 
 from accounts.models import CustomUser, Token
+from api.openapi.document import (
+    clear_openapi_document,
+    openapi_artifact_spec,
+    read_openapi_artifact,
+)
 from api.openapi.spec import (
     build_openapi_spec,
     route_coverage,
@@ -37,6 +44,44 @@ class OpenAPITestCase(TestCase):
         self.assertIn("TokenAuth", data["components"]["securitySchemes"])
         self.assertEqual(data["x-route-coverage"]["undocumented"], [])
 
+    def test_committed_artifact_matches_live_spec(self):
+        artifact = read_openapi_artifact()
+
+        self.assertIsNotNone(artifact)
+        self.assertEqual(
+            artifact,
+            openapi_artifact_spec(build_openapi_spec()),
+            "api/openapi/openapi.json is out of date; run "
+            "`python manage.py export_openapi`",
+        )
+
+    @override_settings(VERSION="test-version")
+    def test_openapi_response_is_conditional_and_gzipped(self):
+        clear_openapi_document()
+        self.addCleanup(clear_openapi_document)
+        auth = f"Token {self.token.key}"
+
+        response = self.client.get(
+            "/api/openapi.json",
+            HTTP_AUTHORIZATION=auth,
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        body = gzip.decompress(response.content)
+        self.assertIn(b'"version": "test-version"', body)
+
+        not_modified = self.client.get(
+            "/api/openapi.json",
+            HTTP_AUTHORIZATION=auth,
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+
     def test_all_api_routes_are_documented(self):
         spec = build_openapi_spec()
         documented_names = set()
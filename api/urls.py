@@ -1,9 +1,13 @@
 from django.urls import path
 
-from .openapi.spec import openapi_json_view
+from .openapi.document import openapi_json_view
+from .views import columnar_exports
+from .views import course_bulk
 from .views import course_exports
+from .views import course_changes
 from .views import courses
 from .views import datamailer_send_audits
+from .views import enrollment_certificate_jobs
 from .views import enrollment_certificates
 from .views import enrollment_graduates
 from .views import health
@@ -49,6 +53,16 @@ urlpatterns = [
         project_exports.project_data_view,
         name="api_project_submissions_export",
     ),
+    path(
+        "courses/<slug:course_slug>/exports/<slug:dataset>",
+        columnar_exports.course_columnar_export_view,
+        name="api_course_columnar_export",
+    ),
+    path(
+        "courses/<slug:course_slug>/changes",
+        course_changes.course_changes_view,
+        name="api_course_changes",
+    ),
     path(
         "courses/<slug:course_slug>/graduates",
         enrollment_graduates.graduates_data_view,
@@ -59,6 +73,16 @@ urlpatterns = [
         enrollment_certificates.bulk_update_enrollment_certificates_view,
         name="api_course_certificates",
     ),
+    path(
+        "courses/<slug:course_slug>/certificates/jobs",
+        enrollment_certificate_jobs.create_certificate_update_job_view,
+        name="api_course_certificate_jobs",
+    ),
+    path(
+        "courses/<slug:course_slug>/certificates/jobs/<int:job_id>",
+        enrollment_certificate_jobs.certificate_update_job_view,
+        name="api_course_certificate_job",
+    ),
     path(
         "datamailer/events",
         webhooks.datamailer_event_webhook,
@@ -80,6 +104,11 @@ urlpatterns = [
         courses.course_detail_view,
         name="api_course_detail",
     ),
+    path(
+        "courses/<slug:course_slug>/bulk/",
+        course_bulk.course_bulk_view,
+        name="api_course_bulk",
+    ),
     path(
         "registration-campaigns/",
         registration_campaigns.registration_campaigns_view,
@@ -0,0 +1,305 @@
+"""
+Columnar (Parquet / Arrow IPC) course data exports.
+
+One endpoint per course returns a whole table — homework submissions,
+answers, project submissions, peer reviews or enrollments — as a single
+Parquet file or Arrow IPC stream, so notebooks can load it straight into
+a dataframe instead of flattening the JSON exports.
+
+Rows are read with ``values_list`` in id-ordered keyset chunks. Each chunk
+becomes one Parquet row group / Arrow record batch, and the bytes the
+writer produced for it are streamed out before the next chunk is read.
+"""
+
+import json
+from dataclasses import dataclass
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_GET
+
+from accounts.auth import token_required
+
+from courses.models.course import Course, Enrollment
+from courses.models.homework import Answer, Submission
+from courses.models.project import PeerReview, ProjectSubmission
+
+EXPORT_CHUNK_SIZE = 10000
+EXPORT_FORMAT_PARQUET = "parquet"
+EXPORT_FORMAT_ARROW = "arrow"
+EXPORT_CONTENT_TYPES = {
+    EXPORT_FORMAT_PARQUET: "application/vnd.apache.parquet",
+    EXPORT_FORMAT_ARROW: "application/vnd.apache.arrow.stream",
+}
+EXPORT_FILE_EXTENSIONS = {
+    EXPORT_FORMAT_PARQUET: "parquet",
+    EXPORT_FORMAT_ARROW: "arrows",
+}
+
+
+@dataclass(frozen=True)
+class ColumnarDataset:
+    model: type
+    course_lookup: str
+    fields: tuple[str, ...]
+
+    def queryset(self, course):
+        return self.model.objects.filter(**{self.course_lookup: course})
+
+
+COLUMNAR_DATASETS = {
+    "homework-submissions": ColumnarDataset(
+        model=Submission,
+        course_lookup="homework__course",
+        fields=(
+            "id",
+            "homework_id",
+            "student_id",
+            "enrollment_id",
+            "homework_link",
+            "learning_in_public_links",
+            "time_spent_lectures",
+            "time_spent_homework",
+            "problems_comments",
+            "faq_contribution_url",
+            "submitted_at",
+            "questions_score",
+            "faq_score",
+            "learning_in_public_score",
+            "total_score",
+        ),
+    ),
+    "answers": ColumnarDataset(
+        model=Answer,
+        course_lookup="submission__homework__course",
+        fields=(
+            "id",
+            "submission_id",
+            "question_id",
+            "answer_text",
+            "is_correct",
+        ),
+    ),
+    "project-submissions": ColumnarDataset(
+        model=ProjectSubmission,
+        course_lookup="project__course",
+        fields=(
+            "id",
+            "project_id",
+            "student_id",
+            "enrollment_id",
+            "github_link",
+            "commit_id",
+            "learning_in_public_links",
+            "faq_contribution_url",
+            "time_spent",
+            "problems_comments",
+            "submitted_at",
+            "project_score",
+            "project_faq_score",
+            "project_learning_in_public_score",
+            "peer_review_score",
+            "peer_review_learning_in_public_score",
+            "total_score",
+            "reviewed_enough_peers",
+            "passed",
+        ),
+    ),
+    "peer-reviews": ColumnarDataset(
+        model=PeerReview,
+        course_lookup="submission_under_evaluation__project__course",
+        fields=(
+            "id",
+            "submission_under_evaluation_id",
+            "reviewer_id",
+            "learning_in_public_links",
+            "time_spent_reviewing",
+            "problems_comments",
+            "optional",
+            "submitted_at",
+            "state",
+        ),
+    ),
+    "enrollments": ColumnarDataset(
+        model=Enrollment,
+        course_lookup="course",
+        fields=(
+            "id",
+            "student_id",
+            "enrollment_date",
+            "display_name",
+            "display_on_leaderboard",
+            "position_on_leaderboard",
+            "total_score",
+            "certificate_url",
+        ),
+    ),
+}
+
+INTEGER_FIELD_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "BigIntegerField",
+    "ForeignKey",
+    "IntegerField",
+    "OneToOneField",
+    "PositiveIntegerField",
+    "PositiveSmallIntegerField",
+    "SmallIntegerField",
+}
+
+
+def arrow_type_for_field(field):
+    internal_type = field.get_internal_type()
+    if internal_type in INTEGER_FIELD_TYPES:
+        return pa.int64()
+    if internal_type == "FloatField":
+        return pa.float64()
+    if internal_type == "BooleanField":
+        return pa.bool_()
+    if internal_type == "DateTimeField":
+        return pa.timestamp("us", tz="UTC")
+    # JSON columns are exported as their JSON text.
+    return pa.string()
+
+
+def columnar_schema(dataset):
+    columns = []
+    for name in dataset.fields:
+        field = dataset.model._meta.get_field(name)
+        columns.append(pa.field(name, arrow_type_for_field(field)))
+    return pa.schema(columns)
+
+
+def json_columns(dataset) -> set[int]:
+    positions = set()
+    for position, name in enumerate(dataset.fields):
+        field = dataset.model._meta.get_field(name)
+        if field.get_internal_type() == "JSONField":
+            positions.add(position)
+    return positions
+
+
+def columnar_row_chunks(dataset, course, chunk_size=None):
+    """Yield lists of value tuples in id order, ``chunk_size`` at a time."""
+    if chunk_size is None:
+        chunk_size = EXPORT_CHUNK_SIZE
+    rows = dataset.queryset(course).order_by("id")
+    last_id = 0
+    while True:
+        chunk = list(
+            rows.filter(id__gt=last_id).values_list(*dataset.fields)[
+                :chunk_size
+            ]
+        )
+        if not chunk:
+            return
+        yield chunk
+        # ``id`` is always the first exported field.
+        last_id = chunk[-1][0]
+        if len(chunk) < chunk_size:
+            return
+
+
+def columnar_record_batch(schema, dataset, chunk):
+    json_positions = json_columns(dataset)
+    arrays = []
+    for position, column in enumerate(schema):
+        values = []
+        for row in chunk:
+            value = row[position]
+            if position in json_positions and value is not None:
+                value = json.dumps(value)
+            values.append(value)
+        arrays.append(pa.array(values, type=column.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class ChunkSink:
+    """Write-only file object that hands written bytes back in pieces.
+
+    The Parquet/Arrow writers write into it; the streaming generator
+    drains it after every row group so nothing accumulates.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self.parts.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+
+def open_columnar_writer(sink, schema, export_format):
+    output = pa.PythonFile(sink, mode="w")
+    if export_format == EXPORT_FORMAT_ARROW:
+        return pa.ipc.new_stream(output, schema)
+    return pq.ParquetWriter(output, schema, compression="zstd")
+
+
+def stream_columnar_export(dataset, course, export_format):
+    schema = columnar_schema(dataset)
+    sink = ChunkSink()
+    writer = open_columnar_writer(sink, schema, export_format)
+    for chunk in columnar_row_chunks(dataset, course):
+        batch = columnar_record_batch(schema, dataset, chunk)
+        writer.write_batch(batch)
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+@require_GET
+@token_required
+def course_columnar_export_view(request, course_slug: str, dataset: str):
+    """Export one course table as Parquet (default) or an Arrow IPC stream."""
+    course = get_object_or_404(Course, slug=course_slug)
+
+    columnar_dataset = COLUMNAR_DATASETS.get(dataset)
+    if columnar_dataset is None:
+        available = ", ".join(COLUMNAR_DATASETS)
+        error_payload = {
+            "error": f"Unknown dataset '{dataset}'. Available: {available}"
+        }
+        return JsonResponse(error_payload, status=404)
+
+    export_format = request.GET.get("format", EXPORT_FORMAT_PARQUET)
+    if export_format not in EXPORT_CONTENT_TYPES:
+        error_payload = {
+            "error": "format must be 'parquet' or 'arrow'",
+        }
+        return JsonResponse(error_payload, status=400)
+
+    content = stream_columnar_export(
+        columnar_dataset,
+        course,
+        export_format,
+    )
+    response = StreamingHttpResponse(
+        content,
+        content_type=EXPORT_CONTENT_TYPES[export_format],
+    )
+    extension = EXPORT_FILE_EXTENSIONS[export_format]
+    filename = f"{course.slug}-{dataset}.{extension}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
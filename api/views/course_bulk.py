@@ -0,0 +1,156 @@
+"""
+Bulk creation of homeworks, projects and questions for one course.
+
+Course setup scripts push hundreds of questions per course. The per-item
+create endpoints validate and save one row at a time; this endpoint
+validates the whole batch first, resolves homework and question references
+with one query per type, and writes everything with ``bulk_create`` /
+``bulk_update`` in a single transaction. Any invalid item rejects the whole
+batch, so a failed import never leaves a course half set up.
+"""
+
+from django.db import transaction
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+
+from accounts.auth import token_required
+from courses.course_catalog import (
+    adjust_course_catalog_stats,
+    bump_course_catalog_version,
+)
+from courses.course_page_cache import bump_course_page_version
+from courses.models.course import Course
+from courses.models.homework import Homework, Question
+from courses.models.project import Project
+
+from api.safety import error_response, require_staff_token
+from api.utils import parse_json_body, require_methods
+from api.views.course_bulk_validation import build_bulk_plan, bulk_sections
+from api.views.homework_serializers import homework_to_dict
+from api.views.project_serializers import project_to_dict
+from api.views.question_serializers import question_to_dict
+
+
+def save_bulk_plan(course, plan):
+    homeworks = []
+    for bulk_homework in plan.homeworks:
+        homeworks.append(bulk_homework.homework)
+    projects = []
+    for _, project in plan.projects:
+        projects.append(project)
+    updated_questions = plan.updated_questions()
+
+    with transaction.atomic():
+        # Homeworks first: new questions take their ids from these objects.
+        Homework.objects.bulk_create(homeworks)
+        Project.objects.bulk_create(projects)
+        Question.objects.bulk_create(plan.new_questions())
+        if updated_questions:
+            Question.objects.bulk_update(
+                updated_questions,
+                sorted(plan.question_update_fields),
+            )
+
+    # bulk_create sends no post_save signals, so do what the
+    # per-object receivers in courses.signals would have done.
+    if homeworks:
+        adjust_course_catalog_stats(
+            course.id,
+            "homework_count",
+            len(homeworks),
+        )
+    if projects:
+        adjust_course_catalog_stats(
+            course.id,
+            "project_count",
+            len(projects),
+        )
+    if homeworks or projects:
+        bump_course_page_version(course.id)
+        bump_course_catalog_version()
+
+
+def bulk_results(plan):
+    homework_results = []
+    for bulk_homework in plan.homeworks:
+        homework = bulk_homework.homework
+        homework.submission_count = 0
+        homework.question_count = len(bulk_homework.questions)
+        homework_results.append(
+            {
+                "index": bulk_homework.index,
+                "status": "created",
+                "homework": homework_to_dict(homework),
+            }
+        )
+
+    project_results = []
+    for index, project in plan.projects:
+        project.submission_count = 0
+        project_results.append(
+            {
+                "index": index,
+                "status": "created",
+                "project": project_to_dict(project),
+            }
+        )
+
+    question_results = []
+    for bulk_question in plan.questions:
+        question = bulk_question.question
+        status = "updated"
+        if bulk_question.created:
+            question.answer_count = 0
+            status = "created"
+        question_results.append(
+            {
+                "index": bulk_question.index,
+                "status": status,
+                "question": question_to_dict(question),
+            }
+        )
+
+    return {
+        "homeworks": homework_results,
+        "projects": project_results,
+        "questions": question_results,
+    }
+
+
+def course_bulk_response(course, data):
+    sections, error = bulk_sections(data)
+    if error:
+        return error_response(error, "invalid_bulk_request")
+
+    plan = build_bulk_plan(course, sections)
+    if plan.errors:
+        return error_response(
+            "Bulk request has invalid items; nothing was written",
+            "bulk_validation_failed",
+            details={"errors": plan.errors},
+        )
+
+    save_bulk_plan(course, plan)
+    return JsonResponse(bulk_results(plan))
+
+
+@token_required
+@csrf_exempt
+@require_methods("POST")
+def course_bulk_view(request, course_slug):
+    """
+    POST /api/courses/<slug>/bulk/ - Create homeworks, projects and
+    questions, and update questions, in one transaction.
+    """
+    course = get_object_or_404(Course, slug=course_slug)
+
+    staff_error = require_staff_token(request)
+    if staff_error:
+        return staff_error
+
+    data, err = parse_json_body(request)
+    if err:
+        return err
+
+    return course_bulk_response(course, data)
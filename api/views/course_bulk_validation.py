@@ -0,0 +1,382 @@
+from dataclasses import dataclass, field
+
+from django.db.models import Count
+
+from courses.models.homework import (
+    AnswerTypes,
+    Homework,
+    Question,
+    QuestionTypes,
+)
+from courses.models.project import Project
+
+from api.views.homework_create import (
+    homework_create_base_attrs,
+    homework_requested_slug,
+)
+from api.views.project_create import (
+    ProjectCreateValues,
+    project_create_checked_fields,
+    project_model_attrs,
+    project_requested_slug,
+)
+from api.views.question_mutations import (
+    QUESTION_PATCH_FIELDS,
+    question_create_attrs,
+    question_patch_value,
+)
+
+BULK_SECTIONS = ("homeworks", "projects", "questions")
+MAX_BULK_ITEMS = 5000
+QUESTION_TYPE_VALUES = {question_type.value for question_type in QuestionTypes}
+ANSWER_TYPE_VALUES = {answer_type.value for answer_type in AnswerTypes}
+
+
+@dataclass
+class BulkHomework:
+    index: int
+    homework: Homework
+    questions: list[Question]
+
+
+@dataclass
+class BulkQuestion:
+    index: int
+    question: Question
+    created: bool
+
+
+@dataclass
+class BulkPlan:
+    """Unsaved objects for one bulk request, built before any write."""
+
+    homeworks: list[BulkHomework] = field(default_factory=list)
+    projects: list[tuple[int, Project]] = field(default_factory=list)
+    questions: list[BulkQuestion] = field(default_factory=list)
+    question_update_fields: set[str] = field(default_factory=set)
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, section, index, error):
+        self.errors.append(
+            {"section": section, "index": index, "error": error}
+        )
+
+    def new_questions(self):
+        questions = []
+        for bulk_homework in self.homeworks:
+            questions.extend(bulk_homework.questions)
+        for bulk_question in self.questions:
+            if bulk_question.created:
+                questions.append(bulk_question.question)
+        return questions
+
+    def updated_questions(self):
+        questions = []
+        for bulk_question in self.questions:
+            if not bulk_question.created:
+                questions.append(bulk_question.question)
+        return questions
+
+
+def bulk_sections(data):
+    """Return ``{section: items}`` for a bulk body, or an error message."""
+    if not isinstance(data, dict):
+        return None, "Request body must be an object"
+
+    unknown_sections = sorted(set(data) - set(BULK_SECTIONS))
+    if unknown_sections:
+        return None, f"Unknown sections: {', '.join(unknown_sections)}"
+
+    sections = {}
+    item_count = 0
+    for section in BULK_SECTIONS:
+        items = data.get(section, [])
+        if not isinstance(items, list):
+            return None, f"{section} must be a list"
+        sections[section] = items
+        item_count += len(items)
+
+    if not item_count:
+        return None, "Nothing to write"
+    if item_count > MAX_BULK_ITEMS:
+        return None, f"At most {MAX_BULK_ITEMS} items per request"
+    return sections, None
+
+
+def build_bulk_plan(course, sections):
+    """Validate every item and resolve references with one query per type."""
+    plan = BulkPlan()
+    homeworks_by_slug = plan_homeworks(course, sections["homeworks"], plan)
+    plan_projects(course, sections["projects"], plan)
+    plan_questions(course, sections["questions"], homeworks_by_slug, plan)
+    return plan
+
+
+def requested_slugs(items, requested_slug):
+    slugs = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        name = item.get("name") or ""
+        slug = requested_slug(item, name)
+        if slug:
+            slugs.add(slug)
+    return slugs
+
+
+def plan_homeworks(course, items, plan):
+    """Plan new homeworks and return them by slug."""
+    existing_slugs = set(
+        Homework.objects.filter(
+            course=course,
+            slug__in=requested_slugs(items, homework_requested_slug),
+        ).values_list("slug", flat=True)
+    )
+
+    homeworks_by_slug = {}
+    for index, item in enumerate(items):
+        homework = plan_homework(course, item, existing_slugs, plan, index)
+        if homework is None:
+            continue
+        existing_slugs.add(homework.slug)
+        homeworks_by_slug[homework.slug] = homework
+    return homeworks_by_slug
+
+
+def plan_homework(course, item, existing_slugs, plan, index):
+    if not isinstance(item, dict):
+        plan.add_error("homeworks", index, "Item must be an object")
+        return None
+
+    attrs, error = homework_create_base_attrs(item)
+    if error:
+        plan.add_error("homeworks", index, error)
+        return None
+
+    slug = homework_requested_slug(item, attrs["title"])
+    if slug in existing_slugs:
+        plan.add_error(
+            "homeworks",
+            index,
+            f"Homework with slug '{slug}' already exists",
+        )
+        return None
+
+    questions_data = item.get("questions", [])
+    if not isinstance(questions_data, list):
+        plan.add_error("homeworks", index, "questions must be a list")
+        return None
+
+    homework = Homework(course=course, slug=slug, **attrs)
+    questions = []
+    for question_index, question_data in enumerate(questions_data):
+        question_attrs, error = bulk_question_create_attrs(question_data)
+        if error:
+            plan.add_error(
+                "homeworks",
+                index,
+                f"questions[{question_index}]: {error}",
+            )
+            return None
+        questions.append(Question(homework=homework, **question_attrs))
+
+    bulk_homework = BulkHomework(
+        index=index,
+        homework=homework,
+        questions=questions,
+    )
+    plan.homeworks.append(bulk_homework)
+    return homework
+
+
+def plan_projects(course, items, plan):
+    existing_slugs = set(
+        Project.objects.filter(
+            course=course,
+            slug__in=requested_slugs(items, project_requested_slug),
+        ).values_list("slug", flat=True)
+    )
+
+    for index, item in enumerate(items):
+        project = plan_project(course, item, existing_slugs, plan, index)
+        if project is None:
+            continue
+        existing_slugs.add(project.slug)
+        plan.projects.append((index, project))
+
+
+def plan_project(course, item, existing_slugs, plan, index):
+    if not isinstance(item, dict):
+        plan.add_error("projects", index, "Item must be an object")
+        return None
+
+    checked_fields, error = project_create_checked_fields(item)
+    if error:
+        plan.add_error("projects", index, error)
+        return None
+
+    input_data, instructions_url, dates = checked_fields
+    slug = project_requested_slug(item, input_data.name)
+    if slug in existing_slugs:
+        plan.add_error(
+            "projects",
+            index,
+            f"Project with slug '{slug}' already exists",
+        )
+        return None
+
+    values = ProjectCreateValues(
+        input_data=input_data,
+        instructions_url=instructions_url,
+        dates=dates,
+        slug=slug,
+    )
+    attrs = project_model_attrs(item, values)
+    return Project(course=course, **attrs)
+
+
+def bulk_question_create_attrs(question_data):
+    if not isinstance(question_data, dict):
+        return None, "Item must be an object"
+
+    for field_name, value in question_data.items():
+        if field_name not in QUESTION_PATCH_FIELDS:
+            continue
+        error = question_field_error(field_name, value)
+        if error:
+            return None, error
+
+    return question_create_attrs(question_data)
+
+
+def question_field_error(field_name, value):
+    """Reject values the model would only fail on at write time.
+
+    The whole batch is written in one transaction, so a bad value caught
+    here is a per-item error instead of a failed request.
+    """
+    if field_name == "possible_answers":
+        if not isinstance(value, list):
+            return "possible_answers must be a list"
+        if not all(isinstance(answer, str) for answer in value):
+            return "possible_answers must be a list of strings"
+    if field_name == "scores_for_correct_answer":
+        if not isinstance(value, int) or isinstance(value, bool):
+            return "scores_for_correct_answer must be an integer"
+    if field_name == "question_type" and value not in QUESTION_TYPE_VALUES:
+        return f"Invalid question_type: {value}"
+    if field_name == "answer_type":
+        if value is not None and value not in ANSWER_TYPE_VALUES:
+            return f"Invalid answer_type: {value}"
+    return None
+
+
+def plan_questions(course, items, homeworks_by_slug, plan):
+    homework_slugs = set()
+    question_ids = set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if "id" in item:
+            if is_question_id(item["id"]):
+                question_ids.add(item["id"])
+        elif isinstance(item.get("homework"), str):
+            homework_slugs.add(item["homework"])
+
+    homework_slugs -= set(homeworks_by_slug)
+    existing_homeworks = Homework.objects.filter(
+        course=course,
+        slug__in=homework_slugs,
+    )
+    for homework in existing_homeworks:
+        homeworks_by_slug[homework.slug] = homework
+
+    questions_by_id = question_lookup(course, question_ids)
+
+    for index, item in enumerate(items):
+        if isinstance(item, dict) and "id" in item:
+            plan_question_update(item, questions_by_id, plan, index)
+            # A second update of the same question in this batch is an
+            # error rather than a silent overwrite.
+            if is_question_id(item["id"]):
+                questions_by_id.pop(item["id"], None)
+        else:
+            plan_question_create(item, homeworks_by_slug, plan, index)
+
+
+def is_question_id(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def question_lookup(course, question_ids):
+    if not question_ids:
+        return {}
+
+    questions = Question.objects.filter(
+        homework__course=course,
+        id__in=question_ids,
+    ).annotate(answer_count=Count("answer"))
+    questions_by_id = {}
+    for question in questions:
+        questions_by_id[question.id] = question
+    return questions_by_id
+
+
+def plan_question_create(item, homeworks_by_slug, plan, index):
+    attrs, error = bulk_question_create_attrs(item)
+    if error:
+        plan.add_error("questions", index, error)
+        return
+
+    homework_slug = item.get("homework")
+    if not homework_slug or not isinstance(homework_slug, str):
+        plan.add_error("questions", index, "homework slug is required")
+        return
+
+    homework = homeworks_by_slug.get(homework_slug)
+    if homework is None:
+        plan.add_error(
+            "questions",
+            index,
+            f"Homework '{homework_slug}' not found",
+        )
+        return
+
+    question = Question(homework=homework, **attrs)
+    bulk_question = BulkQuestion(index=index, question=question, created=True)
+    plan.questions.append(bulk_question)
+
+
+def plan_question_update(item, questions_by_id, plan, index):
+    if not is_question_id(item["id"]):
+        plan.add_error("questions", index, "id must be an integer")
+        return
+
+    question = questions_by_id.get(item["id"])
+    if question is None:
+        plan.add_error("questions", index, f"Question {item['id']} not found")
+        return
+
+    for field_name, value in item.items():
+        if field_name in ("id", "homework"):
+            continue
+        if field_name not in QUESTION_PATCH_FIELDS:
+            plan.add_error(
+                "questions",
+                index,
+                f"Cannot update field: {field_name}",
+            )
+            return
+        error = question_field_error(field_name, value)
+        if error:
+            plan.add_error("questions", index, error)
+            return
+        setattr(question, field_name, question_patch_value(field_name, value))
+        plan.question_update_fields.add(field_name)
+
+    bulk_question = BulkQuestion(
+        index=index,
+        question=question,
+        created=False,
+    )
+    plan.questions.append(bulk_question)
@@ -0,0 +1,247 @@
+"""
+Incremental change feed for course submissions, enrollments and scores.
+
+Clients pass the ``next_cursor`` from their previous call as ``cursor`` and
+receive only the rows changed since then, instead of re-downloading the
+full exports. Each change carries the row's current data; a row changed
+several times within one page appears once per change, so consumers
+should apply changes as idempotent upserts keyed by ``type`` and ``id``.
+
+The cursor is the auto-increment ``id``, which is assigned at insert, not at
+commit: a long scoring transaction can commit entries below ids that other
+transactions already made visible. The feed therefore only serves entries
+older than ``COURSE_CHANGES_SAFETY_LAG_SECONDS`` and stops at the first
+younger one, so a late commit lands above every cursor handed out so far
+as long as it commits within the lag of logging its entries. Scoring jobs
+log their entries as the last step before commit for that reason.
+
+When a page ends with nothing left to serve, ``next_cursor`` moves up to the
+newest settled entry of any course, so a quiet course's cursor keeps pace
+with the log. A cursor below the oldest retained entry then really means
+``prune_change_log`` removed changes the client never saw; the feed answers
+410 and the client re-syncs from the full exports.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+
+from accounts.auth import token_required
+
+from courses.models.change_log import (
+    ChangeAction,
+    ChangeLogEntry,
+    ChangeObjectType,
+)
+from courses.models.course import Course, Enrollment
+from courses.models.homework import Submission
+from courses.models.project import ProjectSubmission
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+DEFAULT_SAFETY_LAG_SECONDS = 300
+
+CHANGE_DATA_SOURCES = {
+    ChangeObjectType.HOMEWORK_SUBMISSION.value: (
+        Submission,
+        (
+            "homework_id",
+            "student_id",
+            "enrollment_id",
+            "submitted_at",
+            "questions_score",
+            "faq_score",
+            "learning_in_public_score",
+            "total_score",
+        ),
+    ),
+    ChangeObjectType.PROJECT_SUBMISSION.value: (
+        ProjectSubmission,
+        (
+            "project_id",
+            "student_id",
+            "enrollment_id",
+            "submitted_at",
+            "project_score",
+            "project_faq_score",
+            "project_learning_in_public_score",
+            "peer_review_score",
+            "peer_review_learning_in_public_score",
+            "total_score",
+            "reviewed_enough_peers",
+            "passed",
+        ),
+    ),
+    ChangeObjectType.ENROLLMENT.value: (
+        Enrollment,
+        (
+            "student_id",
+            "display_name",
+            "total_score",
+            "position_on_leaderboard",
+            "certificate_url",
+        ),
+    ),
+}
+
+
+def _parse_int(raw_value, default) -> int:
+    if not raw_value:
+        return default
+    try:
+        value = int(raw_value)
+    except (TypeError, ValueError):
+        return default
+    return value
+
+
+def _parse_limit(raw_value) -> int:
+    value = _parse_int(raw_value, DEFAULT_LIMIT)
+    if value < 1:
+        return DEFAULT_LIMIT
+    return min(value, MAX_LIMIT)
+
+
+def _parse_types(raw_value):
+    if not raw_value:
+        return None
+    types = []
+    for object_type in raw_value.split(","):
+        object_type = object_type.strip()
+        if object_type:
+            types.append(object_type)
+    return types
+
+
+def _safety_horizon():
+    lag_seconds = getattr(
+        settings,
+        "COURSE_CHANGES_SAFETY_LAG_SECONDS",
+        DEFAULT_SAFETY_LAG_SECONDS,
+    )
+    return timezone.now() - timedelta(seconds=lag_seconds)
+
+
+def _cursor_expired(cursor) -> bool:
+    """Whether entries right after ``cursor`` may have been pruned."""
+    if cursor == 0:
+        return False
+    oldest_id = (
+        ChangeLogEntry.objects.order_by("id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    return oldest_id is not None and cursor < oldest_id - 1
+
+
+def _settled_entries(entries, horizon):
+    """Split off entries from the first one logged after ``horizon``."""
+    for index, entry in enumerate(entries):
+        if entry.occurred_at > horizon:
+            return entries[:index], entry
+    return entries, None
+
+
+def _settled_log_position(horizon, unsettled_entry) -> int | None:
+    """Newest settled id in the whole log, below the course's next entry."""
+    settled = ChangeLogEntry.objects.filter(occurred_at__lte=horizon)
+    if unsettled_entry is not None:
+        settled = settled.filter(id__lt=unsettled_entry.id)
+    return settled.order_by("-id").values_list("id", flat=True).first()
+
+
+def _current_rows(entries) -> dict[tuple[str, int], dict]:
+    """Load the current data of every changed row, one query per type."""
+    ids_by_type = {}
+    for entry in entries:
+        if entry.action == ChangeAction.DELETE.value:
+            continue
+        ids_by_type.setdefault(entry.object_type, set()).add(entry.object_id)
+
+    rows = {}
+    for object_type, object_ids in ids_by_type.items():
+        model, fields = CHANGE_DATA_SOURCES[object_type]
+        values = model.objects.filter(id__in=object_ids).values("id", *fields)
+        for row in values:
+            rows[(object_type, row.pop("id"))] = row
+    return rows
+
+
+def _serialize_change(entry, rows) -> dict:
+    # A row deleted after this entry was logged has no data left.
+    data = rows.get((entry.object_type, entry.object_id))
+    return {
+        "cursor": entry.id,
+        "type": entry.object_type,
+        "id": entry.object_id,
+        "action": entry.action,
+        "occurred_at": entry.occurred_at.isoformat(),
+        "data": data,
+    }
+
+
+@require_GET
+@token_required
+def course_changes_view(request, course_slug: str):
+    """List change log entries for a course after ``cursor``, oldest first."""
+    course = get_object_or_404(Course, slug=course_slug)
+
+    cursor = max(_parse_int(request.GET.get("cursor"), 0), 0)
+    if _cursor_expired(cursor):
+        error_payload = {
+            "error": (
+                "Cursor is older than the retained change log; re-sync "
+                "from the full exports and restart with cursor=0"
+            ),
+        }
+        return JsonResponse(error_payload, status=410)
+
+    limit = _parse_limit(request.GET.get("limit"))
+    horizon = _safety_horizon()
+    entries = ChangeLogEntry.objects.filter(
+        course_id=course.id,
+        id__gt=cursor,
+    )
+
+    types = _parse_types(request.GET.get("types"))
+    if types is not None:
+        unknown_types = sorted(set(types) - set(CHANGE_DATA_SOURCES))
+        if unknown_types:
+            error_payload = {
+                "error": f"Unknown change types: {', '.join(unknown_types)}",
+            }
+            return JsonResponse(error_payload, status=400)
+        entries = entries.filter(object_type__in=types)
+
+    # One extra row tells whether another page follows.
+    entries = list(entries.order_by("id")[: limit + 1])
+    has_more = len(entries) > limit
+    entries, unsettled_entry = _settled_entries(entries[:limit], horizon)
+    if unsettled_entry is not None:
+        has_more = False
+
+    rows = _current_rows(entries)
+    changes = []
+    for entry in entries:
+        changes.append(_serialize_change(entry, rows))
+
+    next_cursor = cursor
+    if entries:
+        next_cursor = entries[-1].id
+    if not has_more:
+        # Everything of this course up to here has been served, so skip
+        # past other courses' entries before they get pruned.
+        log_position = _settled_log_position(horizon, unsettled_entry)
+        if log_position is not None:
+            next_cursor = max(next_cursor, log_position)
+
+    response = {
+        "changes": changes,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
+    return JsonResponse(response)
@@ -1,3 +1,16 @@
+"""
+Datamailer send audits, newest first, in keyset pages.
+
+Pass the ``next_cursor`` of a page as ``cursor`` to read the next one; it
+encodes the last row's ``(occurred_at, id)``, so paging stays cheap and
+stable while new sends are being recorded.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
 
@@ -15,11 +28,9 @@ def datamailer_send_audits_view(request):
 
     email = request.GET.get("email")
     if email:
-        # The recipient is stored under response_payload["message"]["email"].
-        # It is persisted lowercased, so lowercase the query value to match.
-        audits = audits.filter(
-            response_payload__message__email=email.strip().lower()
-        )
+        # recipient_email is stored lowercased, so lowercase the query
+        # value to match.
+        audits = audits.filter(recipient_email=email.strip().lower())
 
     template_key = request.GET.get("template_key")
     if template_key:
@@ -37,17 +48,56 @@ def datamailer_send_audits_view(request):
     if send_type:
         audits = audits.filter(send_type=send_type.strip().lower())
 
+    cursor = request.GET.get("cursor")
+    if cursor:
+        position = _decode_cursor(cursor)
+        if position is None:
+            return JsonResponse({"error": "Invalid cursor"}, status=400)
+        occurred_at, audit_id = position
+        audits = audits.filter(
+            Q(occurred_at__lt=occurred_at)
+            | Q(occurred_at=occurred_at, id__lt=audit_id)
+        )
+
     limit = _parse_limit(request.GET.get("limit"))
-    audits = audits.order_by("-occurred_at")[:limit]
+    # One extra row tells whether another page follows.
+    audits = list(audits.order_by("-occurred_at", "-id")[: limit + 1])
+    has_more = len(audits) > limit
+    audits = audits[:limit]
 
     records = []
     for audit in audits:
         records.append(_serialize_audit(audit))
 
-    response = {"audits": records, "count": len(records)}
+    next_cursor = None
+    if has_more:
+        next_cursor = _encode_cursor(audits[-1])
+
+    response = {
+        "audits": records,
+        "count": len(records),
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
     return JsonResponse(response)
 
 
+def _encode_cursor(audit) -> str:
+    position = f"{audit.occurred_at.isoformat()}|{audit.id}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _decode_cursor(raw_value):
+    try:
+        position = base64.urlsafe_b64decode(raw_value.encode()).decode()
+        raw_occurred_at, raw_id = position.rsplit("|", 1)
+        occurred_at = datetime.fromisoformat(raw_occurred_at)
+        audit_id = int(raw_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    return occurred_at, audit_id
+
+
 def _parse_limit(raw_value) -> int:
     if not raw_value:
         return DEFAULT_LIMIT
@@ -2,6 +2,9 @@ from functools import partial
 
 from django.db import transaction
 
+from courses.change_log import record_changes
+from courses.course_page_cache import bump_course_page_version
+from courses.models.change_log import ChangeObjectType
 from courses.models.course import Enrollment
 
 
@@ -12,12 +15,27 @@ def persist_certificate_updates(enrollments_to_update):
             enrollments,
             ["certificate_url"],
         )
+        enrollment_ids_by_course = {}
+        for enrollment in enrollments:
+            course_enrollment_ids = enrollment_ids_by_course.setdefault(
+                enrollment.course_id, []
+            )
+            course_enrollment_ids.append(enrollment.id)
+        for course_id, enrollment_ids in enrollment_ids_by_course.items():
+            bump_course_page_version(course_id)
+            record_changes(
+                course_id,
+                ChangeObjectType.ENROLLMENT,
+                enrollment_ids,
+            )
 
 
 def queue_certificate_notifications(
+    course,
     enrollments_to_notify,
     notification_sender,
 ):
-    for enrollment in enrollments_to_notify.values():
-        send_notification = partial(notification_sender, enrollment)
-        transaction.on_commit(send_notification)
+    if enrollments_to_notify:
+        enrollments = list(enrollments_to_notify.values())
+        send_notifications = partial(notification_sender, course, enrollments)
+        transaction.on_commit(send_notifications)
@@ -0,0 +1,205 @@
+"""Run queued certificate update jobs.
+
+A job is claimed by flipping its status from ``pending`` to ``running``,
+then applied in chunks of ``CERTIFICATE_UPDATE_CHUNK_SIZE``. Each chunk
+saves its certificate URLs and the job's progress in one transaction, and
+queues its notifications when that transaction commits. A job whose worker
+died stops updating ``updated_at``; ``process_certificate_update_jobs``
+reclaims it after ``CERTIFICATE_UPDATE_JOB_STALE_SECONDS`` and resumes at
+``processed_count``.
+
+The API starts a background thread per job after the request commits
+(``CERTIFICATE_UPDATE_JOBS_RUN_IN_BACKGROUND``). The management command is
+the fallback for jobs that thread never finished.
+"""
+
+import logging
+import threading
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from course_management.datamailer.sync.certificates import (
+    queue_certificate_availability_notifications,
+)
+from courses.models.course import CertificateUpdateJob
+
+from api.views.enrollment_certificate_updates import (
+    CERTIFICATE_UPDATE_CHUNK_SIZE,
+    process_certificate_update_chunk,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CERTIFICATE_UPDATE_JOB_STALE_SECONDS = 600
+
+Status = CertificateUpdateJob.Status
+
+
+def start_certificate_update_job(job):
+    """Run ``job`` in a background thread once the request commits."""
+    run_in_background = getattr(
+        settings,
+        "CERTIFICATE_UPDATE_JOBS_RUN_IN_BACKGROUND",
+        False,
+    )
+    if not run_in_background:
+        return
+    start_thread = partial(start_certificate_update_job_thread, job.id)
+    transaction.on_commit(start_thread)
+
+
+def start_certificate_update_job_thread(job_id):
+    thread = threading.Thread(
+        target=run_certificate_update_job_in_thread,
+        args=(job_id,),
+        name=f"certificate-update-job-{job_id}",
+        daemon=True,
+    )
+    thread.start()
+
+
+def run_certificate_update_job_in_thread(job_id):
+    try:
+        job = claim_certificate_update_job(job_id)
+        if job is not None:
+            run_certificate_update_job(job)
+    except Exception:
+        logger.exception("Certificate update job %s failed", job_id)
+    finally:
+        connection.close()
+
+
+def certificate_update_job_stale_before():
+    stale_seconds = getattr(
+        settings,
+        "CERTIFICATE_UPDATE_JOB_STALE_SECONDS",
+        DEFAULT_CERTIFICATE_UPDATE_JOB_STALE_SECONDS,
+    )
+    return timezone.now() - timedelta(seconds=stale_seconds)
+
+
+def claim_certificate_update_job(job_id, *, reclaim_before=None):
+    """Mark a pending (or stale running) job as running and return it.
+
+    Returns ``None`` when another worker holds the job or it is finished.
+    """
+    now = timezone.now()
+    claimable = CertificateUpdateJob.objects.filter(
+        id=job_id,
+        status=Status.PENDING,
+    )
+    claimed = claimable.update(
+        status=Status.RUNNING,
+        started_at=now,
+        updated_at=now,
+    )
+    if not claimed and reclaim_before is not None:
+        stale = CertificateUpdateJob.objects.filter(
+            id=job_id,
+            status=Status.RUNNING,
+            updated_at__lt=reclaim_before,
+        )
+        claimed = stale.update(updated_at=now)
+    if not claimed:
+        return None
+    return CertificateUpdateJob.objects.select_related("course").get(
+        id=job_id
+    )
+
+
+def run_certificate_update_job(job):
+    try:
+        run_certificate_update_job_chunks(job)
+    except Exception as exc:
+        finish_certificate_update_job(job, Status.FAILED, str(exc))
+        raise
+    finish_certificate_update_job(job, Status.SUCCEEDED)
+
+
+def run_certificate_update_job_chunks(job):
+    certificates = job.certificates
+    chunk_size = CERTIFICATE_UPDATE_CHUNK_SIZE
+    for start in range(job.processed_count, len(certificates), chunk_size):
+        chunk = certificates[start:start + chunk_size]
+        with transaction.atomic():
+            updated, errors = process_certificate_update_chunk(
+                job.course,
+                job.course.slug,
+                chunk,
+                queue_certificate_availability_notifications,
+                start=start,
+            )
+            record_certificate_update_job_progress(
+                job,
+                start + len(chunk),
+                len(updated),
+                errors,
+            )
+
+
+def record_certificate_update_job_progress(
+    job,
+    processed_count,
+    updated_count,
+    errors,
+):
+    job.processed_count = processed_count
+    job.updated_count += updated_count
+    job.errors.extend(errors)
+    job.error_count = len(job.errors)
+    job.save(
+        update_fields=[
+            "processed_count",
+            "updated_count",
+            "errors",
+            "error_count",
+            "updated_at",
+        ]
+    )
+
+
+def finish_certificate_update_job(job, status, last_error=""):
+    job.status = status
+    job.last_error = last_error
+    job.finished_at = timezone.now()
+    job.save(
+        update_fields=[
+            "status",
+            "last_error",
+            "finished_at",
+            "updated_at",
+        ]
+    )
+
+
+def process_certificate_update_jobs(limit=10):
+    """Run pending jobs and resume stale running ones, oldest first."""
+    stale_before = certificate_update_job_stale_before()
+    pending = Q(status=Status.PENDING)
+    stale = Q(status=Status.RUNNING, updated_at__lt=stale_before)
+    due_jobs = CertificateUpdateJob.objects.filter(pending | stale)
+    due_jobs = due_jobs.order_by("created_at", "id")
+    job_ids = list(due_jobs.values_list("id", flat=True)[:limit])
+
+    counts = {"processed": 0, "succeeded": 0, "failed": 0}
+    for job_id in job_ids:
+        job = claim_certificate_update_job(
+            job_id,
+            reclaim_before=stale_before,
+        )
+        if job is None:
+            continue
+        counts["processed"] += 1
+        try:
+            run_certificate_update_job(job)
+        except Exception:
+            logger.exception("Certificate update job %s failed", job_id)
+            counts["failed"] += 1
+            continue
+        counts["succeeded"] += 1
+    return counts
@@ -0,0 +1,116 @@
+import json
+
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from accounts.auth import token_required
+from courses.models.course import CertificateUpdateJob, Course
+
+from .enrollment_certificate_job_runs import start_certificate_update_job
+from .enrollment_certificates import certificate_request_updates
+
+MAX_CERTIFICATE_UPDATE_JOB_ITEMS = 100_000
+
+
+@csrf_exempt
+@require_POST
+@token_required
+def create_certificate_update_job_view(request, course_slug: str):
+    """
+    POST /api/courses/<slug>/certificates/jobs - Queue a bulk certificate
+    update. Accepts the same JSON body as ``certificates`` or a multipart
+    ``file`` upload with one JSON object per line.
+    """
+    course = get_object_or_404(Course, slug=course_slug)
+
+    if "file" in request.FILES:
+        certificate_updates, error = _jsonl_certificate_updates(
+            request.FILES["file"]
+        )
+        if error:
+            return JsonResponse({"error": error}, status=400)
+    else:
+        certificate_updates, error_response = certificate_request_updates(
+            request
+        )
+        if error_response:
+            return error_response
+
+    if len(certificate_updates) > MAX_CERTIFICATE_UPDATE_JOB_ITEMS:
+        error_payload = {
+            "error": (
+                "At most "
+                f"{MAX_CERTIFICATE_UPDATE_JOB_ITEMS} certificate updates "
+                "per job"
+            )
+        }
+        return JsonResponse(error_payload, status=400)
+
+    job = CertificateUpdateJob.objects.create(
+        course=course,
+        requested_by=request.user,
+        certificates=certificate_updates,
+        total_count=len(certificate_updates),
+    )
+    start_certificate_update_job(job)
+
+    return JsonResponse(certificate_update_job_to_dict(job), status=202)
+
+
+@require_GET
+@token_required
+def certificate_update_job_view(request, course_slug: str, job_id: int):
+    """
+    GET /api/courses/<slug>/certificates/jobs/<id> - Poll a certificate
+    update job.
+    """
+    job = get_object_or_404(
+        CertificateUpdateJob.objects.select_related("course"),
+        course__slug=course_slug,
+        id=job_id,
+    )
+    return JsonResponse(certificate_update_job_to_dict(job))
+
+
+def _jsonl_certificate_updates(uploaded_file):
+    certificate_updates = []
+    for line_number, raw_line in enumerate(uploaded_file, 1):
+        try:
+            line = raw_line.decode("utf-8").strip()
+        except UnicodeDecodeError:
+            return None, f"Line {line_number} is not valid UTF-8"
+        if not line:
+            continue
+        try:
+            certificate_updates.append(json.loads(line))
+        except json.JSONDecodeError:
+            return None, f"Line {line_number} is not valid JSON"
+
+    if not certificate_updates:
+        return None, "At least one certificate update is required"
+    return certificate_updates, None
+
+
+def _isoformat_or_none(value):
+    if value is None:
+        return None
+    return value.isoformat()
+
+
+def certificate_update_job_to_dict(job):
+    return {
+        "id": job.id,
+        "course": job.course.slug,
+        "status": job.status,
+        "total_count": job.total_count,
+        "processed_count": job.processed_count,
+        "updated_count": job.updated_count,
+        "error_count": job.error_count,
+        "errors": job.errors,
+        "last_error": job.last_error,
+        "created_at": _isoformat_or_none(job.created_at),
+        "started_at": _isoformat_or_none(job.started_at),
+        "finished_at": _isoformat_or_none(job.finished_at),
+    }
@@ -10,6 +10,9 @@ from api.views.enrollment_certificate_validation import (
     validate_certificate_update_items,
 )
 
+# Bounds the email IN lists and the bulk_update batch for one chunk.
+CERTIFICATE_UPDATE_CHUNK_SIZE = 1000
+
 
 @dataclass
 class CertificateApplyResult:
@@ -51,8 +54,34 @@ def process_certificate_updates(
     certificate_updates,
     notification_sender,
 ):
+    updated = []
+    errors = []
+    chunk_size = CERTIFICATE_UPDATE_CHUNK_SIZE
+    for start in range(0, len(certificate_updates), chunk_size):
+        chunk = certificate_updates[start:start + chunk_size]
+        chunk_updated, chunk_errors = process_certificate_update_chunk(
+            course,
+            course_slug,
+            chunk,
+            notification_sender,
+            start=start,
+        )
+        updated.extend(chunk_updated)
+        errors.extend(chunk_errors)
+    return updated, errors
+
+
+def process_certificate_update_chunk(
+    course,
+    course_slug,
+    certificate_updates,
+    notification_sender,
+    start=0,
+):
+    """Apply one chunk; ``start`` is the index of its first item."""
     valid_updates, errors = validate_certificate_update_items(
-        certificate_updates
+        certificate_updates,
+        start,
     )
 
     lookups = certificate_update_lookups(
@@ -66,14 +95,23 @@ def process_certificate_updates(
     )
     errors.extend(apply_batch.errors)
 
-    deliver_certificate_update_batch(apply_batch, notification_sender)
+    deliver_certificate_update_batch(
+        course,
+        apply_batch,
+        notification_sender,
+    )
 
     return apply_batch.updated, errors
 
 
-def deliver_certificate_update_batch(apply_batch, notification_sender):
+def deliver_certificate_update_batch(
+    course,
+    apply_batch,
+    notification_sender,
+):
     persist_certificate_updates(apply_batch.enrollments_to_update)
     queue_certificate_notifications(
+        course,
         apply_batch.enrollments_to_notify,
         notification_sender,
     )
@@ -1,8 +1,8 @@
-def validate_certificate_update_items(certificate_updates):
+def validate_certificate_update_items(certificate_updates, start=0):
     valid_updates = []
     errors = []
 
-    for index, update in enumerate(certificate_updates):
+    for index, update in enumerate(certificate_updates, start):
         valid_update, error = validate_certificate_update_item(index, update)
         if error:
             errors.append(error)
@@ -7,7 +7,7 @@ from django.views.decorators.http import require_POST
 
 from accounts.auth import token_required
 from course_management.datamailer.sync.certificates import (
-    send_certificate_availability_notification,
+    queue_certificate_availability_notifications,
 )
 from courses.models.course import Course
 
@@ -18,7 +18,7 @@ from .enrollment_certificate_updates import process_certificate_updates
 @require_POST
 @token_required
 def bulk_update_enrollment_certificates_view(request, course_slug: str):
-    certificate_updates, error_response = _certificate_request_updates(request)
+    certificate_updates, error_response = certificate_request_updates(request)
     if error_response:
         return error_response
 
@@ -27,13 +27,13 @@ def bulk_update_enrollment_certificates_view(request, course_slug: str):
         course,
         course_slug,
         certificate_updates,
-        send_certificate_availability_notification,
+        queue_certificate_availability_notifications,
     )
 
     return _certificate_update_response(updated, errors)
 
 
-def _certificate_request_updates(request):
+def certificate_request_updates(request):
     try:
         data = json.loads(request.body)
     except json.JSONDecodeError:
@@ -1,57 +1,103 @@
-from collections import Counter
+"""
+Graduates export.
 
-from django.http import JsonResponse
+Graduates are computed with one aggregated query: passed project
+submissions grouped by enrollment, kept when the count reaches the
+course's ``min_projects_to_pass``, with the student's email and names
+joined in. The JSON body is streamed row by row and cached under a
+version key that project scoring, submission, enrollment and
+certificate-name changes bump (see ``courses.graduates_cache``).
+"""
+
+import json
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_GET
 
 from accounts.auth import token_required
+from courses.graduates_cache import (
+    GRADUATES_CACHE_TTL,
+    graduates_cache_key,
+)
 from courses.models.course import Course
 from courses.models.project import ProjectSubmission
 
+GRADUATES_QUERY_CHUNK_SIZE = 2000
+
 
 @require_GET
 @token_required
 def graduates_data_view(request, course_slug: str):
     course = get_object_or_404(Course, slug=course_slug)
-    passed_project_submissions = ProjectSubmission.objects.filter(
-        project__course=course, passed=True
-    ).prefetch_related("enrollment")
-    passed_enrollments = get_passed_enrollments(
-        passed_project_submissions, course.min_projects_to_pass
-    )
 
-    graduates = []
-    for enrollment in passed_enrollments:
-        student = enrollment.student
-        email = student.email
-        name = student.certificate_name or enrollment.display_name
-        graduate_record = {
-            "email": email,
-            "name": name,
-        }
-        graduates.append(graduate_record)
+    cache_key = graduates_cache_key(course.id)
+    cached_body = cache.get(cache_key)
+    if cached_body is not None:
+        content = [cached_body]
+    else:
+        content = stream_graduates_json(course, cache_key)
 
-    response = {"graduates": graduates}
-    json_response = JsonResponse(response)
-    return json_response
+    response = StreamingHttpResponse(
+        content,
+        content_type="application/json",
+    )
+    return response
 
 
-def get_passed_enrollments(passed_project_submissions, min_projects):
+def graduate_rows(course):
+    """Yield ``(email, certificate_name, display_name)`` per graduate."""
+    min_projects = course.min_projects_to_pass
     assert min_projects > 0, "min_projects must be greater than 0"
 
-    counter_passed = Counter()
-    ids_mapping = {}
+    graduates = (
+        ProjectSubmission.objects.filter(
+            project__course=course,
+            passed=True,
+        )
+        .values(
+            "enrollment_id",
+            "enrollment__display_name",
+            "enrollment__student__email",
+            "enrollment__student__certificate_name",
+        )
+        .annotate(passed_projects=Count("id"))
+        .filter(passed_projects__gte=min_projects)
+        .order_by("enrollment_id")
+        .values_list(
+            "enrollment__student__email",
+            "enrollment__student__certificate_name",
+            "enrollment__display_name",
+        )
+    )
+    return graduates.iterator(chunk_size=GRADUATES_QUERY_CHUNK_SIZE)
+
+
+def graduate_record(email, certificate_name, display_name):
+    return {
+        "email": email,
+        "name": certificate_name or display_name,
+    }
+
 
-    for submission in passed_project_submissions:
-        enrollment = submission.enrollment
-        enrollment_id = enrollment.id
-        counter_passed[enrollment_id] += 1
-        ids_mapping[enrollment_id] = enrollment
+def stream_graduates_json(course, cache_key):
+    """Stream ``{"graduates": [...]}`` and cache the full body at the end.
 
-    passed_enrollments = []
-    for enrollment_id, count in counter_passed.items():
-        if count >= min_projects:
-            enrollment = ids_mapping[enrollment_id]
-            passed_enrollments.append(enrollment)
+    A client that disconnects mid-stream closes the generator before the
+    cache write, so only complete bodies are cached.
+    """
+    parts = ['{"graduates": [']
+    yield parts[0]
+    separator = ""
+    for email, certificate_name, display_name in graduate_rows(course):
+        record = graduate_record(email, certificate_name, display_name)
+        part = separator + json.dumps(record)
+        separator = ", "
+        parts.append(part)
+        yield part
+    parts.append("]}")
+    yield parts[-1]
+    cache.set(cache_key, "".join(parts), GRADUATES_CACHE_TTL)
 
-    return passed_enrollments
@@ -40,8 +40,12 @@ def homework_create_due_date(input_data):
     return due_date, None
 
 
-def homework_create_slug(course, homework_data, input_data):
-    slug = homework_data.get("slug") or slugify(input_data.name)
+def homework_requested_slug(homework_data, name):
+    return homework_data.get("slug") or slugify(name)
+
+
+def homework_create_slug(course, homework_data, name):
+    slug = homework_requested_slug(homework_data, name)
     matching_homework = Homework.objects.filter(course=course, slug=slug)
     slug_exists = matching_homework.exists()
     if slug_exists:
@@ -64,7 +68,8 @@ def homework_create_input(homework_data):
     return input_data, None
 
 
-def homework_create_attrs(course, homework_data):
+def homework_create_base_attrs(homework_data):
+    """Validate a create payload; return its attrs without the slug."""
     input_data, error = homework_create_input(homework_data)
     if error:
         return None, error
@@ -77,10 +82,6 @@ def homework_create_attrs(course, homework_data):
     if error:
         return None, error
 
-    slug, error = homework_create_slug(course, homework_data, input_data)
-    if error:
-        return None, error
-
     description = homework_data.get("description", "")
     attrs = {
         "title": input_data.name,
@@ -88,11 +89,23 @@ def homework_create_attrs(course, homework_data):
         "instructions_url": instructions_url,
         "due_date": due_date,
         "state": HomeworkState.CLOSED.value,
-        "slug": slug,
     }
     return attrs, None
 
 
+def homework_create_attrs(course, homework_data):
+    attrs, error = homework_create_base_attrs(homework_data)
+    if error:
+        return None, error
+
+    slug, error = homework_create_slug(course, homework_data, attrs["title"])
+    if error:
+        return None, error
+
+    attrs["slug"] = slug
+    return attrs, None
+
+
 def create_homework(course, homework_data):
     attrs, error = homework_create_attrs(course, homework_data)
     if error:
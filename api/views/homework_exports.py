@@ -2,12 +2,19 @@
 Homework-related data API views.
 
 Provides views for retrieving homework submission data.
+
+The export is streamed: submissions are read in keyset-ordered chunks
+(``id > last_id``), and each chunk's answers are loaded with one extra
+query, so a chunk always costs two queries and memory stays bounded by
+the chunk size regardless of how many submissions the homework has.
 """
 
-from django.http import JsonResponse
-from django.shortcuts import get_object_or_404
-from django.db.models import Prefetch
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.forms.models import model_to_dict
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_GET
 
 from accounts.auth import token_required
@@ -18,48 +25,79 @@ from courses.models.homework import (
     Homework,
 )
 
-
-def homework_export_submission_answers(submission):
-    answer_values = submission.answer_set.values(
-        "question_id", "answer_text", "is_correct"
-    )
-    return list(answer_values)
-
-
-def homework_export_submission_data(submission):
-    answers = homework_export_submission_answers(submission)
-    return {
-        "student_id": submission.student_id,
-        "homework_link": submission.homework_link,
-        "learning_in_public_links": submission.learning_in_public_links,
-        "time_spent_lectures": submission.time_spent_lectures,
-        "time_spent_homework": submission.time_spent_homework,
-        "problems_comments": submission.problems_comments,
-        "faq_contribution_url": submission.faq_contribution_url,
-        "questions_score": submission.questions_score,
-        "faq_score": submission.faq_score,
-        "learning_in_public_score": submission.learning_in_public_score,
-        "total_score": submission.total_score,
-        "answers": answers,
-    }
-
-
-def homework_export_submissions(homework):
-    answers_queryset = Answer.objects.all()
-    answers_prefetch = Prefetch(
-        "answer_set", queryset=answers_queryset
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_FORMAT_JSON = "json"
+EXPORT_FORMAT_NDJSON = "ndjson"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+SUBMISSION_EXPORT_FIELDS = (
+    "student_id",
+    "homework_link",
+    "learning_in_public_links",
+    "time_spent_lectures",
+    "time_spent_homework",
+    "problems_comments",
+    "faq_contribution_url",
+    "questions_score",
+    "faq_score",
+    "learning_in_public_score",
+    "total_score",
+)
+ANSWER_EXPORT_FIELDS = ("question_id", "answer_text", "is_correct")
+
+
+def dump_json(data) -> str:
+    return json.dumps(data, cls=DjangoJSONEncoder)
+
+
+def homework_export_submission_chunks(homework, chunk_size=None):
+    """Yield lists of submission dicts, answers included, ordered by id."""
+    if chunk_size is None:
+        chunk_size = EXPORT_CHUNK_SIZE
+    submissions = homework.submission_set.order_by("id")
+    last_id = 0
+    while True:
+        chunk = list(
+            submissions.filter(id__gt=last_id).values(
+                "id", *SUBMISSION_EXPORT_FIELDS
+            )[:chunk_size]
+        )
+        if not chunk:
+            return
+
+        submission_ids = []
+        for submission in chunk:
+            submission_ids.append(submission["id"])
+        answers_by_submission = homework_export_answers(submission_ids)
+
+        records = []
+        for submission in chunk:
+            submission_id = submission.pop("id")
+            submission["answers"] = answers_by_submission.get(
+                submission_id, []
+            )
+            records.append(submission)
+        yield records
+
+        last_id = submission_ids[-1]
+        if len(chunk) < chunk_size:
+            return
+
+
+def homework_export_answers(submission_ids) -> dict[int, list[dict]]:
+    answers = (
+        Answer.objects.filter(submission_id__in=submission_ids)
+        .order_by("submission_id", "id")
+        .values("submission_id", *ANSWER_EXPORT_FIELDS)
     )
-    submissions = homework.submission_set.prefetch_related(answers_prefetch)
-    all_submissions = submissions.all()
-    return all_submissions
+    answers_by_submission = {}
+    for answer in answers:
+        submission_id = answer.pop("submission_id")
+        answers_by_submission.setdefault(submission_id, []).append(answer)
+    return answers_by_submission
 
 
-def homework_export_payload(course, homework, submissions):
-    submission_records = []
-    for submission in submissions:
-        submission_record = homework_export_submission_data(submission)
-        submission_records.append(submission_record)
-
+def homework_export_header(course, homework):
     course_data = model_to_dict(
         course, exclude=["students", "first_homework_scored"]
     )
@@ -67,10 +105,34 @@ def homework_export_payload(course, homework, submissions):
     return {
         "course": course_data,
         "homework": homework_data,
-        "submissions": submission_records,
     }
 
 
+def stream_homework_export_json(course, homework):
+    """Stream the ``{"course", "homework", "submissions": [...]}`` object."""
+    header = dump_json(homework_export_header(course, homework))
+    # Reopen the header object to append the submissions array.
+    yield header[:-1] + ', "submissions": ['
+    separator = ""
+    for records in homework_export_submission_chunks(homework):
+        parts = []
+        for record in records:
+            parts.append(separator + dump_json(record))
+            separator = ", "
+        yield "".join(parts)
+    yield "]}"
+
+
+def stream_homework_export_ndjson(course, homework):
+    """Stream the course/homework header, then one submission per line."""
+    yield dump_json(homework_export_header(course, homework)) + "\n"
+    for records in homework_export_submission_chunks(homework):
+        lines = []
+        for record in records:
+            lines.append(dump_json(record) + "\n")
+        yield "".join(lines)
+
+
 @require_GET
 @token_required
 def homework_data_view(request, course_slug: str, homework_slug: str):
@@ -80,8 +142,14 @@ def homework_data_view(request, course_slug: str, homework_slug: str):
     homework = get_object_or_404(
         Homework, course=course, slug=homework_slug
     )
-    submissions = homework_export_submissions(homework)
 
-    payload = homework_export_payload(course, homework, submissions)
-    response = JsonResponse(payload)
+    export_format = request.GET.get("format", EXPORT_FORMAT_JSON)
+    if export_format == EXPORT_FORMAT_NDJSON:
+        content = stream_homework_export_ndjson(course, homework)
+        content_type = NDJSON_CONTENT_TYPE
+    else:
+        content = stream_homework_export_json(course, homework)
+        content_type = "application/json"
+
+    response = StreamingHttpResponse(content, content_type=content_type)
     return response
@@ -47,11 +47,15 @@ def project_create_instructions_url(project_data):
     return instructions_url, None
 
 
-def project_create_slug(course, project_data, name):
+def project_requested_slug(project_data, name):
     slug = project_data.get("slug")
     if not slug:
         slug = slugify(name)
+    return slug
+
 
+def project_create_slug(course, project_data, name):
+    slug = project_requested_slug(project_data, name)
     matching_project = Project.objects.filter(course=course, slug=slug)
     slug_exists = matching_project.exists()
     if slug_exists:
@@ -98,7 +102,8 @@ def project_create_dates(input_data):
     return dates, None
 
 
-def project_create_values(course, project_data):
+def project_create_checked_fields(project_data):
+    """Validate a create payload; return its input, URL and dates."""
     input_data, error = project_create_input(project_data)
     if error:
         return None, error
@@ -111,6 +116,16 @@ def project_create_values(course, project_data):
     if error:
         return None, error
 
+    checked_fields = (input_data, instructions_url, dates)
+    return checked_fields, None
+
+
+def project_create_values(course, project_data):
+    checked_fields, error = project_create_checked_fields(project_data)
+    if error:
+        return None, error
+
+    input_data, instructions_url, dates = checked_fields
     slug, error = project_create_slug(course, project_data, input_data.name)
     if error:
         return None, error
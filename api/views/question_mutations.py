@@ -19,7 +19,7 @@ QUESTION_PATCH_FIELDS = {
 }
 
 
-def create_question(homework, question_data):
+def question_create_attrs(question_data):
     text = question_data.get("text")
     if not text:
         return None, "text is required"
@@ -33,15 +33,23 @@ def create_question(homework, question_data):
         "scores_for_correct_answer",
         1,
     )
-    question = Question.objects.create(
-        homework=homework,
-        text=text,
-        question_type=question_type,
-        answer_type=answer_type,
-        possible_answers=possible_answers,
-        correct_answer=correct_answer,
-        scores_for_correct_answer=scores_for_correct_answer,
-    )
+    attrs = {
+        "text": text,
+        "question_type": question_type,
+        "answer_type": answer_type,
+        "possible_answers": possible_answers,
+        "correct_answer": correct_answer,
+        "scores_for_correct_answer": scores_for_correct_answer,
+    }
+    return attrs, None
+
+
+def create_question(homework, question_data):
+    attrs, error = question_create_attrs(question_data)
+    if error:
+        return None, error
+
+    question = Question.objects.create(homework=homework, **attrs)
 
     question_record = question_to_dict(question)
     return question_record, None
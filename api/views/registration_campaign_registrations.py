@@ -1,4 +1,4 @@
-from django.db.models import Count, Q
+from django.db.models import Q
 
 from api.safety import error_response
 from api.views.registration_campaign_serializers import (
@@ -6,6 +6,10 @@ from api.views.registration_campaign_serializers import (
     registration_to_dict,
 )
 from courses.models.course import CourseRegistration
+from courses.registration_campaign_stats import (
+    registration_campaign_stats_row,
+    sorted_counts,
+)
 
 
 def registration_campaign_registrations_payload(campaign, params):
@@ -50,28 +54,19 @@ def apply_registration_exact_filters(queryset, params):
 
 
 def registration_campaign_stats(campaign):
-    stats_base = CourseRegistration.objects.filter(campaign=campaign)
-    total = stats_base.count()
-    by_role = count_by(stats_base, "role")
-    by_country = count_by(stats_base, "country")
-    by_region = count_by(stats_base, "region")
+    stats = registration_campaign_stats_row(campaign)
     return {
-        "total": total,
-        "by_role": by_role,
-        "by_country": by_country,
-        "by_region": by_region,
+        "total": stats.total,
+        "by_role": count_records(stats.by_role),
+        "by_country": count_records(stats.by_country),
+        "by_region": count_records(stats.by_region),
     }
 
 
-def count_by(queryset, field):
+def count_records(buckets):
     counts = []
-    group_count = Count("id")
-    grouped_values = queryset.values(field).annotate(count=group_count).order_by(
-        "-count",
-        field,
-    )
-    for item in grouped_values:
-        count_record = {"value": item[field] or "", "count": item["count"]}
+    for value, count in sorted_counts(buckets):
+        count_record = {"value": value, "count": count}
         counts.append(count_record)
     return counts
 
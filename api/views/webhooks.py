@@ -5,6 +5,9 @@ from django.utils.dateparse import parse_datetime
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
+from course_management.datamailer.preferences import (
+    apply_cached_email_preference_change,
+)
 from course_management.observability import record_event
 from api.views.datamailer_webhook_validation import (
     datamailer_webhook_data,
@@ -66,12 +69,30 @@ def record_datamailer_event(payload, fields):
     return event, created
 
 
-def datamailer_event_response(event, created):
+PREFERENCE_EVENT_VALUES = {
+    "subscription.unsubscribed": False,
+    "subscription.resubscribed": True,
+}
+
+
+def refresh_cached_email_preference(event, created):
+    """Keep the account page's preference read model in step with
+    Datamailer without a remote lookup on the next page load."""
+    if not created or not event.preference_key:
+        return False
+    enabled = PREFERENCE_EVENT_VALUES.get(event.event_type)
+    if enabled is None:
+        return False
+    values = {event.preference_key: enabled}
+    return apply_cached_email_preference_change(event.email, values)
+
+
+def datamailer_event_response(event, created, preference_updated):
     payload = {
         "ok": True,
         "created": created,
         "duplicate_count": event.duplicate_count,
-        "preference_updated": False,
+        "preference_updated": preference_updated,
     }
     response = JsonResponse(payload)
     return response
@@ -88,6 +109,7 @@ def datamailer_event_webhook(request):
     fields = data.fields
 
     event, created = record_datamailer_event(payload, fields)
+    preference_updated = refresh_cached_email_preference(event, created)
     record_event(
         "datamailer.callback_received",
         properties={
@@ -99,5 +121,9 @@ def datamailer_event_webhook(request):
             "audience": event.audience,
         },
     )
-    response = datamailer_event_response(event, created)
+    response = datamailer_event_response(
+        event,
+        created,
+        preference_updated,
+    )
     return response
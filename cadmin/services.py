@@ -1,5 +1,9 @@
 from django.db import transaction
 
+from courses.homework_answers import save_submission_answers
+from courses.homework_question_stats import (
+    calculate_homework_question_statistics,
+)
 from courses.models.homework import Answer
 from courses.models.project import ProjectEvaluationScore
 from courses.leaderboard import update_leaderboard
@@ -20,6 +24,9 @@ def update_homework_submission_from_admin(submission, cleaned_data):
         submission.faq_contribution_url = cleaned_data["faq_contribution_url"]
         rescore_homework_submission(submission)
         apply_homework_admin_score_overrides(submission, cleaned_data)
+        # Edited answers change the per-question counts; the recount
+        # drops the cached stats page once this transaction commits.
+        calculate_homework_question_statistics(submission.homework)
 
         score_changed = submission.total_score != old_total_score
         if score_changed:
@@ -29,12 +36,7 @@ def update_homework_submission_from_admin(submission, cleaned_data):
 
 
 def update_homework_answers_from_admin(submission, answers_by_question):
-    for question, answer_text in answers_by_question:
-        Answer.objects.update_or_create(
-            submission=submission,
-            question=question,
-            defaults={"answer_text": answer_text},
-        )
+    save_submission_answers(submission, answers_by_question)
 
 
 def rescore_homework_submission(submission):
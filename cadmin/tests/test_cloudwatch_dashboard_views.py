@@ -54,6 +54,16 @@ class CloudWatchDashboardViewTests(TestCase):
             "metric_name": "AppEventCount",
             "period_label": "1 hour",
             "region": "eu-central-1",
+            "duration_rows": [
+                {
+                    "event": "homework.scored",
+                    "title": "Homework scoring",
+                    "course_slug": "ml-zoomcamp",
+                    "p50_ms": 1200,
+                    "p95_ms": 4800,
+                    "p95_percent": 100,
+                }
+            ],
         }
 
     @patch(
@@ -71,7 +81,13 @@ class CloudWatchDashboardViewTests(TestCase):
         self.assertContains(response, "Registrations")
         self.assertContains(response, "registration.submitted")
         self.assertContains(response, "CMP/Test")
-        context_mock.assert_called_once_with(environment=None, hours=24)
+        self.assertContains(response, "Scoring durations")
+        self.assertContains(response, "4800 ms")
+        context_mock.assert_called_once_with(
+            environment=None,
+            hours=24,
+            course_slugs=(),
+        )
 
     def test_cloudwatch_dashboard_non_staff_denied(self):
         url = reverse("cadmin_cloudwatch_dashboard")
@@ -155,3 +171,58 @@ class CloudWatchDashboardContextTests(TestCase):
             ],
         )
         now_mock.assert_called()
+
+    @override_settings(
+        OBSERVABILITY_ENVIRONMENT="dev",
+        CLOUDWATCH_APP_METRIC_NAMESPACE="CMP/Test",
+    )
+    @patch(
+        "course_management.observability.cloudwatch_dashboard.timezone.now",
+        return_value=datetime(2026, 7, 9, 12, 35, tzinfo=UTC),
+    )
+    @patch("course_management.observability.cloudwatch_dashboard.boto3.client")
+    def test_cloudwatch_dashboard_context_builds_course_duration_rows(
+        self,
+        boto3_client_mock,
+        now_mock,
+    ):
+        cloudwatch = boto3_client_mock.return_value
+        cloudwatch.get_metric_data.return_value = {
+            "MetricDataResults": [
+                {"Id": "d0_0_p50", "Values": [1200.0]},
+                {"Id": "d0_0_p95", "Values": [4800.0]},
+            ]
+        }
+
+        context = cloudwatch_dashboard_context(
+            hours=6,
+            course_slugs=("ml-zoomcamp",),
+        )
+
+        self.assertEqual(
+            context["duration_rows"],
+            [
+                {
+                    "event": "homework.scored",
+                    "title": "Homework scoring",
+                    "course_slug": "ml-zoomcamp",
+                    "p50_ms": 1200,
+                    "p95_ms": 4800,
+                    "p95_percent": 100,
+                }
+            ],
+        )
+        queries = cloudwatch.get_metric_data.call_args.kwargs[
+            "MetricDataQueries"
+        ]
+        duration_query = next(
+            query for query in queries if query["Id"] == "d0_0_p95"
+        )
+        metric_stat = duration_query["MetricStat"]
+        self.assertEqual(metric_stat["Stat"], "p95")
+        self.assertEqual(metric_stat["Period"], 6 * 3600)
+        self.assertEqual(metric_stat["Metric"]["MetricName"], "EventDuration")
+        self.assertIn(
+            {"Name": "course_slug", "Value": "ml-zoomcamp"},
+            metric_stat["Metric"]["Dimensions"],
+        )
@@ -1,8 +1,14 @@
+from django.core.cache import cache
+
 from cadmin.tests.homework_view_base import (
     AnswerData,
     HomeworkCadminViewTestBase,
     HomeworkSubmissionScoreExpectation,
 )
+from courses.homework_question_stats import (
+    homework_question_stats,
+    question_stats_cache_key,
+)
 
 
 class HomeworkSubmissionEditViewTests(HomeworkCadminViewTestBase):
@@ -101,3 +107,17 @@ class HomeworkSubmissionEditViewTests(HomeworkCadminViewTestBase):
         self.assertEqual(response.status_code, 302)
         enrollment.refresh_from_db()
         self.assertEqual(enrollment.total_score, 10)
+
+    def test_homework_submission_edit_refreshes_question_stats(self):
+        fixture = self.create_homework_submission_edit_fixture()
+        homework = fixture.submission.homework
+        stats = homework_question_stats(homework)
+        self.assertEqual(stats[0].free_form_values, [("5", 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post_homework_submission_answer_edit(fixture)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIsNone(cache.get(question_stats_cache_key(homework.id)))
+        stats = homework_question_stats(homework)
+        self.assertEqual(stats[0].free_form_values, [("4", 1)])
@@ -6,6 +6,7 @@ from django.utils import timezone
 
 from courses.models import (
     HomeworkState,
+    JobProfile,
     User,
     Enrollment,
     Question,
@@ -447,6 +448,47 @@ class HomeworkCadminRescoreTests(HomeworkCadminViewTestBase):
         self.assertEqual(len(messages), 1)
         self.assertIn("scored", messages[0].message.lower())
 
+    def test_rescore_can_record_a_job_profile(self):
+        self.login_admin()
+        url = reverse(
+            "cadmin_homework_rescore",
+            kwargs={
+                "course_slug": self.course.slug,
+                "homework_slug": self.homework.slug,
+            },
+        )
+        self.client.post(url, {"profile": "1"})
+
+        job_profile = JobProfile.objects.get()
+        self.assertEqual(job_profile.job_name, "score_homework_submissions")
+        self.assertEqual(
+            job_profile.target,
+            f"{self.course.slug}/{self.homework.slug}",
+        )
+        phase_names = [phase["name"] for phase in job_profile.phases]
+        self.assertEqual(
+            phase_names,
+            ["load", "score", "persist", "leaderboard", "statistics"],
+        )
+        self.assertIn("query_count", job_profile.phases[0])
+
+        response = self.client.get(reverse("cadmin_job_profiles"))
+        self.assertContains(response, "score_homework_submissions")
+        self.assertContains(response, "leaderboard")
+
+    def test_rescore_without_profile_records_nothing(self):
+        self.login_admin()
+        url = reverse(
+            "cadmin_homework_rescore",
+            kwargs={
+                "course_slug": self.course.slug,
+                "homework_slug": self.homework.slug,
+            },
+        )
+        self.client.post(url)
+
+        self.assertFalse(JobProfile.objects.exists())
+
     def test_rescore_warns_for_unscored_homework(self):
         self.homework.state = HomeworkState.OPEN.value
         self.homework.save()
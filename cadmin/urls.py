@@ -40,6 +40,11 @@ urlpatterns = [
         observability.cloudwatch_dashboard,
         name="cadmin_cloudwatch_dashboard",
     ),
+    path(
+        "profiles/",
+        observability.job_profiles,
+        name="cadmin_job_profiles",
+    ),
     path(
         "<slug:course_slug>/",
         course_admin.course_admin,
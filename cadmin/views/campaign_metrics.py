@@ -1,18 +1,25 @@
-from courses.models.course import CourseRegistration
-
-from .helpers import count_by
+from courses.registration_campaign_stats import (
+    registration_campaign_stats_row,
+    sorted_counts,
+)
 
 
 def registration_campaign_metrics(campaign):
-    registrations = CourseRegistration.objects.filter(campaign=campaign)
-    total = registrations.count()
-    by_role = count_by(registrations, "role")
-    by_country = count_by(registrations, "country")
-    by_region = count_by(registrations, "region")
+    stats = registration_campaign_stats_row(campaign)
+    by_role = count_records(stats.by_role, "role")
+    by_country = count_records(stats.by_country, "country")
+    by_region = count_records(stats.by_region, "region")
     return {
         "campaign": campaign,
-        "total": total,
+        "total": stats.total,
         "by_role": by_role,
         "by_country": by_country,
         "by_region": by_region,
     }
+
+
+def count_records(buckets, field):
+    counts = []
+    for value, count in sorted_counts(buckets):
+        counts.append({field: value, "count": count})
+    return counts
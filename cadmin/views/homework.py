@@ -27,6 +27,13 @@ from .helpers import (
 )
 
 
+def profile_requested(request):
+    """Staff can tick "Profile this run" to record a JobProfile."""
+    if request.POST.get("profile") == "1":
+        return True
+    return None
+
+
 @staff_required
 def homework_score(request, course_slug, homework_slug):
     """Score a homework"""
@@ -38,7 +45,10 @@ def homework_score(request, course_slug, homework_slug):
         Homework, course=course, slug=homework_slug
     )
 
-    status, message = score_homework_submissions(homework.id)
+    status, message = score_homework_submissions(
+        homework.id,
+        profile=profile_requested(request),
+    )
 
     if status == HomeworkScoringStatus.OK:
         messages.success(request, message)
@@ -104,7 +114,10 @@ def homework_rescore(request, course_slug, homework_slug):
     homework.state = HomeworkState.OPEN.value
     homework.save(update_fields=["state"])
 
-    status, message = score_homework_submissions(homework.id)
+    status, message = score_homework_submissions(
+        homework.id,
+        profile=profile_requested(request),
+    )
 
     if status == HomeworkScoringStatus.OK:
         messages.success(request, message)
@@ -7,8 +7,20 @@ from course_management.observability.cloudwatch_dashboard import (
     normalized_hours,
 )
 
+from courses.models import Course, JobProfile
+
 from .helpers import staff_required
 
+# Courses whose scoring durations the dashboard charts; each adds two
+# percentile queries per scoring event.
+DURATION_COURSE_LIMIT = 20
+
+
+def duration_course_slugs() -> tuple[str, ...]:
+    courses = Course.objects.filter(finished=False).order_by("slug")
+    slugs = courses.values_list("slug", flat=True)[:DURATION_COURSE_LIMIT]
+    return tuple(slugs)
+
 
 @staff_required
 def cloudwatch_dashboard(request):
@@ -19,6 +31,7 @@ def cloudwatch_dashboard(request):
         context = cloudwatch_dashboard_context(
             environment=environment,
             hours=hours,
+            course_slugs=duration_course_slugs(),
         )
     except CloudWatchDashboardError as exc:
         context = cloudwatch_dashboard_error_context(
@@ -30,6 +43,16 @@ def cloudwatch_dashboard(request):
     return render(request, "cadmin/cloudwatch_dashboard.html", context)
 
 
+@staff_required
+def job_profiles(request):
+    profiles = JobProfile.objects.select_related("course")[:50]
+    return render(
+        request,
+        "cadmin/job_profiles.html",
+        {"profiles": profiles},
+    )
+
+
 def int_or_default(value, default: int) -> int:
     try:
         return int(value)
@@ -57,20 +57,26 @@ class DatamailerRecipientListMemberClient:
         *,
         include_removed: bool = False,
         limit: int = 10000,
+        cursor: str | None = None,
     ) -> dict[str, Any] | None:
         if include_removed:
             include_removed_value = "true"
         else:
             include_removed_value = "false"
+        params = {
+            "audience": self.config.audience,
+            "client": self.config.client,
+            "include_removed": include_removed_value,
+            "limit": limit,
+        }
+        if cursor is not None:
+            # Cursor pages are ordered by source_object_key; an empty
+            # cursor requests the first page.
+            params["cursor"] = cursor
         request_data = DatamailerRequestData(
             method="GET",
             path=f"/api/recipient-lists/{list_key}/members",
-            params={
-                "audience": self.config.audience,
-                "client": self.config.client,
-                "include_removed": include_removed_value,
-                "limit": limit,
-            },
+            params=params,
         )
         return self.request(request_data)
 
@@ -1,3 +1,4 @@
+import hashlib
 from typing import Any
 
 from course_management import email_templates
@@ -8,26 +9,27 @@ from .urls import public_route_url
 
 
 def _certificate_availability_urls(enrollment):
-    course = enrollment.course
     certificate_path = enrollment.certificate_url.strip()
     certificate_url = public_url(certificate_path)
+    urls = _certificate_availability_course_urls(enrollment.course)
+    urls["certificate_url"] = certificate_url
+    return urls
+
+
+def _certificate_availability_course_urls(course):
     course_kwargs = {"course_slug": course.slug}
     course_url = public_route_url("course", course_kwargs)
     profile_url = public_route_url("account_settings")
     return {
         "course_url": course_url,
-        "certificate_url": certificate_url,
         "profile_url": profile_url,
     }
 
 
-def _certificate_availability_context(enrollment, urls):
-    course = enrollment.course
-    certificate_url = urls["certificate_url"]
+def _certificate_availability_course_context(course, urls):
     return {
         "course_slug": course.slug,
         "course_title": course.title,
-        "certificate_url": certificate_url,
         "course_url": urls["course_url"],
         "profile_url": urls["profile_url"],
         "email_subject": f"Certificate available: {course.title}",
@@ -38,9 +40,6 @@ def _certificate_availability_context(enrollment, urls):
             f"Congratulations - your certificate for {course.title} "
             "is available."
         ),
-        "download_text": (
-            f"You can download your certificate here: {certificate_url}"
-        ),
         "notification_category": "course-related emails",
         "notification_footer": (
             "You are receiving this because general course-related "
@@ -49,6 +48,27 @@ def _certificate_availability_context(enrollment, urls):
     }
 
 
+def _certificate_availability_learner_context(certificate_url):
+    return {
+        "certificate_url": certificate_url,
+        "download_text": (
+            f"You can download your certificate here: {certificate_url}"
+        ),
+    }
+
+
+def _certificate_availability_context(enrollment, urls):
+    context = _certificate_availability_course_context(
+        enrollment.course,
+        urls,
+    )
+    learner_context = _certificate_availability_learner_context(
+        urls["certificate_url"]
+    )
+    context.update(learner_context)
+    return context
+
+
 def _certificate_availability_metadata(enrollment):
     return {
         "source": "course-management-platform",
@@ -114,3 +134,89 @@ def certificate_availability_notification_payload(
         config, enrollment, email
     )
     return _add_from_email_if_configured(payload, config)
+
+
+def certificate_availability_batch_key(course, enrollments) -> str:
+    """Return a stable key for one batch of certificate notifications."""
+    enrollment_ids = []
+    for enrollment in enrollments:
+        enrollment_ids.append(str(enrollment.pk))
+    joined_ids = ",".join(sorted(enrollment_ids))
+    digest = hashlib.sha256(joined_ids.encode()).hexdigest()[:16]
+    return f"certificate-available:{course.slug}:{digest}"
+
+
+def _certificate_availability_member(enrollment):
+    email = _certificate_availability_recipient(enrollment)
+    if email is None:
+        return None
+
+    certificate_path = enrollment.certificate_url.strip()
+    certificate_url = public_url(certificate_path)
+    source_object_key = f"enrollment:{enrollment.pk}"
+    metadata = _certificate_availability_learner_context(certificate_url)
+    metadata.update(
+        {
+            "enrollment_id": enrollment.pk,
+            "user_id": enrollment.student_id,
+            "source_object_key": source_object_key,
+        }
+    )
+    return {
+        "source_object_key": source_object_key,
+        "email": email,
+        "status": "active",
+        "metadata": metadata,
+    }
+
+
+def certificate_availability_batch_payload(
+    course,
+    enrollments,
+) -> dict[str, Any] | None:
+    """Build one transient recipient-list send for many new certificates.
+
+    Course-level text goes in the shared context; each member's metadata
+    carries its own certificate URL and is merged into that learner's
+    template context.
+    """
+    config = DatamailerConfig.from_settings()
+    if config is None:
+        return None
+
+    members = []
+    for enrollment in enrollments:
+        member = _certificate_availability_member(enrollment)
+        if member is not None:
+            members.append(member)
+    if not members:
+        return None
+
+    batch_key = certificate_availability_batch_key(course, enrollments)
+    urls = _certificate_availability_course_urls(course)
+    context = _certificate_availability_course_context(course, urls)
+    metadata = {
+        "source": "course-management-platform",
+        "event": "certificate_availability",
+        "preference_key": "email_course_updates",
+        "cmp_preference_key": "email_course_updates",
+        "course_slug": course.slug,
+    }
+    payload = {
+        "audience": config.audience,
+        "client": config.client,
+        "template_key": (
+            email_templates.CERTIFICATE_AVAILABILITY_NOTIFICATION
+        ),
+        "category_tag": "course-updates",
+        "idempotency_key": batch_key,
+        "context": context,
+        "metadata": metadata,
+        "list": {
+            "key": batch_key,
+            "name": f"{course.title} certificate notifications",
+            "metadata": metadata,
+        },
+        "members": members,
+    }
+    return _add_from_email_if_configured(payload, config)
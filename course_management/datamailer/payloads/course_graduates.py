@@ -39,6 +39,37 @@ def course_graduate_recipient_list_payload(
     return list_key, payload
 
 
+def course_graduates_recipient_list_payload(
+    course,
+    enrollments,
+) -> tuple[str, dict[str, Any]] | None:
+    """Return one graduates-list bulk upsert covering many enrollments."""
+    config = DatamailerConfig.from_settings()
+    if config is None:
+        return None
+
+    list_data = None
+    members = []
+    for enrollment in enrollments:
+        member_data = _course_graduate_member_data(enrollment)
+        if member_data is None:
+            continue
+        source_object_key, member_payload = member_data
+        if list_data is None:
+            list_data = member_payload["list"]
+        member = recipient_list_send_member_payload(
+            source_object_key,
+            member_payload,
+        )
+        members.append(member)
+    if not members:
+        return None
+
+    payload = bulk_recipient_list_payload(config, list_data, members)
+    list_key = course_graduates_list_key(course)
+    return list_key, payload
+
+
 def _course_graduate_certificate_url(enrollment) -> str:
     certificate_url = enrollment.certificate_url or ""
     stripped_certificate_url = certificate_url.strip()
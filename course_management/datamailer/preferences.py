@@ -1,24 +1,41 @@
-import logging
+from django.db import transaction
+from django.utils import timezone
 
-import requests
+from course_management.datamailer_outbox import (
+    DatamailerOutboxEventData,
+    enqueue_datamailer_outbox_event,
+)
+from data.models import (
+    DatamailerEmailPreference,
+    DatamailerOutboxEvent,
+    DatamailerOutboxStatus,
+)
 
-from .client import DatamailerClient, DatamailerConfig
+from .client import DatamailerConfig
 from .preference_categories import (
     email_preference_category_tags,
     email_preference_payloads,
     email_preference_values_from_response,
 )
 
-logger = logging.getLogger(__name__)
+OPEN_OUTBOX_STATUSES = (
+    DatamailerOutboxStatus.PENDING,
+    DatamailerOutboxStatus.PROCESSING,
+    DatamailerOutboxStatus.RETRYING,
+)
 
 
-def _normalized_user_email(user) -> str:
-    email = user.email or ""
+def _normalized_email(email) -> str:
+    email = email or ""
     stripped_email = email.strip()
     normalized_email = stripped_email.lower()
     return normalized_email
 
 
+def _normalized_user_email(user) -> str:
+    return _normalized_email(user.email)
+
+
 def _datamailer_user_context(user):
     email = _normalized_user_email(user)
     if not email:
@@ -31,53 +48,144 @@ def _datamailer_user_context(user):
     return email, config
 
 
-def _contact_preferences_response(user, email, config):
-    client = DatamailerClient(config)
-    try:
-        category_tags = email_preference_category_tags()
-        return client.contacts.contact_preferences(
-            email,
-            category_tags=category_tags,
+def cached_email_preferences(email: str) -> dict[str, bool] | None:
+    """Return the synced read model for ``email``, or None if there is none.
+
+    Rows that only hold local changes don't count: they lack the
+    categories nobody has touched yet.
+    """
+    email = _normalized_email(email)
+    preference = DatamailerEmailPreference.objects.filter(
+        email=email,
+        synced_at__isnull=False,
+    ).first()
+    if preference is None:
+        return None
+    return preference.preferences
+
+
+def store_email_preferences(email: str, values: dict[str, bool]) -> None:
+    email = _normalized_email(email)
+    DatamailerEmailPreference.objects.update_or_create(
+        email=email,
+        defaults={
+            "preferences": values,
+            "synced_at": timezone.now(),
+        },
+    )
+
+
+def _locked_email_preference(email):
+    preference, _created = (
+        DatamailerEmailPreference.objects.select_for_update().get_or_create(
+            email=email,
         )
-    except requests.RequestException:
-        logger.exception(
-            "Datamailer preference lookup failed for user_id=%s",
-            user.pk,
+    )
+    return preference
+
+
+def apply_cached_email_preference_change(
+    email: str,
+    values: dict[str, bool],
+) -> bool:
+    """Merge a preference change into the read model.
+
+    Without a synced row the change is kept as a local overlay that the
+    next remote fetch is patched with, since Datamailer may not have
+    applied the queued update yet.
+    """
+    email = _normalized_email(email)
+    with transaction.atomic():
+        preference = _locked_email_preference(email)
+        preference.preferences = preference.preferences | values
+        preference.save(update_fields=["preferences", "updated_at"])
+    return True
+
+
+def refresh_email_preferences_from_response(
+    email: str,
+    response,
+) -> dict[str, bool]:
+    """Store a remote preference lookup, keeping newer local changes.
+
+    A row that is already synced was kept current by write-through and
+    webhooks, so it wins over the fetched values.
+    """
+    email = _normalized_email(email)
+    remote_values = email_preference_values_from_response(response)
+    with transaction.atomic():
+        preference = _locked_email_preference(email)
+        if preference.synced_at is not None:
+            return preference.preferences
+        preference.preferences = remote_values | preference.preferences
+        preference.synced_at = timezone.now()
+        preference.save(
+            update_fields=["preferences", "synced_at", "updated_at"],
         )
-        if config.strict:
-            raise
+    return preference.preferences
+
+
+def _email_preferences_fetch_key(email):
+    return f"contact.preferences-fetch:{email}"
+
+
+def _enqueue_email_preferences_fetch(user, email):
+    idempotency_key = _email_preferences_fetch_key(email)
+    queued = DatamailerOutboxEvent.objects.filter(
+        idempotency_key=idempotency_key,
+        status__in=OPEN_OUTBOX_STATUSES,
+    )
+    if queued.exists():
         return None
+    event_data = DatamailerOutboxEventData(
+        event_type="contact.preferences_fetch",
+        idempotency_key=idempotency_key,
+        ordering_key=f"user:{user.pk}",
+        payload={
+            "email": email,
+            "category_tags": email_preference_category_tags(),
+            "user_id": user.pk,
+        },
+    )
+    return enqueue_datamailer_outbox_event(event_data)
 
 
 def get_email_preferences_for_user(user) -> dict[str, bool] | None:
+    """Read preferences without calling Datamailer.
+
+    On a miss a fetch is queued in the outbox and None is returned, so
+    the page shows preferences as unavailable until the fetch lands.
+    """
     context = _datamailer_user_context(user)
     if context is None:
         return None
 
-    email, config = context
-    response = _contact_preferences_response(user, email, config)
-    if response is None:
-        return None
-    return email_preference_values_from_response(response)
-
-
-def _log_preference_update_error(user):
-    logger.exception(
-        "Datamailer preference update failed for user_id=%s",
-        user.pk,
+    email, _config = context
+    cached = cached_email_preferences(email)
+    if cached is not None:
+        return cached
+
+    _enqueue_email_preferences_fetch(user, email)
+    return None
+
+
+def _enqueue_email_preference_update(user, email, categories):
+    tags = []
+    for category in categories:
+        tags.append(f"{category['tag']}={category['enabled']}")
+    event_data = DatamailerOutboxEventData(
+        event_type="contact.preferences_update",
+        idempotency_key=(
+            f"contact.preferences-update:{email}:{','.join(tags)}"
+        ),
+        ordering_key=f"user:{user.pk}",
+        payload={
+            "email": email,
+            "categories": categories,
+            "user_id": user.pk,
+        },
     )
-
-
-def _send_email_preference_update(user, email, config, categories):
-    client = DatamailerClient(config)
-    try:
-        client.contacts.update_contact_preferences(email, categories)
-    except requests.RequestException:
-        _log_preference_update_error(user)
-        if config.strict:
-            raise
-        return False
-    return True
+    return enqueue_datamailer_outbox_event(event_data)
 
 
 def update_email_preferences_for_user(
@@ -92,5 +200,7 @@ def update_email_preferences_for_user(
     if not categories:
         return False
 
-    email, config = context
-    return _send_email_preference_update(user, email, config, categories)
+    email, _config = context
+    _enqueue_email_preference_update(user, email, categories)
+    apply_cached_email_preference_change(email, values)
+    return True
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 import requests
@@ -7,16 +8,23 @@ from course_management.datamailer.client import (
     DatamailerClient,
     DatamailerConfig,
 )
-from course_management.datamailer.recipient_list_drift import member_drift
+from course_management.datamailer.recipient_list_drift import (
+    DRIFT_LABELS,
+    expected_member_digests,
+    member_drift,
+    merge_join_drift,
+    ordered_member_digests,
+)
 
 
 @dataclass(frozen=True)
 class AuditRunData:
     client: DatamailerClient
     config: DatamailerConfig
-    batches: dict
+    batches: Iterable[tuple[str, dict]]
     limit: int
     repair: bool
+    paged: bool = False
 
 
 @dataclass(frozen=True)
@@ -29,6 +37,12 @@ class AuditListData:
     repair: bool
 
 
+@dataclass
+class AuditTotals:
+    list_count: int = 0
+    drift_count: int = 0
+
+
 @dataclass(frozen=True)
 class DriftReportData:
     list_key: str
@@ -38,8 +52,8 @@ class DriftReportData:
 
 
 def audit_batches_against_datamailer(data, write_line):
-    drift_count = 0
-    for list_key, payload in data.batches.items():
+    totals = AuditTotals()
+    for list_key, payload in data.batches:
         list_data = AuditListData(
             client=data.client,
             config=data.config,
@@ -48,10 +62,14 @@ def audit_batches_against_datamailer(data, write_line):
             limit=data.limit,
             repair=data.repair,
         )
-        drift = audit_list(list_data, write_line)
-        if drift["has_drift"]:
-            drift_count += 1
-    return drift_count
+        if data.paged:
+            has_drift = audit_list_paged(list_data, write_line)
+        else:
+            has_drift = audit_list(list_data, write_line)["has_drift"]
+        totals.list_count += 1
+        if has_drift:
+            totals.drift_count += 1
+    return totals
 
 
 def audit_list(data, write_line):
@@ -71,12 +89,49 @@ def audit_list(data, write_line):
     return drift_data.drift
 
 
-def list_members(data):
+def audit_list_paged(data, write_line):
+    """Merge-join CMP members against Datamailer pages of ``limit``.
+
+    Drifted members are written as they are found; only digests of the
+    current page are held for the Datamailer side.
+    """
+
+    def report(label, source_object_key):
+        write_line(f"{label}: {source_object_key}")
+
+    expected = expected_member_digests(data.payload)
+    actual_members = iter_member_pages(data)
+    actual = ordered_member_digests(actual_members, data.list_key)
+    counts = merge_join_drift(expected, actual, report)
+    print_drift_counts(write_line, data.list_key, counts)
+
+    if data.repair and counts.has_drift:
+        repair_list(data, write_line)
+    return counts.has_drift
+
+
+def iter_member_pages(data):
+    cursor = ""
+    while True:
+        response = list_members(data, cursor=cursor) or {}
+        yield from response.get("members", [])
+        if not response.get("has_more"):
+            return
+        cursor = response.get("next_cursor")
+        if not cursor:
+            raise CommandError(
+                f"Datamailer returned has_more without next_cursor for "
+                f"{data.list_key}."
+            )
+
+
+def list_members(data, **page):
     try:
         return data.client.recipient_lists.members.list_members(
             data.list_key,
             include_removed=False,
             limit=data.limit,
+            **page,
         )
     except requests.RequestException as exc:
         if data.config.strict:
@@ -121,11 +176,17 @@ def print_drift(write_line, data):
         f"email_mismatches={len(data.drift['email_mismatches'])} "
         f"metadata_mismatches={len(data.drift['metadata_mismatches'])}"
     )
-    for label in (
-        "missing",
-        "unexpected",
-        "email_mismatches",
-        "metadata_mismatches",
-    ):
+    for label in DRIFT_LABELS:
         if data.drift[label]:
             write_line(f"{label}: {', '.join(data.drift[label])}")
+
+
+def print_drift_counts(write_line, list_key, counts):
+    labels = counts.labels
+    write_line(
+        f"Audited {list_key}: expected={counts.expected} "
+        f"actual={counts.actual} missing={labels['missing']} "
+        f"unexpected={labels['unexpected']} "
+        f"email_mismatches={labels['email_mismatches']} "
+        f"metadata_mismatches={labels['metadata_mismatches']}"
+    )
@@ -1,4 +1,4 @@
-from collections import OrderedDict
+from dataclasses import dataclass
 
 from django.core.management.base import CommandError
 
@@ -10,62 +10,108 @@ from course_management.datamailer.recipient_list_sources import (
     RecipientListFilters,
 )
 
+# Rows fetched per database round trip while streaming a source queryset.
+DEFAULT_QUERY_CHUNK_SIZE = 2000
 
-def add_member_to_batches(batches, item):
+
+@dataclass
+class RecipientListBatchTotals:
+    list_count: int = 0
+    member_count: int = 0
+    last_list_key: str | None = None
+
+    def add(self, list_key, payload):
+        if list_key != self.last_list_key:
+            self.list_count += 1
+            self.last_list_key = list_key
+        self.member_count += len(payload["members"])
+
+
+def new_batch(payload):
+    return {
+        "audience": payload["audience"],
+        "client": payload["client"],
+        "list": payload["list"],
+        "members": [],
+    }
+
+
+def batch_member(item):
     payload = item.payload
-    batch = batches.setdefault(
-        item.list_key,
-        {
-            "audience": payload["audience"],
-            "client": payload["client"],
-            "list": payload["list"],
-            "members": [],
-        },
-    )
-    member = {
+    return {
         "source_object_key": item.source_object_key,
         "email": payload["member"]["email"],
         "status": payload["member"]["status"],
         "metadata": payload["member"]["metadata"],
     }
-    batch["members"].append(member)
-
-
-def add_payload_members_to_batches(batches, list_key, payload):
-    batch = batches.setdefault(
-        list_key,
-        {
-            "audience": payload["audience"],
-            "client": payload["client"],
-            "list": payload["list"],
-            "members": [],
-        },
-    )
-    batch["members"].extend(payload["members"])
 
 
-def build_batches(
-    kind, *, course_slug="", homework_slug="", project_slug=""
-):
+def recipient_list_source(kind):
     source = RECIPIENT_LIST_SOURCES.get(kind)
     if source is None:
         raise CommandError(f"Unknown recipient list kind: {kind}")
+    return source
 
-    queryset_for, payload_for = source
-    batches = OrderedDict()
-    filters = RecipientListFilters(
-        course_slug=course_slug,
-        homework_slug=homework_slug,
-        project_slug=project_slug,
-    )
+
+def iter_source_members(kind, filters, *, chunk_size):
+    """Yield ``(list_key, list_payload, members)`` for each source row.
+
+    Source querysets are ordered by list, so each list's rows arrive
+    contiguously and callers can flush a list as soon as the key changes.
+    """
+    queryset_for, payload_for = recipient_list_source(kind)
     objects = queryset_for(filters)
-    for obj in objects:
+    for obj in objects.iterator(chunk_size=chunk_size):
         item = payload_for(obj)
         if item is None:
             continue
         if isinstance(item, RecipientListMemberPayload):
-            add_member_to_batches(batches, item)
+            member = batch_member(item)
+            yield item.list_key, item.payload, [member]
             continue
         list_key, payload = item
-        add_payload_members_to_batches(batches, list_key, payload)
-    return batches
+        yield list_key, payload, payload["members"]
+
+
+def iter_batches(
+    kind,
+    *,
+    course_slug="",
+    homework_slug="",
+    project_slug="",
+    max_members=None,
+    chunk_size=DEFAULT_QUERY_CHUNK_SIZE,
+):
+    """Stream ``(list_key, payload)`` batches, holding one list at a time.
+
+    ``max_members`` splits a large list into several batches. Only pass it
+    for additive upserts: reconcile and import-by-reference runs remove
+    members absent from the payload, so they need each list whole.
+    """
+    filters = RecipientListFilters(
+        course_slug=course_slug,
+        homework_slug=homework_slug,
+        project_slug=project_slug,
+    )
+    current_key = None
+    current_batch = None
+    members_by_list = iter_source_members(
+        kind,
+        filters,
+        chunk_size=chunk_size,
+    )
+    for list_key, payload, members in members_by_list:
+        if current_batch is not None and list_key != current_key:
+            yield current_key, current_batch
+            current_batch = None
+        if current_batch is None:
+            current_key = list_key
+            current_batch = new_batch(payload)
+        current_batch["members"].extend(members)
+        if max_members and len(current_batch["members"]) >= max_members:
+            yield current_key, current_batch
+            current_batch = None
+
+    if current_batch is not None:
+        yield current_key, current_batch
+
@@ -1,4 +1,16 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import hashlib
+
+from django.core.management.base import CommandError
+
+from course_management.datamailer.recipient_list_hashes import canonical_json
+
+DRIFT_LABELS = (
+    "missing",
+    "unexpected",
+    "email_mismatches",
+    "metadata_mismatches",
+)
 
 
 @dataclass(frozen=True)
@@ -79,12 +91,113 @@ def member_field_mismatches(expected, actual, shared_keys, field):
 
 
 def has_member_drift(drift):
-    for label in (
-        "missing",
-        "unexpected",
-        "email_mismatches",
-        "metadata_mismatches",
-    ):
+    for label in DRIFT_LABELS:
         if drift[label]:
             return True
     return False
+
+
+@dataclass(frozen=True)
+class MemberDigest:
+    email: str
+    metadata_sha256: str
+
+
+@dataclass
+class DriftCounts:
+    expected: int = 0
+    actual: int = 0
+    labels: dict = field(
+        default_factory=lambda: dict.fromkeys(DRIFT_LABELS, 0)
+    )
+
+    @property
+    def has_drift(self):
+        return any(self.labels.values())
+
+
+def member_digest(member):
+    record = active_member_record(member)
+    metadata_json = canonical_json(record["metadata"])
+    metadata_sha256 = hashlib.sha256(metadata_json.encode()).hexdigest()
+    return MemberDigest(
+        email=record["email"],
+        metadata_sha256=metadata_sha256,
+    )
+
+
+def active_member_digests(raw_members):
+    for member in raw_members:
+        if member.get("status", "active") == "removed":
+            continue
+        yield member["source_object_key"], member_digest(member)
+
+
+def expected_member_digests(payload):
+    """Digest a CMP list payload, sorted for the merge join.
+
+    Source rows arrive in primary-key order, which differs from string
+    order of ``source_object_key`` (``user:10`` sorts before ``user:9``).
+    """
+    digests = dict(active_member_digests(payload["members"]))
+    for source_object_key in sorted(digests):
+        yield source_object_key, digests[source_object_key]
+
+
+def ordered_member_digests(raw_members, list_key):
+    """Digest streamed Datamailer members, requiring ascending keys."""
+    previous_key = None
+    for source_object_key, digest in active_member_digests(raw_members):
+        if previous_key is not None and source_object_key <= previous_key:
+            raise CommandError(
+                f"Datamailer members for {list_key} are not ordered by "
+                "source_object_key; rerun without --paged."
+            )
+        previous_key = source_object_key
+        yield source_object_key, digest
+
+
+def merge_join_drift(expected, actual, report):
+    """Walk two key-sorted digest streams once and count drift.
+
+    ``report(label, source_object_key)`` is called as each drifted member
+    is found, so neither side needs to be held as a full dict.
+    """
+    counts = DriftCounts()
+    expected_item = next(expected, None)
+    actual_item = next(actual, None)
+    while expected_item is not None or actual_item is not None:
+        if actual_item is None or (
+            expected_item is not None and expected_item[0] < actual_item[0]
+        ):
+            counts.expected += 1
+            record_drift(counts, report, "missing", expected_item[0])
+            expected_item = next(expected, None)
+            continue
+
+        if expected_item is None or actual_item[0] < expected_item[0]:
+            counts.actual += 1
+            record_drift(counts, report, "unexpected", actual_item[0])
+            actual_item = next(actual, None)
+            continue
+
+        counts.expected += 1
+        counts.actual += 1
+        compare_member_digests(counts, report, expected_item, actual_item)
+        expected_item = next(expected, None)
+        actual_item = next(actual, None)
+    return counts
+
+
+def compare_member_digests(counts, report, expected_item, actual_item):
+    source_object_key, expected_digest = expected_item
+    _actual_key, actual_digest = actual_item
+    if expected_digest.email != actual_digest.email:
+        record_drift(counts, report, "email_mismatches", source_object_key)
+    if expected_digest.metadata_sha256 != actual_digest.metadata_sha256:
+        record_drift(counts, report, "metadata_mismatches", source_object_key)
+
+
+def record_drift(counts, report, label, source_object_key):
+    counts.labels[label] += 1
+    report(label, source_object_key)
@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+import hashlib
+import json
+
+from django.db import transaction
+from django.utils import timezone
+
+from data.models import (
+    DatamailerRecipientListMemberHash,
+    DatamailerRecipientListSyncState,
+)
+
+# Keeps each ``source_object_key__in`` lookup under SQLite's bound
+# parameter limit.
+MEMBER_HASH_LOOKUP_CHUNK_SIZE = 500
+
+# Whole-list sync modes. Only additive imports may be skipped on an
+# unchanged hash: reconcile runs also clean up members removed on the
+# Datamailer side, so they always go out.
+RECONCILE_SYNC_MODE = "reconcile"
+IMPORT_SYNC_MODE = "import"
+IMPORT_REMOVE_ABSENT_SYNC_MODE = "import-remove-absent"
+
+
+@dataclass(frozen=True)
+class ChangedMembers:
+    payload: dict
+    member_hashes: dict[str, str]
+    unchanged_count: int
+
+
+@dataclass(frozen=True)
+class RecipientListSyncRecord:
+    kind: str
+    list_key: str
+    mode: str
+    content_sha256: str
+    member_hashes: dict[str, str]
+
+
+def canonical_json(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def list_header_json(payload):
+    # List metadata is copied from whichever member opens the batch, so it
+    # is left out; each member's own metadata is already in its hash.
+    recipient_list = payload["list"]
+    header = {
+        "audience": payload["audience"],
+        "client": payload["client"],
+        "type": recipient_list["type"],
+        "name": recipient_list["name"],
+    }
+    return canonical_json(header)
+
+
+def member_content_sha256(header_json, member):
+    """Hash a member together with its list header.
+
+    A renamed list then counts as a change for every member, so the new
+    name still reaches Datamailer.
+    """
+    member_json = canonical_json(member)
+    content = f"{header_json}\n{member_json}".encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def member_content_hashes(payload):
+    header_json = list_header_json(payload)
+    hashes = {}
+    for member in payload["members"]:
+        source_object_key = member["source_object_key"]
+        member_sha256 = member_content_sha256(header_json, member)
+        hashes[source_object_key] = member_sha256
+    return hashes
+
+
+def list_content_sha256(member_hashes):
+    digest = hashlib.sha256()
+    for source_object_key in sorted(member_hashes):
+        member_sha256 = member_hashes[source_object_key]
+        digest.update(f"{source_object_key}={member_sha256}\n".encode())
+    return digest.hexdigest()
+
+
+def stored_member_hashes(list_key, source_object_keys):
+    stored = {}
+    for start in range(
+        0,
+        len(source_object_keys),
+        MEMBER_HASH_LOOKUP_CHUNK_SIZE,
+    ):
+        end = start + MEMBER_HASH_LOOKUP_CHUNK_SIZE
+        keys_chunk = source_object_keys[start:end]
+        rows = DatamailerRecipientListMemberHash.objects.filter(
+            list_key=list_key,
+            source_object_key__in=keys_chunk,
+        ).values_list("source_object_key", "member_sha256")
+        stored.update(rows)
+    return stored
+
+
+def changed_members(list_key, payload):
+    member_hashes = member_content_hashes(payload)
+    source_object_keys = list(member_hashes)
+    stored = stored_member_hashes(list_key, source_object_keys)
+    members = []
+    changed_hashes = {}
+    for member in payload["members"]:
+        source_object_key = member["source_object_key"]
+        member_sha256 = member_hashes[source_object_key]
+        if stored.get(source_object_key) == member_sha256:
+            continue
+        members.append(member)
+        changed_hashes[source_object_key] = member_sha256
+    changed_payload = payload | {"members": members}
+    unchanged_count = len(payload["members"]) - len(members)
+    return ChangedMembers(
+        payload=changed_payload,
+        member_hashes=changed_hashes,
+        unchanged_count=unchanged_count,
+    )
+
+
+def record_member_hashes(list_key, member_hashes):
+    now = timezone.now()
+    rows = []
+    for source_object_key, member_sha256 in member_hashes.items():
+        row = DatamailerRecipientListMemberHash(
+            list_key=list_key,
+            source_object_key=source_object_key,
+            member_sha256=member_sha256,
+            synced_at=now,
+        )
+        rows.append(row)
+    DatamailerRecipientListMemberHash.objects.bulk_create(
+        rows,
+        batch_size=MEMBER_HASH_LOOKUP_CHUNK_SIZE,
+        update_conflicts=True,
+        unique_fields=["list_key", "source_object_key"],
+        update_fields=["member_sha256", "synced_at"],
+    )
+
+
+def forget_removed_member(list_key, source_object_key):
+    """Drop the hashes that a member removal makes stale.
+
+    Otherwise re-adding the member with the same content would be
+    skipped as unchanged, by member or by whole list, and never reach
+    Datamailer again.
+    """
+    with transaction.atomic():
+        DatamailerRecipientListMemberHash.objects.filter(
+            list_key=list_key,
+            source_object_key=source_object_key,
+        ).delete()
+        DatamailerRecipientListSyncState.objects.filter(
+            list_key=list_key,
+        ).delete()
+
+
+def list_content_unchanged(list_key, mode, content_sha256):
+    state = DatamailerRecipientListSyncState.objects.filter(
+        list_key=list_key,
+        mode=mode,
+    ).first()
+    if state is None:
+        return False
+    return state.content_sha256 == content_sha256
+
+
+def record_whole_list_sync(record):
+    """Store the list hash and replace its member hashes.
+
+    Whole-list syncs remove absent members on the Datamailer side, so
+    members missing from the payload lose their stored hash too.
+    """
+    member_count = len(record.member_hashes)
+    with transaction.atomic():
+        DatamailerRecipientListSyncState.objects.update_or_create(
+            list_key=record.list_key,
+            mode=record.mode,
+            defaults={
+                "kind": record.kind,
+                "content_sha256": record.content_sha256,
+                "member_count": member_count,
+                "synced_at": timezone.now(),
+            },
+        )
+        DatamailerRecipientListMemberHash.objects.filter(
+            list_key=record.list_key
+        ).delete()
+        record_member_hashes(record.list_key, record.member_hashes)
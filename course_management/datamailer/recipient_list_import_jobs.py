@@ -59,6 +59,11 @@ class ImportJobStatusData:
 
 
 def create_import_job(import_data, write):
+    """Upload and create an import job.
+
+    Returns True only when the job was polled to a ``succeeded`` status;
+    a job left running in Datamailer is not yet a confirmed sync.
+    """
     upload, response = safe_create_import_job_response(import_data)
     job = (response or {}).get("import_job", {})
     job_id = job.get("id")
@@ -69,15 +74,18 @@ def create_import_job(import_data, write):
         job_id=job_id,
     )
     write_import_job_created(created_data, write)
-    if import_data.options.wait_for_import:
-        wait_data = ImportJobWaitData(
-            client=import_data.client,
-            list_key=import_data.list_key,
-            job_id=job_id,
-            timeout=import_data.options.timeout,
-            poll_interval=import_data.options.poll_interval,
-        )
-        wait_for_created_import_job(wait_data, write)
+    if not import_data.options.wait_for_import:
+        return False
+
+    wait_data = ImportJobWaitData(
+        client=import_data.client,
+        list_key=import_data.list_key,
+        job_id=job_id,
+        timeout=import_data.options.timeout,
+        poll_interval=import_data.options.poll_interval,
+    )
+    finished_job = wait_for_created_import_job(wait_data, write)
+    return finished_job.get("status") == "succeeded"
 
 
 def safe_create_import_job_response(import_data):
@@ -137,7 +145,7 @@ def wait_for_created_import_job(data, write):
             "Datamailer did not return an import job id for "
             f"{data.list_key}."
         )
-    wait_for_import_job(data, write)
+    return wait_for_import_job(data, write)
 
 
 def wait_for_import_job(data, write):
@@ -151,7 +159,7 @@ def wait_for_import_job(data, write):
             write=write,
         )
         if handle_import_job_status(status_data):
-            return
+            return job
         if time.monotonic() >= deadline:
             raise CommandError(
                 "Timed out waiting for Datamailer import job "
@@ -2,30 +2,57 @@ from dataclasses import dataclass
 import hashlib
 import json
 import re
+import tempfile
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from django.conf import settings
 from django.core.management.base import CommandError
 
+# JSONL bodies stay in memory up to this size and spill to a temp file
+# beyond it, so a large list never needs the whole upload as one bytes
+# object.
+IMPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+IMPORT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=IMPORT_SPOOL_MAX_BYTES,
+    multipart_chunksize=IMPORT_SPOOL_MAX_BYTES,
+)
+
 
 @dataclass(frozen=True)
 class ImportUploadBody:
     s3: object
     bucket: str
     key: str
-    body: bytes
+    body: object
     metadata: dict
 
 
+@dataclass(frozen=True)
+class ImportMemberFile:
+    body: object
+    content_sha256: str
+    row_count: int
+
+
 def import_member_jsonl(members):
-    lines = []
+    """Write members as JSONL to a spooled file, hashing as we go."""
+    body = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_BYTES)
+    digest = hashlib.sha256()
+    row_count = 0
     for member in members:
         line = json.dumps(member, sort_keys=True, separators=(",", ":"))
-        lines.append(line)
-    content = "\n".join(lines)
-    content_with_trailing_newline = f"{content}\n"
-    body = content_with_trailing_newline.encode("utf-8")
-    return body
+        encoded_line = f"{line}\n".encode("utf-8")
+        digest.update(encoded_line)
+        body.write(encoded_line)
+        row_count += 1
+    body.seek(0)
+    content_sha256 = digest.hexdigest()
+    return ImportMemberFile(
+        body=body,
+        content_sha256=content_sha256,
+        row_count=row_count,
+    )
 
 
 def safe_s3_key_part(value):
@@ -87,12 +114,16 @@ def import_file_metadata(config, list_key, content_sha256):
 
 
 def upload_import_body(upload_body):
-    upload_body.s3.put_object(
-        Bucket=upload_body.bucket,
-        Key=upload_body.key,
-        Body=upload_body.body,
-        ContentType="application/x-ndjson",
-        Metadata=upload_body.metadata,
+    extra_args = {
+        "ContentType": "application/x-ndjson",
+        "Metadata": upload_body.metadata,
+    }
+    upload_body.s3.upload_fileobj(
+        upload_body.body,
+        upload_body.bucket,
+        upload_body.key,
+        ExtraArgs=extra_args,
+        Config=IMPORT_TRANSFER_CONFIG,
     )
 
 
@@ -111,8 +142,8 @@ def presigned_import_url(s3, bucket, key):
 
 def upload_import_file(kind, config, list_key, payload):
     bucket = import_s3_bucket()
-    body = import_member_jsonl(payload["members"])
-    content_sha256 = hashlib.sha256(body).hexdigest()
+    member_file = import_member_jsonl(payload["members"])
+    content_sha256 = member_file.content_sha256
     key = import_object_key(kind, config, list_key, content_sha256)
     s3 = import_s3_client()
     metadata = import_file_metadata(config, list_key, content_sha256)
@@ -120,12 +151,13 @@ def upload_import_file(kind, config, list_key, payload):
         s3=s3,
         bucket=bucket,
         key=key,
-        body=body,
+        body=member_file.body,
         metadata=metadata,
     )
-    upload_import_body(upload_body)
+    with member_file.body:
+        upload_import_body(upload_body)
     source_url = presigned_import_url(s3, bucket, key)
-    row_count = len(payload["members"])
+    row_count = member_file.row_count
     return {
         "source_url": source_url,
         "s3_bucket": bucket,
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from django.db.models.functions import Coalesce
+
 from course_management.datamailer.payloads.base import (
     enrollment_recipient_list_payload,
 )
@@ -45,10 +47,19 @@ class RecipientListFilters:
     project_slug: str = ""
 
 
+# Each queryset is ordered by the recipient list its rows belong to, so the
+# batch builder can stream one list at a time instead of holding every list.
+
+
 def registration_queryset(filters):
-    queryset = CourseRegistration.objects.select_related(
-        "campaign", "course", "user"
-    ).order_by("pk")
+    list_slug = Coalesce("course__slug", "campaign__slug")
+    queryset = (
+        CourseRegistration.objects.select_related(
+            "campaign", "course", "user"
+        )
+        .annotate(list_slug=list_slug)
+        .order_by("list_slug", "pk")
+    )
     course_slug = filters.course_slug
     if course_slug:
         queryset = queryset.filter(course__slug=course_slug)
@@ -59,7 +70,7 @@ def enrollment_queryset(filters):
     queryset = Enrollment.objects.select_related(
         "student",
         "course",
-    ).order_by("pk")
+    ).order_by("course__slug", "pk")
     course_slug = filters.course_slug
     if course_slug:
         queryset = queryset.filter(course__slug=course_slug)
@@ -71,7 +82,7 @@ def homework_submission_queryset(filters):
         "student",
         "homework",
         "homework__course",
-    ).order_by("pk")
+    ).order_by("homework__course__slug", "homework__slug", "pk")
     course_slug = filters.course_slug
     homework_slug = filters.homework_slug
     if course_slug:
@@ -86,7 +97,7 @@ def project_submission_queryset(filters):
         "student",
         "project",
         "project__course",
-    ).order_by("pk")
+    ).order_by("project__course__slug", "project__slug", "pk")
     course_slug = filters.course_slug
     project_slug = filters.project_slug
     if course_slug:
@@ -124,7 +135,7 @@ def graduates_queryset(filters):
         Enrollment.objects.select_related("student", "course")
         .exclude(certificate_url__isnull=True)
         .exclude(certificate_url="")
-        .order_by("pk")
+        .order_by("course__slug", "pk")
     )
     course_slug = filters.course_slug
     if course_slug:
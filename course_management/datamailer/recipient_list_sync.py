@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from django.core.management.base import CommandError
@@ -7,6 +8,21 @@ from course_management.datamailer.client import (
     DatamailerClient,
     DatamailerConfig,
 )
+from course_management.datamailer.recipient_list_batches import (
+    RecipientListBatchTotals,
+)
+from course_management.datamailer.recipient_list_hashes import (
+    IMPORT_REMOVE_ABSENT_SYNC_MODE,
+    IMPORT_SYNC_MODE,
+    RECONCILE_SYNC_MODE,
+    RecipientListSyncRecord,
+    changed_members,
+    list_content_sha256,
+    list_content_unchanged,
+    member_content_hashes,
+    record_member_hashes,
+    record_whole_list_sync,
+)
 from course_management.datamailer.recipient_list_import_jobs import (
     ImportJobData,
     ImportJobOptions,
@@ -28,10 +44,11 @@ class RecipientListSyncData:
     client: DatamailerClient
     config: DatamailerConfig
     kind: str
-    batches: dict
+    batches: Iterable[tuple[str, dict]]
     reconcile: bool
     import_by_reference: bool
     import_options: ImportJobOptions
+    force: bool = False
 
 
 @dataclass(frozen=True)
@@ -42,11 +59,62 @@ class SyncResultData:
 
 
 def sync_recipient_list_batches(data, write):
-    for list_key, payload in data.batches.items():
+    totals = RecipientListBatchTotals()
+    for list_key, payload in data.batches:
         sync_recipient_list_batch(data, list_key, payload, write)
+        totals.add(list_key, payload)
+    return totals
 
 
 def sync_recipient_list_batch(data, list_key, payload, write):
+    if data.import_by_reference or data.reconcile:
+        sync_whole_recipient_list(data, list_key, payload, write)
+        return
+
+    sync_changed_recipient_list_members(data, list_key, payload, write)
+
+
+def sync_whole_recipient_list(data, list_key, payload, write):
+    """Send a list whose membership Datamailer takes as a whole.
+
+    Reconcile runs always go out. An additive import is skipped when its
+    content hash matches the last import Datamailer reported as succeeded.
+    """
+    member_hashes = member_content_hashes(payload)
+    content_sha256 = list_content_sha256(member_hashes)
+    mode = whole_list_sync_mode(data)
+    if can_skip_unchanged_list(data, list_key, mode, content_sha256):
+        write_unchanged_list(list_key, payload, write)
+        return
+
+    confirmed = send_whole_recipient_list(data, list_key, payload, write)
+    if not confirmed:
+        return
+    record = RecipientListSyncRecord(
+        kind=data.kind,
+        list_key=list_key,
+        mode=mode,
+        content_sha256=content_sha256,
+        member_hashes=member_hashes,
+    )
+    record_whole_list_sync(record)
+
+
+def whole_list_sync_mode(data):
+    if not data.import_by_reference:
+        return RECONCILE_SYNC_MODE
+    if data.import_options.remove_absent:
+        return IMPORT_REMOVE_ABSENT_SYNC_MODE
+    return IMPORT_SYNC_MODE
+
+
+def can_skip_unchanged_list(data, list_key, mode, content_sha256):
+    if data.force or mode != IMPORT_SYNC_MODE:
+        return False
+    return list_content_unchanged(list_key, mode, content_sha256)
+
+
+def send_whole_recipient_list(data, list_key, payload, write):
     if data.import_by_reference:
         import_data = ImportJobData(
             client=data.client,
@@ -56,8 +124,7 @@ def sync_recipient_list_batch(data, list_key, payload, write):
             payload=payload,
             options=data.import_options,
         )
-        create_import_job(import_data, write)
-        return
+        return create_import_job(import_data, write)
 
     result_data = sync_inline_recipient_list_batch(
         data,
@@ -65,6 +132,36 @@ def sync_recipient_list_batch(data, list_key, payload, write):
         payload,
     )
     write_sync_result(result_data, write)
+    return True
+
+
+def sync_changed_recipient_list_members(data, list_key, payload, write):
+    if data.force:
+        member_hashes = member_content_hashes(payload)
+        changed_payload = payload
+    else:
+        changed = changed_members(list_key, payload)
+        member_hashes = changed.member_hashes
+        changed_payload = changed.payload
+    if not changed_payload["members"]:
+        write_unchanged_list(list_key, payload, write)
+        return
+
+    result_data = sync_inline_recipient_list_batch(
+        data,
+        list_key,
+        changed_payload,
+    )
+    write_sync_result(result_data, write)
+    record_member_hashes(list_key, member_hashes)
+
+
+def write_unchanged_list(list_key, payload, write):
+    member_count = len(payload["members"])
+    write(
+        f"Unchanged {list_key}: {member_count} member(s); "
+        "skipped"
+    )
 
 
 def sync_inline_recipient_list_batch(data, list_key, payload):
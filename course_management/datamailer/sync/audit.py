@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from typing import Any
 
+from django.db import transaction
+from django.utils import timezone
+
 from data.models import (
     DatamailerSendAudit,
     DatamailerSendAuditStatus,
@@ -11,6 +14,9 @@ from ..payloads.send import (
     datamailer_send_list_key,
 )
 
+# Older audit rows rewritten per transaction by the recipient backfill.
+DEFAULT_RECIPIENT_BACKFILL_BATCH_SIZE = 1000
+
 
 @dataclass(frozen=True)
 class DatamailerSendAuditData:
@@ -49,6 +55,12 @@ def datamailer_audit_template_key(payload, response) -> str:
     return payload_template_key
 
 
+def datamailer_audit_recipient_email(response) -> str:
+    message = response.get("message") or {}
+    email = message.get("email") or ""
+    return email.strip().lower()
+
+
 def datamailer_audit_category_tag(payload, metadata) -> str:
     payload_category_tag = payload.get("category_tag", "")
     metadata_category_tag = metadata.get("category_tag", "")
@@ -86,7 +98,9 @@ def datamailer_send_audit_send_defaults(data) -> dict[str, Any]:
         data.payload,
         data.metadata,
     )
+    recipient_email = datamailer_audit_recipient_email(data.response)
     return {
+        "recipient_email": recipient_email,
         "template_key": template_key,
         "category_tag": category_tag,
         "list_key": list_key,
@@ -146,3 +160,122 @@ def record_datamailer_send_audit(data) -> DatamailerSendAudit | None:
         defaults=defaults,
     )
     return audit
+
+
+MEMBER_SEND_AUDIT_UPDATE_FIELDS = [
+    "status",
+    "recipient_email",
+    "template_key",
+    "category_tag",
+    "list_key",
+    "source",
+    "event",
+    "error",
+    "occurred_at",
+]
+
+
+def record_datamailer_member_send_audits(data, member_emails) -> None:
+    """Write one audit row per recipient of a recipient-list send.
+
+    ``member_emails`` maps each member's idempotency key to its email. The
+    rows share the send's ``list_key`` and outcome so recipient lookups
+    find list sends; their counts stay zero because the send's own audit
+    row already carries them.
+    """
+    if not member_emails:
+        return
+
+    response = data.response or {}
+    metadata = data.payload.get("metadata")
+    if not isinstance(metadata, dict):
+        metadata = {}
+    template_key = datamailer_audit_template_key(data.payload, response)
+    category_tag = datamailer_audit_category_tag(data.payload, metadata)
+    status = datamailer_audit_status(data.error)
+    occurred_at = timezone.now()
+
+    audits = []
+    for idempotency_key, email in member_emails.items():
+        audit = DatamailerSendAudit(
+            send_type=data.send_type,
+            status=status,
+            idempotency_key=idempotency_key,
+            recipient_email=email.strip().lower(),
+            template_key=template_key,
+            category_tag=category_tag,
+            list_key=data.list_key,
+            source=metadata.get("source", ""),
+            event=metadata.get("event", ""),
+            error=data.error,
+            occurred_at=occurred_at,
+        )
+        audits.append(audit)
+    DatamailerSendAudit.objects.bulk_create(
+        audits,
+        update_conflicts=True,
+        unique_fields=["send_type", "idempotency_key"],
+        update_fields=MEMBER_SEND_AUDIT_UPDATE_FIELDS,
+    )
+
+
+def backfill_datamailer_send_audit_recipients_batch(
+    after_id: int,
+    batch_size: int,
+) -> tuple[int, int]:
+    """Fill ``recipient_email`` on one id-ordered batch of older rows.
+
+    Returns the last id scanned (``0`` when nothing is left) and the number
+    of rows updated.
+    """
+    with transaction.atomic():
+        rows = list(
+            DatamailerSendAudit.objects.filter(
+                id__gt=after_id,
+                recipient_email="",
+            )
+            .order_by("id")
+            .values("id", "response_payload")[:batch_size]
+        )
+        if not rows:
+            return 0, 0
+
+        audits = []
+        for row in rows:
+            response = row["response_payload"]
+            if not isinstance(response, dict):
+                continue
+            recipient_email = datamailer_audit_recipient_email(response)
+            if recipient_email:
+                audits.append(
+                    DatamailerSendAudit(
+                        id=row["id"],
+                        recipient_email=recipient_email,
+                    )
+                )
+        DatamailerSendAudit.objects.bulk_update(audits, ["recipient_email"])
+    return rows[-1]["id"], len(audits)
+
+
+def backfill_datamailer_send_audit_recipients(
+    batch_size: int = DEFAULT_RECIPIENT_BACKFILL_BATCH_SIZE,
+) -> int:
+    """Copy the recipient out of ``response_payload`` for rows written
+    before ``recipient_email`` existed. Returns the number of rows updated.
+
+    Rows without a recipient (list sends) keep an empty value, so the scan
+    moves forward by id instead of re-reading them every batch.
+    """
+    updated_count = 0
+    last_id = 0
+    while True:
+        last_id, batch_updated_count = (
+            backfill_datamailer_send_audit_recipients_batch(
+                last_id,
+                batch_size,
+            )
+        )
+        if not last_id:
+            break
+        updated_count += batch_updated_count
+    return updated_count
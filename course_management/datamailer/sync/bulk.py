@@ -39,8 +39,11 @@ def enqueue_recipient_list_bulk_upsert(data):
         },
         # Bulk upsert is called before a recipient-list send (campaigns,
         # certificates), which needs the ACKED status synchronously to decide
-        # whether to proceed. All other outbox events are deferred to the
-        # scheduled processor so request-time submissions are not blocked.
+        # whether to proceed. Callers run it from staff actions or from the
+        # outbox processor itself (certificate notifications), never from
+        # public request handlers. All other outbox events are deferred to
+        # the scheduled processor so request-time submissions are not
+        # blocked.
         dispatch_immediately=True,
     )
     return enqueue_datamailer_outbox_event(event_data)
@@ -3,17 +3,35 @@ from dataclasses import dataclass
 from typing import Any
 
 import requests
+from django.db import transaction
 
-from data.models import DatamailerSendAuditType
+from data.models import (
+    DatamailerSendAudit,
+    DatamailerSendAuditStatus,
+    DatamailerSendAuditType,
+)
+
+from course_management.datamailer_outbox import (
+    DatamailerOutboxEventData,
+    enqueue_datamailer_outbox_event,
+)
 
-from ..client import DatamailerConfig
+from ..client import DatamailerClient, DatamailerConfig
+from ..keys import course_graduates_list_key, datamailer_ordering_key
 from ..payloads.certificate_availability import (
+    certificate_availability_batch_key,
+    certificate_availability_batch_payload,
     certificate_availability_notification_payload,
 )
 from ..payloads.course_graduates import (
     course_graduate_recipient_list_payload,
+    course_graduates_recipient_list_payload,
+)
+from .audit import (
+    DatamailerSendAuditData,
+    record_datamailer_member_send_audits,
+    record_datamailer_send_audit,
 )
-from .audit import DatamailerSendAuditData, record_datamailer_send_audit
 from .bulk import (
     RecipientListBulkUpsertData,
     bulk_upsert_recipient_list_members_before_send,
@@ -23,10 +41,20 @@ from .transactional import send_transactional_and_audit
 
 logger = logging.getLogger(__name__)
 
+CERTIFICATE_NOTIFICATION_BATCH_SIZE = 500
+
 
 GraduateListPayload = tuple[str, dict[str, Any]] | None
 
 
+class CertificateNotificationNotSent(requests.RequestException):
+    """A certificate email was not sent and its outbox event should retry.
+
+    Subclasses ``RequestException`` so ``dispatch_claimed_outbox_event``
+    treats it like a transport failure instead of acknowledging the event.
+    """
+
+
 @dataclass(frozen=True)
 class CertificateAvailabilitySendData:
     config: DatamailerConfig
@@ -35,6 +63,58 @@ class CertificateAvailabilitySendData:
     payload: dict[str, Any] | None
 
 
+def queue_certificate_availability_notification(enrollment) -> None:
+    """Defer the certificate email to the outbox processor.
+
+    The send needs an acknowledged graduate-list upsert first, which would
+    otherwise block the certificate API request on Datamailer.
+    """
+    if DatamailerConfig.from_settings() is None:
+        return
+
+    ordering_key = datamailer_ordering_key(enrollment)
+    event_data = DatamailerOutboxEventData(
+        event_type="certificate.availability_notify",
+        idempotency_key=certificate_availability_key(enrollment.pk),
+        ordering_key=ordering_key,
+        payload={"enrollment_id": enrollment.pk},
+    )
+    enqueue_datamailer_outbox_event(event_data)
+
+
+def queue_certificate_availability_notifications(course, enrollments) -> None:
+    """Defer certificate emails for many enrollments to the outbox.
+
+    Each outbox event covers up to ``CERTIFICATE_NOTIFICATION_BATCH_SIZE``
+    enrollments and sends one graduate-list upsert and one recipient-list
+    send, instead of one event and two Datamailer calls per learner.
+    """
+    if DatamailerConfig.from_settings() is None:
+        return
+
+    enrollments = list(enrollments)
+    ordering_key = course_graduates_list_key(course)
+    batch_size = CERTIFICATE_NOTIFICATION_BATCH_SIZE
+    for start in range(0, len(enrollments), batch_size):
+        batch = enrollments[start:start + batch_size]
+        enrollment_ids = []
+        for enrollment in batch:
+            enrollment_ids.append(enrollment.pk)
+        event_data = DatamailerOutboxEventData(
+            event_type="certificate.availability_notify_batch",
+            idempotency_key=certificate_availability_batch_key(
+                course,
+                batch,
+            ),
+            ordering_key=ordering_key,
+            payload={
+                "course_id": course.pk,
+                "enrollment_ids": enrollment_ids,
+            },
+        )
+        enqueue_datamailer_outbox_event(event_data)
+
+
 def send_certificate_availability_notification(
     enrollment,
 ) -> dict[str, Any] | None:
@@ -59,11 +139,39 @@ def send_certificate_availability_notification(
         return handle_certificate_availability_send_error(send_data, exc)
 
 
+def certificate_availability_key(enrollment_id) -> str:
+    return f"certificate-available:{enrollment_id}"
+
+
+def certificate_notified_enrollment_ids(enrollments) -> set[int]:
+    """Return the enrollments whose certificate email already went out.
+
+    Single and batched sends audit each learner under the same key, so a
+    learner re-queued in a later batch, or queued both ways, is emailed
+    once.
+    """
+    keys_by_enrollment_id = {}
+    for enrollment in enrollments:
+        key = certificate_availability_key(enrollment.pk)
+        keys_by_enrollment_id[key] = enrollment.pk
+    sent_keys = DatamailerSendAudit.objects.filter(
+        idempotency_key__in=list(keys_by_enrollment_id),
+        status=DatamailerSendAuditStatus.SUCCEEDED,
+    ).values_list("idempotency_key", flat=True)
+    notified_ids = set()
+    for key in sent_keys:
+        notified_ids.add(keys_by_enrollment_id[key])
+    return notified_ids
+
+
 def certificate_availability_payloads(enrollment):
     graduate_list_payload = course_graduate_recipient_list_payload(
         enrollment
     )
-    payload = certificate_availability_notification_payload(enrollment)
+    if certificate_notified_enrollment_ids([enrollment]):
+        payload = None
+    else:
+        payload = certificate_availability_notification_payload(enrollment)
     if graduate_list_payload is None and payload is None:
         return None
     return graduate_list_payload, payload
@@ -71,13 +179,16 @@ def certificate_availability_payloads(enrollment):
 
 def send_certificate_availability_if_ready(data):
     if not sync_graduate_outcome_before_certificate_send(data):
-        return None
+        raise CertificateNotificationNotSent(
+            "Datamailer graduate-outcome sync was not acknowledged"
+        )
     if data.payload is None:
         return None
     return send_transactional_and_audit(data.config, data.payload)
 
 
 def handle_certificate_availability_send_error(data, exc):
+    """Audit the failure and re-raise it so the outbox event retries."""
     logger.exception(
         "Datamailer certificate availability notification failed "
         "for enrollment_id=%s",
@@ -91,9 +202,7 @@ def handle_certificate_availability_send_error(data, exc):
             error=error,
         )
         record_datamailer_send_audit(audit_data)
-    if data.config.strict:
-        raise
-    return None
+    raise exc
 
 
 def sync_graduate_outcome_before_certificate_send(data):
@@ -109,21 +218,135 @@ def sync_graduate_outcome_before_certificate_send(data):
         idempotency_key=idempotency_key,
         ordering_key=list_key,
     )
-    synced = bulk_upsert_recipient_list_members_before_send(bulk_data)
-    if synced:
-        return True
+    return bulk_upsert_recipient_list_members_before_send(bulk_data)
 
-    if data.payload is not None:
-        audit_data = DatamailerSendAuditData(
-            send_type=DatamailerSendAuditType.TRANSACTIONAL,
-            payload=data.payload,
-            error="Datamailer graduate-outcome sync was not acknowledged",
+
+def certificate_graduate_outcome_idempotency_key(data):
+    key = certificate_availability_key(data.enrollment.pk)
+    return f"{key}:graduate-outcome"
+
+
+@dataclass(frozen=True)
+class CertificateAvailabilityBatchSendData:
+    config: DatamailerConfig
+    course: Any
+    graduate_list_payload: GraduateListPayload
+    payload: dict[str, Any] | None
+
+
+def send_certificate_availability_notifications(
+    course,
+    enrollments,
+) -> dict[str, Any] | None:
+    config = DatamailerConfig.from_settings()
+    if config is None:
+        return None
+
+    graduate_list_payload = course_graduates_recipient_list_payload(
+        course,
+        enrollments,
+    )
+    notified_ids = certificate_notified_enrollment_ids(enrollments)
+    unnotified_enrollments = []
+    for enrollment in enrollments:
+        if enrollment.pk not in notified_ids:
+            unnotified_enrollments.append(enrollment)
+    payload = certificate_availability_batch_payload(
+        course,
+        unnotified_enrollments,
+    )
+    if graduate_list_payload is None and payload is None:
+        return None
+
+    send_data = CertificateAvailabilityBatchSendData(
+        config=config,
+        course=course,
+        graduate_list_payload=graduate_list_payload,
+        payload=payload,
+    )
+    try:
+        return send_certificate_availability_batch_if_ready(send_data)
+    except requests.RequestException as exc:
+        return handle_certificate_availability_batch_error(send_data, exc)
+
+
+def send_certificate_availability_batch_if_ready(data):
+    if not sync_graduate_outcomes_before_certificate_batch(data):
+        raise CertificateNotificationNotSent(
+            "Datamailer graduate-outcome sync was not acknowledged"
         )
-        record_datamailer_send_audit(audit_data)
-    return False
+    if data.payload is None:
+        return None
 
+    client = DatamailerClient(data.config)
+    response = client.recipient_lists.sends.send_to_transient_list(
+        data.payload,
+    )
+    record_certificate_batch_audit(data, response=response)
+    return response
 
-def certificate_graduate_outcome_idempotency_key(data):
+
+def sync_graduate_outcomes_before_certificate_batch(data):
+    if data.graduate_list_payload is None:
+        return True
+
+    list_key, list_payload = data.graduate_list_payload
+    idempotency_key = certificate_batch_graduate_outcome_idempotency_key(data)
+    bulk_data = RecipientListBulkUpsertData(
+        config=data.config,
+        list_key=list_key,
+        payload=list_payload,
+        idempotency_key=idempotency_key,
+        ordering_key=list_key,
+    )
+    return bulk_upsert_recipient_list_members_before_send(bulk_data)
+
+
+def certificate_batch_graduate_outcome_idempotency_key(data):
     if data.payload is not None:
         return f"{data.payload['idempotency_key']}:graduate-outcome"
-    return f"certificate-available:{data.enrollment.pk}:graduate-outcome"
+    list_key, _ = data.graduate_list_payload
+    return f"certificate-available:{list_key}:graduate-outcome"
+
+
+def handle_certificate_availability_batch_error(data, exc):
+    """Audit the failure and re-raise it so the outbox event retries."""
+    logger.exception(
+        "Datamailer certificate availability notifications failed "
+        "for course_id=%s",
+        data.course.pk,
+    )
+    if data.payload is not None:
+        record_certificate_batch_audit(data, error=str(exc))
+    raise exc
+
+
+def certificate_batch_member_emails(payload) -> dict[str, str]:
+    """Key each learner of a batch like a single certificate send."""
+    member_emails = {}
+    for member in payload["members"]:
+        enrollment_id = member["metadata"]["enrollment_id"]
+        idempotency_key = certificate_availability_key(enrollment_id)
+        member_emails[idempotency_key] = member["email"]
+    return member_emails
+
+
+def record_certificate_batch_audit(data, *, response=None, error=""):
+    """Audit the batch send and each learner in it.
+
+    The per-learner rows keep certificate emails findable by recipient in
+    the send-audit lookup, as they were when each was sent on its own.
+    """
+    audit_data = DatamailerSendAuditData(
+        send_type=DatamailerSendAuditType.TRANSIENT_RECIPIENT_LIST,
+        payload=data.payload,
+        list_key=data.payload["list"]["key"],
+        response=response,
+        error=error,
+    )
+    with transaction.atomic():
+        record_datamailer_send_audit(audit_data)
+        record_datamailer_member_send_audits(
+            audit_data,
+            certificate_batch_member_emails(data.payload),
+        )
@@ -1,35 +1,20 @@
-import logging
-
-import requests
-
 from course_management.datamailer_outbox import (
     DatamailerOutboxEventData,
     enqueue_datamailer_outbox_event,
 )
 
-from ..client import DatamailerClient, DatamailerConfig
+from ..client import DatamailerConfig
 from ..payloads.base import contact_payload_for_user
 
 
-logger = logging.getLogger(__name__)
-
-
 def payload_with_configured_from_email(payload, config):
     if config.from_email and "from_email" not in payload:
         return payload | {"from_email": config.from_email}
     return payload
 
 
-def handle_contact_sync_error(config, user):
-    logger.exception(
-        "Datamailer contact sync failed for user_id=%s",
-        user.pk,
-    )
-    if config.strict:
-        raise
-
-
 def sync_contact(user, course=None) -> None:
+    """Queue a contact upsert; the outbox processor talks to Datamailer."""
     config = DatamailerConfig.from_settings()
     if config is None:
         return
@@ -38,13 +23,19 @@ def sync_contact(user, course=None) -> None:
     if payload is None:
         return
 
-    client = DatamailerClient(config)
     payload = payload_with_configured_from_email(payload, config)
-
-    try:
-        client.contacts.upsert_contact(payload)
-    except requests.RequestException:
-        handle_contact_sync_error(config, user)
+    ordering_key = f"user:{user.pk}"
+    course_key = course.slug if course is not None else ""
+    event_data = DatamailerOutboxEventData(
+        event_type="contact.upsert",
+        idempotency_key=f"contact.upsert:{ordering_key}:{course_key}",
+        ordering_key=ordering_key,
+        payload={
+            "contact_payload": payload,
+            "user_id": user.pk,
+        },
+    )
+    enqueue_datamailer_outbox_event(event_data)
 
 
 def erase_contact_from_datamailer(
@@ -2,6 +2,9 @@ from dataclasses import dataclass
 from typing import Any
 
 from course_management.datamailer.keys import datamailer_ordering_key
+from course_management.datamailer.recipient_list_hashes import (
+    forget_removed_member,
+)
 from course_management.datamailer.payloads.base import (
     removed_recipient_list_member_payload,
 )
@@ -79,3 +82,7 @@ def remove_recipient_list_memberships(data) -> None:
             },
         )
         enqueue_datamailer_outbox_event(event_data)
+        forget_removed_member(
+            list_payload.list_key,
+            list_payload.source_object_key,
+        )
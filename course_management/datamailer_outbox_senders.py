@@ -37,18 +37,95 @@ def send_recipient_list_members_bulk_upsert_event(client, payload):
     )
 
 
+def send_contact_upsert_event(client, payload):
+    contact_payload = payload["contact_payload"]
+    return client.contacts.upsert_contact(contact_payload)
+
+
+def send_contact_preferences_update_event(client, payload):
+    email = payload["email"]
+    categories = payload["categories"]
+    return client.contacts.update_contact_preferences(email, categories)
+
+
+def send_contact_preferences_fetch_event(client, payload):
+    """Fill the account page's preference read model from Datamailer."""
+    from course_management.datamailer.preferences import (
+        refresh_email_preferences_from_response,
+    )
+
+    email = payload["email"]
+    response = client.contacts.contact_preferences(
+        email,
+        category_tags=payload["category_tags"],
+    )
+    refresh_email_preferences_from_response(email, response)
+    return response
+
+
 def send_contact_erase_event(client, payload):
     email = payload["email"]
     return client.contacts.erase_contact(email)
 
 
+def send_certificate_availability_event(client, payload):
+    """Run the graduate-list sync and certificate email off the request.
+
+    The notification still needs the acknowledged bulk upsert before it
+    sends, so it runs its own nested dispatch from the outbox processor.
+    """
+    from course_management.datamailer.sync.certificates import (
+        send_certificate_availability_notification,
+    )
+    from courses.models.course import Enrollment
+
+    enrollment_id = payload["enrollment_id"]
+    enrollments = Enrollment.objects.select_related("student", "course")
+    enrollment = enrollments.filter(id=enrollment_id).first()
+    if enrollment is None:
+        return {"skipped": "enrollment_not_found"}
+    return send_certificate_availability_notification(enrollment)
+
+
+def send_certificate_availability_batch_event(client, payload):
+    """Send certificate emails for one batch of enrollments.
+
+    Queued by ``queue_certificate_availability_notifications``; like the
+    single-enrollment event it upserts graduates before it sends.
+    """
+    from course_management.datamailer.sync.certificates import (
+        send_certificate_availability_notifications,
+    )
+    from courses.models.course import Course, Enrollment
+
+    course = Course.objects.filter(id=payload["course_id"]).first()
+    if course is None:
+        return {"skipped": "course_not_found"}
+    enrollments = Enrollment.objects.select_related("student", "course")
+    enrollments = enrollments.filter(
+        course=course,
+        id__in=payload["enrollment_ids"],
+    ).order_by("id")
+    enrollments = list(enrollments)
+    if not enrollments:
+        return {"skipped": "enrollments_not_found"}
+    return send_certificate_availability_notifications(course, enrollments)
+
+
 DATAMAILER_OUTBOX_EVENT_SENDERS = {
     "recipient_list.member_upsert": send_recipient_list_member_upsert_event,
     "recipient_list.member_remove": send_recipient_list_member_remove_event,
     "recipient_list.members_bulk_upsert": (
         send_recipient_list_members_bulk_upsert_event
     ),
+    "contact.upsert": send_contact_upsert_event,
+    "contact.preferences_update": send_contact_preferences_update_event,
+    "contact.preferences_fetch": send_contact_preferences_fetch_event,
     "contact.erase": send_contact_erase_event,
+    "certificate.availability_notify": send_certificate_availability_event,
+    "certificate.availability_notify_batch": (
+        send_certificate_availability_batch_event
+    ),
 }
 
 
@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from datetime import timedelta
+import gzip
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from data.models import (
+    DatamailerContactEvent,
+    DatamailerOutboxEvent,
+    DatamailerOutboxStatus,
+    DatamailerSendAudit,
+    DatamailerSendAuditStatus,
+)
+
+# Rows archived and deleted per transaction. Small batches keep each delete's
+# row locks short, so the dispatcher and webhooks are never blocked for long.
+DEFAULT_PRUNE_BATCH_SIZE = 1000
+# Pending, processing and retrying outbox rows are never pruned: they are
+# still work for the dispatcher.
+DEFAULT_RETENTION_DAYS = {
+    "outbox_events": {
+        DatamailerOutboxStatus.ACKED: 30,
+        DatamailerOutboxStatus.FAILED: 180,
+        DatamailerOutboxStatus.DEAD: 180,
+    },
+    "send_audits": {
+        DatamailerSendAuditStatus.SUCCEEDED: 180,
+        DatamailerSendAuditStatus.FAILED: 365,
+    },
+    "contact_events": {
+        "all": 365,
+    },
+}
+
+
+@dataclass(frozen=True)
+class RetentionTarget:
+    name: str
+    model: type
+    timestamp_field: str
+    status_field: str | None
+
+
+RETENTION_TARGETS = (
+    RetentionTarget(
+        name="outbox_events",
+        model=DatamailerOutboxEvent,
+        timestamp_field="updated_at",
+        status_field="status",
+    ),
+    RetentionTarget(
+        name="send_audits",
+        model=DatamailerSendAudit,
+        timestamp_field="occurred_at",
+        status_field="status",
+    ),
+    RetentionTarget(
+        name="contact_events",
+        model=DatamailerContactEvent,
+        timestamp_field="created_at",
+        status_field=None,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    target: RetentionTarget
+    status: str
+    days: int
+
+    @property
+    def label(self):
+        return f"{self.target.name}.{self.status}"
+
+    def queryset(self, now):
+        cutoff = now - timedelta(days=self.days)
+        filters = {f"{self.target.timestamp_field}__lt": cutoff}
+        if self.target.status_field:
+            filters[self.target.status_field] = self.status
+        return self.target.model.objects.filter(**filters)
+
+
+@dataclass(frozen=True)
+class PruneOptions:
+    batch_size: int = DEFAULT_PRUNE_BATCH_SIZE
+    archive_dir: str = ""
+    dry_run: bool = False
+
+
+@dataclass
+class PruneResult:
+    label: str
+    matched_count: int = 0
+    deleted_count: int = 0
+    archive_path: str = ""
+
+
+def retention_days():
+    configured = getattr(settings, "DATAMAILER_RETENTION_DAYS", None)
+    if configured is None:
+        return DEFAULT_RETENTION_DAYS
+    return configured
+
+
+def retention_policies():
+    days_by_target = retention_days()
+    policies = []
+    for target in RETENTION_TARGETS:
+        days_by_status = days_by_target.get(target.name, {})
+        for status, days in days_by_status.items():
+            if not days:
+                continue
+            policy = RetentionPolicy(
+                target=target,
+                status=str(status),
+                days=int(days),
+            )
+            policies.append(policy)
+    return policies
+
+
+def archive_path(archive_dir, policy, now):
+    stamp = now.strftime("%Y%m%dT%H%M%SZ")
+    filename = f"{policy.target.name}-{policy.status}-{stamp}.jsonl.gz"
+    return Path(archive_dir) / filename
+
+
+def write_archive_rows(archive_file, rows):
+    for row in rows:
+        line = json.dumps(row, cls=DjangoJSONEncoder, sort_keys=True)
+        archive_file.write(f"{line}\n")
+
+
+def sync_archive(archive_file):
+    """Push archived rows to disk so a crash cannot lose deleted rows."""
+    archive_file.flush()
+    os.fsync(archive_file.fileno())
+
+
+def prune_batch(policy, now, batch_size, archive_file):
+    """Archive and delete one batch of expired rows in its own transaction."""
+    with transaction.atomic():
+        expired = policy.queryset(now).order_by("pk")
+        rows = list(expired.values()[:batch_size])
+        if not rows:
+            return 0
+        if archive_file is not None:
+            write_archive_rows(archive_file, rows)
+            sync_archive(archive_file)
+        primary_keys = [row["id"] for row in rows]
+        policy.target.model.objects.filter(pk__in=primary_keys).delete()
+    return len(rows)
+
+
+def prune_policy(policy, options, now):
+    result = PruneResult(label=policy.label)
+    result.matched_count = policy.queryset(now).count()
+    if options.dry_run or not result.matched_count:
+        return result
+
+    archive_file = None
+    if options.archive_dir:
+        path = archive_path(options.archive_dir, policy, now)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        archive_file = gzip.open(path, "wt", encoding="utf-8")
+        result.archive_path = str(path)
+    try:
+        while True:
+            deleted_count = prune_batch(
+                policy,
+                now,
+                options.batch_size,
+                archive_file,
+            )
+            if not deleted_count:
+                break
+            result.deleted_count += deleted_count
+    finally:
+        if archive_file is not None:
+            archive_file.close()
+    return result
+
+
+def prune_datamailer_records(options=None):
+    options = options or PruneOptions()
+    now = timezone.now()
+    results = []
+    for policy in retention_policies():
+        result = prune_policy(policy, options, now)
+        results.append(result)
+    return results
@@ -1,6 +1,19 @@
+import logging
+import time
+
+from django.db import connection
 from django.http import HttpResponse
 
-from course_management.observability import report_exception
+from course_management.observability import record_event, report_exception
+from course_management.observability.request_metrics import (
+    REQUEST_EVENT_NAME,
+    QueryMetrics,
+    request_metric_properties,
+    request_metrics_config,
+    request_sampled,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class HealthCheckMiddleware:
@@ -28,3 +41,56 @@ class ObservabilityExceptionMiddleware:
             properties={"source": "django.request"},
         )
         return None
+
+
+class RequestMetricsMiddleware:
+    """Record wall time, query count/time and response size per route.
+
+    Streaming responses are timed until the view returns, not until the
+    body has been sent.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = request_metrics_config()
+        if not request_sampled(config):
+            return self.get_response(request)
+
+        queries = QueryMetrics(slowest_limit=config.slow_query_limit)
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        properties = request_metric_properties(
+            request,
+            response,
+            duration_ms,
+            queries,
+        )
+        record_event(
+            REQUEST_EVENT_NAME,
+            request=request,
+            properties=properties,
+        )
+        if duration_ms >= config.slow_request_ms:
+            log_slow_request(properties, queries)
+        return response
+
+
+def log_slow_request(properties, queries):
+    logger.warning(
+        "slow_request route=%s duration_ms=%s query_count=%s",
+        properties["route"],
+        properties["duration_ms"],
+        properties["query_count"],
+        extra={
+            "route": properties["route"],
+            "duration_ms": properties["duration_ms"],
+            "query_count": properties["query_count"],
+            "query_time_ms": properties["query_time_ms"],
+            "slowest_queries": queries.slowest_queries(),
+        },
+    )
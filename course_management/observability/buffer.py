@@ -0,0 +1,148 @@
+import atexit
+import logging
+import os
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+
+from course_management.observability.events import AppEvent, EventBackend
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_DISTINCT_ID = "aggregate"
+DROPPED_EVENT_NAME = "observability.events_dropped"
+# Low-cardinality properties kept when counter events are aggregated; every
+# other property (ids, slugs) only exists on unaggregated events.
+AGGREGATE_PROPERTY_KEYS = ("event_type", "status")
+
+
+@dataclass(frozen=True)
+class EventBufferConfig:
+    capacity: int
+    flush_interval: float
+    aggregated_events: frozenset[str]
+
+
+def aggregate_key(event: AppEvent):
+    values = []
+    for key in AGGREGATE_PROPERTY_KEYS:
+        value = event.properties.get(key)
+        if value is not None:
+            values.append((key, str(value)))
+    return event.name, tuple(values)
+
+
+class BufferedEventBackend:
+    """Queue events in a ring buffer drained by a background thread.
+
+    ``record`` only appends to a deque, so request and scoring loops never
+    format or write log records themselves. Events named in
+    ``aggregated_events`` are folded into one counter event per flush.
+    When the buffer is full the oldest event is dropped and counted.
+    """
+
+    def __init__(self, backends: list[EventBackend], config: EventBufferConfig):
+        self.backends = backends
+        self.config = config
+        self._events = deque(maxlen=config.capacity)
+        self._counters = Counter()
+        self._dropped_count = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def record(self, event: AppEvent) -> None:
+        self._ensure_worker()
+        with self._lock:
+            if event.name in self.config.aggregated_events:
+                self._counters[aggregate_key(event)] += 1
+                return
+            if len(self._events) == self.config.capacity:
+                self._dropped_count += 1
+            self._events.append(event)
+            half_full = len(self._events) * 2 >= self.config.capacity
+        if half_full:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        for event in self._drain():
+            for backend in self.backends:
+                try:
+                    backend.record(event)
+                except Exception:
+                    logger.exception(
+                        "observability backend failed for event=%s",
+                        event.name,
+                    )
+
+    def _drain(self) -> list[AppEvent]:
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+            counters = dict(self._counters)
+            self._counters.clear()
+            dropped_count = self._dropped_count
+            self._dropped_count = 0
+        for (name, properties), count in counters.items():
+            event = AppEvent(
+                name=name,
+                distinct_id=AGGREGATE_DISTINCT_ID,
+                properties=dict(properties),
+                count=count,
+            )
+            events.append(event)
+        if dropped_count:
+            event = AppEvent(
+                name=DROPPED_EVENT_NAME,
+                distinct_id=AGGREGATE_DISTINCT_ID,
+                count=dropped_count,
+            )
+            events.append(event)
+        return events
+
+    def _ensure_worker(self) -> None:
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None:
+                return
+            if self._pid is not None:
+                # Forked worker: the parent's queued events are its own.
+                self._events.clear()
+                self._counters.clear()
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run,
+                name="observability-events",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.config.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+_buffered_backends: list[BufferedEventBackend] = []
+_buffered_backends_lock = threading.Lock()
+
+
+def buffered_event_backend(backends, config) -> BufferedEventBackend:
+    backend = BufferedEventBackend(backends, config)
+    with _buffered_backends_lock:
+        _buffered_backends.append(backend)
+    return backend
+
+
+def flush_buffered_events() -> None:
+    with _buffered_backends_lock:
+        backends = list(_buffered_backends)
+    for backend in backends:
+        backend.flush()
+
+
+atexit.register(flush_buffered_events)
@@ -11,6 +11,67 @@ logger = logging.getLogger(__name__)
 METRIC_NAME = "AppEventCount"
 
 
+@dataclass(frozen=True)
+class EventMetric:
+    property_name: str
+    metric_name: str
+    unit: str
+
+
+@dataclass(frozen=True)
+class EventMetrics:
+    dimension_sets: tuple[tuple[str, ...], ...]
+    metrics: tuple[EventMetric, ...]
+
+
+# Scoring metrics roll up per event and per course. Course slugs are a small,
+# bounded set, unlike ids or homework slugs.
+SCORING_DIMENSION_SETS = (
+    ("environment", "event"),
+    ("environment", "event", "course_slug"),
+)
+DURATION_METRIC = EventMetric("duration_ms", "EventDuration", "Milliseconds")
+SUBMISSIONS_METRIC = EventMetric(
+    "submissions_count",
+    "EventSubmissions",
+    "Count",
+)
+
+# Numeric event properties published as metrics, keyed by event name. Each
+# record carries one value, so CloudWatch can derive percentiles from them.
+EVENT_METRICS = {
+    "http.request": EventMetrics(
+        dimension_sets=(("environment", "route"),),
+        metrics=(
+            EventMetric("duration_ms", "RequestDuration", "Milliseconds"),
+            EventMetric("query_count", "RequestQueryCount", "Count"),
+            EventMetric("query_time_ms", "RequestQueryTime", "Milliseconds"),
+            EventMetric("response_bytes", "ResponseSize", "Bytes"),
+        ),
+    ),
+    "homework.scored": EventMetrics(
+        dimension_sets=SCORING_DIMENSION_SETS,
+        metrics=(DURATION_METRIC,),
+    ),
+    "project.scored": EventMetrics(
+        dimension_sets=SCORING_DIMENSION_SETS,
+        metrics=(
+            DURATION_METRIC,
+            SUBMISSIONS_METRIC,
+            EventMetric("passed_count", "EventPassed", "Count"),
+        ),
+    ),
+    "project.peer_reviews_assigned": EventMetrics(
+        dimension_sets=SCORING_DIMENSION_SETS,
+        metrics=(
+            DURATION_METRIC,
+            SUBMISSIONS_METRIC,
+            EventMetric("assigned_count", "PeerReviewsAssigned", "Count"),
+        ),
+    ),
+}
+
+
 @dataclass(frozen=True)
 class CloudWatchMetricsConfig:
     namespace: str
@@ -34,6 +95,30 @@ def cloudwatch_metrics_config() -> CloudWatchMetricsConfig:
     return CloudWatchMetricsConfig(namespace=namespace)
 
 
+def event_metric_directive(event_metrics, properties, namespace):
+    metrics = []
+    values = {}
+    for metric in event_metrics.metrics:
+        value = properties.get(metric.property_name)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        metrics.append({"Name": metric.metric_name, "Unit": metric.unit})
+        values[metric.metric_name] = value
+    dimension_sets = []
+    for dimension_set in event_metrics.dimension_sets:
+        # EMF rejects a record whose dimension value is missing.
+        if all(properties.get(key) for key in dimension_set):
+            dimension_sets.append(list(dimension_set))
+    if not metrics or not dimension_sets:
+        return None, values
+    directive = {
+        "Namespace": namespace,
+        "Dimensions": dimension_sets,
+        "Metrics": metrics,
+    }
+    return directive, values
+
+
 def cloudwatch_metric_payload(
     event: AppEvent,
     *,
@@ -42,24 +127,35 @@ def cloudwatch_metric_payload(
     properties = event.normalized_properties()
     environment = properties["environment"]
     payload = dict(properties)
+    directives = [
+        {
+            "Namespace": config.namespace,
+            "Dimensions": [["environment", "event"]],
+            "Metrics": [
+                {
+                    "Name": METRIC_NAME,
+                    "Unit": "Count",
+                }
+            ],
+        }
+    ]
+    event_metrics = EVENT_METRICS.get(event.name)
+    if event_metrics is not None:
+        directive, values = event_metric_directive(
+            event_metrics,
+            properties,
+            config.namespace,
+        )
+        if directive is not None:
+            directives.append(directive)
+            payload.update(values)
     payload.update(
         {
             "distinct_id": event.distinct_id,
-            METRIC_NAME: 1,
+            METRIC_NAME: event.count,
             "_aws": {
                 "Timestamp": int(time.time() * 1000),
-                "CloudWatchMetrics": [
-                    {
-                        "Namespace": config.namespace,
-                        "Dimensions": [["environment", "event"]],
-                        "Metrics": [
-                            {
-                                "Name": METRIC_NAME,
-                                "Unit": "Count",
-                            }
-                        ],
-                    }
-                ]
+                "CloudWatchMetrics": directives,
             },
             "environment": environment,
             "event": event.name,
@@ -8,7 +8,10 @@ from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 from django.conf import settings
 from django.utils import timezone
 
-from course_management.observability.cloudwatch import METRIC_NAME
+from course_management.observability.cloudwatch import (
+    DURATION_METRIC,
+    METRIC_NAME,
+)
 from course_management.observability.events import observability_environment
 
 
@@ -51,6 +54,13 @@ DEFAULT_DASHBOARD_EVENTS = [
 ]
 
 
+DURATION_DASHBOARD_EVENTS = [
+    ("homework.scored", "Homework scoring"),
+    ("project.scored", "Project scoring"),
+]
+DURATION_STATS = ("p50", "p95")
+
+
 @dataclass(frozen=True)
 class CloudWatchDashboardEvent:
     name: str
@@ -62,10 +72,20 @@ class CloudWatchDashboardError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class DurationQueryTarget:
+    query_id: str
+    event_name: str
+    title: str
+    course_slug: str
+    stat: str
+
+
 def cloudwatch_dashboard_context(
     *,
     environment: str | None = None,
     hours: int = 24,
+    course_slugs: tuple[str, ...] = (),
 ) -> dict:
     environment = (environment or observability_environment()).strip()
     hours = normalized_hours(hours)
@@ -76,17 +96,27 @@ def cloudwatch_dashboard_context(
         "CourseManagement/App",
     )
     events = cloudwatch_dashboard_events()
+    duration_targets = duration_query_targets(course_slugs)
 
     try:
         client = cloudwatch_client()
         buckets = metric_buckets(hours=hours, period_seconds=period_seconds)
-        results = client.get_metric_data(
-            MetricDataQueries=metric_data_queries(
-                events=events,
+        queries = metric_data_queries(
+            events=events,
+            namespace=namespace,
+            environment=environment,
+            period_seconds=period_seconds,
+        )
+        queries.extend(
+            duration_data_queries(
+                targets=duration_targets,
                 namespace=namespace,
                 environment=environment,
-                period_seconds=period_seconds,
-            ),
+                period_seconds=len(buckets) * period_seconds,
+            )
+        )
+        results = client.get_metric_data(
+            MetricDataQueries=queries,
             StartTime=buckets[0],
             EndTime=buckets[-1] + timedelta(seconds=period_seconds),
             ScanBy="TimestampAscending",
@@ -100,6 +130,10 @@ def cloudwatch_dashboard_context(
             buckets=buckets,
             results=results,
         ),
+        "duration_rows": duration_rows_from_results(
+            targets=duration_targets,
+            results=results,
+        ),
         "environment": environment,
         "hours": hours,
         "namespace": namespace,
@@ -117,6 +151,7 @@ def cloudwatch_dashboard_error_context(
 ) -> dict:
     return {
         "metric_series": [],
+        "duration_rows": [],
         "environment": (environment or observability_environment()).strip(),
         "hours": normalized_hours(hours),
         "namespace": getattr(
@@ -221,6 +256,97 @@ def metric_data_queries(
     return queries
 
 
+def duration_query_targets(course_slugs) -> list[DurationQueryTarget]:
+    targets = []
+    for event_index, (event_name, title) in enumerate(
+        DURATION_DASHBOARD_EVENTS
+    ):
+        for course_index, course_slug in enumerate(course_slugs):
+            for stat in DURATION_STATS:
+                target = DurationQueryTarget(
+                    query_id=f"d{event_index}_{course_index}_{stat}",
+                    event_name=event_name,
+                    title=title,
+                    course_slug=course_slug,
+                    stat=stat,
+                )
+                targets.append(target)
+    return targets
+
+
+def duration_data_queries(
+    *,
+    targets: list[DurationQueryTarget],
+    namespace: str,
+    environment: str,
+    period_seconds: int,
+) -> list[dict]:
+    """One percentile over the whole range per event, course and stat."""
+    queries = []
+    for target in targets:
+        queries.append(
+            {
+                "Id": target.query_id,
+                "Label": f"{target.title} {target.course_slug} {target.stat}",
+                "MetricStat": {
+                    "Metric": {
+                        "Namespace": namespace,
+                        "MetricName": DURATION_METRIC.metric_name,
+                        "Dimensions": [
+                            {"Name": "environment", "Value": environment},
+                            {"Name": "event", "Value": target.event_name},
+                            {
+                                "Name": "course_slug",
+                                "Value": target.course_slug,
+                            },
+                        ],
+                    },
+                    "Period": period_seconds,
+                    "Stat": target.stat,
+                    "Unit": DURATION_METRIC.unit,
+                },
+                "ReturnData": True,
+            }
+        )
+    return queries
+
+
+def duration_rows_from_results(
+    *,
+    targets: list[DurationQueryTarget],
+    results: dict,
+) -> list[dict]:
+    values_by_id = {}
+    for result in results.get("MetricDataResults", []):
+        values = result.get("Values", [])
+        if values:
+            values_by_id[result["Id"]] = max(values)
+
+    rows_by_key = {}
+    for target in targets:
+        key = (target.event_name, target.course_slug)
+        row = rows_by_key.setdefault(
+            key,
+            {
+                "event": target.event_name,
+                "title": target.title,
+                "course_slug": target.course_slug,
+            },
+        )
+        value = values_by_id.get(target.query_id)
+        row[f"{target.stat}_ms"] = None if value is None else int(value)
+
+    rows = []
+    for row in rows_by_key.values():
+        if row.get("p95_ms") is None and row.get("p50_ms") is None:
+            continue
+        rows.append(row)
+    peak = max((row.get("p95_ms") or 0 for row in rows), default=0)
+    for row in rows:
+        row["p95_percent"] = round(100 * (row.get("p95_ms") or 0) / max(1, peak))
+    return rows
+
+
 def metric_series_from_results(
     *,
     events: list[CloudWatchDashboardEvent],
@@ -32,6 +32,8 @@ class AppEvent:
     name: str
     distinct_id: str
     properties: dict[str, Any] = field(default_factory=dict)
+    # Occurrences represented by this event; above 1 for buffered counters.
+    count: int = 1
 
     def normalized_properties(self) -> dict[str, Any]:
         normalized = {
@@ -45,6 +47,8 @@ class AppEvent:
                 normalized[f"app_{key}"] = value
                 continue
             normalized[key] = value
+        if self.count != 1:
+            normalized["event_count"] = self.count
         return normalized
 
 
@@ -150,14 +154,60 @@ def event_properties(
     return result
 
 
+# Resolved backends keyed by the settings that shape them, so record_event
+# does not rebuild backend objects on every call.
+_backend_cache: dict[tuple, list[EventBackend]] = {}
+
+
 def configured_event_backends() -> list[EventBackend]:
+    backend_names = tuple(
+        getattr(settings, "OBSERVABILITY_EVENT_BACKENDS", ["log"])
+    )
+    buffer_config = event_buffer_config()
+    cache_key = (backend_names, buffer_config)
+    backends = _backend_cache.get(cache_key)
+    if backends is None:
+        backends = resolve_event_backends(backend_names, buffer_config)
+        _backend_cache[cache_key] = backends
+    return backends
+
+
+def resolve_event_backends(backend_names, buffer_config) -> list[EventBackend]:
     backends = []
-    backend_names = getattr(settings, "OBSERVABILITY_EVENT_BACKENDS", ["log"])
     for backend_name in backend_names:
         backend = event_backend(backend_name)
         if backend is not None:
             backends.append(backend)
-    return backends
+    if buffer_config is None or not backends:
+        return backends
+
+    from course_management.observability.buffer import (
+        buffered_event_backend,
+    )
+
+    return [buffered_event_backend(backends, buffer_config)]
+
+
+def event_buffer_config():
+    if not getattr(settings, "OBSERVABILITY_EVENT_BUFFER", False):
+        return None
+
+    from course_management.observability.buffer import EventBufferConfig
+
+    aggregated_events = getattr(
+        settings,
+        "OBSERVABILITY_AGGREGATED_EVENTS",
+        [],
+    )
+    return EventBufferConfig(
+        capacity=getattr(settings, "OBSERVABILITY_EVENT_BUFFER_SIZE", 10000),
+        flush_interval=getattr(
+            settings,
+            "OBSERVABILITY_EVENT_FLUSH_SECONDS",
+            1.0,
+        ),
+        aggregated_events=frozenset(aggregated_events),
+    )
 
 
 def event_backend(name: str) -> EventBackend | None:
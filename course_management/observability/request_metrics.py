@@ -0,0 +1,103 @@
+import heapq
+import itertools
+import random
+import time
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+REQUEST_EVENT_NAME = "http.request"
+
+
+@dataclass(frozen=True)
+class RequestMetricsConfig:
+    sample_rate: float
+    slow_request_ms: float
+    slow_query_limit: int
+
+
+def request_metrics_config() -> RequestMetricsConfig:
+    return RequestMetricsConfig(
+        sample_rate=getattr(settings, "OBSERVABILITY_REQUEST_SAMPLE_RATE", 1.0),
+        slow_request_ms=getattr(settings, "OBSERVABILITY_SLOW_REQUEST_MS", 1000),
+        slow_query_limit=getattr(
+            settings,
+            "OBSERVABILITY_SLOW_REQUEST_QUERY_LIMIT",
+            5,
+        ),
+    )
+
+
+def request_sampled(config: RequestMetricsConfig) -> bool:
+    if config.sample_rate >= 1:
+        return True
+    if config.sample_rate <= 0:
+        return False
+    return random.random() < config.sample_rate
+
+
+@dataclass
+class QueryMetrics:
+    """Database execute wrapper that counts and times queries.
+
+    Only the ``slowest_limit`` slowest statements are kept, so a request
+    that issues thousands of queries costs a small, bounded heap.
+    """
+
+    slowest_limit: int = 5
+    query_count: int = 0
+    query_time_ms: float = 0.0
+    _slowest: list = field(default_factory=list)
+    _sequence: itertools.count = field(default_factory=itertools.count)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            self.query_count += 1
+            self.query_time_ms += duration_ms
+            self.remember(duration_ms, sql)
+
+    def remember(self, duration_ms, sql):
+        if self.slowest_limit <= 0:
+            return
+        item = (duration_ms, next(self._sequence), sql)
+        if len(self._slowest) < self.slowest_limit:
+            heapq.heappush(self._slowest, item)
+            return
+        heapq.heappushpop(self._slowest, item)
+
+    def slowest_queries(self) -> list[dict]:
+        queries = []
+        for duration_ms, _sequence, sql in sorted(self._slowest, reverse=True):
+            queries.append({"duration_ms": round(duration_ms, 2), "sql": sql})
+        return queries
+
+
+def request_route(request) -> str:
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        return "unresolved"
+    return resolver_match.view_name or "unresolved"
+
+
+def response_size(response) -> int | None:
+    if getattr(response, "streaming", False):
+        return None
+    return len(response.content)
+
+
+def request_metric_properties(request, response, duration_ms, queries):
+    properties = {
+        "route": request_route(request),
+        "status_code": response.status_code,
+        "duration_ms": round(duration_ms, 2),
+        "query_count": queries.query_count,
+        "query_time_ms": round(queries.query_time_ms, 2),
+    }
+    size = response_size(response)
+    if size is not None:
+        properties["response_bytes"] = size
+    return properties
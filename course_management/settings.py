@@ -73,6 +73,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "course_management.middleware.HealthCheckMiddleware",
     "course_management.middleware.ObservabilityExceptionMiddleware",
+    "course_management.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -206,6 +207,39 @@ def env_list(name, default):
     ]
 
 
+# API token resolution is cached per process; token usage (last_used_at,
+# use_count) is written in batches by a background thread. Tests flush
+# usage explicitly instead.
+API_TOKEN_CACHE_TTL_SECONDS = env_float("API_TOKEN_CACHE_TTL_SECONDS", 60)
+API_TOKEN_CACHE_SIZE = int(os.getenv("API_TOKEN_CACHE_SIZE", "1024"))
+API_TOKEN_USAGE_FLUSH_SECONDS = env_float(
+    "API_TOKEN_USAGE_FLUSH_SECONDS",
+    60,
+)
+API_TOKEN_USAGE_BACKGROUND_FLUSH = not is_test
+
+# Certificate update jobs start in a background thread once the request
+# commits. process_certificate_update_jobs runs jobs that thread never
+# finished; a running job idle for CERTIFICATE_UPDATE_JOB_STALE_SECONDS is
+# taken over.
+CERTIFICATE_UPDATE_JOBS_RUN_IN_BACKGROUND = not is_test and (
+    os.getenv("CERTIFICATE_UPDATE_JOBS_RUN_IN_BACKGROUND", "1") == "1"
+)
+CERTIFICATE_UPDATE_JOB_STALE_SECONDS = env_float(
+    "CERTIFICATE_UPDATE_JOB_STALE_SECONDS",
+    600,
+)
+
+# The course change feed only serves entries logged at least this long ago,
+# so rows committed late by long scoring transactions are not skipped. It must
+# exceed the time between logging an entry and committing it; scoring jobs
+# log their entries as the last step before commit, other writers log from
+# short transactions.
+COURSE_CHANGES_SAFETY_LAG_SECONDS = env_float(
+    "COURSE_CHANGES_SAFETY_LAG_SECONDS",
+    300,
+)
+
 OBSERVABILITY_ENVIRONMENT = os.getenv(
     "OBSERVABILITY_ENVIRONMENT",
     "local" if IS_LOCAL or DEBUG else "production",
@@ -222,6 +256,37 @@ OBSERVABILITY_EVENT_BACKENDS = env_list(
     "OBSERVABILITY_EVENT_BACKENDS",
     DEFAULT_OBSERVABILITY_EVENT_BACKENDS,
 )
+# Queue events in memory and write them from a background thread. Events in
+# OBSERVABILITY_AGGREGATED_EVENTS are emitted as one counter per flush.
+OBSERVABILITY_EVENT_BUFFER = (
+    os.getenv("OBSERVABILITY_EVENT_BUFFER", "0" if is_test else "1") == "1"
+)
+OBSERVABILITY_EVENT_BUFFER_SIZE = int(
+    os.getenv("OBSERVABILITY_EVENT_BUFFER_SIZE", "10000")
+)
+OBSERVABILITY_EVENT_FLUSH_SECONDS = float(
+    os.getenv("OBSERVABILITY_EVENT_FLUSH_SECONDS", "1")
+)
+OBSERVABILITY_AGGREGATED_EVENTS = env_list(
+    "OBSERVABILITY_AGGREGATED_EVENTS",
+    "datamailer.outbox_enqueued,datamailer.outbox_acked",
+)
+# Record a JobProfile (phase timings and query counts) for every scoring and
+# leaderboard run. Staff can also profile a single run from cadmin. With
+# JOB_PROFILE_DIR set, profiled runs also write a cProfile dump there.
+JOB_PROFILING_ENABLED = os.getenv("JOB_PROFILING_ENABLED", "0") == "1"
+JOB_PROFILE_DIR = os.getenv("JOB_PROFILE_DIR", "")
+# Share of requests timed by RequestMetricsMiddleware (0..1), and the wall time
+# above which a sampled request logs its slowest queries.
+OBSERVABILITY_REQUEST_SAMPLE_RATE = float(
+    os.getenv("OBSERVABILITY_REQUEST_SAMPLE_RATE", "1")
+)
+OBSERVABILITY_SLOW_REQUEST_MS = float(
+    os.getenv("OBSERVABILITY_SLOW_REQUEST_MS", "1000")
+)
+OBSERVABILITY_SLOW_REQUEST_QUERY_LIMIT = int(
+    os.getenv("OBSERVABILITY_SLOW_REQUEST_QUERY_LIMIT", "5")
+)
 CLOUDWATCH_APP_METRIC_NAMESPACE = os.getenv(
     "CLOUDWATCH_APP_METRIC_NAMESPACE",
     "CourseManagement/App",
@@ -268,6 +333,12 @@ DATAMAILER_SYNC_ON_USER_CREATE = (
 DATAMAILER_OUTBOX_DISPATCH_IMMEDIATELY = (
     os.getenv("DATAMAILER_OUTBOX_DISPATCH_IMMEDIATELY", "0") == "1"
 )
+# prune_datamailer_records writes gzipped JSONL archives here before deleting
+# expired rows; empty deletes without archiving. Per-status retention lives in
+# DATAMAILER_RETENTION_DAYS (see course_management/datamailer_retention.py).
+DATAMAILER_RETENTION_ARCHIVE_DIR = os.getenv(
+    "DATAMAILER_RETENTION_ARCHIVE_DIR", ""
+)
 
 # Cache configuration
 CACHES = {
@@ -19,6 +19,7 @@ from courses.models.project import (
     ReviewCriteria,
 )
 from courses.leaderboard import update_leaderboard
+from courses.admin.deletion import DeferredChangeLogDeleteMixin
 from courses.validators.criteria_validators import (
     validate_review_criteria_options,
 )
@@ -149,7 +150,7 @@ def _copy_review_criteria(source_course, target_course):
 
 
 @admin.register(Course)
-class CourseAdmin(ModelAdmin):
+class CourseAdmin(DeferredChangeLogDeleteMixin, ModelAdmin):
     actions = [update_leaderboard_admin, duplicate_course]
     inlines = [CriteriaInline]
     list_display = [
@@ -0,0 +1,20 @@
+from django.db import transaction
+
+from courses.change_log import deferred_change_log
+
+
+class DeferredChangeLogDeleteMixin:
+    """Write the change-log entries of an admin delete in one insert.
+
+    Deleting a course, homework or project cascades to its submissions,
+    and each one records a change-log entry from its ``post_delete``
+    signal.
+    """
+
+    def delete_model(self, request, obj):
+        with transaction.atomic(), deferred_change_log():
+            super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic(), deferred_change_log():
+            super().delete_queryset(request, queryset)
@@ -10,11 +10,15 @@ from django.contrib import messages
 from courses.models.homework import Homework, HomeworkState, Question
 
 from courses.assignment_statistics import calculate_homework_statistics
+from courses.homework_question_stats import (
+    calculate_homework_question_statistics,
+)
 from courses.homework_correct_answers import (
     clear_correct_answers,
     fill_correct_answers,
 )
 from courses.scoring import score_homework_submissions
+from courses.admin.deletion import DeferredChangeLogDeleteMixin
 
 
 QUESTION_TEXT_WIDGET = UnfoldAdminTextInputWidget(attrs={"size": "60"})
@@ -103,6 +107,7 @@ def calculate_statistics_selected_homeworks(
             continue
 
         calculate_homework_statistics(homework, force=True)
+        calculate_homework_question_statistics(homework)
 
         message = f"Statistics calculated for {homework}"
         modeladmin.message_user(
@@ -116,7 +121,7 @@ calculate_statistics_selected_homeworks.short_description = (
 
 
 @admin.register(Homework)
-class HomeworkAdmin(ModelAdmin):
+class HomeworkAdmin(DeferredChangeLogDeleteMixin, ModelAdmin):
     inlines = [QuestionInline]
     actions = [
         score_selected_homeworks,
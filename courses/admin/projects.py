@@ -12,6 +12,7 @@ from courses.project_assignment import (
 from courses.project_scoring import score_project
 
 from courses.assignment_statistics import calculate_project_statistics
+from courses.admin.deletion import DeferredChangeLogDeleteMixin
 
 
 def assign_peer_reviews_for_project_admin(
@@ -77,7 +78,7 @@ calculate_statistics_selected_projects.short_description = (
 
 
 @admin.register(Project)
-class ProjectAdmin(ModelAdmin):
+class ProjectAdmin(DeferredChangeLogDeleteMixin, ModelAdmin):
     actions = [
         assign_peer_reviews_for_project_admin,
         score_projects_admin,
@@ -0,0 +1,100 @@
+"""Append-only change log behind the ``/api/courses/<slug>/changes`` feed.
+
+Single-row saves and deletes are recorded by signals in
+``courses/signals.py``. Scoring, leaderboard and certificate jobs write
+with ``bulk_update``, which sends no signals, so they call
+``record_changes`` for the rows they touched.
+
+The feed trusts that an entry commits within the safety lag of its
+``occurred_at``. Long jobs therefore wrap their transaction body in
+``deferred_change_log``, which holds the entries back and inserts them as
+the last step before commit instead of when the rows were written.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from django.utils import timezone
+
+from courses.models.change_log import (
+    ChangeAction,
+    ChangeLogEntry,
+    ChangeObjectType,
+)
+
+
+_deferred = threading.local()
+
+
+def _deferred_buffers() -> list[list[ChangeLogEntry]]:
+    buffers = getattr(_deferred, "buffers", None)
+    if buffers is None:
+        buffers = []
+        _deferred.buffers = buffers
+    return buffers
+
+
+def _insert_entries(entries) -> None:
+    buffers = _deferred_buffers()
+    if buffers:
+        buffers[-1].extend(entries)
+        return
+    if not entries:
+        return
+    occurred_at = timezone.now()
+    for entry in entries:
+        entry.occurred_at = occurred_at
+    ChangeLogEntry.objects.bulk_create(entries)
+
+
+@contextmanager
+def deferred_change_log():
+    """Insert the entries recorded inside the block when it exits.
+
+    Use it directly inside ``transaction.atomic`` so the inserts are the
+    last writes before commit. Entries are dropped if the block raises.
+    """
+    entries = []
+    buffers = _deferred_buffers()
+    buffers.append(entries)
+    try:
+        yield
+    finally:
+        buffers.pop()
+    _insert_entries(entries)
+
+
+def record_change(
+    course_id,
+    object_type: ChangeObjectType,
+    object_id,
+    action: ChangeAction = ChangeAction.UPSERT,
+) -> None:
+    if course_id is None or object_id is None:
+        return
+    record_changes(course_id, object_type, [object_id], action)
+
+
+def record_changes(
+    course_id,
+    object_type: ChangeObjectType,
+    object_ids,
+    action: ChangeAction = ChangeAction.UPSERT,
+) -> None:
+    entries = []
+    for object_id in object_ids:
+        entry = ChangeLogEntry(
+            course_id=course_id,
+            object_type=object_type.value,
+            object_id=object_id,
+            action=action.value,
+        )
+        entries.append(entry)
+    _insert_entries(entries)
+
+
+def prune_change_log(before) -> int:
+    deleted_count, _ = ChangeLogEntry.objects.filter(
+        occurred_at__lt=before
+    ).delete()
+    return deleted_count
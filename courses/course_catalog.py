@@ -0,0 +1,94 @@
+"""Denormalized catalog counts and the cached course list.
+
+The course list used to annotate homework, project and enrollment counts
+with three ``Count(..., distinct=True)`` joins on every homepage request.
+The counts now live in ``CourseCatalogStats``: signals adjust them, and
+``refresh_course_catalog_stats`` recounts them from scratch.
+"""
+
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from courses.models.course import Course, CourseCatalogStats, Enrollment
+from courses.models.homework import Homework
+from courses.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+COURSE_CATALOG_VERSION_KEY = "course_catalog_version"
+# Learner counts are adjusted without bumping the catalog version, so a
+# cached list shows them at most this stale.
+COURSE_CATALOG_CACHE_TTL = 10 * 60
+
+
+def course_catalog_cache_key() -> str:
+    version = cache.get(COURSE_CATALOG_VERSION_KEY, 1)
+    return f"course_catalog:v{version}"
+
+
+def _increment_course_catalog_version() -> None:
+    cache.add(COURSE_CATALOG_VERSION_KEY, 1, None)
+    cache.incr(COURSE_CATALOG_VERSION_KEY)
+
+
+def bump_course_catalog_version() -> None:
+    """Retire the cached list now and again once the transaction commits.
+
+    The second bump drops anything a concurrent request cached from the
+    pre-commit rows, as in ``courses.course_page_cache``.
+    """
+    _increment_course_catalog_version()
+    transaction.on_commit(_increment_course_catalog_version)
+
+
+def refresh_course_catalog_stats(course_id) -> CourseCatalogStats:
+    homework_count = Homework.objects.filter(course_id=course_id).count()
+    project_count = Project.objects.filter(course_id=course_id).count()
+    learner_count = Enrollment.objects.filter(course_id=course_id).count()
+    stats, _ = CourseCatalogStats.objects.update_or_create(
+        course_id=course_id,
+        defaults={
+            "homework_count": homework_count,
+            "project_count": project_count,
+            "learner_count": learner_count,
+        },
+    )
+    return stats
+
+
+def refresh_all_course_catalog_stats() -> int:
+    course_ids = Course.objects.values_list("id", flat=True)
+    refreshed_count = 0
+    for course_id in course_ids:
+        refresh_course_catalog_stats(course_id)
+        refreshed_count += 1
+    bump_course_catalog_version()
+    logger.info(f"Refreshed catalog stats for {refreshed_count} course(s)")
+    return refreshed_count
+
+
+def adjust_course_catalog_stats(course_id, field, delta) -> None:
+    """Add ``delta`` to one counter with a single UPDATE.
+
+    A course without a stats row is left alone rather than recounted here:
+    the signal may fire while the course itself is being deleted. The
+    refresh command creates missing rows.
+    """
+    CourseCatalogStats.objects.filter(course_id=course_id).update(
+        **{field: F(field) + delta}
+    )
+
+
+def course_catalog_counts(course) -> dict[str, int]:
+    try:
+        stats = course.catalog_stats
+    except CourseCatalogStats.DoesNotExist:
+        return {"homework_count": 0, "project_count": 0, "learner_count": 0}
+    return {
+        "homework_count": stats.homework_count,
+        "project_count": stats.project_count,
+        "learner_count": stats.learner_count,
+    }
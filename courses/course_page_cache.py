@@ -0,0 +1,96 @@
+"""Version counters for the cached course page.
+
+The course page caches a shared per-course part (homeworks, projects,
+registration campaign) and a per-(course, user) part (submissions, enrollment
+progress, registration). Both keys embed version counters instead of being
+deleted: bumping a course version invalidates the shared part and every
+user's part at once, bumping a user version only that user's part.
+Registrations are keyed by normalized email rather than user, so a
+registration write never has to look its user up.
+
+A bump increments the version right away, so later reads inside the
+writing transaction skip the stale entry, and again once that transaction
+commits, which retires anything a concurrent request cached from the
+pre-commit rows in between.
+
+The default cache is per-process LocMem, so a bump only reaches the
+process that made the write; the short TTL bounds how long other workers
+can serve a stale page.
+"""
+
+import logging
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+COURSE_PAGE_CACHE_TTL = 10 * 60
+
+
+def course_page_version_key(course_id) -> str:
+    return f"course_page_version:{course_id}"
+
+
+def course_page_user_version_key(course_id, user_id) -> str:
+    return f"course_page_user_version:{course_id}:{user_id}"
+
+
+def course_page_registration_version_key(course_id, email) -> str:
+    return f"course_page_registration_version:{course_id}:{email}"
+
+
+def course_page_version(course_id) -> int:
+    return cache.get(course_page_version_key(course_id), 1)
+
+
+def course_page_user_version(course_id, user_id) -> int:
+    return cache.get(course_page_user_version_key(course_id, user_id), 1)
+
+
+def course_page_registration_version(course_id, email) -> int:
+    version_key = course_page_registration_version_key(course_id, email)
+    return cache.get(version_key, 1)
+
+
+def _increment_version(version_key) -> None:
+    cache.add(version_key, 1, None)
+    cache.incr(version_key)
+
+
+def _bump(version_key) -> None:
+    _increment_version(version_key)
+    transaction.on_commit(partial(_increment_version, version_key))
+
+
+def bump_course_page_version(course_id) -> None:
+    if course_id is None:
+        return
+    _bump(course_page_version_key(course_id))
+    logger.debug(f"Invalidated course page cache for course {course_id}")
+
+
+def bump_course_page_user_version(course_id, user_id) -> None:
+    if course_id is None or user_id is None:
+        return
+    _bump(course_page_user_version_key(course_id, user_id))
+
+
+def bump_course_page_registration_version(course_id, email) -> None:
+    if course_id is None or not email:
+        return
+    _bump(course_page_registration_version_key(course_id, email))
+
+
+def course_page_shared_cache_key(course_id) -> str:
+    version = course_page_version(course_id)
+    return f"course_page:{course_id}:v{version}"
+
+
+def course_page_user_cache_key(course_id, user_id, email) -> str:
+    version = course_page_version(course_id)
+    user_version = course_page_user_version(course_id, user_id)
+    registration_version = course_page_registration_version(course_id, email)
+    versions = f"v{version}.{user_version}.{registration_version}"
+    return f"course_page_user:{course_id}:{user_id}:{versions}"
@@ -0,0 +1,37 @@
+"""Version counter for the cached graduates export.
+
+The graduates list depends on which project submissions passed, the
+course's ``min_projects_to_pass`` and the graduates' names. Every change
+to those bumps the course's version, which retires the cached body
+without deleting it. Bumps wait for the surrounding transaction to commit
+so a concurrent request cannot cache uncommitted state under the new
+version.
+"""
+
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+GRADUATES_CACHE_TTL = 24 * 60 * 60
+
+
+def graduates_version_key(course_id) -> str:
+    return f"graduates_version:{course_id}"
+
+
+def _increment_version(version_key) -> None:
+    cache.add(version_key, 1, None)
+    cache.incr(version_key)
+
+
+def bump_graduates_version(course_id) -> None:
+    if course_id is None:
+        return
+    version_key = graduates_version_key(course_id)
+    transaction.on_commit(partial(_increment_version, version_key))
+
+
+def graduates_cache_key(course_id) -> str:
+    version = cache.get(graduates_version_key(course_id), 1)
+    return f"graduates:{course_id}:v{version}"
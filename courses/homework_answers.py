@@ -0,0 +1,35 @@
+from courses.models.homework import Answer
+
+
+def save_submission_answers(submission, answers_by_question):
+    """Write answer texts for a submission in a fixed number of queries.
+
+    Existing answers are loaded in one query, then new answers are
+    inserted with one ``bulk_create`` and changed ones written with one
+    ``bulk_update``, instead of a SELECT plus INSERT/UPDATE per question.
+    ``answers_by_question`` is an iterable of ``(question, answer_text)``.
+    """
+    existing_answers = {}
+    for answer in Answer.objects.filter(submission=submission):
+        existing_answers.setdefault(answer.question_id, answer)
+
+    new_answers = []
+    changed_answers = []
+    for question, answer_text in answers_by_question:
+        answer = existing_answers.get(question.id)
+        if answer is None:
+            answer = Answer(
+                submission=submission,
+                question=question,
+                answer_text=answer_text,
+            )
+            new_answers.append(answer)
+            continue
+        if answer.answer_text != answer_text:
+            answer.answer_text = answer_text
+            changed_answers.append(answer)
+
+    if new_answers:
+        Answer.objects.bulk_create(new_answers)
+    if changed_answers:
+        Answer.objects.bulk_update(changed_answers, ["answer_text"])
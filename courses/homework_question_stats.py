@@ -1,10 +1,14 @@
 from collections import Counter
 from dataclasses import dataclass
+from functools import partial
 
+from django.core.cache import cache
+from django.db import transaction
 
 from courses.models.homework import (
     Answer,
     Homework,
+    HomeworkQuestionStatistics,
     Question,
 )
 from courses.views.homework_answer_formatting import (
@@ -12,6 +16,17 @@ from courses.views.homework_answer_formatting import (
 )
 
 
+QUESTION_STATS_CACHE_TTL = 3600
+STATISTICS_FIELDS = [
+    "homework",
+    "total_answers",
+    "correct_answers",
+    "option_counts",
+    "free_form_counts",
+    "last_calculated",
+]
+
+
 @dataclass(frozen=True)
 class ChoiceOptionStat:
     index: int
@@ -34,40 +49,130 @@ class QuestionStat:
     free_form_values: list[tuple[str, int]] | None
 
 
-def homework_question_stats(homework: Homework) -> list[QuestionStat]:
+def question_stats_cache_key(homework_id) -> str:
+    return f"homework_question_stats:{homework_id}"
+
+
+def calculate_homework_question_statistics(homework: Homework):
+    """Count answers per question once and persist them.
+
+    Called when the homework is scored or re-scored; the stats page only
+    reads the stored counts afterwards.
+    """
     questions = list(
         Question.objects.filter(homework=homework).order_by("id")
     )
-    answers = list(
-        Answer.objects.filter(question__homework=homework).select_related(
-            "question"
+    answer_rows = Answer.objects.filter(
+        question__homework=homework
+    ).values_list("question_id", "answer_text", "is_correct")
+    rows_by_question: dict[int, list[tuple]] = {}
+    for question_id, answer_text, is_correct in answer_rows:
+        rows_by_question.setdefault(question_id, []).append(
+            (answer_text, is_correct)
         )
+
+    statistics = []
+    for question in questions:
+        question_rows = rows_by_question.get(question.id, [])
+        question_statistics = _count_question_answers(
+            homework, question, question_rows
+        )
+        statistics.append(question_statistics)
+
+    with transaction.atomic():
+        HomeworkQuestionStatistics.objects.filter(homework=homework).exclude(
+            question__in=questions
+        ).delete()
+        # The stats page recounts lazily, so two first reads can race here.
+        HomeworkQuestionStatistics.objects.bulk_create(
+            statistics,
+            update_conflicts=True,
+            unique_fields=["question"],
+            update_fields=STATISTICS_FIELDS,
+        )
+    cache_key = question_stats_cache_key(homework.id)
+    transaction.on_commit(partial(cache.delete, cache_key))
+    return statistics
+
+
+def _count_question_answers(
+    homework: Homework, question: Question, rows: list[tuple]
+):
+    correct_answers = sum(1 for _, is_correct in rows if is_correct)
+    option_counts = {}
+    free_form_counts = []
+    if question.has_choice_answers():
+        option_counter: Counter = Counter()
+        for answer_text, _ in rows:
+            selected = extract_selected_option_indexes(answer_text)
+            option_counter.update(selected)
+        option_counts = {
+            str(index): count for index, count in option_counter.items()
+        }
+    else:
+        value_counter: Counter = Counter()
+        for answer_text, _ in rows:
+            text = (answer_text or "").strip()
+            if text:
+                value_counter[text] += 1
+        free_form_counts = [
+            [value, count] for value, count in value_counter.most_common()
+        ]
+
+    return HomeworkQuestionStatistics(
+        homework=homework,
+        question=question,
+        total_answers=len(rows),
+        correct_answers=correct_answers,
+        option_counts=option_counts,
+        free_form_counts=free_form_counts,
+    )
+
+
+def homework_question_stats(homework: Homework) -> list[QuestionStat]:
+    cache_key = question_stats_cache_key(homework.id)
+    stats = cache.get(cache_key)
+    if stats is not None:
+        return stats
+
+    statistics = list(
+        HomeworkQuestionStatistics.objects.filter(homework=homework)
+        .select_related("question")
+        .order_by("question_id")
     )
-    answers_by_question: dict[int, list[Answer]] = {}
-    for answer in answers:
-        answers_by_question.setdefault(answer.question_id, []).append(answer)
+    question_count = Question.objects.filter(homework=homework).count()
+    if len(statistics) != question_count:
+        # Scored before per-question statistics were stored, or the
+        # questions changed since: recount once.
+        statistics = calculate_homework_question_statistics(homework)
 
     stats = []
-    for question in questions:
-        question_answers = answers_by_question.get(question.id, [])
-        stat = _build_question_stat(question, question_answers)
+    for question_statistics in statistics:
+        stat = _build_question_stat(question_statistics)
         stats.append(stat)
+    cache.set(cache_key, stats, QUESTION_STATS_CACHE_TTL)
     return stats
 
 
 def _build_question_stat(
-    question: Question, answers: list[Answer]
+    question_statistics: HomeworkQuestionStatistics,
 ) -> QuestionStat:
-    total = len(answers)
-    correct = sum(1 for a in answers if a.is_correct)
+    question = question_statistics.question
+    total = question_statistics.total_answers
+    correct = question_statistics.correct_answers
     pct_correct = round(correct / total * 100, 1) if total else None
 
     if question.has_choice_answers():
-        choice_options = _choice_distribution(question, answers)
+        choice_options = _choice_distribution(
+            question, question_statistics.option_counts, total
+        )
         free_form_values = None
     else:
         choice_options = None
-        free_form_values = _free_form_distribution(answers)
+        free_form_values = [
+            (value, count)
+            for value, count in question_statistics.free_form_counts
+        ]
 
     return QuestionStat(
         question_id=question.id,
@@ -83,22 +188,15 @@ def _build_question_stat(
 
 
 def _choice_distribution(
-    question: Question, answers: list[Answer]
+    question: Question, option_counts: dict, total: int
 ) -> list[ChoiceOptionStat]:
     possible_answers = question.get_possible_answers()
     correct_indices = question.get_correct_answer_indices()
-    total = len(answers)
-
-    option_counter: Counter = Counter()
-    for answer in answers:
-        selected = extract_selected_option_indexes(answer.answer_text)
-        for index in selected:
-            option_counter[index] += 1
 
     options = []
     for index in range(1, len(possible_answers) + 1):
         label = possible_answers[index - 1]
-        count = option_counter.get(index, 0)
+        count = option_counts.get(str(index), 0)
         pct = round(count / total * 100, 1) if total else 0.0
         is_correct = index in correct_indices
         options.append(
@@ -111,14 +209,3 @@ def _choice_distribution(
             )
         )
     return options
-
-
-def _free_form_distribution(
-    answers: list[Answer]
-) -> list[tuple[str, int]]:
-    value_counter: Counter = Counter()
-    for answer in answers:
-        text = (answer.answer_text or "").strip()
-        if text:
-            value_counter[text] += 1
-    return value_counter.most_common()
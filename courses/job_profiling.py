@@ -0,0 +1,141 @@
+"""Opt-in phase timers and cProfile dumps for scoring and leaderboard jobs.
+
+Profiling is enabled per call (``profile=True``, e.g. from the cadmin score
+form) or for every run with ``JOB_PROFILING_ENABLED``. A disabled profiler
+costs one attribute check per phase.
+
+Use the profiler as a context manager around the job: it records the
+``JobProfile`` when the job finishes and only stops cProfile when it raises.
+"""
+
+import cProfile
+import logging
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from course_management.observability.request_metrics import QueryMetrics
+
+from .models.profiling import JobProfile
+
+logger = logging.getLogger(__name__)
+
+
+def job_profiling_enabled(profile=None) -> bool:
+    if profile is not None:
+        return profile
+    return getattr(settings, "JOB_PROFILING_ENABLED", False)
+
+
+class JobProfiler:
+    def __init__(self, job_name, *, target="", course=None):
+        self.job_name = job_name
+        self.target = target
+        self.course = course
+        self.phases = []
+        self.started_at = timezone.now()
+        self._started = perf_counter()
+        self._cprofile = None
+        if getattr(settings, "JOB_PROFILE_DIR", ""):
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.abort()
+        return False
+
+    @contextmanager
+    def phase(self, name):
+        queries = QueryMetrics(slowest_limit=0)
+        started = perf_counter()
+        try:
+            with connection.execute_wrapper(queries):
+                yield
+        finally:
+            duration_ms = (perf_counter() - started) * 1000
+            self.phases.append(
+                {
+                    "name": name,
+                    "duration_ms": round(duration_ms, 2),
+                    "query_count": queries.query_count,
+                    "query_time_ms": round(queries.query_time_ms, 2),
+                }
+            )
+
+    def finish(self) -> JobProfile:
+        duration_ms = (perf_counter() - self._started) * 1000
+        profile_path = self._dump_cprofile()
+        job_profile = JobProfile.objects.create(
+            job_name=self.job_name,
+            target=self.target,
+            course=self.course,
+            started_at=self.started_at,
+            duration_ms=round(duration_ms, 2),
+            phases=self.phases,
+            profile_path=profile_path,
+        )
+        logger.info(
+            "Profiled %s %s in %.2f ms: %s",
+            self.job_name,
+            self.target,
+            duration_ms,
+            self.phases,
+        )
+        return job_profile
+
+    def abort(self) -> None:
+        """Stop profiling a job that raised; nothing is recorded."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile = None
+        logger.info(
+            "Profiling of %s %s stopped by an error after: %s",
+            self.job_name,
+            self.target,
+            self.phases,
+        )
+
+    def _dump_cprofile(self) -> str:
+        if self._cprofile is None:
+            return ""
+        self._cprofile.disable()
+        profile_dir = Path(settings.JOB_PROFILE_DIR)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        stamp = self.started_at.strftime("%Y%m%dT%H%M%S")
+        target = self.target.replace("/", "-")
+        path = profile_dir / f"{self.job_name}-{target}-{stamp}.prof"
+        self._cprofile.dump_stats(path)
+        return str(path)
+
+
+class NoopJobProfiler:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+    def phase(self, name):
+        return nullcontext()
+
+    def finish(self):
+        return None
+
+    def abort(self):
+        return None
+
+
+def job_profiler(job_name, *, target="", course=None, profile=None):
+    if not job_profiling_enabled(profile):
+        return NoopJobProfiler()
+    return JobProfiler(job_name, target=target, course=course)
@@ -4,6 +4,10 @@ from time import time
 from django.core.cache import cache
 from django.db.models import Sum
 
+from courses.change_log import record_changes
+from courses.course_page_cache import bump_course_page_version
+from courses.job_profiling import job_profiler
+from courses.models.change_log import ChangeObjectType
 from courses.models.course import Enrollment
 from courses.models.homework import Submission
 from courses.models.project import (
@@ -51,6 +55,12 @@ def _update_enrollment_totals(course):
     project_scores = _scores_by_enrollment(project_submissions)
     enrollment_queryset = Enrollment.objects.filter(course=course)
     enrollments = list(enrollment_queryset)
+    previous_standings = {}
+    for enrollment in enrollments:
+        previous_standings[enrollment.id] = (
+            enrollment.total_score,
+            enrollment.position_on_leaderboard,
+        )
 
     for enrollment in enrollments:
         enrollment.total_score = (
@@ -65,6 +75,16 @@ def _update_enrollment_totals(course):
         ["total_score", "position_on_leaderboard"],
     )
 
+    changed_ids = []
+    for enrollment in enrollments:
+        standing = (
+            enrollment.total_score,
+            enrollment.position_on_leaderboard,
+        )
+        if standing != previous_standings[enrollment.id]:
+            changed_ids.append(enrollment.id)
+    record_changes(course.id, ChangeObjectType.ENROLLMENT, changed_ids)
+
 
 def _invalidate_leaderboard_caches(course):
     cache.delete(f"leaderboard:{course.id}")
@@ -72,13 +92,24 @@ def _invalidate_leaderboard_caches(course):
     cache.delete(f"leaderboard_yaml:{course.id}")
     version_key = f"leaderboard_cache_version:{course.id}"
     cache.set(version_key, cache.get(version_key, 1) + 1, None)
+    # Enrollment totals shown on the course page were bulk-updated.
+    bump_course_page_version(course.id)
     logger.info(f"Invalidated cache for leaderboard of course {course.id}")
 
 
-def update_leaderboard(course):
+def update_leaderboard(course, profile=None):
     started_at = time()
     logger.info(f"Updating leaderboard for course {course.id}")
-    _update_enrollment_totals(course)
-    _invalidate_leaderboard_caches(course)
+    profiler = job_profiler(
+        "update_leaderboard",
+        target=course.slug,
+        course=course,
+        profile=profile,
+    )
+    with profiler:
+        with profiler.phase("totals"):
+            _update_enrollment_totals(course)
+        with profiler.phase("invalidate_caches"):
+            _invalidate_leaderboard_caches(course)
     duration = time() - started_at
     logger.info(f"Updated leaderboard in {duration:.2f} seconds")
@@ -9,7 +9,7 @@ from course_management.datamailer.recipient_list_audit import (
     audit_batches_against_datamailer,
 )
 from course_management.datamailer.recipient_list_batches import (
-    build_batches,
+    iter_batches,
 )
 from course_management.datamailer.recipient_list_sources import (
     RECIPIENT_LIST_KINDS,
@@ -39,7 +39,18 @@ def add_audit_behavior_arguments(parser):
         "--limit",
         type=int,
         default=10000,
-        help="Maximum Datamailer members to fetch per list.",
+        help=(
+            "Maximum Datamailer members to fetch per list, or per page "
+            "with --paged."
+        ),
+    )
+    parser.add_argument(
+        "--paged",
+        action="store_true",
+        help=(
+            "Page through Datamailer members and merge-join them against "
+            "CMP by source_object_key, reporting drift as it is found."
+        ),
     )
     parser.add_argument(
         "--repair",
@@ -68,29 +79,29 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         config = self._datamailer_config()
         self._validate_options(options)
-        batches = build_batches(
+        batches = iter_batches(
             options["kind"],
             course_slug=options["course_slug"],
             homework_slug=options["homework_slug"],
             project_slug=options["project_slug"],
         )
-        if not batches:
-            self.stdout.write(
-                "No Datamailer recipient-list members to audit."
-            )
-            return
-
         audit_data = recipient_list_audit_run_data(
             config,
             batches,
             options,
         )
-        drift_count = audit_batches_against_datamailer(
+        totals = audit_batches_against_datamailer(
             audit_data,
             self.stdout.write,
         )
-        self._write_audit_summary(batches, drift_count)
-        self._fail_on_drift_if_requested(drift_count, options)
+        if not totals.list_count:
+            self.stdout.write(
+                "No Datamailer recipient-list members to audit."
+            )
+            return
+
+        self._write_audit_summary(totals)
+        self._fail_on_drift_if_requested(totals.drift_count, options)
 
     def _datamailer_config(self):
         config = DatamailerConfig.from_settings()
@@ -101,10 +112,10 @@ class Command(BaseCommand):
         )
         return config
 
-    def _write_audit_summary(self, batches, drift_count):
+    def _write_audit_summary(self, totals):
         self.stdout.write(
-            f"Audited {len(batches)} recipient list(s); "
-            f"drifted={drift_count}."
+            f"Audited {totals.list_count} recipient list(s); "
+            f"drifted={totals.drift_count}."
         )
 
     def _fail_on_drift_if_requested(self, drift_count, options):
@@ -127,6 +138,7 @@ def recipient_list_audit_run_data(config, batches, options):
         batches=batches,
         limit=options["limit"],
         repair=options["repair"],
+        paged=options["paged"],
     )
     return audit_data
 
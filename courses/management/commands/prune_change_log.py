@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from courses.change_log import prune_change_log
+
+DEFAULT_RETENTION_DAYS = 90
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete change feed entries older than --days. Clients whose "
+        "cursor is older than the retention window must re-sync from the "
+        "full exports."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=DEFAULT_RETENTION_DAYS,
+            help=f"Retention in days (default {DEFAULT_RETENTION_DAYS}).",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        if days < 1:
+            raise CommandError("--days must be at least 1.")
+        before = timezone.now() - timedelta(days=days)
+        deleted_count = prune_change_log(before)
+        self.stdout.write(
+            f"Deleted {deleted_count} change log entries older than "
+            f"{days} day(s)"
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from courses.registration_campaign_stats import (
+    reconcile_registration_campaign_stats,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount total, role, country and region registration counts for "
+        "every campaign. Signals keep them current; run this periodically "
+        "to fix drift from bulk writes."
+    )
+
+    def handle(self, *args, **options):
+        fixed_count = reconcile_registration_campaign_stats()
+        self.stdout.write(
+            f"Fixed registration stats for {fixed_count} campaign(s)"
+        )
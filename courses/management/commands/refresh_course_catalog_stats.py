@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from courses.course_catalog import refresh_all_course_catalog_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount homework, project and learner counts shown in the course "
+        "catalog. Signals keep them current; run this periodically to fix "
+        "drift from bulk writes."
+    )
+
+    def handle(self, *args, **options):
+        refreshed_count = refresh_all_course_catalog_stats()
+        self.stdout.write(
+            f"Refreshed catalog stats for {refreshed_count} course(s)"
+        )
@@ -7,7 +7,8 @@ from course_management.datamailer.client import (
     DatamailerConfig,
 )
 from course_management.datamailer.recipient_list_batches import (
-    build_batches as build_recipient_list_batches,
+    RecipientListBatchTotals,
+    iter_batches as iter_recipient_list_batches,
 )
 from course_management.datamailer.recipient_list_sources import (
     PROJECT_FILTER_KINDS,
@@ -26,7 +27,7 @@ from course_management.datamailer.recipient_list_sync import (
 class RecipientListSyncRequest:
     config: DatamailerConfig
     kind: str
-    batches: dict
+    batches: object
     options: dict
 
 
@@ -44,6 +45,11 @@ def validate_recipient_list_options(kind, options):
         "import_poll_interval",
         "--import-poll-interval",
     )
+    _validate_positive_import_option(
+        options,
+        "batch_size",
+        "--batch-size",
+    )
 
 
 def _validate_homework_filter(kind, options):
@@ -145,22 +151,43 @@ def add_execution_arguments(parser):
         action="store_true",
         help="Print planned batches without calling Datamailer.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=5000,
+        help=(
+            "Maximum members per inline bulk upsert. Reconcile and "
+            "import-by-reference runs always send each list whole."
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Resend lists and members whose content hash is unchanged.",
+    )
+
 
+def batch_member_limit(options):
+    if options["reconcile"] or options["import_by_reference"]:
+        return None
+    return options["batch_size"]
 
-def write_batch_summary(write_line, batches):
-    total_members = 0
-    for payload in batches.values():
-        total_members += len(payload["members"])
+
+def write_batch_summary(write_line, totals):
     write_line(
-        f"Prepared {len(batches)} recipient list(s), {total_members} member(s)."
+        f"Prepared {totals.list_count} recipient list(s), "
+        f"{totals.member_count} member(s)."
     )
 
 
 def write_dry_run(write_line, batches, options):
-    for list_key, payload in batches.items():
+    totals = RecipientListBatchTotals()
+    for list_key, payload in batches:
         write_line(f"{list_key}: {len(payload['members'])} member(s)")
         if options["import_by_reference"]:
             write_line(f"{list_key}: would create import job")
+        totals.add(list_key, payload)
+    return totals
 
 
 def sync_batches(request, write_line):
@@ -179,8 +206,9 @@ def sync_batches(request, write_line):
         reconcile=request.options["reconcile"],
         import_by_reference=request.options["import_by_reference"],
         import_options=import_options,
+        force=request.options["force"],
     )
-    sync_recipient_list_batches(sync_data, write_line)
+    return sync_recipient_list_batches(sync_data, write_line)
 
 
 class Command(BaseCommand):
@@ -197,29 +225,30 @@ class Command(BaseCommand):
         kind = options["kind"]
         validate_recipient_list_options(kind, options)
 
-        batches = build_recipient_list_batches(
+        batches = iter_recipient_list_batches(
             kind,
             course_slug=options["course_slug"],
             homework_slug=options["homework_slug"],
             project_slug=options["project_slug"],
+            max_members=batch_member_limit(options),
         )
-        if not batches:
-            self.stdout.write("No Datamailer recipient-list members to sync.")
-            return
-
-        write_batch_summary(self.stdout.write, batches)
 
         if options["dry_run"]:
-            write_dry_run(self.stdout.write, batches, options)
+            totals = write_dry_run(self.stdout.write, batches, options)
+        else:
+            sync_request = RecipientListSyncRequest(
+                config=config,
+                kind=kind,
+                batches=batches,
+                options=options,
+            )
+            totals = sync_batches(sync_request, self.stdout.write)
+
+        if not totals.list_count:
+            self.stdout.write("No Datamailer recipient-list members to sync.")
             return
 
-        sync_request = RecipientListSyncRequest(
-            config=config,
-            kind=kind,
-            batches=batches,
-            options=options,
-        )
-        sync_batches(sync_request, self.stdout.write)
+        write_batch_summary(self.stdout.write, totals)
 
     def get_datamailer_config(self):
         config = DatamailerConfig.from_settings()
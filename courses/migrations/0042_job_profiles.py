@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0041_system_project_evaluations'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_name', models.CharField(db_index=True, max_length=80)),
+                ('target', models.CharField(blank=True, max_length=255)),
+                ('started_at', models.DateTimeField(db_index=True)),
+                ('duration_ms', models.FloatField()),
+                ('phases', models.JSONField(blank=True, default=list)),
+                ('profile_path', models.CharField(blank=True, max_length=500)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('course', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='job_profiles', to='courses.course')),
+            ],
+            options={
+                'ordering': ['-started_at', '-id'],
+            },
+        ),
+    ]
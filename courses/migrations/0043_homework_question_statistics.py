@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0042_job_profiles'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HomeworkQuestionStatistics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_answers', models.IntegerField(default=0)),
+                ('correct_answers', models.IntegerField(default=0)),
+                ('option_counts', models.JSONField(blank=True, default=dict)),
+                ('free_form_counts', models.JSONField(blank=True, default=list)),
+                ('last_calculated', models.DateTimeField(auto_now=True)),
+                ('homework', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='question_statistics', to='courses.homework')),
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='statistics', to='courses.question')),
+            ],
+        ),
+    ]
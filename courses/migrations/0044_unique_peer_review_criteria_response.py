@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:13
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def remove_duplicate_criteria_responses(apps, schema_editor):
+    # Keep the newest response for each (review, criteria) pair.
+    CriteriaResponse = apps.get_model("courses", "CriteriaResponse")
+    duplicates = (
+        CriteriaResponse.objects.values("review_id", "criteria_id")
+        .annotate(keep_id=Max("id"), response_count=models.Count("id"))
+        .filter(response_count__gt=1)
+    )
+    for duplicate in duplicates:
+        CriteriaResponse.objects.filter(
+            review_id=duplicate["review_id"],
+            criteria_id=duplicate["criteria_id"],
+        ).exclude(id=duplicate["keep_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0043_homework_question_statistics'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_criteria_responses,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='criteriaresponse',
+            constraint=models.UniqueConstraint(fields=('review', 'criteria'), name='unique_peer_review_criteria_response'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_course_catalog_stats(apps, schema_editor):
+    Course = apps.get_model("courses", "Course")
+    CourseCatalogStats = apps.get_model("courses", "CourseCatalogStats")
+    courses = Course.objects.annotate(
+        homework_total=models.Count("homework", distinct=True),
+        project_total=models.Count("project", distinct=True),
+        learner_total=models.Count("enrollment", distinct=True),
+    )
+    stats = []
+    for course in courses:
+        stats.append(
+            CourseCatalogStats(
+                course=course,
+                homework_count=course.homework_total,
+                project_count=course.project_total,
+                learner_count=course.learner_total,
+            )
+        )
+    CourseCatalogStats.objects.bulk_create(stats)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0044_unique_peer_review_criteria_response'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseCatalogStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('homework_count', models.IntegerField(default=0)),
+                ('project_count', models.IntegerField(default=0)),
+                ('learner_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='catalog_stats', to='courses.course')),
+            ],
+        ),
+        migrations.RunPython(
+            populate_course_catalog_stats,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-19 00:46
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0045_course_catalog_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.IntegerField()),
+                ('object_type', models.CharField(choices=[('homework_submission', 'HOMEWORK_SUBMISSION'), ('project_submission', 'PROJECT_SUBMISSION'), ('enrollment', 'ENROLLMENT')], max_length=32)),
+                ('object_id', models.IntegerField()),
+                ('action', models.CharField(choices=[('upsert', 'UPSERT'), ('delete', 'DELETE')], default='upsert', max_length=8)),
+                ('occurred_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['course_id', 'id'], name='change_log_course_cursor'), models.Index(fields=['occurred_at'], name='change_log_occurred_at')],
+            },
+        ),
+    ]
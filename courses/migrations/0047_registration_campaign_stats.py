@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-19 01:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_registration_campaign_stats(apps, schema_editor):
+    RegistrationCampaign = apps.get_model("courses", "RegistrationCampaign")
+    CourseRegistration = apps.get_model("courses", "CourseRegistration")
+    RegistrationCampaignStats = apps.get_model(
+        "courses",
+        "RegistrationCampaignStats",
+    )
+    stats = []
+    for campaign in RegistrationCampaign.objects.all():
+        registrations = CourseRegistration.objects.filter(campaign=campaign)
+        counts = {"total": registrations.count()}
+        for field in ("role", "country", "region"):
+            grouped_values = registrations.values(field).annotate(
+                count=models.Count("id")
+            )
+            field_counts = {}
+            for item in grouped_values.order_by(field):
+                field_counts[item[field]] = item["count"]
+            counts[f"by_{field}"] = field_counts
+        stats.append(RegistrationCampaignStats(campaign=campaign, **counts))
+    RegistrationCampaignStats.objects.bulk_create(stats)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0046_change_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistrationCampaignStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total', models.IntegerField(default=0)),
+                ('by_role', models.JSONField(default=dict)),
+                ('by_country', models.JSONField(default=dict)),
+                ('by_region', models.JSONField(default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('campaign', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='courses.registrationcampaign')),
+            ],
+        ),
+        migrations.RunPython(
+            populate_registration_campaign_stats,
+            migrations.RunPython.noop,
+        ),
+    ]
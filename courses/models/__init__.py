@@ -1,25 +1,31 @@
-from . import course, project, homework, wrapped  # noqa: F401
+from . import change_log, course, project, homework, profiling, wrapped  # noqa: F401
 
 from django.contrib.auth import get_user_model
 
+from .change_log import ChangeAction, ChangeLogEntry, ChangeObjectType
 from .course import (
+    CertificateUpdateJob,
     Course,
+    CourseCatalogStats,
     CourseRegistration,
     Enrollment,
     LeaderboardComplaint,
     RegistrationCampaign,
+    RegistrationCampaignStats,
 )
 from .homework import (
     Answer,
     AnswerTypes,
     Homework,
     HomeworkState,
+    HomeworkQuestionStatistics,
     HomeworkStatistics,
     QUESTION_ANSWER_DELIMITER,
     Question,
     QuestionTypes,
     Submission,
 )
+from .profiling import JobProfile
 from .project import (
     CriteriaResponse,
     PeerReview,
@@ -42,13 +48,20 @@ User = get_user_model()
 __all__ = (
     "Answer",
     "AnswerTypes",
+    "CertificateUpdateJob",
+    "ChangeAction",
+    "ChangeLogEntry",
+    "ChangeObjectType",
     "Course",
+    "CourseCatalogStats",
     "CourseRegistration",
     "CriteriaResponse",
     "Enrollment",
     "Homework",
     "HomeworkState",
+    "HomeworkQuestionStatistics",
     "HomeworkStatistics",
+    "JobProfile",
     "LeaderboardComplaint",
     "PeerReview",
     "PeerReviewState",
@@ -62,6 +75,7 @@ __all__ = (
     "Question",
     "QuestionTypes",
     "RegistrationCampaign",
+    "RegistrationCampaignStats",
     "ReviewCriteria",
     "ReviewCriteriaTypes",
     "SystemEvaluationCriteriaResponse",
@@ -0,0 +1,61 @@
+from enum import Enum
+
+from django.db import models
+from django.utils import timezone
+
+
+class ChangeObjectType(Enum):
+    HOMEWORK_SUBMISSION = "homework_submission"
+    PROJECT_SUBMISSION = "project_submission"
+    ENROLLMENT = "enrollment"
+
+
+class ChangeAction(Enum):
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+
+def _enum_choices(enum_class):
+    choices = []
+    for member in enum_class:
+        choice = (member.value, member.name)
+        choices.append(choice)
+    return choices
+
+
+class ChangeLogEntry(models.Model):
+    """One insert, update or delete of a row exposed by the change feed.
+
+    The auto-increment ``id`` is the feed cursor. ``course_id`` is a plain
+    column rather than a foreign key so that rows deleted together with
+    their course can still be logged while the course row is going away.
+    """
+
+    course_id = models.IntegerField()
+    object_type = models.CharField(
+        max_length=32,
+        choices=_enum_choices(ChangeObjectType),
+    )
+    object_id = models.IntegerField()
+    action = models.CharField(
+        max_length=8,
+        choices=_enum_choices(ChangeAction),
+        default=ChangeAction.UPSERT.value,
+    )
+    occurred_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(
+                fields=["course_id", "id"],
+                name="change_log_course_cursor",
+            ),
+            models.Index(
+                fields=["occurred_at"],
+                name="change_log_occurred_at",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.object_type} {self.object_id} {self.action}"
@@ -103,6 +103,27 @@ class Course(models.Model):
                 )
 
 
+class CourseCatalogStats(models.Model):
+    """Denormalized counts shown in the course catalog.
+
+    Kept current by signals in ``courses.signals`` and recounted by the
+    ``refresh_course_catalog_stats`` command.
+    """
+
+    course = models.OneToOneField(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="catalog_stats",
+    )
+    homework_count = models.IntegerField(default=0)
+    project_count = models.IntegerField(default=0)
+    learner_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Catalog stats for {self.course}"
+
+
 class RegistrationCampaign(models.Model):
     slug = models.SlugField(unique=True, blank=False)
     title = models.CharField(max_length=200)
@@ -209,6 +230,29 @@ class CourseRegistration(models.Model):
         return f"{self.email_normalized} registered for {self.campaign}"
 
 
+class RegistrationCampaignStats(models.Model):
+    """Denormalized registration counts for one campaign.
+
+    The ``by_*`` fields map each role, country and region value to its
+    registration count. Kept current by signals in ``courses.signals`` and
+    recounted by the ``reconcile_registration_campaign_stats`` command.
+    """
+
+    campaign = models.OneToOneField(
+        RegistrationCampaign,
+        on_delete=models.CASCADE,
+        related_name="stats",
+    )
+    total = models.IntegerField(default=0)
+    by_role = models.JSONField(default=dict)
+    by_country = models.JSONField(default=dict)
+    by_region = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Registration stats for {self.campaign}"
+
+
 class Enrollment(models.Model):
     class Meta:
         unique_together = ["student", "course"]
@@ -258,6 +302,61 @@ class Enrollment(models.Model):
         return f"{self.student} enrolled in {self.course}"
 
 
+class CertificateUpdateJob(models.Model):
+    """A bulk certificate URL update processed outside the request.
+
+    ``certificates`` holds the submitted ``{email, certificate_path}``
+    items. Workers apply them in chunks and record progress after each
+    chunk, so a job interrupted mid-way resumes at ``processed_count``.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        SUCCEEDED = "succeeded", "Succeeded"
+        FAILED = "failed", "Failed"
+
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="certificate_update_jobs",
+    )
+    requested_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="certificate_update_jobs",
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    certificates = models.JSONField(default=list)
+    total_count = models.PositiveIntegerField(default=0)
+    processed_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "created_at"],
+                name="cert_job_status_created_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Certificate update job {self.pk} for {self.course}"
+
+
 class LeaderboardComplaint(models.Model):
     class IssueType(models.TextChoices):
         LEARNING_IN_PUBLIC = (
@@ -248,6 +248,37 @@ class Answer(models.Model):
         return f"Answer id={self.id} for {self.question}"
 
 
+class HomeworkQuestionStatistics(models.Model):
+    """Per-question answer counts, computed when the homework is scored.
+
+    ``option_counts`` maps 1-based option indexes to how many answers picked
+    them (choice questions); ``free_form_counts`` holds ``[value, count]``
+    pairs, most common first (free-form questions). Labels and correct
+    options are read from the question at render time.
+    """
+
+    homework = models.ForeignKey(
+        Homework,
+        on_delete=models.CASCADE,
+        related_name="question_statistics",
+    )
+    question = models.OneToOneField(
+        Question,
+        on_delete=models.CASCADE,
+        related_name="statistics",
+    )
+
+    total_answers = models.IntegerField(default=0)
+    correct_answers = models.IntegerField(default=0)
+    option_counts = models.JSONField(default=dict, blank=True)
+    free_form_counts = models.JSONField(default=list, blank=True)
+
+    last_calculated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Statistics for question {self.question_id}"
+
+
 class HomeworkStatistics(models.Model):
     homework = models.OneToOneField(
         Homework, on_delete=models.CASCADE, related_name="statistics"
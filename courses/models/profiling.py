@@ -0,0 +1,28 @@
+from django.db import models
+
+from .course import Course
+
+
+class JobProfile(models.Model):
+    """Phase timings from one profiled scoring or leaderboard run."""
+
+    job_name = models.CharField(max_length=80, db_index=True)
+    target = models.CharField(max_length=255, blank=True)
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="job_profiles",
+    )
+    started_at = models.DateTimeField(db_index=True)
+    duration_ms = models.FloatField()
+    phases = models.JSONField(default=list, blank=True)
+    profile_path = models.CharField(max_length=500, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-started_at", "-id"]
+
+    def __str__(self):
+        return f"{self.job_name} {self.target} ({self.duration_ms:.0f} ms)"
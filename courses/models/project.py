@@ -240,6 +240,14 @@ class CriteriaResponse(models.Model):
     )
     answer = models.CharField(max_length=255, blank=True, null=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["review", "criteria"],
+                name="unique_peer_review_criteria_response",
+            )
+        ]
+
     def get_scores(self):
         criteria = self.criteria
 
@@ -12,6 +12,7 @@ from course_management.datamailer.sync.memberships import (
     sync_project_submission_to_datamailer,
 )
 
+from courses.models.change_log import ChangeObjectType
 from courses.models.project import (
     Project,
     ProjectSubmission,
@@ -21,6 +22,8 @@ from courses.models.project import (
 )
 
 from . import project_assignment
+from .change_log import deferred_change_log, record_changes
+from .graduates_cache import bump_graduates_version
 from .leaderboard import update_leaderboard
 from .project_score_calculation import (
     calculate_project_scoring,
@@ -76,6 +79,17 @@ def _bulk_update_project_submissions(submissions_to_update):
     )
 
 
+def _log_project_submission_changes(project, submissions_to_update):
+    submission_ids = []
+    for submission in submissions_to_update:
+        submission_ids.append(submission.id)
+    record_changes(
+        project.course_id,
+        ChangeObjectType.PROJECT_SUBMISSION,
+        submission_ids,
+    )
+
+
 def _sync_project_submissions_after_commit(submissions_to_update):
     for submission in submissions_to_update:
         callback = partial(
@@ -97,6 +111,12 @@ def _complete_scored_project(
     calculation,
 ):
     _bulk_update_project_submissions(calculation.submissions_to_update)
+    _log_project_submission_changes(
+        project,
+        calculation.submissions_to_update,
+    )
+    # ``passed`` flags were bulk-updated without signals.
+    bump_graduates_version(project.course_id)
     _sync_project_submissions_after_commit(calculation.submissions_to_update)
     submission_ids = calculation.submissions.keys()
     _replace_project_evaluation_scores(
@@ -142,7 +162,7 @@ def _score_project_with_reviews(project, peer_reviews):
 def score_project(
     project: Project,
 ) -> tuple[project_assignment.ProjectActionStatus, str]:
-    with transaction.atomic():
+    with transaction.atomic(), deferred_change_log():
         t0 = time()
 
         peer_reviews, error = _project_scoreable_peer_reviews(project)
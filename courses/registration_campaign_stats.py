@@ -0,0 +1,123 @@
+"""Denormalized registration counts per campaign.
+
+Campaign dashboards used to run a total count plus three ``GROUP BY``
+queries over ``CourseRegistration`` on every request. The counts now live
+in one ``RegistrationCampaignStats`` row per campaign: signals adjust it
+when a registration is created, changed or deleted, and
+``reconcile_registration_campaign_stats`` recounts it from scratch.
+"""
+
+import logging
+
+from django.db import transaction
+from django.db.models import Count
+
+from courses.models.course import (
+    CourseRegistration,
+    RegistrationCampaign,
+    RegistrationCampaignStats,
+)
+
+logger = logging.getLogger(__name__)
+
+STATS_FIELDS = ("role", "country", "region")
+
+
+def registration_stats_values(registration) -> dict:
+    values = {"campaign_id": registration.campaign_id}
+    for field in STATS_FIELDS:
+        values[field] = getattr(registration, field) or ""
+    return values
+
+
+def count_registrations(campaign_id) -> dict:
+    registrations = CourseRegistration.objects.filter(campaign_id=campaign_id)
+    counts = {"total": registrations.count()}
+    for field in STATS_FIELDS:
+        grouped_values = registrations.values(field).annotate(
+            count=Count("id")
+        )
+        field_counts = {}
+        for item in grouped_values.order_by(field):
+            field_counts[item[field]] = item["count"]
+        counts[f"by_{field}"] = field_counts
+    return counts
+
+
+def refresh_registration_campaign_stats(campaign_id):
+    counts = count_registrations(campaign_id)
+    stats, _ = RegistrationCampaignStats.objects.update_or_create(
+        campaign_id=campaign_id,
+        defaults=counts,
+    )
+    return stats
+
+
+def reconcile_registration_campaign_stats() -> int:
+    """Recount every campaign and return how many rows had drifted."""
+    fixed_count = 0
+    campaign_ids = RegistrationCampaign.objects.values_list("id", flat=True)
+    for campaign_id in campaign_ids:
+        counts = count_registrations(campaign_id)
+        stats = RegistrationCampaignStats.objects.filter(
+            campaign_id=campaign_id
+        ).first()
+        if stats is not None and _stats_counts(stats) == counts:
+            continue
+        RegistrationCampaignStats.objects.update_or_create(
+            campaign_id=campaign_id,
+            defaults=counts,
+        )
+        fixed_count += 1
+    logger.info(f"Reconciled registration stats: {fixed_count} fixed")
+    return fixed_count
+
+
+def _stats_counts(stats) -> dict:
+    counts = {"total": stats.total}
+    for field in STATS_FIELDS:
+        counts[f"by_{field}"] = getattr(stats, f"by_{field}")
+    return counts
+
+
+def _adjust_bucket(buckets, value, delta) -> None:
+    count = buckets.get(value, 0) + delta
+    if count > 0:
+        buckets[value] = count
+    else:
+        buckets.pop(value, None)
+
+
+def adjust_registration_campaign_stats(values, delta) -> None:
+    """Add ``delta`` to the counters matching one registration's ``values``.
+
+    The row is locked for the read-modify-write so concurrent registrations
+    do not lose each other's increments. A campaign without a stats row is
+    left alone: the signal may fire while the campaign itself is being
+    deleted, and reads recount a missing row.
+    """
+    with transaction.atomic():
+        stats = (
+            RegistrationCampaignStats.objects.select_for_update()
+            .filter(campaign_id=values["campaign_id"])
+            .first()
+        )
+        if stats is None:
+            return
+        stats.total = max(stats.total + delta, 0)
+        for field in STATS_FIELDS:
+            buckets = getattr(stats, f"by_{field}")
+            _adjust_bucket(buckets, values[field], delta)
+        stats.save()
+
+
+def registration_campaign_stats_row(campaign):
+    stats = RegistrationCampaignStats.objects.filter(campaign=campaign).first()
+    if stats is None:
+        stats = refresh_registration_campaign_stats(campaign.id)
+    return stats
+
+
+def sorted_counts(buckets) -> list[tuple[str, int]]:
+    """Order ``{value: count}`` by count descending, then by value."""
+    return sorted(buckets.items(), key=lambda item: (-item[1], item[0]))
@@ -12,8 +12,12 @@ from django.db import transaction
 from course_management.observability import record_event
 
 from . import assignment_statistics, leaderboard
+from .change_log import deferred_change_log, record_changes
+from .homework_question_stats import calculate_homework_question_statistics
 from .homework_score_calculation import update_score
+from .job_profiling import job_profiler
 
+from .models.change_log import ChangeObjectType
 from .models.homework import (
     Answer,
     Homework,
@@ -72,8 +76,12 @@ def _score_homework_submission_batch(
         update_score(submission, submission_answers, save=False)
 
 
-def _persist_scored_homework_submissions(homework_id, submissions, answers):
-    logger.info(f"Updating the submissions for homework {homework_id}")
+def _persist_scored_homework_submissions(
+    homework,
+    submissions,
+    answers,
+):
+    logger.info(f"Updating the submissions for homework {homework.id}")
     Submission.objects.bulk_update(
         submissions,
         [
@@ -83,18 +91,30 @@ def _persist_scored_homework_submissions(homework_id, submissions, answers):
             "total_score",
         ],
     )
+    submission_ids = []
+    for submission in submissions:
+        submission_ids.append(submission.id)
+    record_changes(
+        homework.course_id,
+        ChangeObjectType.HOMEWORK_SUBMISSION,
+        submission_ids,
+    )
 
-    logger.info(f"Updating answers for homework {homework_id}")
+    logger.info(f"Updating answers for homework {homework.id}")
     Answer.objects.bulk_update(answers, ["is_correct"])
 
 
 def _homework_scoring_batch(homework_id):
-    submissions = Submission.objects.filter(
-        homework__id=homework_id
-    ).select_related("enrollment")
-    answers = Answer.objects.filter(
-        submission__in=submissions
-    ).select_related("question", "submission")
+    submissions = list(
+        Submission.objects.filter(
+            homework__id=homework_id
+        ).select_related("enrollment")
+    )
+    answers = list(
+        Answer.objects.filter(
+            submission__homework__id=homework_id
+        ).select_related("question", "submission")
+    )
     answers_by_submission_id = _answers_by_submission(answers)
     return HomeworkScoringBatch(
         submissions=submissions,
@@ -103,17 +123,23 @@ def _homework_scoring_batch(homework_id):
     )
 
 
-def _mark_homework_scored(homework):
+def _mark_homework_scored(homework, profiler):
     homework.state = HomeworkState.SCORED.value
     homework.save()
 
     course = homework.course
-    leaderboard.update_leaderboard(course)
+    with profiler.phase("leaderboard"):
+        leaderboard.update_leaderboard(course, profile=False)
 
     course.first_homework_scored = True
     course.save()
 
-    assignment_statistics.calculate_homework_statistics(homework, force=True)
+    with profiler.phase("statistics"):
+        assignment_statistics.calculate_homework_statistics(
+            homework,
+            force=True,
+        )
+        calculate_homework_question_statistics(homework)
 
 
 def _homework_scoring_success(homework_id, started_at):
@@ -126,21 +152,25 @@ def _homework_scoring_success(homework_id, started_at):
     )
 
 
-def _score_and_persist_homework_submissions(homework_id):
-    batch = _homework_scoring_batch(homework_id)
+def _score_and_persist_homework_submissions(homework, profiler):
+    homework_id = homework.id
+    with profiler.phase("load"):
+        batch = _homework_scoring_batch(homework_id)
     logger.info(
         f"Scoring {len(batch.answers_by_submission_id)} submissions for homework {homework_id}"
     )
 
-    _score_homework_submission_batch(
-        batch.submissions,
-        batch.answers_by_submission_id,
-    )
-    _persist_scored_homework_submissions(
-        homework_id,
-        batch.submissions,
-        batch.answers,
-    )
+    with profiler.phase("score"):
+        _score_homework_submission_batch(
+            batch.submissions,
+            batch.answers_by_submission_id,
+        )
+    with profiler.phase("persist"):
+        _persist_scored_homework_submissions(
+            homework,
+            batch.submissions,
+            batch.answers,
+        )
 
     logger.info(
         f"Scored {len(batch.submissions)} submissions for homework {homework_id}"
@@ -150,8 +180,14 @@ def _score_and_persist_homework_submissions(homework_id):
 def score_homework_submissions(
     homework_id: str,
     force: bool = False,
+    profile: bool | None = None,
 ) -> tuple[HomeworkScoringStatus, str]:
-    with transaction.atomic():
+    """Score every submission of a homework and refresh derived data.
+
+    ``profile`` records per-phase timings as a ``JobProfile``; ``None``
+    defers to ``JOB_PROFILING_ENABLED``.
+    """
+    with transaction.atomic(), deferred_change_log():
         t0 = time()
         logger.info(f"Scoring submissions for homework {homework_id}")
 
@@ -177,8 +213,15 @@ def score_homework_submissions(
             )
             return (HomeworkScoringStatus.FAIL, error)
 
-        _score_and_persist_homework_submissions(homework_id)
-        _mark_homework_scored(homework)
+        profiler = job_profiler(
+            "score_homework_submissions",
+            target=f"{homework.course.slug}/{homework.slug}",
+            course=homework.course,
+            profile=profile,
+        )
+        with profiler:
+            _score_and_persist_homework_submissions(homework, profiler)
+            _mark_homework_scored(homework, profiler)
         record_event(
             "homework.scored",
             properties={
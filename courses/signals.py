@@ -1,8 +1,14 @@
+import threading
 from functools import partial
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 
 from accounts.models import CustomUser
@@ -19,9 +25,33 @@ from course_management.datamailer.sync.membership_removals import (
 from course_management.datamailer.sync.memberships import (
     sync_enrollment_to_datamailer as sync_enrollment_recipient_list,
 )
-from courses.models.course import CourseRegistration, Enrollment
-from courses.models.homework import Submission
-from courses.models.project import ProjectSubmission
+from courses.change_log import record_change
+from courses.course_catalog import (
+    adjust_course_catalog_stats,
+    bump_course_catalog_version,
+    refresh_course_catalog_stats,
+)
+from courses.course_page_cache import (
+    bump_course_page_registration_version,
+    bump_course_page_user_version,
+    bump_course_page_version,
+)
+from courses.graduates_cache import bump_graduates_version
+from courses.models.change_log import ChangeAction, ChangeObjectType
+from courses.models.course import (
+    Course,
+    CourseRegistration,
+    Enrollment,
+    RegistrationCampaign,
+)
+from courses.models.homework import Homework, Submission
+from courses.models.project import PeerReview, Project, ProjectSubmission
+from courses.registration_campaign_stats import (
+    STATS_FIELDS,
+    adjust_registration_campaign_stats,
+    refresh_registration_campaign_stats,
+    registration_stats_values,
+)
 
 
 @receiver(post_save, sender=CustomUser)
@@ -79,3 +109,269 @@ def remove_homework_submission_from_datamailer(sender, instance, **kwargs):
 def remove_project_submission_from_datamailer(sender, instance, **kwargs):
     callback = partial(remove_project_submission_recipient_list, instance)
     transaction.on_commit(callback)
+
+
+@receiver([post_save, post_delete], sender=Course)
+def invalidate_course_page_for_course(sender, instance, **kwargs):
+    bump_course_page_version(instance.id)
+    bump_course_catalog_version()
+
+
+@receiver(post_save, sender=Course)
+def create_course_catalog_stats(sender, instance, created, **kwargs):
+    if created:
+        refresh_course_catalog_stats(instance.id)
+
+
+@receiver([post_save, post_delete], sender=Homework)
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_course_page_for_assignment(sender, instance, **kwargs):
+    bump_course_page_version(instance.course_id)
+    bump_course_catalog_version()
+
+
+@receiver(post_save, sender=Homework)
+def count_created_homework(sender, instance, created, **kwargs):
+    if created:
+        adjust_course_catalog_stats(instance.course_id, "homework_count", 1)
+
+
+@receiver(post_delete, sender=Homework)
+def count_deleted_homework(sender, instance, **kwargs):
+    adjust_course_catalog_stats(instance.course_id, "homework_count", -1)
+
+
+@receiver(post_save, sender=Project)
+def count_created_project(sender, instance, created, **kwargs):
+    if created:
+        adjust_course_catalog_stats(instance.course_id, "project_count", 1)
+
+
+@receiver(post_delete, sender=Project)
+def count_deleted_project(sender, instance, **kwargs):
+    adjust_course_catalog_stats(instance.course_id, "project_count", -1)
+
+
+@receiver([post_save, post_delete], sender=RegistrationCampaign)
+def invalidate_course_page_for_campaign(sender, instance, **kwargs):
+    bump_course_page_version(instance.current_course_id)
+    bump_course_catalog_version()
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def invalidate_course_page_for_enrollment(sender, instance, **kwargs):
+    bump_course_page_user_version(instance.course_id, instance.student_id)
+
+
+@receiver(post_save, sender=Enrollment)
+def count_created_enrollment(sender, instance, created, **kwargs):
+    if created:
+        adjust_course_catalog_stats(instance.course_id, "learner_count", 1)
+
+
+@receiver(post_delete, sender=Enrollment)
+def count_deleted_enrollment(sender, instance, **kwargs):
+    adjust_course_catalog_stats(instance.course_id, "learner_count", -1)
+
+
+# Course ids of the homeworks and projects being deleted, so the
+# submissions removed by the cascade don't each load their assignment.
+_deleting_assignments = threading.local()
+
+
+def _deleting_course_ids(model) -> dict[int, int]:
+    course_ids_by_model = getattr(_deleting_assignments, "course_ids", None)
+    if course_ids_by_model is None:
+        course_ids_by_model = {}
+        _deleting_assignments.course_ids = course_ids_by_model
+    return course_ids_by_model.setdefault(model, {})
+
+
+@receiver(pre_delete, sender=Homework)
+@receiver(pre_delete, sender=Project)
+def remember_deleting_assignment(sender, instance, **kwargs):
+    _deleting_course_ids(sender)[instance.id] = instance.course_id
+
+
+@receiver(post_delete, sender=Homework)
+@receiver(post_delete, sender=Project)
+def forget_deleted_assignment(sender, instance, **kwargs):
+    _deleting_course_ids(sender).pop(instance.id, None)
+
+
+def _assignment_course_id(submission, field_name, model):
+    """Return the course of a submission's homework or project.
+
+    During a cascading delete the course comes from the assignment being
+    deleted; otherwise the assignment is loaded once and the other
+    receivers of the same signal reuse it.
+    """
+    field = submission._meta.get_field(field_name)
+    if not field.is_cached(submission):
+        assignment_id = getattr(submission, field.attname)
+        course_ids = _deleting_course_ids(model)
+        if assignment_id in course_ids:
+            return course_ids[assignment_id]
+    return getattr(submission, field_name).course_id
+
+
+def _submission_course_id(submission):
+    return _assignment_course_id(submission, "homework", Homework)
+
+
+def _project_submission_course_id(submission):
+    return _assignment_course_id(submission, "project", Project)
+
+
+@receiver([post_save, post_delete], sender=Submission)
+def invalidate_course_page_for_submission(sender, instance, **kwargs):
+    bump_course_page_user_version(
+        _submission_course_id(instance),
+        instance.student_id,
+    )
+
+
+@receiver([post_save, post_delete], sender=ProjectSubmission)
+def invalidate_course_page_for_project_submission(sender, instance, **kwargs):
+    bump_course_page_user_version(
+        _project_submission_course_id(instance),
+        instance.student_id,
+    )
+
+
+@receiver(post_save, sender=PeerReview)
+def invalidate_course_page_for_peer_review(sender, instance, **kwargs):
+    # Submitted reviews move the reviewer's "Review" badge.
+    reviewer = (
+        ProjectSubmission.objects.filter(id=instance.reviewer_id)
+        .values_list("project__course_id", "student_id")
+        .first()
+    )
+    if reviewer is None:
+        return
+    course_id, student_id = reviewer
+    bump_course_page_user_version(course_id, student_id)
+
+
+def _bump_course_page_for_registration(campaign_id, email_normalized):
+    course_id = (
+        RegistrationCampaign.objects.filter(id=campaign_id)
+        .values_list("current_course_id", flat=True)
+        .first()
+    )
+    bump_course_page_registration_version(course_id, email_normalized)
+
+
+@receiver([post_save, post_delete], sender=CourseRegistration)
+def invalidate_course_page_for_registration(sender, instance, **kwargs):
+    callback = partial(
+        _bump_course_page_for_registration,
+        instance.campaign_id,
+        instance.email_normalized,
+    )
+    transaction.on_commit(callback)
+
+
+@receiver(post_save, sender=RegistrationCampaign)
+def create_registration_campaign_stats(sender, instance, created, **kwargs):
+    if created:
+        refresh_registration_campaign_stats(instance.id)
+
+
+@receiver(pre_save, sender=CourseRegistration)
+def remember_registration_stats_values(sender, instance, **kwargs):
+    # Updates move a registration between counters, so note where it was.
+    if instance.pk is None:
+        return
+    previous = (
+        CourseRegistration.objects.filter(pk=instance.pk)
+        .only("campaign_id", *STATS_FIELDS)
+        .first()
+    )
+    if previous is not None:
+        instance._previous_stats_values = registration_stats_values(previous)
+
+
+@receiver(post_save, sender=CourseRegistration)
+def count_saved_registration(sender, instance, created, **kwargs):
+    values = registration_stats_values(instance)
+    previous_values = getattr(instance, "_previous_stats_values", None)
+    instance._previous_stats_values = None
+    if not created:
+        if previous_values is None or previous_values == values:
+            return
+        adjust_registration_campaign_stats(previous_values, -1)
+    adjust_registration_campaign_stats(values, 1)
+
+
+@receiver(post_delete, sender=CourseRegistration)
+def count_deleted_registration(sender, instance, **kwargs):
+    values = registration_stats_values(instance)
+    adjust_registration_campaign_stats(values, -1)
+
+
+def _change_action(signal) -> ChangeAction:
+    if signal is post_delete:
+        return ChangeAction.DELETE
+    return ChangeAction.UPSERT
+
+
+@receiver([post_save, post_delete], sender=Submission)
+def log_submission_change(sender, instance, signal, **kwargs):
+    record_change(
+        _submission_course_id(instance),
+        ChangeObjectType.HOMEWORK_SUBMISSION,
+        instance.id,
+        _change_action(signal),
+    )
+
+
+@receiver([post_save, post_delete], sender=ProjectSubmission)
+def log_project_submission_change(sender, instance, signal, **kwargs):
+    record_change(
+        _project_submission_course_id(instance),
+        ChangeObjectType.PROJECT_SUBMISSION,
+        instance.id,
+        _change_action(signal),
+    )
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def log_enrollment_change(sender, instance, signal, **kwargs):
+    record_change(
+        instance.course_id,
+        ChangeObjectType.ENROLLMENT,
+        instance.id,
+        _change_action(signal),
+    )
+
+
+@receiver([post_save, post_delete], sender=Course)
+def invalidate_graduates_for_course(sender, instance, **kwargs):
+    bump_graduates_version(instance.id)
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def invalidate_graduates_for_enrollment(sender, instance, **kwargs):
+    bump_graduates_version(instance.course_id)
+
+
+@receiver([post_save, post_delete], sender=ProjectSubmission)
+def invalidate_graduates_for_project_submission(sender, instance, **kwargs):
+    bump_graduates_version(_project_submission_course_id(instance))
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_graduates_for_user(
+    sender, instance, created, update_fields, **kwargs
+):
+    if created:
+        return
+    # Logins save only last_login; skip saves that cannot touch the name.
+    if update_fields is not None and "certificate_name" not in update_fields:
+        return
+    course_ids = Enrollment.objects.filter(student=instance).values_list(
+        "course_id", flat=True
+    )
+    for course_id in course_ids:
+        bump_graduates_version(course_id)
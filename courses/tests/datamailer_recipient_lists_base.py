@@ -189,22 +189,29 @@ class DatamailerRecipientListCommandTestBase(TestCase):
         create_import.return_value = {
             "import_job": {"id": job_id, "status": "pending"}
         }
+        s3.uploaded_bodies = []
+
+        def capture_upload(body, bucket, key, **kwargs):
+            s3.uploaded_bodies.append(body.read())
+
+        s3.upload_fileobj.side_effect = capture_upload
         return s3
 
     def assert_registration_import_object(self, s3, registration):
-        s3.put_object.assert_called_once()
-        put_kwargs = s3.put_object.call_args.kwargs
-        self.assertEqual(put_kwargs["Bucket"], "cmp-imports")
-        key_has_expected_prefix = put_kwargs["Key"].startswith(
+        s3.upload_fileobj.assert_called_once()
+        _body, bucket, key = s3.upload_fileobj.call_args.args
+        upload_kwargs = s3.upload_fileobj.call_args.kwargs
+        self.assertEqual(bucket, "cmp-imports")
+        key_has_expected_prefix = key.startswith(
             "datamailer-test/dtc-courses/dtc-courses/registrations/"
         )
         self.assertTrue(key_has_expected_prefix)
         self.assertEqual(
-            put_kwargs["ContentType"],
+            upload_kwargs["ExtraArgs"]["ContentType"],
             "application/x-ndjson",
         )
         rows = []
-        body = put_kwargs["Body"].decode("utf-8")
+        body = s3.uploaded_bodies[0].decode("utf-8")
         lines = body.splitlines()
         for line in lines:
             row = json.loads(line)
@@ -217,7 +224,7 @@ class DatamailerRecipientListCommandTestBase(TestCase):
         )
         self.assertEqual(rows[0]["email"], "student@example.com")
         self.assertEqual(rows[0]["metadata"]["company_name"], "Acme Data")
-        return put_kwargs["Key"]
+        return key
 
     def assert_presigned_import_url_created(self, s3, key):
         s3.generate_presigned_url.assert_called_once_with(
@@ -0,0 +1,92 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+
+from courses.course_catalog import (
+    bump_course_catalog_version,
+    course_catalog_cache_key,
+)
+from courses.models import CourseCatalogStats, Enrollment, Homework
+from courses.tests.course_list_base import CourseListViewTestBase
+
+User = get_user_model()
+
+
+class CourseCatalogStatsTest(CourseListViewTestBase):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+
+    def catalog_stats(self):
+        return CourseCatalogStats.objects.get(course=self.course)
+
+    def test_signals_keep_counts_current(self):
+        user = User.objects.create_user(username="learner@test.com")
+        enrollment = Enrollment.objects.create(student=user, course=self.course)
+
+        stats = self.catalog_stats()
+        self.assertEqual(stats.homework_count, 3)
+        self.assertEqual(stats.project_count, 2)
+        self.assertEqual(stats.learner_count, 1)
+
+        enrollment.delete()
+        Homework.objects.filter(slug="scored-homework").delete()
+
+        stats = self.catalog_stats()
+        self.assertEqual(stats.homework_count, 2)
+        self.assertEqual(stats.learner_count, 0)
+
+    def test_refresh_command_recounts_stats(self):
+        CourseCatalogStats.objects.filter(course=self.course).update(
+            homework_count=0,
+            project_count=0,
+        )
+
+        call_command("refresh_course_catalog_stats", stdout=StringIO())
+
+        stats = self.catalog_stats()
+        self.assertEqual(stats.homework_count, 3)
+        self.assertEqual(stats.project_count, 2)
+
+    def test_warm_anonymous_course_list_runs_no_queries(self):
+        self.course_list_response()
+
+        with self.assertNumQueries(0):
+            response = self.course_list_response()
+
+        self.assertEqual(response.context["home_stats"]["homeworks"], 3)
+        self.assertEqual(response.context["home_stats"]["projects"], 2)
+
+    def test_new_homework_refreshes_cached_course_list(self):
+        self.course_list_response()
+        Homework.objects.create(
+            slug="new-homework",
+            course=self.course,
+            title="New Homework",
+            due_date=timezone.now() + timezone.timedelta(days=3),
+        )
+
+        response = self.course_list_response()
+
+        self.assertEqual(response.context["home_stats"]["homeworks"], 4)
+
+    def test_catalog_version_is_bumped_again_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_course_catalog_version()
+            in_transaction_key = course_catalog_cache_key()
+
+        self.assertNotEqual(course_catalog_cache_key(), in_transaction_key)
+
+    def test_enrollment_overlay_is_computed_per_user(self):
+        user = User.objects.create_user(username="learner@test.com")
+        self.course_list_response()
+        Enrollment.objects.create(student=user, course=self.course)
+        self.client.force_login(user)
+
+        response = self.course_list_response()
+
+        courses = response.context["active_courses"]
+        self.assertTrue(courses[0].is_enrolled)
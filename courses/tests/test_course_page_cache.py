@@ -0,0 +1,144 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from courses.course_page_cache import (
+    bump_course_page_version,
+    course_page_version,
+)
+from courses.leaderboard import update_leaderboard
+from courses.models import (
+    CourseRegistration,
+    HomeworkState,
+    PeerReview,
+    PeerReviewState,
+    ProjectState,
+    ProjectSubmission,
+    RegistrationCampaign,
+    Submission,
+)
+from courses.tests.course_view_base import CourseDetailViewTestBase
+
+
+class CoursePageCacheTest(CourseDetailViewTestBase):
+    def course_page_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_course_response()
+        self.assertEqual(response.status_code, 200)
+        # Session and user lookups come from authentication, not the page.
+        page_queries = [
+            query
+            for query in queries.captured_queries
+            if "django_session" not in query["sql"]
+            and "accounts_customuser" not in query["sql"]
+        ]
+        return len(page_queries)
+
+    def test_warm_course_page_costs_one_query(self):
+        self.client.login(username="test@test.com", password="12345")
+        self.get_course_response()
+
+        self.assertEqual(self.course_page_query_count(), 1)
+
+    def test_warm_anonymous_course_page_costs_one_query(self):
+        self.get_course_response()
+
+        self.assertEqual(self.course_page_query_count(), 1)
+
+    def test_course_version_is_bumped_again_on_commit(self):
+        version = course_page_version(self.course.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_course_page_version(self.course.id)
+            self.assertEqual(course_page_version(self.course.id), version + 1)
+
+        self.assertEqual(course_page_version(self.course.id), version + 2)
+
+    def test_new_submission_refreshes_the_users_badges(self):
+        response = self.get_course_response(login=True)
+        homework3 = self.homeworks_by_slug(response)["unscored-homework"]
+        self.assertFalse(homework3.submitted)
+
+        Submission.objects.create(
+            homework=self.homework3,
+            enrollment=self.enrollment,
+            student=self.user,
+        )
+
+        response = self.get_course_response()
+        homework3 = self.homeworks_by_slug(response)["unscored-homework"]
+        self.assertTrue(homework3.submitted)
+
+    def test_homework_change_refreshes_the_shared_part(self):
+        self.get_course_response(login=True)
+
+        self.homework2.title = "Renamed Homework"
+        self.homework2.state = HomeworkState.SCORED.value
+        self.homework2.save()
+
+        response = self.get_course_response()
+        self.assertContains(response, "Renamed Homework")
+
+    def test_leaderboard_update_refreshes_total_score(self):
+        self.get_course_response(login=True)
+        self.submission1.total_score = 95
+        self.submission1.save()
+
+        update_leaderboard(self.course)
+
+        response = self.get_course_response()
+        self.assertEqual(response.context["total_score"], 95)
+
+    def test_submitted_peer_review_refreshes_reviewers_badge(self):
+        self.open_project.state = ProjectState.PEER_REVIEWING.value
+        self.open_project.number_of_peers_to_evaluate = 1
+        self.open_project.save()
+        reviewer = ProjectSubmission.objects.get(
+            project=self.open_project,
+            student=self.user,
+        )
+        reviewed_user = self.create_project_submitter(self.open_project)
+        reviewed = ProjectSubmission.objects.get(student=reviewed_user)
+        review = PeerReview.objects.create(
+            submission_under_evaluation=reviewed,
+            reviewer=reviewer,
+            optional=False,
+        )
+        response = self.get_course_response(login=True)
+        project = response.context["projects"][0]
+        self.assertEqual(project.badge_state_name, "Review")
+
+        review.state = PeerReviewState.SUBMITTED.value
+        review.save()
+
+        response = self.get_course_response()
+        project = response.context["projects"][0]
+        self.assertEqual(project.badge_state_name, "Review completed")
+
+    def test_registration_refreshes_the_users_registration_state(self):
+        campaign = RegistrationCampaign.objects.create(
+            slug="test-campaign",
+            title="Test Campaign",
+            current_course=self.course,
+        )
+        response = self.get_course_response(login=True)
+        self.assertFalse(response.context["has_registration"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as queries:
+                CourseRegistration.objects.create(
+                    campaign=campaign,
+                    email=" Test@Test.com ",
+                    name="Test User",
+                    country="Germany",
+                    region="Europe",
+                    role=CourseRegistration.Role.OTHER,
+                )
+
+        user_queries = [
+            query
+            for query in queries.captured_queries
+            if "accounts_customuser" in query["sql"]
+        ]
+        self.assertEqual(user_queries, [])
+        response = self.get_course_response()
+        self.assertTrue(response.context["has_registration"])
@@ -1,8 +1,10 @@
 from unittest.mock import patch
 
+import requests
+
 from django.test import TestCase, override_settings
 
-from accounts.models import CustomUser
+from accounts.models import CustomUser, Token
 from course_management.datamailer.keys import course_graduates_list_key
 from course_management.datamailer.payloads.certificate_availability import (
     certificate_availability_notification_payload,
@@ -11,9 +13,20 @@ from course_management.datamailer.payloads.course_graduates import (
     course_graduate_recipient_list_payload,
 )
 from course_management.datamailer.sync.certificates import (
+    queue_certificate_availability_notification,
+    queue_certificate_availability_notifications,
     send_certificate_availability_notification,
 )
+from course_management.datamailer_outbox_runs import (
+    process_due_datamailer_outbox,
+)
 from courses.models import Course, Enrollment
+from data.models import (
+    DatamailerOutboxEvent,
+    DatamailerOutboxStatus,
+    DatamailerSendAudit,
+    DatamailerSendAuditType,
+)
 
 
 DATAMAILER_SETTINGS = {
@@ -245,3 +258,319 @@ class DatamailerCertificateSendTestCase(TestCase):
             payload["template_key"],
             "certificate-availability-notification",
         )
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_transactional.DatamailerTransactionalClient.send_transactional"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_queued_certificate_notification_sends_from_outbox_processor(
+        self,
+        bulk_upsert,
+        send,
+    ):
+        bulk_upsert.return_value = {"updated_count": 1}
+        send.return_value = {"id": 123}
+        enrollment = create_certificate_enrollment()
+
+        queue_certificate_availability_notification(enrollment)
+
+        send.assert_not_called()
+        event = DatamailerOutboxEvent.objects.get(
+            event_type="certificate.availability_notify"
+        )
+        self.assertEqual(event.payload, {"enrollment_id": enrollment.pk})
+
+        process_due_datamailer_outbox()
+
+        bulk_upsert.assert_called_once()
+        send.assert_called_once()
+        event.refresh_from_db()
+        self.assertEqual(event.status, DatamailerOutboxStatus.ACKED)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_transactional.DatamailerTransactionalClient.send_transactional"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_failed_certificate_send_leaves_event_retrying(
+        self,
+        bulk_upsert,
+        send,
+    ):
+        bulk_upsert.return_value = {"updated_count": 1}
+        send.side_effect = requests.ConnectionError("Datamailer down")
+        enrollment = create_certificate_enrollment()
+
+        queue_certificate_availability_notification(enrollment)
+        process_due_datamailer_outbox()
+
+        event = DatamailerOutboxEvent.objects.get(
+            event_type="certificate.availability_notify"
+        )
+        self.assertEqual(event.status, DatamailerOutboxStatus.RETRYING)
+        self.assertIn("Datamailer down", event.last_error)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_transactional.DatamailerTransactionalClient.send_transactional"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_unacked_graduate_sync_leaves_certificate_event_retrying(
+        self,
+        bulk_upsert,
+        send,
+    ):
+        bulk_upsert.side_effect = requests.ConnectionError("Datamailer down")
+        enrollment = create_certificate_enrollment()
+
+        queue_certificate_availability_notification(enrollment)
+        process_due_datamailer_outbox()
+
+        send.assert_not_called()
+        event = DatamailerOutboxEvent.objects.get(
+            event_type="certificate.availability_notify"
+        )
+        self.assertEqual(event.status, DatamailerOutboxStatus.RETRYING)
+
+    @override_settings(
+        **DATAMAILER_SETTINGS,
+        PUBLIC_BASE_URL="https://courses.example.com",
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListSendClient.send_to_transient_list"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_batched_certificate_notifications_use_one_list_send(
+        self,
+        bulk_upsert,
+        send,
+    ):
+        bulk_upsert.return_value = {"updated_count": 2}
+        send.return_value = {"enqueued_count": 2}
+        enrollment = create_certificate_enrollment()
+        second_user = CustomUser.objects.create(
+            email="second@example.com",
+            username="second",
+        )
+        second_enrollment = create_enrollment(
+            second_user,
+            enrollment.course,
+            certificate_url="/certificates/second.pdf",
+        )
+        enrollments = [enrollment, second_enrollment]
+
+        queue_certificate_availability_notifications(
+            enrollment.course,
+            enrollments,
+        )
+
+        event = DatamailerOutboxEvent.objects.get(
+            event_type="certificate.availability_notify_batch"
+        )
+        self.assertEqual(
+            event.payload["enrollment_ids"],
+            [enrollment.pk, second_enrollment.pk],
+        )
+
+        process_due_datamailer_outbox()
+
+        bulk_upsert.assert_called_once()
+        self.assertEqual(len(bulk_upsert.call_args.args[1]["members"]), 2)
+        send.assert_called_once()
+        payload = send.call_args.args[0]
+        self.assertEqual(
+            payload["template_key"],
+            "certificate-availability-notification",
+        )
+        self.assertNotIn("certificate_url", payload["context"])
+        member_urls = []
+        for member in payload["members"]:
+            member_urls.append(member["metadata"]["certificate_url"])
+        self.assertEqual(
+            member_urls,
+            [
+                "https://courses.example.com/certificates/student.pdf",
+                "https://courses.example.com/certificates/second.pdf",
+            ],
+        )
+        self.assertTrue(
+            DatamailerSendAudit.objects.filter(
+                send_type=DatamailerSendAuditType.TRANSIENT_RECIPIENT_LIST,
+                idempotency_key=payload["idempotency_key"],
+            ).exists()
+        )
+        event.refresh_from_db()
+        self.assertEqual(event.status, DatamailerOutboxStatus.ACKED)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListSendClient.send_to_transient_list"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_batched_certificate_email_is_found_by_recipient(
+        self,
+        bulk_upsert,
+        send,
+    ):
+        bulk_upsert.return_value = {"updated_count": 1}
+        send.return_value = {"enqueued_count": 1}
+        enrollment = create_certificate_enrollment()
+        staff = CustomUser.objects.create(
+            email="staff@example.com",
+            username="staff",
+            is_staff=True,
+        )
+        token = Token.objects.create(user=staff)
+
+        queue_certificate_availability_notifications(
+            enrollment.course,
+            [enrollment],
+        )
+        process_due_datamailer_outbox()
+
+        response = self.client.get(
+            "/api/datamailer/send-audits",
+            {"email": "Student@Example.com"},
+            HTTP_AUTHORIZATION=f"Token {token.key}",
+        )
+        self.assertEqual(response.status_code, 200)
+        audits = response.json()["audits"]
+        self.assertEqual(len(audits), 1)
+        batch_key = send.call_args.args[0]["idempotency_key"]
+        self.assertEqual(audits[0]["list_key"], batch_key)
+        self.assertEqual(
+            audits[0]["idempotency_key"],
+            f"certificate-available:{enrollment.pk}",
+        )
+        self.assertEqual(audits[0]["status"], "succeeded")
+        self.assertEqual(audits[0]["intended_count"], 0)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_transactional.DatamailerTransactionalClient.send_transactional"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListSendClient.send_to_transient_list"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_batched_certificate_send_skips_already_notified_learners(
+        self,
+        bulk_upsert,
+        send,
+        send_transactional,
+    ):
+        bulk_upsert.return_value = {"updated_count": 2}
+        send.return_value = {"enqueued_count": 1}
+        send_transactional.return_value = {"id": 123}
+        enrollment = create_certificate_enrollment()
+        second_user = CustomUser.objects.create(
+            email="second@example.com",
+            username="second",
+        )
+        second_enrollment = create_enrollment(
+            second_user,
+            enrollment.course,
+            certificate_url="/certificates/second.pdf",
+        )
+        queue_certificate_availability_notification(enrollment)
+        process_due_datamailer_outbox()
+        send_transactional.assert_called_once()
+
+        queue_certificate_availability_notifications(
+            enrollment.course,
+            [enrollment, second_enrollment],
+        )
+        process_due_datamailer_outbox()
+
+        send.assert_called_once()
+        members = send.call_args.args[0]["members"]
+        self.assertEqual(
+            [member["email"] for member in members],
+            ["second@example.com"],
+        )
+        self.assertEqual(len(bulk_upsert.call_args.args[1]["members"]), 2)
+
+        send.reset_mock()
+        queue_certificate_availability_notifications(
+            enrollment.course,
+            [enrollment, second_enrollment],
+        )
+        process_due_datamailer_outbox()
+
+        send.assert_not_called()
+        queue_certificate_availability_notification(second_enrollment)
+        process_due_datamailer_outbox()
+        send_transactional.assert_called_once()
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListSendClient.send_to_transient_list"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_failed_batched_certificate_send_leaves_event_retrying(
+        self,
+        bulk_upsert,
+        send,
+    ):
+        bulk_upsert.return_value = {"updated_count": 1}
+        send.side_effect = requests.ConnectionError("Datamailer down")
+        enrollment = create_certificate_enrollment()
+
+        queue_certificate_availability_notifications(
+            enrollment.course,
+            [enrollment],
+        )
+        process_due_datamailer_outbox()
+
+        event = DatamailerOutboxEvent.objects.get(
+            event_type="certificate.availability_notify_batch"
+        )
+        self.assertEqual(event.status, DatamailerOutboxStatus.RETRYING)
+        self.assertIn("Datamailer down", event.last_error)
+        member_audit = DatamailerSendAudit.objects.get(
+            recipient_email="student@example.com",
+        )
+        self.assertEqual(member_audit.status, "failed")
+        self.assertIn("Datamailer down", member_audit.error)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListSendClient.send_to_transient_list"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_unacked_graduate_sync_leaves_batch_event_retrying(
+        self,
+        bulk_upsert,
+        send,
+    ):
+        bulk_upsert.side_effect = requests.ConnectionError("Datamailer down")
+        enrollment = create_certificate_enrollment()
+
+        queue_certificate_availability_notifications(
+            enrollment.course,
+            [enrollment],
+        )
+        process_due_datamailer_outbox()
+
+        send.assert_not_called()
+        event = DatamailerOutboxEvent.objects.get(
+            event_type="certificate.availability_notify_batch"
+        )
+        self.assertEqual(event.status, DatamailerOutboxStatus.RETRYING)
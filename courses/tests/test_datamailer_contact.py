@@ -10,6 +10,7 @@ from course_management.datamailer.payloads.base import (
 )
 from course_management.datamailer.sync.contacts import sync_contact
 from courses.models import Course
+from data.models import DatamailerOutboxEvent, DatamailerOutboxStatus
 from courses.tests.datamailer_contact_base import (
     DATAMAILER_SETTINGS,
     DatamailerContactBase,
@@ -42,6 +43,25 @@ class DatamailerContactTest(DatamailerContactBase):
     @patch(
         "course_management.datamailer.client_contacts.DatamailerContactClient.upsert_contact"
     )
+    def test_sync_contact_enqueues_outbox_event(self, upsert):
+        user = CustomUser.objects.create(email="student@example.com")
+
+        sync_contact(user)
+
+        upsert.assert_not_called()
+        event = DatamailerOutboxEvent.objects.get(event_type="contact.upsert")
+        self.assertEqual(event.status, DatamailerOutboxStatus.PENDING)
+        self.assertEqual(event.ordering_key, f"user:{user.pk}")
+        contact_payload = event.payload["contact_payload"]
+        self.assertEqual(contact_payload["email"], "student@example.com")
+
+    @override_settings(
+        **DATAMAILER_SETTINGS,
+        DATAMAILER_OUTBOX_DISPATCH_IMMEDIATELY=True,
+    )
+    @patch(
+        "course_management.datamailer.client_contacts.DatamailerContactClient.upsert_contact"
+    )
     def test_sync_contact_logs_and_continues_on_api_failure(
         self, upsert
     ):
@@ -51,8 +71,14 @@ class DatamailerContactTest(DatamailerContactBase):
         sync_contact(user)
 
         upsert.assert_called_once()
+        event = DatamailerOutboxEvent.objects.get(event_type="contact.upsert")
+        self.assertEqual(event.status, DatamailerOutboxStatus.RETRYING)
 
-    @override_settings(**DATAMAILER_SETTINGS, DATAMAILER_STRICT=True)
+    @override_settings(
+        **DATAMAILER_SETTINGS,
+        DATAMAILER_STRICT=True,
+        DATAMAILER_OUTBOX_DISPATCH_IMMEDIATELY=True,
+    )
     @patch(
         "course_management.datamailer.client_contacts.DatamailerContactClient.upsert_contact"
     )
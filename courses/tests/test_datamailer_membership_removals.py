@@ -2,6 +2,12 @@ from unittest.mock import patch
 
 from django.test import override_settings
 
+from course_management.datamailer.payloads.submissions import (
+    homework_submission_recipient_list_payload,
+)
+from course_management.datamailer.recipient_list_hashes import (
+    record_member_hashes,
+)
 from course_management.datamailer.sync.membership_removals import (
     remove_enrollment_from_datamailer,
     remove_homework_submission_from_datamailer,
@@ -11,6 +17,10 @@ from courses.tests.datamailer_membership_base import (
     DATAMAILER_SETTINGS,
     DatamailerMembershipBase,
 )
+from data.models import (
+    DatamailerRecipientListMemberHash,
+    DatamailerRecipientListSyncState,
+)
 
 
 class DatamailerMembershipRemovalTest(DatamailerMembershipBase):
@@ -77,3 +87,31 @@ class DatamailerMembershipRemovalTest(DatamailerMembershipBase):
             project,
             submission,
         )
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    def test_remove_member_forgets_its_stored_hashes(self):
+        homework = self.create_homework()
+        user = self.create_user("student@example.com")
+        submission = self.create_homework_submission(homework, user)
+        list_payload = homework_submission_recipient_list_payload(submission)
+        list_key = list_payload.list_key
+        record_member_hashes(
+            list_key,
+            {list_payload.source_object_key: "a" * 64, "other": "b" * 64},
+        )
+        DatamailerRecipientListSyncState.objects.create(
+            list_key=list_key,
+            kind="homework-submitters",
+            content_sha256="c" * 64,
+        )
+
+        remove_homework_submission_from_datamailer(submission)
+
+        remaining_keys = list(
+            DatamailerRecipientListMemberHash.objects.values_list(
+                "source_object_key",
+                flat=True,
+            )
+        )
+        self.assertEqual(remaining_keys, ["other"])
+        self.assertFalse(DatamailerRecipientListSyncState.objects.exists())
@@ -4,13 +4,28 @@ from django.test import TestCase, override_settings
 
 from accounts.models import CustomUser
 from course_management.datamailer.preferences import (
+    apply_cached_email_preference_change,
+    cached_email_preferences,
     get_email_preferences_for_user,
+    store_email_preferences,
     update_email_preferences_for_user,
 )
+from course_management.datamailer_outbox_dispatch import (
+    dispatch_datamailer_outbox_event,
+)
+from data.models import DatamailerEmailPreference, DatamailerOutboxEvent
 
 from .datamailer_settings import DATAMAILER_SETTINGS
 
 
+def dispatch_preference_fetches():
+    events = DatamailerOutboxEvent.objects.filter(
+        event_type="contact.preferences_fetch",
+    )
+    for event in events:
+        dispatch_datamailer_outbox_event(event)
+
+
 class DatamailerPreferencesTest(TestCase):
     @override_settings(**DATAMAILER_SETTINGS)
     @patch(
@@ -42,6 +57,9 @@ class DatamailerPreferencesTest(TestCase):
             email="Student@Example.com",
         )
 
+        self.assertIsNone(get_email_preferences_for_user(user))
+        contact_preferences.assert_not_called()
+        dispatch_preference_fetches()
         result = get_email_preferences_for_user(user)
 
         expected = {
@@ -59,7 +77,10 @@ class DatamailerPreferencesTest(TestCase):
             category_tags=category_tags,
         )
 
-    @override_settings(**DATAMAILER_SETTINGS)
+    @override_settings(
+        **DATAMAILER_SETTINGS,
+        DATAMAILER_OUTBOX_DISPATCH_IMMEDIATELY=True,
+    )
     @patch(
         "course_management.datamailer.client_contacts.DatamailerContactClient.update_contact_preferences"
     )
@@ -99,3 +120,158 @@ class DatamailerPreferencesTest(TestCase):
             "student@example.com",
             expected_updates,
         )
+        event = DatamailerOutboxEvent.objects.get()
+        self.assertEqual(event.event_type, "contact.preferences_update")
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_contacts.DatamailerContactClient.contact_preferences"
+    )
+    def test_get_email_preferences_for_user_serves_cached_values(
+        self,
+        contact_preferences,
+    ):
+        user = CustomUser.objects.create_user(
+            username="student",
+            email="student@example.com",
+        )
+        cached = {"email_deadline_reminders": False}
+        store_email_preferences("student@example.com", cached)
+
+        result = get_email_preferences_for_user(user)
+
+        self.assertEqual(result, cached)
+        contact_preferences.assert_not_called()
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_contacts.DatamailerContactClient.update_contact_preferences"
+    )
+    def test_update_email_preferences_for_user_defers_to_outbox(
+        self,
+        update_contact_preferences,
+    ):
+        user = CustomUser.objects.create_user(
+            username="student",
+            email="student@example.com",
+        )
+        store_email_preferences(
+            "student@example.com",
+            {
+                "email_deadline_reminders": True,
+                "email_course_updates": True,
+            },
+        )
+
+        result = update_email_preferences_for_user(
+            user,
+            {"email_course_updates": False},
+        )
+
+        self.assertTrue(result)
+        update_contact_preferences.assert_not_called()
+        event = DatamailerOutboxEvent.objects.get()
+        self.assertEqual(event.payload["email"], "student@example.com")
+        expected = {
+            "email_deadline_reminders": True,
+            "email_course_updates": False,
+        }
+        cached = cached_email_preferences("student@example.com")
+        self.assertEqual(cached, expected)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_contacts.DatamailerContactClient.contact_preferences"
+    )
+    def test_update_without_cached_entry_survives_stale_remote_read(
+        self,
+        contact_preferences,
+    ):
+        user = CustomUser.objects.create_user(
+            username="student",
+            email="student@example.com",
+        )
+        contact_preferences.return_value = {
+            "categories": [
+                {"tag": "deadline-reminders", "enabled": True},
+                {"tag": "course-updates", "enabled": True},
+            ]
+        }
+
+        update_email_preferences_for_user(
+            user,
+            {"email_course_updates": False},
+        )
+        self.assertIsNone(get_email_preferences_for_user(user))
+        dispatch_preference_fetches()
+        result = get_email_preferences_for_user(user)
+
+        expected = {
+            "email_deadline_reminders": True,
+            "email_course_updates": False,
+        }
+        self.assertEqual(result, expected)
+        cached = cached_email_preferences("student@example.com")
+        self.assertEqual(cached, expected)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_contacts.DatamailerContactClient.contact_preferences"
+    )
+    def test_missing_preferences_queue_one_fetch(self, contact_preferences):
+        user = CustomUser.objects.create_user(
+            username="student",
+            email="student@example.com",
+        )
+
+        get_email_preferences_for_user(user)
+        get_email_preferences_for_user(user)
+
+        contact_preferences.assert_not_called()
+        event = DatamailerOutboxEvent.objects.get()
+        self.assertEqual(event.event_type, "contact.preferences_fetch")
+        self.assertEqual(event.payload["email"], "student@example.com")
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_contacts.DatamailerContactClient.contact_preferences"
+    )
+    def test_fetch_does_not_overwrite_synced_preferences(
+        self,
+        contact_preferences,
+    ):
+        user = CustomUser.objects.create_user(
+            username="student",
+            email="student@example.com",
+        )
+        contact_preferences.return_value = {
+            "categories": [{"tag": "course-updates", "enabled": True}]
+        }
+        get_email_preferences_for_user(user)
+        store_email_preferences(
+            "student@example.com",
+            {"email_course_updates": False},
+        )
+
+        dispatch_preference_fetches()
+
+        cached = cached_email_preferences("student@example.com")
+        self.assertEqual(cached, {"email_course_updates": False})
+
+    def test_preference_change_is_shared_through_the_database(self):
+        store_email_preferences(
+            "student@example.com",
+            {"email_course_updates": True},
+        )
+
+        apply_cached_email_preference_change(
+            "Student@Example.com",
+            {"email_course_updates": False},
+        )
+
+        preference = DatamailerEmailPreference.objects.get()
+        self.assertEqual(preference.email, "student@example.com")
+        self.assertEqual(
+            preference.preferences,
+            {"email_course_updates": False},
+        )
@@ -258,6 +258,115 @@ class DatamailerRecipientListAuditListingErrorTest(TestCase):
             audit_enrollment_recipient_list(target.enrollment.course)
 
 
+def datamailer_member(member_payload, **overrides):
+    payload_member = member_payload.payload["member"]
+    member = {
+        "source_object_key": member_payload.source_object_key,
+        "email": payload_member["email"],
+        "status": "active",
+        "metadata": payload_member["metadata"],
+    }
+    return member | overrides
+
+
+class DatamailerRecipientListPagedAuditTest(TestCase):
+    def create_enrollment_member_payloads(self, count):
+        course = create_ml_course()
+        member_payloads = []
+        for index in range(count):
+            user = create_user(f"student-{index}@example.com")
+            enrollment = create_enrollment(user, course)
+            member_payload = enrollment_recipient_list_payload(enrollment)
+            member_payloads.append(member_payload)
+        member_payloads.sort(key=lambda item: item.source_object_key)
+        return course, member_payloads
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.list_members"
+    )
+    def test_recipient_list_paged_audit_merge_joins_member_pages(
+        self,
+        recipient_list_members,
+    ):
+        course, member_payloads = self.create_enrollment_member_payloads(3)
+        first, second, third = member_payloads
+        recipient_list_members.side_effect = [
+            {
+                "has_more": True,
+                "next_cursor": "page-2",
+                "members": [
+                    datamailer_member(first),
+                    datamailer_member(
+                        second,
+                        metadata={"display_name": "Old name"},
+                    ),
+                ],
+            },
+            {
+                "has_more": False,
+                "members": [
+                    {
+                        "source_object_key": "user:999",
+                        "email": "old@example.com",
+                        "status": "active",
+                        "metadata": {},
+                    }
+                ],
+            },
+        ]
+
+        output = audit_enrollment_recipient_list(
+            course,
+            extra_args=["--paged", "--limit", "2"],
+        )
+
+        cursors = []
+        for call in recipient_list_members.call_args_list:
+            cursors.append(call.kwargs["cursor"])
+            self.assertEqual(call.kwargs["limit"], 2)
+        self.assertEqual(cursors, ["", "page-2"])
+        self.assertIn(
+            f"metadata_mismatches: {second.source_object_key}",
+            output,
+        )
+        self.assertIn(f"missing: {third.source_object_key}", output)
+        self.assertIn("unexpected: user:999", output)
+        self.assertIn(
+            "expected=3 actual=3 missing=1 unexpected=1 "
+            "email_mismatches=0 metadata_mismatches=1",
+            output,
+        )
+        self.assertIn("drifted=1", output)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.list_members"
+    )
+    def test_recipient_list_paged_audit_rejects_unordered_pages(
+        self,
+        recipient_list_members,
+    ):
+        course, member_payloads = self.create_enrollment_member_payloads(2)
+        first, second = member_payloads
+        recipient_list_members.return_value = {
+            "has_more": False,
+            "members": [
+                datamailer_member(second),
+                datamailer_member(first),
+            ],
+        }
+
+        with self.assertRaisesMessage(
+            CommandError,
+            "are not ordered by source_object_key",
+        ):
+            audit_enrollment_recipient_list(
+                course,
+                extra_args=["--paged"],
+            )
+
+
 class DatamailerRecipientListAuditOptionValidationTest(TestCase):
     @override_settings(**DATAMAILER_SETTINGS)
     def test_recipient_list_audit_rejects_invalid_options(self):
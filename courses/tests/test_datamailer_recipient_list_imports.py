@@ -6,6 +6,7 @@ from django.core.management.base import CommandError
 from django.test import override_settings
 
 from course_management.datamailer.keys import course_enrolled_list_key
+from data.models import DatamailerRecipientListSyncState
 from courses.tests.datamailer_recipient_lists_base import (
     DATAMAILER_SETTINGS,
     DatamailerRecipientListCommandTestBase,
@@ -125,6 +126,61 @@ class DatamailerRecipientListImportSuccessTest(
         self.assert_import_waited_for_success(expectation)
 
 
+class DatamailerRecipientListImportContentHashTest(
+    DatamailerRecipientListCommandTestBase
+):
+    @override_settings(
+        **DATAMAILER_SETTINGS,
+        DATAMAILER_IMPORT_S3_BUCKET="cmp-imports",
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListImportClient.get"
+    )
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListImportClient.create"
+    )
+    @patch(
+        "course_management.datamailer.recipient_list_imports.boto3.client"
+    )
+    def test_recipient_list_import_skips_list_after_confirmed_success(
+        self,
+        boto3_client,
+        create_import,
+        recipient_list_import,
+    ):
+        self.configure_import_by_reference(
+            boto3_client, create_import, job_id=21
+        )
+        enrollment = self.create_enrolled_student()
+
+        run_enrollment_import_by_reference(enrollment)
+        self.assertFalse(DatamailerRecipientListSyncState.objects.exists())
+
+        self.configure_successful_import_polling(
+            recipient_list_import, job_id=21
+        )
+        run_enrollment_import_by_reference(
+            enrollment,
+            "--wait-for-import",
+            "--import-poll-interval",
+            "0.01",
+        )
+        create_import.reset_mock()
+
+        out = run_enrollment_import_by_reference(enrollment)
+        create_import.assert_not_called()
+        list_key = course_enrolled_list_key(enrollment.course)
+        self.assertIn(
+            f"Unchanged {list_key}: 1 member(s); skipped",
+            out.getvalue(),
+        )
+
+        run_enrollment_import_by_reference(enrollment, "--reconcile")
+        create_import.assert_called_once()
+        import_payload = create_import.call_args.args[1]
+        self.assertTrue(import_payload["remove_absent"])
+
+
 class DatamailerRecipientListImportFailureTest(
     DatamailerRecipientListCommandTestBase
 ):
@@ -164,6 +220,8 @@ class DatamailerRecipientListImportFailureTest(
                 "--wait-for-import",
             )
 
+        self.assertFalse(DatamailerRecipientListSyncState.objects.exists())
+
     def failed_import_response(self):
         import_job = {
             "id": 19,
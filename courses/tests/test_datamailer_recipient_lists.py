@@ -11,6 +11,7 @@ from course_management.datamailer.keys import (
     project_passed_list_key,
     registration_list_key,
 )
+from courses.models import Course
 from courses.tests.datamailer_recipient_lists_base import (
     BulkUpsertMemberExpectation,
     DATAMAILER_SETTINGS,
@@ -84,6 +85,177 @@ class DatamailerRecipientListBulkUpsertTest(
         self.assert_prepared_one_member(out)
 
 
+class DatamailerRecipientListStreamingTest(
+    DatamailerRecipientListCommandTestBase
+):
+    def create_enrollments_in_two_courses(self):
+        ml_course = self.create_ml_course()
+        de_course = Course.objects.create(
+            slug="de-zoomcamp-2026",
+            title="DE Zoomcamp 2026",
+            description="Data engineering",
+        )
+        for index in range(3):
+            user = self.create_user(f"ml-{index}@example.com")
+            self.create_enrollment(user, ml_course)
+            user = self.create_user(f"de-{index}@example.com")
+            self.create_enrollment(user, de_course)
+        return ml_course, de_course
+
+    def bulk_upsert_member_counts(self, client_method):
+        counts = []
+        for call in client_method.call_args_list:
+            list_key, payload = call.args
+            counts.append((list_key, len(payload["members"])))
+        return counts
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_recipient_list_backfill_command_splits_lists_by_batch_size(
+        self,
+        bulk_upsert,
+    ):
+        self.configure_bulk_upsert_success(bulk_upsert)
+        ml_course, de_course = self.create_enrollments_in_two_courses()
+
+        out = run_recipient_list_command("enrollments", "--batch-size", "2")
+
+        de_list_key = course_enrolled_list_key(de_course)
+        ml_list_key = course_enrolled_list_key(ml_course)
+        expected_counts = [
+            (de_list_key, 2),
+            (de_list_key, 1),
+            (ml_list_key, 2),
+            (ml_list_key, 1),
+        ]
+        counts = self.bulk_upsert_member_counts(bulk_upsert)
+        self.assertEqual(counts, expected_counts)
+        self.assertIn(
+            "Prepared 2 recipient list(s), 6 member(s).",
+            out.getvalue(),
+        )
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.reconcile"
+    )
+    def test_recipient_list_reconcile_sends_each_list_whole(
+        self,
+        reconcile,
+    ):
+        ml_course, de_course = self.create_enrollments_in_two_courses()
+
+        run_recipient_list_command(
+            "enrollments",
+            "--reconcile",
+            "--batch-size",
+            "2",
+        )
+
+        expected_counts = [
+            (course_enrolled_list_key(de_course), 3),
+            (course_enrolled_list_key(ml_course), 3),
+        ]
+        counts = self.bulk_upsert_member_counts(reconcile)
+        self.assertEqual(counts, expected_counts)
+
+
+class DatamailerRecipientListContentHashTest(
+    DatamailerRecipientListCommandTestBase
+):
+    def create_course_enrollments(self, count):
+        course = self.create_ml_course()
+        enrollments = []
+        for index in range(count):
+            user = self.create_user(f"student-{index}@example.com")
+            enrollments.append(self.create_enrollment(user, course))
+        return course, enrollments
+
+    def sent_source_object_keys(self, client_method):
+        keys = []
+        for call in client_method.call_args_list:
+            _list_key, payload = call.args
+            for member in payload["members"]:
+                keys.append(member["source_object_key"])
+        return keys
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_recipient_list_backfill_command_resends_only_changed_members(
+        self,
+        bulk_upsert,
+    ):
+        self.configure_bulk_upsert_success(bulk_upsert)
+        course, enrollments = self.create_course_enrollments(2)
+        run_recipient_list_command("enrollments")
+        bulk_upsert.reset_mock()
+
+        changed_enrollment = enrollments[0]
+        changed_enrollment.display_name = "Renamed Student"
+        changed_enrollment.save()
+        run_recipient_list_command("enrollments")
+
+        self.assertEqual(
+            self.sent_source_object_keys(bulk_upsert),
+            [f"user:{changed_enrollment.student_id}"],
+        )
+
+        bulk_upsert.reset_mock()
+        out = run_recipient_list_command("enrollments")
+
+        bulk_upsert.assert_not_called()
+        list_key = course_enrolled_list_key(course)
+        self.assertIn(
+            f"Unchanged {list_key}: 2 member(s); skipped",
+            out.getvalue(),
+        )
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.bulk_upsert"
+    )
+    def test_recipient_list_backfill_command_force_resends_unchanged_members(
+        self,
+        bulk_upsert,
+    ):
+        self.configure_bulk_upsert_success(bulk_upsert)
+        self.create_course_enrollments(2)
+        run_recipient_list_command("enrollments")
+        bulk_upsert.reset_mock()
+
+        run_recipient_list_command("enrollments", "--force")
+
+        self.assertEqual(len(self.sent_source_object_keys(bulk_upsert)), 2)
+
+    @override_settings(**DATAMAILER_SETTINGS)
+    @patch(
+        "course_management.datamailer.client_recipient_lists.DatamailerRecipientListMemberClient.reconcile"
+    )
+    def test_recipient_list_reconcile_resends_unchanged_lists(
+        self,
+        reconcile,
+    ):
+        course, enrollments = self.create_course_enrollments(2)
+        run_recipient_list_command("enrollments", "--reconcile")
+        reconcile.reset_mock()
+
+        run_recipient_list_command("enrollments", "--reconcile")
+        reconcile.assert_called_once()
+        reconcile.reset_mock()
+
+        enrollments[1].delete()
+        run_recipient_list_command("enrollments", "--reconcile")
+
+        reconcile.assert_called_once()
+        list_key, payload = reconcile.call_args.args
+        self.assertEqual(list_key, course_enrolled_list_key(course))
+        self.assertEqual(len(payload["members"]), 1)
+
+
 class DatamailerRecipientListProjectPassedTest(
     DatamailerRecipientListCommandTestBase
 ):
@@ -235,6 +407,10 @@ class DatamailerRecipientListOptionValidationTest(
                 ("registrations", "--import-poll-interval", "0"),
                 "--import-poll-interval must be positive.",
             ),
+            (
+                ("registrations", "--batch-size", "0"),
+                "--batch-size must be positive.",
+            ),
         ):
             with self.subTest(args=args):
                 with self.assertRaisesMessage(CommandError, message):
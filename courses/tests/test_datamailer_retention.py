@@ -0,0 +1,134 @@
+from datetime import timedelta
+import gzip
+from io import StringIO
+import json
+from pathlib import Path
+import tempfile
+import zlib
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from course_management.datamailer_retention import (
+    prune_batch,
+    retention_policies,
+)
+from data.models import (
+    DatamailerContactEvent,
+    DatamailerOutboxEvent,
+    DatamailerOutboxStatus,
+)
+
+
+def create_outbox_event(event_id, status, *, age_days):
+    event = DatamailerOutboxEvent.objects.create(
+        event_id=event_id,
+        event_type="contact.upsert",
+        idempotency_key=event_id,
+        status=status,
+        payload={"email": f"{event_id}@example.com"},
+    )
+    updated_at = timezone.now() - timedelta(days=age_days)
+    DatamailerOutboxEvent.objects.filter(pk=event.pk).update(
+        updated_at=updated_at
+    )
+    return event
+
+
+def prune_datamailer_records(*args):
+    out = StringIO()
+    call_command("prune_datamailer_records", *args, stdout=out)
+    return out.getvalue()
+
+
+class DatamailerRetentionCommandTest(TestCase):
+    def create_outbox_events(self):
+        create_outbox_event(
+            "old-acked-1",
+            DatamailerOutboxStatus.ACKED,
+            age_days=45,
+        )
+        create_outbox_event(
+            "old-acked-2",
+            DatamailerOutboxStatus.ACKED,
+            age_days=60,
+        )
+        create_outbox_event(
+            "recent-acked",
+            DatamailerOutboxStatus.ACKED,
+            age_days=1,
+        )
+        create_outbox_event(
+            "old-pending",
+            DatamailerOutboxStatus.PENDING,
+            age_days=400,
+        )
+
+    def remaining_event_ids(self):
+        event_ids = DatamailerOutboxEvent.objects.values_list(
+            "event_id",
+            flat=True,
+        )
+        return sorted(event_ids)
+
+    def test_prune_archives_and_deletes_expired_rows_in_batches(self):
+        self.create_outbox_events()
+        DatamailerContactEvent.objects.create(
+            event_id="evt-old",
+            event_type="subscription.unsubscribed",
+            email="student@example.com",
+        )
+        DatamailerContactEvent.objects.update(
+            created_at=timezone.now() - timedelta(days=400)
+        )
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            output = prune_datamailer_records(
+                "--archive-dir",
+                archive_dir,
+                "--batch-size",
+                "1",
+            )
+
+            archives = sorted(Path(archive_dir).glob("outbox_events-acked-*"))
+            self.assertEqual(len(archives), 1)
+            with gzip.open(archives[0], "rt", encoding="utf-8") as archive:
+                archived = [json.loads(line) for line in archive]
+
+        archived_ids = sorted(row["event_id"] for row in archived)
+        self.assertEqual(archived_ids, ["old-acked-1", "old-acked-2"])
+        self.assertEqual(archived[0]["payload"]["email"], "old-acked-1@example.com")
+        self.assertEqual(
+            self.remaining_event_ids(),
+            ["old-pending", "recent-acked"],
+        )
+        self.assertFalse(DatamailerContactEvent.objects.exists())
+        self.assertIn("outbox_events.acked: deleted 2 (archived to", output)
+        self.assertIn("contact_events.all: deleted 1", output)
+
+    def test_archived_batch_is_on_disk_before_the_archive_closes(self):
+        self.create_outbox_events()
+        policy = next(
+            policy
+            for policy in retention_policies()
+            if policy.label == "outbox_events.acked"
+        )
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            path = Path(archive_dir) / "archive.jsonl.gz"
+            with gzip.open(path, "wt", encoding="utf-8") as archive_file:
+                prune_batch(policy, timezone.now(), 1, archive_file)
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                written = decompressor.decompress(path.read_bytes())
+
+        archived = json.loads(written.decode())
+        self.assertEqual(archived["event_id"], "old-acked-1")
+
+    def test_prune_dry_run_counts_without_deleting(self):
+        self.create_outbox_events()
+
+        output = prune_datamailer_records("--dry-run")
+
+        self.assertIn("outbox_events.acked: would delete 2", output)
+        self.assertEqual(len(self.remaining_event_ids()), 4)
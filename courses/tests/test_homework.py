@@ -1,8 +1,10 @@
+from django.test import RequestFactory
 from django.urls import reverse
 
 from courses.tests.homework_view_base import (
     HomeworkDetailViewTestBase,
 )
+from courses.views.homework_context import homework_viewer
 
 class HomeworkDetailViewTests(HomeworkDetailViewTestBase):
 
@@ -92,6 +94,28 @@ class HomeworkDetailViewTests(HomeworkDetailViewTestBase):
             ),
         )
 
+    def test_homework_detail_get_does_not_create_enrollment(self):
+        response = self.get_homework_response(login=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assert_no_enrollment_or_submission()
+        self.assertIsNone(response.context["submission"])
+
+    def test_homework_viewer_is_loaded_once_per_request(self):
+        self.create_submission_with_answers()
+        request = RequestFactory().get(self.homework_url())
+        request.user = self.user
+
+        with self.assertNumQueries(2):
+            viewer = homework_viewer(request, self.course, self.homework)
+        with self.assertNumQueries(0):
+            same_viewer = homework_viewer(request, self.course, self.homework)
+
+        self.assertIs(same_viewer, viewer)
+        self.assertEqual(viewer.submission, self.submission)
+        self.assertEqual(viewer.enrollment, self.enrollment)
+        self.assertEqual(len(viewer.answers_by_question_id), 6)
+
     def test_homework_detail_authenticated_with_submission(self):
         self.create_submission_with_answers()
 
@@ -1,17 +1,22 @@
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
-from courses.homework_question_stats import homework_question_stats
+from courses.homework_question_stats import (
+    calculate_homework_question_statistics,
+    homework_question_stats,
+)
 from courses.models import (
     Answer,
     AnswerTypes,
     Course,
     Enrollment,
     Homework,
+    HomeworkQuestionStatistics,
     HomeworkState,
     Question,
     QuestionTypes,
@@ -23,6 +28,7 @@ User = get_user_model()
 
 class HomeworkQuestionStatsTestCase(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = Client()
         self.course = Course.objects.create(
             slug="test-course",
@@ -171,3 +177,64 @@ class HomeworkQuestionStatsTestCase(TestCase):
         self.assertContains(response, "Option B")
         question_stats = response.context["question_stats"]
         self.assertEqual(len(question_stats), 3)
+
+    def test_stats_are_persisted_per_question(self):
+        self.create_answers(2, "42")
+        self.create_answers(3, " 42 ")
+
+        calculate_homework_question_statistics(self.homework)
+
+        choice_statistics = HomeworkQuestionStatistics.objects.get(
+            question=self.choice_question
+        )
+        self.assertEqual(choice_statistics.total_answers, 2)
+        self.assertEqual(choice_statistics.correct_answers, 1)
+        self.assertEqual(choice_statistics.option_counts, {"2": 1, "3": 1})
+        free_form_statistics = HomeworkQuestionStatistics.objects.get(
+            question=self.free_form_question
+        )
+        self.assertEqual(free_form_statistics.free_form_counts, [["42", 2]])
+
+    def test_stats_page_reads_stored_counts(self):
+        self.create_answers(2, "42")
+        calculate_homework_question_statistics(self.homework)
+        self.create_answers(1, "99")
+
+        stats = homework_question_stats(self.homework)
+        self.assertEqual(stats[0].total, 1)
+
+        with self.assertNumQueries(0):
+            homework_question_stats(self.homework)
+
+    def test_recalculation_invalidates_cached_stats(self):
+        self.create_answers(2, "42")
+        calculate_homework_question_statistics(self.homework)
+        homework_question_stats(self.homework)
+        self.create_answers(1, "99")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            calculate_homework_question_statistics(self.homework)
+
+        stats = homework_question_stats(self.homework)
+        self.assertEqual(stats[0].total, 2)
+        self.assertEqual(
+            HomeworkQuestionStatistics.objects.filter(
+                homework=self.homework
+            ).count(),
+            3,
+        )
+
+    def test_recount_updates_existing_rows_in_place(self):
+        self.create_answers(2, "42")
+        calculate_homework_question_statistics(self.homework)
+        row_ids = set(
+            HomeworkQuestionStatistics.objects.values_list("id", flat=True)
+        )
+        self.create_answers(1, "99")
+
+        calculate_homework_question_statistics(self.homework)
+
+        statistics = HomeworkQuestionStatistics.objects.all()
+        self.assertEqual({row.id for row in statistics}, row_ids)
+        choice_statistics = statistics.get(question=self.choice_question)
+        self.assertEqual(choice_statistics.total_answers, 2)
@@ -4,7 +4,8 @@ from unittest import mock
 from django.urls import reverse
 from django.utils import timezone
 
-from courses.models import Submission
+from courses.homework_answers import save_submission_answers
+from courses.models import Answer, Submission
 from courses.tests.homework_view_base import (
     HomeworkDetailViewTestBase,
     credentials,
@@ -61,6 +62,45 @@ class HomeworkSubmissionViewTests(HomeworkDetailViewTestBase):
             },
         )
 
+    def test_save_submission_answers_uses_bulk_writes(self):
+        self.create_submission_with_answers()
+        Answer.objects.filter(question=self.question6).delete()
+        answers_by_question = [
+            (self.question1, "3"),
+            (self.question2, "Changed text"),
+            (self.question3, "1,2"),
+            (self.question4, "2"),
+            (self.question5, "3.141516"),
+            (self.question6, "1"),
+        ]
+
+        # One SELECT, one bulk INSERT and one bulk UPDATE.
+        with self.assertNumQueries(3):
+            save_submission_answers(self.submission, answers_by_question)
+
+        self.assert_submission_answers(
+            self.submission,
+            {
+                self.question1: "3",
+                self.question2: "Changed text",
+                self.question3: "1,2",
+                self.question4: "2",
+                self.question5: "3.141516",
+                self.question6: "1",
+            },
+        )
+
+    def test_save_submission_answers_skips_unchanged_answers(self):
+        self.create_submission_with_answers()
+        answers = Answer.objects.filter(submission=self.submission)
+        answers_by_question = [
+            (answer.question, answer.answer_text)
+            for answer in answers.select_related("question")
+        ]
+
+        with self.assertNumQueries(1):
+            save_submission_answers(self.submission, answers_by_question)
+
     def test_submit_homework_submission_artifacts(self):
         post_data = self.artifact_post_data()
         self.post_homework(post_data)
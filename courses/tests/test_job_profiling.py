@@ -0,0 +1,25 @@
+from django.test import TestCase, override_settings
+
+from courses.job_profiling import JobProfiler
+from courses.models import JobProfile
+
+
+class JobProfilerTest(TestCase):
+    def test_finished_job_records_a_profile(self):
+        with JobProfiler("update_leaderboard", target="course") as profiler:
+            with profiler.phase("totals"):
+                pass
+
+        job_profile = JobProfile.objects.get()
+        self.assertEqual(job_profile.phases[0]["name"], "totals")
+
+    @override_settings(JOB_PROFILE_DIR="/tmp/job-profiles")
+    def test_failed_job_stops_cprofile_and_records_nothing(self):
+        profiler = JobProfiler("update_leaderboard", target="course")
+
+        with self.assertRaises(ValueError):
+            with profiler:
+                raise ValueError("scoring failed")
+
+        self.assertIsNone(profiler._cprofile)
+        self.assertFalse(JobProfile.objects.exists())
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from courses.models import (
@@ -5,12 +7,16 @@ from courses.models import (
     CriteriaResponse,
     ProjectState,
     ProjectVote,
+    ReviewCriteriaTypes,
 )
 from courses.tests.project_eval_base import (
     ProjectEvaluationTestBase,
     credentials,
     fetch_fresh,
 )
+from courses.views.project_eval_submit_save import (
+    save_project_eval_criteria_responses,
+)
 
 
 def close_project_reviews(project):
@@ -201,6 +207,61 @@ class ProjectEvaluationSubmitPostTestCase(ProjectEvaluationTestBase):
         self.assertEqual(c3.answer, "1,2,3")
 
 
+class ProjectEvaluationCriteriaResponseQueryTestCase(ProjectEvaluationTestBase):
+    def create_extra_criteria(self, count):
+        options = [
+            {"criteria": "No", "score": 0},
+            {"criteria": "Yes", "score": 1},
+        ]
+        extra_criteria = []
+        for index in range(count):
+            criteria = self.create_review_criteria(
+                f"Extra criterion {index}",
+                options,
+                ReviewCriteriaTypes.RADIO_BUTTONS.value,
+            )
+            extra_criteria.append(criteria)
+        return extra_criteria
+
+    def count_submit_queries(self, post_data):
+        self.client.login(**credentials)
+        eval_submit_url = self.eval_submit_url()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(eval_submit_url, post_data)
+        self.assertEqual(response.status_code, 302)
+        return len(queries)
+
+    def test_criteria_responses_are_upserted_in_one_query(self):
+        self.create_criteria_responses()
+        criteria = self.criteria + self.create_extra_criteria(7)
+        answers_by_field = {}
+        for criterion in criteria:
+            answers_by_field[f"answer_{criterion.id}"] = "2"
+
+        with self.assertNumQueries(1):
+            save_project_eval_criteria_responses(
+                self.peer_review,
+                criteria,
+                answers_by_field,
+            )
+
+        answers = list(
+            self.criteria_responses().values_list("answer", flat=True)
+        )
+        self.assertEqual(answers, ["2"] * len(criteria))
+
+    def test_submit_query_count_does_not_grow_with_criteria(self):
+        post_data = self.review_post_data()
+        query_count = self.count_submit_queries(post_data)
+
+        extra_criteria = self.create_extra_criteria(7)
+        for criteria in extra_criteria:
+            post_data[f"answer_{criteria.id}"] = "1"
+        query_count_with_more_criteria = self.count_submit_queries(post_data)
+
+        self.assertEqual(query_count_with_more_criteria, query_count)
+
+
 class ProjectEvaluationSubmitVoteTestCase(ProjectEvaluationTestBase):
     def test_eval_submit_page_can_vote_for_reviewed_submission(self):
         self.client.login(**credentials)
@@ -1,4 +1,5 @@
 from courses.models import (
+    Enrollment,
     ProjectSubmission,
     ProjectState,
 )
@@ -91,6 +92,19 @@ class ProjectViewTestCase(ProjectViewTestBase):
         )
         self.assert_save_submission_copy(response)
 
+    def test_project_detail_get_does_not_create_enrollment(self):
+        self.enrollment.delete()
+
+        response = self.authenticated_project_response()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.context["certificate_name"])
+        enrollment_exists = Enrollment.objects.filter(
+            student=self.user,
+            course=self.course,
+        ).exists()
+        self.assertFalse(enrollment_exists)
+
     def test_project_detail_explains_which_part_of_commit_id_to_use(self):
         response = self.authenticated_project_response()
 
@@ -0,0 +1,133 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from cadmin.views.campaign_metrics import registration_campaign_metrics
+from courses.models import CourseRegistration, RegistrationCampaignStats
+from courses.tests.registration_campaign_base import RegistrationCampaignBase
+
+DATA_ENGINEER = CourseRegistration.Role.DATA_ENGINEER
+ML_ENGINEER = CourseRegistration.Role.ML_ENGINEER
+
+
+class RegistrationCampaignStatsTest(RegistrationCampaignBase):
+    def create_registration(self, email, role, country, region):
+        return CourseRegistration.objects.create(
+            campaign=self.campaign,
+            email=email,
+            name="Student",
+            country=country,
+            region=region,
+            role=role,
+        )
+
+    def campaign_stats(self):
+        return RegistrationCampaignStats.objects.get(campaign=self.campaign)
+
+    def test_signals_keep_counts_current(self):
+        first = self.create_registration(
+            "first@example.com",
+            DATA_ENGINEER,
+            "Germany",
+            "Europe",
+        )
+        self.create_registration(
+            "second@example.com",
+            DATA_ENGINEER,
+            "Canada",
+            "North America",
+        )
+
+        stats = self.campaign_stats()
+        self.assertEqual(stats.total, 2)
+        self.assertEqual(stats.by_role, {DATA_ENGINEER: 2})
+        self.assertEqual(stats.by_country, {"Canada": 1, "Germany": 1})
+
+        first.role = ML_ENGINEER
+        first.save()
+
+        stats = self.campaign_stats()
+        self.assertEqual(stats.total, 2)
+        self.assertEqual(stats.by_role, {DATA_ENGINEER: 1, ML_ENGINEER: 1})
+
+        first.delete()
+
+        stats = self.campaign_stats()
+        self.assertEqual(stats.total, 1)
+        self.assertEqual(stats.by_role, {DATA_ENGINEER: 1})
+        self.assertEqual(stats.by_region, {"North America": 1})
+
+    def test_metrics_are_read_from_one_row(self):
+        self.create_registration(
+            "first@example.com",
+            DATA_ENGINEER,
+            "Germany",
+            "Europe",
+        )
+        self.create_registration(
+            "second@example.com",
+            ML_ENGINEER,
+            "Germany",
+            "Europe",
+        )
+        self.create_registration(
+            "third@example.com",
+            ML_ENGINEER,
+            "Canada",
+            "North America",
+        )
+
+        with self.assertNumQueries(1):
+            metrics = registration_campaign_metrics(self.campaign)
+
+        self.assertEqual(metrics["total"], 3)
+        self.assertEqual(
+            metrics["by_role"],
+            [
+                {"role": ML_ENGINEER, "count": 2},
+                {"role": DATA_ENGINEER, "count": 1},
+            ],
+        )
+        self.assertEqual(
+            metrics["by_country"][0],
+            {"country": "Germany", "count": 2},
+        )
+
+    def test_reconcile_command_fixes_drift(self):
+        self.create_registration(
+            "first@example.com",
+            DATA_ENGINEER,
+            "Germany",
+            "Europe",
+        )
+        RegistrationCampaignStats.objects.filter(
+            campaign=self.campaign
+        ).update(total=5, by_role={})
+
+        stdout = StringIO()
+        call_command("reconcile_registration_campaign_stats", stdout=stdout)
+
+        self.assertIn("Fixed registration stats for 1", stdout.getvalue())
+        stats = self.campaign_stats()
+        self.assertEqual(stats.total, 1)
+        self.assertEqual(stats.by_role, {DATA_ENGINEER: 1})
+
+    def test_missing_row_is_recounted_on_read(self):
+        self.create_registration(
+            "first@example.com",
+            DATA_ENGINEER,
+            "Germany",
+            "Europe",
+        )
+        RegistrationCampaignStats.objects.filter(
+            campaign=self.campaign
+        ).delete()
+
+        metrics = registration_campaign_metrics(self.campaign)
+
+        self.assertEqual(metrics["total"], 1)
+        self.assertTrue(
+            RegistrationCampaignStats.objects.filter(
+                campaign=self.campaign
+            ).exists()
+        )
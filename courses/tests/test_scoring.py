@@ -1,4 +1,4 @@
-from courses.models import HomeworkState
+from courses.models import HomeworkQuestionStatistics, HomeworkState
 from courses.scoring import HomeworkScoringStatus, score_homework_submissions
 
 from .scoring_base import HomeworkScoringBase, fetch_fresh
@@ -89,3 +89,21 @@ class HomeworkScoringWorkflowTests(HomeworkScoringBase):
 
         self.course = fetch_fresh(self.course)
         self.assertTrue(self.course.first_homework_scored)
+
+    def test_homework_scoring_stores_question_statistics(self):
+        answers_student1 = self.scoring_answers_student1()
+        self.create_submission_with_answers(
+            self.student1, self.enrollment1, answers_student1
+        )
+
+        self.score_homework_and_assert_ok()
+
+        question_statistics = HomeworkQuestionStatistics.objects.filter(
+            homework=self.homework
+        )
+        question_count = self.homework.question_set.count()
+        self.assertEqual(question_statistics.count(), question_count)
+        total_answers = sum(
+            statistics.total_answers for statistics in question_statistics
+        )
+        self.assertEqual(total_answers, len(answers_student1))
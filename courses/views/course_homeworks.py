@@ -5,11 +5,14 @@ from courses.models.course import Course
 from courses.models.homework import Homework, Submission
 
 
-def get_homeworks_for_course(course: Course, user) -> list[Homework]:
+def user_homework_submissions(user):
     if user.is_authenticated:
-        queryset = Submission.objects.filter(student=user)
-    else:
-        queryset = Submission.objects.none()
+        return Submission.objects.filter(student=user)
+    return Submission.objects.none()
+
+
+def get_homeworks_for_course(course: Course, user) -> list[Homework]:
+    queryset = user_homework_submissions(user)
 
     submissions_prefetch = Prefetch(
         "submission_set",
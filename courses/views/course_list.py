@@ -1,10 +1,15 @@
 from collections import defaultdict
 from dataclasses import dataclass
 
-from django.db.models import Count
+from django.core.cache import cache
 from django.shortcuts import render
 from django.utils import timezone
 
+from courses.course_catalog import (
+    COURSE_CATALOG_CACHE_TTL,
+    course_catalog_cache_key,
+    course_catalog_counts,
+)
 from courses.models.course import Course
 from courses.views.course_homepage import (
     add_course_homepage_info,
@@ -28,18 +33,32 @@ class CourseListCourses:
 
 def visible_course_list_queryset():
     courses = Course.objects.filter(visible=True)
-    homework_count = Count("homework", distinct=True)
-    project_count = Count("project", distinct=True)
-    learner_count = Count("enrollment", distinct=True)
-    courses = courses.annotate(
-        homework_count=homework_count,
-        project_count=project_count,
-        learner_count=learner_count,
-    )
+    courses = courses.select_related("catalog_stats")
     courses = courses.prefetch_related("homework_set", "project_set")
     return courses.order_by("-id")
 
 
+def load_catalog_courses():
+    courses = list(visible_course_list_queryset())
+    for course in courses:
+        counts = course_catalog_counts(course)
+        course.homework_count = counts["homework_count"]
+        course.project_count = counts["project_count"]
+        course.learner_count = counts["learner_count"]
+    attach_registration_campaigns(courses)
+    return courses
+
+
+def catalog_courses():
+    """Visible courses with counts and campaigns, shared by all viewers."""
+    cache_key = course_catalog_cache_key()
+    courses = cache.get(cache_key)
+    if courses is None:
+        courses = load_catalog_courses()
+        cache.set(cache_key, courses, COURSE_CATALOG_CACHE_TTL)
+    return courses
+
+
 def split_courses_by_status(courses, now, submitted_project_ids=None):
     active_courses = []
     open_registration_courses = []
@@ -129,8 +148,7 @@ def other_active_courses(active_courses, featured_course):
 
 
 def prepare_course_list_courses(user):
-    visible_courses = visible_course_list_queryset()
-    courses = list(visible_courses)
+    courses = catalog_courses()
     now = timezone.now()
     submitted_project_ids = submitted_project_ids_for_user(courses, user)
     course_groups = split_courses_by_status(
@@ -140,7 +158,6 @@ def prepare_course_list_courses(user):
     )
 
     mark_enrolled_courses(course_groups.courses, user)
-    attach_registration_campaigns(course_groups.courses)
     mark_registered_courses(course_groups.courses, user)
 
     return course_groups
@@ -1,21 +1,33 @@
 from dataclasses import dataclass
+from operator import attrgetter
 
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
+from courses.course_page_cache import (
+    COURSE_PAGE_CACHE_TTL,
+    course_page_shared_cache_key,
+    course_page_user_cache_key,
+)
 from courses.models.course import (
     Course,
     CourseRegistration,
     Enrollment,
     RegistrationCampaign,
 )
-from courses.models.project import ProjectState
-from courses.views.course_homepage import (
-    add_course_homepage_info,
-    submitted_project_ids_for_user,
+from courses.models.homework import Homework
+from courses.models.project import Project, ProjectState
+from courses.views.course_homepage import add_course_homepage_info
+from courses.views.course_homeworks import (
+    update_homework_with_additional_info,
+    user_homework_submissions,
+)
+from courses.views.course_list_user_state import normalized_user_email
+from courses.views.course_projects import (
+    update_project_with_additional_info,
+    user_project_submissions,
 )
-from courses.views.course_homeworks import get_homeworks_for_course
-from courses.views.course_projects import get_projects_for_course
 
 
 @dataclass(frozen=True)
@@ -25,6 +37,26 @@ class CoursePageData:
     homeworks: list
     projects: list
     registration_campaign: object
+    user_context: dict
+
+
+@dataclass(frozen=True)
+class CoursePageSharedData:
+    """The parts of the course page that are the same for every viewer."""
+
+    course: Course
+    homeworks: list[Homework]
+    projects: list[Project]
+    registration_campaign: RegistrationCampaign | None
+
+
+@dataclass(frozen=True)
+class CoursePageUserData:
+    """One viewer's submissions and progress, keyed by assignment id."""
+
+    homework_submissions: dict[int, list]
+    project_submissions: dict[int, list]
+    user_context: dict
 
 
 def active_registration_campaign_for_course(
@@ -101,9 +133,7 @@ def _has_course_registration(
     if not registration_campaign:
         return False
 
-    email = user.email or ""
-    stripped_email = email.strip()
-    email_normalized = stripped_email.lower()
+    email_normalized = normalized_user_email(user)
     return CourseRegistration.objects.filter(
         campaign=registration_campaign,
         email_normalized=email_normalized,
@@ -140,29 +170,134 @@ def course_page_context(data: CoursePageData) -> dict:
         "is_authenticated": data.user.is_authenticated,
         "registration_campaign": data.registration_campaign,
     }
-    user_context = course_user_context(
-        data.user,
-        data.course,
-        data.registration_campaign,
-    )
-    context.update(user_context)
+    context.update(data.user_context)
     return context
 
 
-def course_page_data(course_slug: str, user) -> CoursePageData:
-    course = get_object_or_404(Course, slug=course_slug)
-    now = timezone.now()
-    submitted_project_ids = submitted_project_ids_for_user([course], user)
-    add_course_homepage_info(course, now, submitted_project_ids)
-    homeworks = get_homeworks_for_course(course, user)
-    projects = get_projects_for_course(course, user)
+def load_course_page_shared_data(course_id) -> CoursePageSharedData:
+    # The prefetched sets also serve add_course_homepage_info, so the cached
+    # course needs no further queries to render.
+    course = Course.objects.prefetch_related(
+        "homework_set",
+        "project_set",
+    ).get(id=course_id)
+    homeworks = sorted(course.homework_set.all(), key=attrgetter("due_date"))
+    projects = sorted(course.project_set.all(), key=attrgetter("id"))
     registration_campaign = active_registration_campaign_for_course(
         course
     )
-    return CoursePageData(
+    return CoursePageSharedData(
         course=course,
-        user=user,
         homeworks=homeworks,
         projects=projects,
         registration_campaign=registration_campaign,
     )
+
+
+def course_page_shared_data(course_id) -> CoursePageSharedData:
+    cache_key = course_page_shared_cache_key(course_id)
+    shared_data = cache.get(cache_key)
+    if shared_data is None:
+        shared_data = load_course_page_shared_data(course_id)
+        cache.set(cache_key, shared_data, COURSE_PAGE_CACHE_TTL)
+    return shared_data
+
+
+def _submissions_by_id(submissions, id_attribute):
+    submissions_by_id = {}
+    for submission in submissions:
+        assignment_id = getattr(submission, id_attribute)
+        submissions_by_id.setdefault(assignment_id, []).append(submission)
+    return submissions_by_id
+
+
+def load_course_page_user_data(
+    user,
+    shared_data: CoursePageSharedData,
+) -> CoursePageUserData:
+    course = shared_data.course
+    homework_submissions = user_homework_submissions(user).filter(
+        homework__course=course
+    )
+    project_submissions = user_project_submissions(user).filter(
+        project__course=course
+    )
+    user_context = course_user_context(
+        user,
+        course,
+        shared_data.registration_campaign,
+    )
+    return CoursePageUserData(
+        homework_submissions=_submissions_by_id(
+            homework_submissions,
+            "homework_id",
+        ),
+        project_submissions=_submissions_by_id(
+            project_submissions,
+            "project_id",
+        ),
+        user_context=user_context,
+    )
+
+
+def course_page_user_data(
+    user,
+    shared_data: CoursePageSharedData,
+) -> CoursePageUserData:
+    if not user.is_authenticated:
+        return CoursePageUserData(
+            homework_submissions={},
+            project_submissions={},
+            user_context=course_user_context(user, shared_data.course, None),
+        )
+
+    course_id = shared_data.course.id
+    cache_key = course_page_user_cache_key(
+        course_id,
+        user.id,
+        normalized_user_email(user),
+    )
+    user_data = cache.get(cache_key)
+    if user_data is None:
+        user_data = load_course_page_user_data(user, shared_data)
+        cache.set(cache_key, user_data, COURSE_PAGE_CACHE_TTL)
+    return user_data
+
+
+def course_page_data(course_slug: str, user) -> CoursePageData:
+    course_id = get_object_or_404(
+        Course.objects.only("id"),
+        slug=course_slug,
+    ).id
+    shared_data = course_page_shared_data(course_id)
+    user_data = course_page_user_data(user, shared_data)
+
+    # Days-until-due and badges depend on the current time, so they are
+    # derived from the cached rows on every view.
+    course = shared_data.course
+    now = timezone.now()
+    submitted_project_ids = None
+    if user.is_authenticated:
+        submitted_project_ids = set(user_data.project_submissions)
+    add_course_homepage_info(course, now, submitted_project_ids)
+    for homework in shared_data.homeworks:
+        homework.submissions = user_data.homework_submissions.get(
+            homework.id,
+            [],
+        )
+        update_homework_with_additional_info(homework)
+    for project in shared_data.projects:
+        project.submissions = user_data.project_submissions.get(
+            project.id,
+            [],
+        )
+        update_project_with_additional_info(project)
+
+    return CoursePageData(
+        course=course,
+        user=user,
+        homeworks=shared_data.homeworks,
+        projects=shared_data.projects,
+        registration_campaign=shared_data.registration_campaign,
+        user_context=user_data.user_context,
+    )
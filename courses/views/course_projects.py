@@ -19,23 +19,25 @@ class ProjectBadgeData:
     score: object = None
 
 
+def user_project_submissions(user: User):
+    if not user.is_authenticated:
+        return ProjectSubmission.objects.none()
+
+    return ProjectSubmission.objects.filter(student=user).annotate(
+        completed_reviews_count=Count(
+            "reviewers",
+            filter=Q(
+                reviewers__optional=False,
+                reviewers__state=PeerReviewState.SUBMITTED.value,
+            ),
+        )
+    )
+
+
 def get_projects_for_course(
     course: Course, user: User
 ) -> list[Project]:
-    if user.is_authenticated:
-        queryset = ProjectSubmission.objects.filter(
-            student=user
-        ).annotate(
-            completed_reviews_count=Count(
-                "reviewers",
-                filter=Q(
-                    reviewers__optional=False,
-                    reviewers__state=PeerReviewState.SUBMITTED.value,
-                ),
-            )
-        )
-    else:
-        queryset = ProjectSubmission.objects.none()
+    queryset = user_project_submissions(user)
 
     submissions_prefetch = Prefetch(
         "projectsubmission_set",
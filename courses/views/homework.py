@@ -33,7 +33,7 @@ class HomeworkRequestData:
 
 def authenticated_homework_response(data: HomeworkRequestData):
     authenticated_context = authenticated_homework_context(
-        user=data.request.user,
+        request=data.request,
         course=data.course,
         homework=data.homework,
         questions=data.questions,
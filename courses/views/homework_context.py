@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
@@ -34,7 +35,20 @@ class HomeworkDetailObjects:
 class AuthenticatedHomeworkContext:
     context: dict
     submission: Submission | None
-    enrollment: Enrollment
+    enrollment: Enrollment | None
+
+
+@dataclass(frozen=True)
+class HomeworkViewer:
+    """What the signed-in user already has for a homework.
+
+    ``enrollment`` is None until the user's first submission: reads never
+    create enrollments, the submission POST does.
+    """
+
+    enrollment: Enrollment | None
+    submission: Submission | None
+    answers_by_question_id: dict[int, Answer]
 
 
 def homework_deadline_passed(homework: Homework) -> bool:
@@ -80,21 +94,65 @@ def submission_answer_map(
     if not submission:
         return {}
 
-    answers = Answer.objects.filter(
-        submission=submission
-    ).select_related("question")
     answer_map = {}
-    for answer in answers:
-        answer_map[answer.question.id] = answer
+    for answer in submission.answer_set.all():
+        answer_map[answer.question_id] = answer
     return answer_map
 
 
+def load_homework_viewer(
+    user: User,
+    course: Course,
+    homework: Homework,
+) -> HomeworkViewer:
+    # The submission carries the enrollment, so a returning student costs one
+    # query plus one for the answers; only first-time viewers need a separate
+    # enrollment lookup.
+    submission = (
+        Submission.objects.filter(homework=homework, student=user)
+        .select_related("enrollment")
+        .prefetch_related("answer_set")
+        .first()
+    )
+    if submission is not None:
+        enrollment = submission.enrollment
+    else:
+        enrollment = Enrollment.objects.filter(
+            student=user,
+            course=course,
+        ).first()
+    return HomeworkViewer(
+        enrollment=enrollment,
+        submission=submission,
+        answers_by_question_id=submission_answer_map(submission),
+    )
+
+
+def homework_viewer(
+    request: HttpRequest,
+    course: Course,
+    homework: Homework,
+) -> HomeworkViewer:
+    """Load the viewer once per request and homework."""
+    viewers = getattr(request, "_homework_viewers", None)
+    if viewers is None:
+        viewers = {}
+        request._homework_viewers = viewers
+    viewer = viewers.get(homework.id)
+    if viewer is None:
+        viewer = load_homework_viewer(request.user, course, homework)
+        viewers[homework.id] = viewer
+    return viewer
+
+
 def question_answers_for_submission(
     homework: Homework,
     questions: list[Question],
     submission: Submission | None,
+    question_answers_map: dict[int, Answer] | None = None,
 ) -> list[tuple[Question, dict]]:
-    question_answers_map = submission_answer_map(submission)
+    if question_answers_map is None:
+        question_answers_map = submission_answer_map(submission)
     question_answers = []
 
     for question in questions:
@@ -118,11 +176,15 @@ def learning_in_public_disabled(
     return enrollment.disable_learning_in_public
 
 
-def homework_detail_build_context_authenticated(data) -> dict:
+def homework_detail_build_context_authenticated(
+    data: HomeworkDetailContextData,
+    question_answers_map: dict[int, Answer] | None = None,
+) -> dict:
     question_answers = question_answers_for_submission(
         data.homework,
         data.questions,
         data.submission,
+        question_answers_map,
     )
     disable_learning_in_public = learning_in_public_disabled(
         data.enrollment
@@ -158,29 +220,25 @@ def homework_detail_objects(course_slug: str, homework_slug: str):
 
 
 def authenticated_homework_context(
-    user: User,
+    request: HttpRequest,
     course: Course,
     homework: Homework,
     questions: list[Question],
 ):
-    submission = Submission.objects.filter(
-        homework=homework,
-        student=user,
-    ).first()
-    enrollment, _ = Enrollment.objects.get_or_create(
-        student=user,
-        course=course,
-    )
+    viewer = homework_viewer(request, course, homework)
     context_data = HomeworkDetailContextData(
         course=course,
         homework=homework,
         questions=questions,
-        submission=submission,
-        enrollment=enrollment,
+        submission=viewer.submission,
+        enrollment=viewer.enrollment,
+    )
+    context = homework_detail_build_context_authenticated(
+        context_data,
+        viewer.answers_by_question_id,
     )
-    context = homework_detail_build_context_authenticated(context_data)
     return AuthenticatedHomeworkContext(
         context=context,
-        submission=submission,
-        enrollment=enrollment,
+        submission=viewer.submission,
+        enrollment=viewer.enrollment,
     )
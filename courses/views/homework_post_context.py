@@ -3,7 +3,10 @@ from django.http import HttpRequest
 
 from courses.models.homework import Answer, Homework, Question, Submission
 from courses.views.homework_answers import process_question_options
-from courses.views.homework_context import homework_state_context
+from courses.views.homework_context import (
+    homework_state_context,
+    learning_in_public_disabled,
+)
 from courses.views.homework_post_fields import (
     apply_homework_post_preview_fields,
 )
@@ -66,7 +69,7 @@ def homework_detail_build_context_from_post(
         data.homework,
         data.questions,
     )
-    disable_learning_in_public = data.enrollment.disable_learning_in_public
+    disable_learning_in_public = learning_in_public_disabled(data.enrollment)
     state_context = homework_state_context(data.homework)
     context = {
         "course": data.course,
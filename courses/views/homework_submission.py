@@ -11,9 +11,9 @@ from course_management.datamailer.sync.memberships import (
     sync_homework_submission_to_datamailer,
 )
 from course_management.observability import record_event
+from courses.homework_answers import save_submission_answers
 from courses.models.course import Course, Enrollment
 from courses.models.homework import (
-    Answer,
     Homework,
     Question,
     Submission,
@@ -36,7 +36,7 @@ class HomeworkPostData:
     homework: Homework
     questions: list[Question]
     submission: Submission | None
-    enrollment: Enrollment
+    enrollment: Enrollment | None
 
 
 def homework_answers_from_post(request):
@@ -70,13 +70,11 @@ def homework_submission_for_user(user, course, homework, submission):
 
 
 def save_homework_answers(submission, questions, answers_dict):
+    answers_by_question = []
     for question in questions:
         answer_text = answers_dict.get(f"answer_{question.id}")
-        Answer.objects.update_or_create(
-            submission=submission,
-            question=question,
-            defaults={"answer_text": answer_text},
-        )
+        answers_by_question.append((question, answer_text))
+    save_submission_answers(submission, answers_by_question)
 
 
 def register_homework_submission_callbacks(data, submission):
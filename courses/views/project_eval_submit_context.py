@@ -28,10 +28,10 @@ class ProjectEvalSubmitPage:
 def project_eval_submit_context(
     request: HttpRequest, page: ProjectEvalSubmitPage
 ):
-    enrollment, _ = Enrollment.objects.get_or_create(
+    enrollment = Enrollment.objects.filter(
         student=request.user,
         course=page.course,
-    )
+    ).first()
     context = project_eval_build_context(
         page.project,
         page.review,
@@ -82,13 +82,22 @@ def save_project_eval_criteria_responses(
     review_criteria,
     answers_by_field,
 ):
+    """Upsert every criterion's answer for the review in one query."""
+    responses = []
     for criteria in review_criteria:
         answer = answers_by_field.get(f"answer_{criteria.id}")
-        CriteriaResponse.objects.update_or_create(
+        response = CriteriaResponse(
             review=review,
             criteria=criteria,
-            defaults={"answer": answer},
+            answer=answer,
         )
+        responses.append(response)
+    CriteriaResponse.objects.bulk_create(
+        responses,
+        update_conflicts=True,
+        unique_fields=["review", "criteria"],
+        update_fields=["answer"],
+    )
 
 
 def apply_review_learning_in_public_links(request, project, review):
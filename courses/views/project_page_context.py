@@ -50,10 +50,11 @@ def project_context_user_details(
     project: Project,
 ) -> ProjectContextUserDetails:
     project_submission = project_context_submission(user, project)
-    enrollment, _ = Enrollment.objects.get_or_create(
+    # Read-only: the enrollment is created by the first submission.
+    enrollment = Enrollment.objects.filter(
         student=user,
         course=course,
-    )
+    ).first()
     certificate_name = project_context_certificate_name(user, enrollment)
     return ProjectContextUserDetails(
         submission=project_submission,
@@ -75,10 +76,12 @@ def project_context_submission(
 
 def project_context_certificate_name(
     user: User,
-    enrollment: Enrollment,
+    enrollment: Enrollment | None,
 ) -> str | None:
     if user.certificate_name:
         return user.certificate_name
+    if enrollment is None:
+        return None
     return enrollment.display_name
 
 
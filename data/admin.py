@@ -8,6 +8,7 @@ from data.models import (
     DatamailerOutboxDispatchRun,
     DatamailerOutboxEvent,
     DatamailerOutboxStatus,
+    DatamailerRecipientListSyncState,
     DatamailerSendAudit,
 )
 
@@ -138,3 +139,18 @@ class DatamailerSendAuditAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     )
+
+
+@admin.register(DatamailerRecipientListSyncState)
+class DatamailerRecipientListSyncStateAdmin(admin.ModelAdmin):
+    list_display = ("list_key", "mode", "kind", "member_count", "synced_at")
+    list_filter = ("mode", "kind")
+    search_fields = ("list_key", "content_sha256")
+    readonly_fields = (
+        "list_key",
+        "mode",
+        "kind",
+        "content_sha256",
+        "member_count",
+        "synced_at",
+    )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from course_management.datamailer.sync.audit import (
+    DEFAULT_RECIPIENT_BACKFILL_BATCH_SIZE,
+    backfill_datamailer_send_audit_recipients,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the recipient email out of response_payload into the indexed "
+        "recipient_email column of older Datamailer send audits."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_RECIPIENT_BACKFILL_BATCH_SIZE,
+            help="Rows read and updated per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        updated_count = backfill_datamailer_send_audit_recipients(
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(f"Send audits updated: {updated_count}")
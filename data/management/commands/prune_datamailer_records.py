@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from course_management.datamailer_retention import (
+    DEFAULT_PRUNE_BATCH_SIZE,
+    PruneOptions,
+    prune_datamailer_records,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive and delete expired Datamailer outbox events, send audits, "
+        "and contact events in small batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_PRUNE_BATCH_SIZE,
+            help="Rows archived and deleted per transaction.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=None,
+            help=(
+                "Directory for gzipped JSONL archives. Defaults to "
+                "DATAMAILER_RETENTION_ARCHIVE_DIR; empty deletes without "
+                "archiving."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count expired rows without archiving or deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        archive_dir = options["archive_dir"]
+        if archive_dir is None:
+            archive_dir = getattr(
+                settings,
+                "DATAMAILER_RETENTION_ARCHIVE_DIR",
+                "",
+            )
+        prune_options = PruneOptions(
+            batch_size=options["batch_size"],
+            archive_dir=archive_dir,
+            dry_run=options["dry_run"],
+        )
+        results = prune_datamailer_records(prune_options)
+        for result in results:
+            self.write_result(result, prune_options)
+
+    def write_result(self, result, prune_options):
+        if prune_options.dry_run:
+            self.stdout.write(
+                f"{result.label}: would delete {result.matched_count}"
+            )
+            return
+
+        message = f"{result.label}: deleted {result.deleted_count}"
+        if result.archive_path:
+            message = f"{message} (archived to {result.archive_path})"
+        self.stdout.write(message)
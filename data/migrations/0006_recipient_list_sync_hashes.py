@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0005_datamailersendaudit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatamailerRecipientListSyncState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('list_key', models.CharField(max_length=255, unique=True)),
+                ('kind', models.CharField(max_length=40)),
+                ('content_sha256', models.CharField(max_length=64)),
+                ('member_count', models.PositiveIntegerField(default=0)),
+                ('synced_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['list_key'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DatamailerRecipientListMemberHash',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('list_key', models.CharField(max_length=255)),
+                ('source_object_key', models.CharField(max_length=255)),
+                ('member_sha256', models.CharField(max_length=64)),
+                ('synced_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('list_key', 'source_object_key'), name='dm_list_member_hash_uniq')],
+            },
+        ),
+    ]
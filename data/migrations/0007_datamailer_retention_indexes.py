@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-18 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0006_recipient_list_sync_hashes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='datamailercontactevent',
+            index=models.Index(fields=['created_at'], name='dm_events_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='datamaileroutboxevent',
+            index=models.Index(fields=['status', 'updated_at'], name='dm_outbox_status_updated_idx'),
+        ),
+    ]
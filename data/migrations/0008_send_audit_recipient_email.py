@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-19 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0007_datamailer_retention_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datamailersendaudit',
+            name='recipient_email',
+            field=models.CharField(blank=True, max_length=254),
+        ),
+        migrations.AddIndex(
+            model_name='datamailersendaudit',
+            index=models.Index(fields=['recipient_email', 'occurred_at'], name='dm_send_recipient_occurred_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='datamailersendaudit',
+            index=models.Index(fields=['template_key', 'occurred_at'], name='dm_send_template_occurred_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='datamailersendaudit',
+            index=models.Index(fields=['list_key', 'occurred_at'], name='dm_send_list_occurred_idx'),
+        ),
+    ]
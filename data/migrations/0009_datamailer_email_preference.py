@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-19 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0008_send_audit_recipient_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DatamailerEmailPreference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.CharField(max_length=254, unique=True)),
+                ('preferences', models.JSONField(blank=True, default=dict)),
+                ('synced_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['email'],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.1.2 on 2026-10-19 03:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0009_datamailer_email_preference'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='datamailerrecipientlistsyncstate',
+            options={'ordering': ['list_key', 'mode']},
+        ),
+        migrations.AddField(
+            model_name='datamailerrecipientlistsyncstate',
+            name='mode',
+            field=models.CharField(default='', max_length=40),
+        ),
+        migrations.AlterField(
+            model_name='datamailerrecipientlistsyncstate',
+            name='list_key',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AddConstraint(
+            model_name='datamailerrecipientlistsyncstate',
+            constraint=models.UniqueConstraint(fields=('list_key', 'mode'), name='dm_list_sync_state_uniq'),
+        ),
+    ]
@@ -23,6 +23,10 @@ class DatamailerContactEvent(models.Model):
                 fields=["event_type", "created_at"],
                 name="dm_events_type_created_idx",
             ),
+            models.Index(
+                fields=["created_at"],
+                name="dm_events_created_idx",
+            ),
         ]
 
     def __str__(self):
@@ -76,6 +80,10 @@ class DatamailerOutboxEvent(models.Model):
                 fields=["event_type", "created_at"],
                 name="dm_outbox_type_created_idx",
             ),
+            models.Index(
+                fields=["status", "updated_at"],
+                name="dm_outbox_status_updated_idx",
+            ),
         ]
 
     def __str__(self):
@@ -141,6 +149,9 @@ class DatamailerSendAudit(models.Model):
         db_index=True,
     )
     idempotency_key = models.CharField(max_length=255, db_index=True)
+    # Lowercased copy of response_payload["message"]["email"], so recipient
+    # lookups use an index instead of a JSON path.
+    recipient_email = models.CharField(max_length=254, blank=True)
     template_key = models.CharField(max_length=120, blank=True)
     category_tag = models.CharField(max_length=80, blank=True)
     list_key = models.CharField(max_length=255, blank=True, db_index=True)
@@ -178,7 +189,86 @@ class DatamailerSendAudit(models.Model):
                 fields=["event", "occurred_at"],
                 name="dm_send_event_occurred_idx",
             ),
+            models.Index(
+                fields=["recipient_email", "occurred_at"],
+                name="dm_send_recipient_occurred_idx",
+            ),
+            models.Index(
+                fields=["template_key", "occurred_at"],
+                name="dm_send_template_occurred_idx",
+            ),
+            models.Index(
+                fields=["list_key", "occurred_at"],
+                name="dm_send_list_occurred_idx",
+            ),
         ]
 
     def __str__(self):
         return f"{self.send_type} {self.idempotency_key} ({self.status})"
+
+
+class DatamailerRecipientListSyncState(models.Model):
+    """Content hash of the last whole-list sync (reconcile or import).
+
+    ``mode`` separates the sync flavours, so a list last sent by an
+    additive import is never mistaken for one Datamailer has reconciled.
+    """
+
+    list_key = models.CharField(max_length=255)
+    mode = models.CharField(max_length=40, default="")
+    kind = models.CharField(max_length=40)
+    content_sha256 = models.CharField(max_length=64)
+    member_count = models.PositiveIntegerField(default=0)
+    synced_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["list_key", "mode"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["list_key", "mode"],
+                name="dm_list_sync_state_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.list_key} {self.mode} ({self.member_count} members)"
+
+
+class DatamailerRecipientListMemberHash(models.Model):
+    """Content hash of the member payload last sent for a list."""
+
+    list_key = models.CharField(max_length=255)
+    source_object_key = models.CharField(max_length=255)
+    member_sha256 = models.CharField(max_length=64)
+    synced_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["list_key", "source_object_key"],
+                name="dm_list_member_hash_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.list_key} {self.source_object_key}"
+
+
+class DatamailerEmailPreference(models.Model):
+    """Account-page read model of a contact's Datamailer preferences.
+
+    ``synced_at`` is empty while the row only holds local changes (account
+    page writes or webhook callbacks) that a remote fetch has not yet been
+    merged with.
+    """
+
+    email = models.CharField(max_length=254, unique=True)
+    preferences = models.JSONField(default=dict, blank=True)
+    synced_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["email"]
+
+    def __str__(self):
+        return self.email
@@ -3,7 +3,6 @@ Shared fixtures for enrollment-related API tests.
 """
 
 import json
-import random
 from dataclasses import dataclass, field
 
 from django.test import Client, TestCase
@@ -29,18 +28,17 @@ class PassedProjectSubmissionData:
 
 @dataclass(frozen=True)
 class PassedEnrollmentExpectation:
-    passed_submissions: list[ProjectSubmission]
     min_projects: int
-    expected_enrollments: list[Enrollment]
-    missing_enrollments: list[Enrollment] = field(default_factory=list)
+    expected_emails: list[str]
+    missing_emails: list[str] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
 class PassedEnrollmentScenario:
-    passed_submissions: list[ProjectSubmission]
-    enrollment2: Enrollment
-    enrollment3: Enrollment
-    enrollment4: Enrollment
+    email1: str
+    email2: str
+    email3: str
+    email4: str
 
 
 @dataclass(frozen=True)
@@ -121,46 +119,6 @@ class EnrollmentDataAPIBase(TestCase):
             passed=True,
         )
 
-    def create_test_project(self, slug, title):
-        now = timezone.now()
-        submission_due_date = now + timezone.timedelta(days=7)
-        peer_review_due_date = now + timezone.timedelta(days=14)
-        return Project(
-            course=self.course,
-            slug=slug,
-            title=title,
-            description="Description",
-            submission_due_date=submission_due_date,
-            peer_review_due_date=peer_review_due_date,
-        )
-
-    def create_project_submission(self, project, student, enrollment):
-        choices = random.choices("0123456789abcdef", k=7)
-        commit_id = "".join(choices)
-        github_link = f"https://github.com/test{student.username[-1]}"
-
-        return ProjectSubmission(
-            project=project,
-            student=student,
-            enrollment=enrollment,
-            github_link=github_link,
-            commit_id=commit_id,
-            passed=True,
-        )
-
-    def create_unsaved_student(self, username, email):
-        return CustomUser(
-            username=username,
-            email=email,
-        )
-
-    def create_unsaved_enrollment(self, enrollment_id, student):
-        return Enrollment(
-            id=enrollment_id,
-            student=student,
-            course=self.course,
-        )
-
     def graduates_url(self):
         return reverse(
             "api_course_graduates",
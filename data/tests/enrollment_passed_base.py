@@ -1,112 +1,57 @@
-"""Shared fixtures for enrollment pass-threshold helper tests."""
+"""Shared fixtures for graduate pass-threshold tests."""
 
-from dataclasses import dataclass
+from django.core.cache import cache
 
 from .enrollment_base import (
     EnrollmentDataAPIBase,
     PassedEnrollmentScenario,
+    PassedProjectSubmissionData,
 )
 
 
-@dataclass(frozen=True)
-class PassedSubmissionRowsActors:
-    user2: object
-    user3: object
-    enrollment2: object
-    enrollment3: object
-
-
-@dataclass(frozen=True)
-class PassedSubmissionRowsContext:
-    passed_submissions: list
-    user2: object
-    user3: object
-    enrollment2: object
-    enrollment3: object
-    project1: object
-    project2: object
-    project3: object
-
-
-def append_primary_user_submissions(test_case, context):
-    submission = test_case.create_project_submission(
-        context.project1, test_case.user, test_case.enrollment
-    )
-    context.passed_submissions.append(submission)
-    submission = test_case.create_project_submission(
-        context.project2, test_case.user, test_case.enrollment
-    )
-    context.passed_submissions.append(submission)
-
-
-def append_other_student_submissions(test_case, context):
-    submission = test_case.create_project_submission(
-        context.project1, context.user2, context.enrollment2
-    )
-    context.passed_submissions.append(submission)
-    submission = test_case.create_project_submission(
-        context.project1, context.user3, context.enrollment3
-    )
-    context.passed_submissions.append(submission)
-    submission = test_case.create_project_submission(
-        context.project2, context.user3, context.enrollment3
-    )
-    context.passed_submissions.append(submission)
-    submission = test_case.create_project_submission(
-        context.project3, context.user3, context.enrollment3
-    )
-    context.passed_submissions.append(submission)
-
-
 class PassedEnrollmentTestBase(EnrollmentDataAPIBase):
-    """Shared base for passed-enrollment helper tests."""
+    """Shared base for graduate pass-threshold tests."""
 
-    def create_passed_submission_rows(
-        self,
-        actors,
-    ):
-        project1 = self.create_test_project("p1", "P1")
-        project2 = self.create_test_project("p2", "P2")
-        project3 = self.create_test_project("p3", "P3")
+    def tearDown(self):
+        cache.clear()
 
-        passed_submissions = []
-        context = PassedSubmissionRowsContext(
-            passed_submissions=passed_submissions,
-            user2=actors.user2,
-            user3=actors.user3,
-            enrollment2=actors.enrollment2,
-            enrollment3=actors.enrollment3,
-            project1=project1,
-            project2=project2,
-            project3=project3,
-        )
-        append_primary_user_submissions(self, context)
-        append_other_student_submissions(self, context)
-        return passed_submissions
+    def create_passed_submissions(self, student, enrollment, projects):
+        for index, project in enumerate(projects):
+            data = PassedProjectSubmissionData(
+                project=project,
+                student=student,
+                enrollment=enrollment,
+                commit_id=f"{enrollment.id:04d}{index:03d}",
+            )
+            self.create_passed_project_submission(data)
 
     def get_passed_enrollment_scenario(self):
-        user2 = self.create_unsaved_student(
+        """Passed projects: primary user 2, student2 1, student3 3, student4 0."""
+        project1 = self.create_saved_project("p1", "P1")
+        project2 = self.create_saved_project("p2", "P2")
+        project3 = self.create_saved_project("p3", "P3")
+        user2, enrollment2 = self.create_enrolled_user(
             "student2", "student2@example.com"
         )
-        user3 = self.create_unsaved_student(
+        user3, enrollment3 = self.create_enrolled_user(
             "student3", "student3@example.com"
         )
-        user4 = self.create_unsaved_student(
-            "student4", "student4@example.com"
+        self.create_enrolled_user("student4", "student4@example.com")
+
+        self.create_passed_submissions(
+            self.user,
+            self.enrollment,
+            [project1, project2],
         )
-        enrollment2 = self.create_unsaved_enrollment(2, user2)
-        enrollment3 = self.create_unsaved_enrollment(3, user3)
-        enrollment4 = self.create_unsaved_enrollment(4, user4)
-        actors = PassedSubmissionRowsActors(
-            user2=user2,
-            user3=user3,
-            enrollment2=enrollment2,
-            enrollment3=enrollment3,
+        self.create_passed_submissions(user2, enrollment2, [project1])
+        self.create_passed_submissions(
+            user3,
+            enrollment3,
+            [project1, project2, project3],
         )
-        passed_submissions = self.create_passed_submission_rows(actors)
         return PassedEnrollmentScenario(
-            passed_submissions=passed_submissions,
-            enrollment2=enrollment2,
-            enrollment3=enrollment3,
-            enrollment4=enrollment4,
+            email1=self.user.email,
+            email2="student2@example.com",
+            email3="student3@example.com",
+            email4="student4@example.com",
         )
@@ -1,5 +1,9 @@
 from django.test import override_settings
 
+from course_management.datamailer.preferences import (
+    cached_email_preferences,
+    store_email_preferences,
+)
 from data.models import DatamailerContactEvent
 
 from .datamailer_webhook_base import DatamailerWebhookTestBase
@@ -23,7 +27,7 @@ class DatamailerWebhookUnsubscribePreferenceTest(
 
         self.assertEqual(response.status_code, 200)
         response_data = response.json()
-        self.assertFalse(response_data["preference_updated"])
+        self.assertTrue(response_data["preference_updated"])
         user.refresh_from_db()
         event = DatamailerContactEvent.objects.get()
         self.assertEqual(event.preference_key, "email_deadline_reminders")
@@ -46,12 +50,61 @@ class DatamailerWebhookUnsubscribePreferenceTest(
 
         self.assertEqual(response.status_code, 200)
         response_data = response.json()
-        self.assertFalse(response_data["preference_updated"])
+        self.assertTrue(response_data["preference_updated"])
         user.refresh_from_db()
         event = DatamailerContactEvent.objects.get()
         self.assertEqual(event.preference_key, "email_course_updates")
 
 
+class DatamailerWebhookCachedPreferenceTest(DatamailerWebhookTestBase):
+    def unsubscribe_payload(self, event_id):
+        return {
+            "event_id": event_id,
+            "event_type": "subscription.unsubscribed",
+            "email": "student@example.com",
+            "preference_key": "email_deadline_reminders",
+        }
+
+    @override_settings(DATAMAILER_WEBHOOK_TOKEN="secret-token")
+    def test_webhook_unsubscribe_updates_cached_preferences(self):
+        self.create_student_user()
+        store_email_preferences(
+            "student@example.com",
+            {
+                "email_deadline_reminders": True,
+                "email_course_updates": True,
+            },
+        )
+        payload = self.unsubscribe_payload("evt-unsub-cached")
+
+        response = self.post_event(payload)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["preference_updated"])
+        cached = cached_email_preferences("student@example.com")
+        expected = {
+            "email_deadline_reminders": False,
+            "email_course_updates": True,
+        }
+        self.assertEqual(cached, expected)
+
+    @override_settings(DATAMAILER_WEBHOOK_TOKEN="secret-token")
+    def test_duplicate_webhook_does_not_update_cached_preferences(self):
+        self.create_student_user()
+        payload = self.unsubscribe_payload("evt-unsub-duplicate")
+        self.post_event(payload)
+        store_email_preferences(
+            "student@example.com",
+            {"email_deadline_reminders": True},
+        )
+
+        response = self.post_event(payload)
+
+        self.assertFalse(response.json()["preference_updated"])
+        cached = cached_email_preferences("student@example.com")
+        self.assertEqual(cached, {"email_deadline_reminders": True})
+
+
 class DatamailerWebhookUnsubscribeEventTest(DatamailerWebhookTestBase):
     @override_settings(DATAMAILER_WEBHOOK_TOKEN="secret-token")
     def test_webhook_unsubscribe_without_preference_only_records_event(self):
@@ -75,7 +128,7 @@ class DatamailerWebhookUnsubscribeEventTest(DatamailerWebhookTestBase):
 
 class DatamailerWebhookResubscribeTest(DatamailerWebhookTestBase):
     @override_settings(DATAMAILER_WEBHOOK_TOKEN="secret-token")
-    def test_webhook_records_resubscribe_without_preference_change(self):
+    def test_webhook_records_resubscribe_preference_change(self):
         user = self.create_student_user()
         payload = {
             "event_id": "evt-resub-1",
@@ -88,7 +141,7 @@ class DatamailerWebhookResubscribeTest(DatamailerWebhookTestBase):
 
         self.assertEqual(response.status_code, 200)
         response_data = response.json()
-        self.assertFalse(response_data["preference_updated"])
+        self.assertTrue(response_data["preference_updated"])
         user.refresh_from_db()
         event = DatamailerContactEvent.objects.get()
         self.assertEqual(event.preference_key, "email_course_updates")
@@ -2,7 +2,15 @@
 Tests for enrollment-related graduate data API views.
 """
 
-from courses.models import Enrollment
+import json
+
+from django.core.cache import cache
+
+from courses.graduates_cache import (
+    bump_graduates_version,
+    graduates_cache_key,
+)
+from courses.models import Enrollment, ProjectSubmission
 
 from .enrollment_base import (
     EnrollmentDataAPIBase,
@@ -11,6 +19,9 @@ from .enrollment_base import (
 
 
 class EnrollmentGraduateDataAPITestCase(EnrollmentDataAPIBase):
+    def tearDown(self):
+        cache.clear()
+
     def create_other_graduate_candidate(self):
         other_user = self.create_certificate_user(
             username="student2",
@@ -23,6 +34,18 @@ class EnrollmentGraduateDataAPITestCase(EnrollmentDataAPIBase):
         )
         return other_user, other_enrollment
 
+    def streamed_json(self, response):
+        content = b"".join(response.streaming_content)
+        return json.loads(content)
+
+    def graduate_emails(self):
+        response = self.client.get(self.graduates_url())
+        self.assertEqual(response.status_code, 200)
+        emails = []
+        for graduate in self.streamed_json(response)["graduates"]:
+            emails.append(graduate["email"])
+        return emails
+
     def create_primary_graduate_submissions(self, project1, project2):
         first_submission = PassedProjectSubmissionData(
             project=project1,
@@ -61,7 +84,7 @@ class EnrollmentGraduateDataAPITestCase(EnrollmentDataAPIBase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
-        response_json = response.json()
+        response_json = self.streamed_json(response)
         graduates = response_json["graduates"]
         graduates_count = len(graduates)
 
@@ -72,3 +95,76 @@ class EnrollmentGraduateDataAPITestCase(EnrollmentDataAPIBase):
         self.assertEqual(
             first_graduate["name"], self.user.certificate_name
         )
+
+    def test_graduates_are_cached_until_a_submission_changes(self):
+        self.create_graduate_view_scenario()
+        self.assertEqual(self.graduate_emails(), [self.user.email])
+
+        ProjectSubmission.objects.filter(enrollment=self.enrollment).update(
+            passed=False
+        )
+        self.assertEqual(self.graduate_emails(), [self.user.email])
+
+        submission = ProjectSubmission.objects.filter(
+            enrollment=self.enrollment
+        ).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            submission.save()
+        self.assertEqual(self.graduate_emails(), [])
+
+    def test_graduates_version_bumps_when_the_transaction_commits(self):
+        cache_key = graduates_cache_key(self.course.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_graduates_version(self.course.id)
+            self.assertEqual(graduates_cache_key(self.course.id), cache_key)
+
+        self.assertNotEqual(graduates_cache_key(self.course.id), cache_key)
+
+    def test_graduate_names_follow_certificate_name_changes(self):
+        self.create_graduate_view_scenario()
+        self.graduate_emails()
+
+        self.user.certificate_name = "Renamed Student"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save(update_fields=["certificate_name"])
+
+        response = self.client.get(self.graduates_url())
+        graduates = self.streamed_json(response)["graduates"]
+        self.assertEqual(graduates[0]["name"], "Renamed Student")
+
+    def create_graduate_cohort(self, size):
+        for index in range(size):
+            _, enrollment = self.create_enrolled_user(
+                f"graduate{index}",
+                f"graduate{index}@example.com",
+            )
+            for project in self.course.project_set.all():
+                ProjectSubmission.objects.create(
+                    project=project,
+                    student=enrollment.student,
+                    enrollment=enrollment,
+                    github_link="https://httpbin.org/status/200",
+                    commit_id=f"{index}" * 4,
+                    passed=True,
+                )
+
+    def test_graduates_query_count_does_not_grow_with_cohort(self):
+        self.create_graduate_view_scenario()
+        url = self.graduates_url()
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+            graduates = self.streamed_json(response)["graduates"]
+        self.assertEqual(len(graduates), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_graduate_cohort(3)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+            graduates = self.streamed_json(response)["graduates"]
+        self.assertEqual(len(graduates), 4)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+            self.streamed_json(response)
@@ -0,0 +1,217 @@
+"""Tests for queued bulk certificate update jobs."""
+
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from courses.models import CertificateUpdateJob, Course
+
+from .enrollment_base import EnrollmentDataAPIBase
+
+Status = CertificateUpdateJob.Status
+
+
+class EnrollmentCertificateJobAPITestCase(EnrollmentDataAPIBase):
+    def jobs_url(self):
+        return reverse(
+            "api_course_certificate_jobs",
+            kwargs={"course_slug": self.course.slug},
+        )
+
+    def job_url(self, job_id, course_slug=None):
+        return reverse(
+            "api_course_certificate_job",
+            kwargs={
+                "course_slug": course_slug or self.course.slug,
+                "job_id": job_id,
+            },
+        )
+
+    def upload_jsonl(self, lines):
+        content = "\n".join(lines).encode()
+        upload = SimpleUploadedFile(
+            "certificates.jsonl",
+            content,
+            content_type="application/jsonl",
+        )
+        return self.client.post(self.jobs_url(), {"file": upload})
+
+    def certificate_line(self, email, certificate_path):
+        return json.dumps(
+            {"email": email, "certificate_path": certificate_path}
+        )
+
+    def run_jobs(self):
+        stdout = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("process_certificate_update_jobs", stdout=stdout)
+        return stdout.getvalue()
+
+    @patch(
+        "api.views.enrollment_certificate_job_runs."
+        "queue_certificate_availability_notifications"
+    )
+    def test_json_job_is_queued_then_processed(self, send_notifications):
+        data = self.certificate_payload(
+            [
+                {
+                    "email": self.user.email,
+                    "certificate_path": "/certificates/first.pdf",
+                },
+                {
+                    "email": "missing@example.com",
+                    "certificate_path": "/certificates/missing.pdf",
+                },
+            ]
+        )
+
+        response = self.client.post(
+            self.jobs_url(),
+            json.dumps(data),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        job_data = response.json()
+        self.assertEqual(job_data["status"], Status.PENDING)
+        self.assertEqual(job_data["total_count"], 2)
+        self.assert_certificate_url(self.enrollment, None)
+
+        output = self.run_jobs()
+
+        self.assertIn("1 succeeded", output)
+        response = self.client.get(self.job_url(job_data["id"]))
+        self.assertEqual(response.status_code, 200)
+        job_data = response.json()
+        self.assertEqual(job_data["status"], Status.SUCCEEDED)
+        self.assertEqual(job_data["processed_count"], 2)
+        self.assertEqual(job_data["updated_count"], 1)
+        self.assertEqual(job_data["error_count"], 1)
+        self.assertEqual(job_data["errors"][0]["code"], "user_not_found")
+        self.assertIsNotNone(job_data["finished_at"])
+        self.assert_certificate_url(
+            self.enrollment,
+            "/certificates/first.pdf",
+        )
+        send_notifications.assert_called_once()
+        course, enrollments = send_notifications.call_args.args
+        self.assertEqual(course, self.course)
+        self.assertEqual([self.enrollment.id], [e.id for e in enrollments])
+
+    @patch(
+        "api.views.enrollment_certificate_job_runs."
+        "queue_certificate_availability_notifications"
+    )
+    @patch(
+        "api.views.enrollment_certificate_job_runs."
+        "CERTIFICATE_UPDATE_CHUNK_SIZE",
+        2,
+    )
+    def test_jsonl_upload_is_processed_in_chunks(self, send_notifications):
+        lines = [
+            self.certificate_line(
+                self.user.email,
+                "/certificates/first.pdf",
+            )
+        ]
+        for index in range(4):
+            email = f"student{index}@example.com"
+            self.create_enrolled_user(f"student{index}", email)
+            lines.append(
+                self.certificate_line(email, f"/certificates/{index}.pdf")
+            )
+        lines.append("")
+
+        response = self.upload_jsonl(lines)
+
+        self.assertEqual(response.status_code, 202)
+        self.run_jobs()
+        job = CertificateUpdateJob.objects.get(id=response.json()["id"])
+        self.assertEqual(job.status, Status.SUCCEEDED)
+        self.assertEqual(job.processed_count, 5)
+        self.assertEqual(job.updated_count, 5)
+        self.assertEqual(send_notifications.call_count, 3)
+
+    def test_jsonl_upload_rejects_invalid_line(self):
+        lines = [
+            self.certificate_line(
+                self.user.email,
+                "/certificates/first.pdf",
+            ),
+            "{not json",
+        ]
+
+        response = self.upload_jsonl(lines)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["error"],
+            "Line 2 is not valid JSON",
+        )
+        self.assertFalse(CertificateUpdateJob.objects.exists())
+
+    @patch(
+        "api.views.enrollment_certificate_job_runs."
+        "queue_certificate_availability_notifications"
+    )
+    def test_stale_running_job_resumes_where_it_stopped(
+        self,
+        send_notifications,
+    ):
+        second_user, second_enrollment = self.create_enrolled_user(
+            "seconduser",
+            "second@example.com",
+        )
+        job = CertificateUpdateJob.objects.create(
+            course=self.course,
+            status=Status.RUNNING,
+            certificates=[
+                {
+                    "email": self.user.email,
+                    "certificate_path": "/certificates/first.pdf",
+                },
+                {
+                    "email": second_user.email,
+                    "certificate_path": "/certificates/second.pdf",
+                },
+            ],
+            total_count=2,
+            processed_count=1,
+            updated_count=1,
+        )
+        stale_at = timezone.now() - timedelta(hours=1)
+        CertificateUpdateJob.objects.filter(id=job.id).update(
+            updated_at=stale_at
+        )
+
+        self.run_jobs()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Status.SUCCEEDED)
+        self.assertEqual(job.processed_count, 2)
+        self.assertEqual(job.updated_count, 2)
+        self.assert_certificate_url(self.enrollment, None)
+        self.assert_certificate_url(
+            second_enrollment,
+            "/certificates/second.pdf",
+        )
+
+    def test_job_from_another_course_is_not_found(self):
+        other_course = Course.objects.create(
+            title="Other Course",
+            slug="other-course",
+        )
+        job = CertificateUpdateJob.objects.create(
+            course=other_course,
+            certificates=[],
+        )
+
+        response = self.client.get(self.job_url(job.id))
+
+        self.assertEqual(response.status_code, 404)
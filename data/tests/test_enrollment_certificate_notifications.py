@@ -29,7 +29,10 @@ class EnrollmentCertificateNotificationAPITestCase(EnrollmentDataAPIBase):
 
     def assert_certificate_notification_sent(self, send_notification):
         send_notification.assert_called_once()
-        notified_enrollment = send_notification.call_args.args[0]
+        course, notified_enrollments = send_notification.call_args.args
+        self.assertEqual(course, self.course)
+        self.assertEqual(len(notified_enrollments), 1)
+        notified_enrollment = notified_enrollments[0]
         self.assertEqual(notified_enrollment.id, self.enrollment.id)
         self.assertEqual(
             notified_enrollment.certificate_url,
@@ -38,7 +41,7 @@ class EnrollmentCertificateNotificationAPITestCase(EnrollmentDataAPIBase):
 
     @patch(
         "api.views.enrollment_certificates."
-        "send_certificate_availability_notification"
+        "queue_certificate_availability_notifications"
     )
     def test_bulk_update_enrollment_certificates_sends_new_certificate_notifications(
         self,
@@ -1,96 +1,106 @@
-"""Tests for enrollment pass-threshold helper logic."""
+"""Tests for the graduates pass threshold."""
 
-from api.views.enrollment_graduates import get_passed_enrollments
+import json
+
+from api.views.enrollment_graduates import graduate_rows
 
 from .enrollment_base import PassedEnrollmentExpectation
 from .enrollment_passed_base import PassedEnrollmentTestBase
 
 
-def assert_enrollments_for_min_projects(
+def graduate_emails(course):
+    emails = []
+    for email, _certificate_name, _display_name in graduate_rows(course):
+        emails.append(email)
+    return emails
+
+
+def assert_graduates_for_min_projects(
     test_case,
     data: PassedEnrollmentExpectation,
 ):
-    result = get_passed_enrollments(
-        data.passed_submissions,
-        data.min_projects,
-    )
-    actual_count = len(result)
-    expected_count = len(data.expected_enrollments)
-    test_case.assertEqual(actual_count, expected_count)
-    for enrollment in data.expected_enrollments:
-        test_case.assertIn(enrollment, result)
-    for enrollment in data.missing_enrollments:
-        test_case.assertNotIn(enrollment, result)
+    test_case.course.min_projects_to_pass = data.min_projects
+    test_case.course.save()
+    result = graduate_emails(test_case.course)
+    test_case.assertEqual(len(result), len(data.expected_emails))
+    for email in data.expected_emails:
+        test_case.assertIn(email, result)
+    for email in data.missing_emails:
+        test_case.assertNotIn(email, result)
     return result
 
 
 class PassedEnrollmentThresholdTestCase(PassedEnrollmentTestBase):
-    def test_get_passed_enrollments_for_two_project_minimum(self):
+    def test_graduates_for_two_project_minimum(self):
         scenario = self.get_passed_enrollment_scenario()
-        expected_enrollments = []
-        expected_enrollments.append(self.enrollment)
-        expected_enrollments.append(scenario.enrollment3)
-        missing_enrollments = []
-        missing_enrollments.append(scenario.enrollment2)
-        missing_enrollments.append(scenario.enrollment4)
         expectation = PassedEnrollmentExpectation(
-            passed_submissions=scenario.passed_submissions,
             min_projects=2,
-            expected_enrollments=expected_enrollments,
-            missing_enrollments=missing_enrollments,
+            expected_emails=[scenario.email1, scenario.email3],
+            missing_emails=[scenario.email2, scenario.email4],
         )
 
-        assert_enrollments_for_min_projects(self, expectation)
+        assert_graduates_for_min_projects(self, expectation)
 
-    def test_get_passed_enrollments_for_one_project_minimum(self):
+    def test_graduates_for_one_project_minimum(self):
         scenario = self.get_passed_enrollment_scenario()
-        expected_enrollments = []
-        expected_enrollments.append(self.enrollment)
-        expected_enrollments.append(scenario.enrollment2)
-        expected_enrollments.append(scenario.enrollment3)
-        missing_enrollments = []
-        missing_enrollments.append(scenario.enrollment4)
         expectation = PassedEnrollmentExpectation(
-            passed_submissions=scenario.passed_submissions,
             min_projects=1,
-            expected_enrollments=expected_enrollments,
-            missing_enrollments=missing_enrollments,
+            expected_emails=[
+                scenario.email1,
+                scenario.email2,
+                scenario.email3,
+            ],
+            missing_emails=[scenario.email4],
         )
 
-        assert_enrollments_for_min_projects(self, expectation)
+        assert_graduates_for_min_projects(self, expectation)
+
+    def test_graduates_endpoint_applies_project_minimum(self):
+        scenario = self.get_passed_enrollment_scenario()
+        self.require_two_projects_to_pass()
+
+        response = self.client.get(self.graduates_url())
+
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(b"".join(response.streaming_content))
+        emails = []
+        for graduate in body["graduates"]:
+            emails.append(graduate["email"])
+        self.assertEqual(emails, [scenario.email1, scenario.email3])
 
 
 class PassedEnrollmentBoundaryTestCase(PassedEnrollmentTestBase):
-    def test_get_passed_enrollments_for_three_project_minimum(self):
+    def test_graduates_for_three_project_minimum(self):
         scenario = self.get_passed_enrollment_scenario()
-        expected_enrollments = []
-        expected_enrollments.append(scenario.enrollment3)
         expectation = PassedEnrollmentExpectation(
-            passed_submissions=scenario.passed_submissions,
             min_projects=3,
-            expected_enrollments=expected_enrollments,
+            expected_emails=[scenario.email3],
         )
 
-        result = assert_enrollments_for_min_projects(self, expectation)
+        result = assert_graduates_for_min_projects(self, expectation)
 
-        self.assertEqual(result[0], scenario.enrollment3)
+        self.assertEqual(result[0], scenario.email3)
 
-    def test_get_passed_enrollments_for_too_many_projects(self):
-        scenario = self.get_passed_enrollment_scenario()
+    def test_graduates_for_too_many_projects(self):
+        self.get_passed_enrollment_scenario()
+        expectation = PassedEnrollmentExpectation(
+            min_projects=4,
+            expected_emails=[],
+        )
 
-        result = get_passed_enrollments(scenario.passed_submissions, 4)
+        assert_graduates_for_min_projects(self, expectation)
 
-        result_count = len(result)
-        self.assertEqual(result_count, 0)
+    def test_graduates_without_submissions(self):
+        self.course.min_projects_to_pass = 1
+        self.course.save()
 
-    def test_get_passed_enrollments_without_submissions(self):
-        result = get_passed_enrollments([], 1)
+        result = graduate_emails(self.course)
 
-        result_count = len(result)
-        self.assertEqual(result_count, 0)
+        self.assertEqual(len(result), 0)
 
-    def test_get_passed_enrollments_rejects_zero_minimum(self):
-        scenario = self.get_passed_enrollment_scenario()
+    def test_graduates_reject_zero_minimum(self):
+        self.get_passed_enrollment_scenario()
+        self.course.min_projects_to_pass = 0
 
         with self.assertRaises(AssertionError):
-            get_passed_enrollments(scenario.passed_submissions, 0)
+            graduate_rows(self.course)
@@ -1,11 +1,14 @@
 """
 Tests for homework-related data API views.
 
-Tests for homework_data_view.
+Tests for homework_data_view, including the streamed NDJSON export.
 The old HomeworkContentAPITestCase has been
 replaced by tests in api/tests/ for the new /api/ endpoints.
 """
 
+import json
+from unittest import mock
+
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -86,6 +89,32 @@ class HomeworkDataAPITestCase(TestCase):
             },
         )
 
+    def streamed_json(self, response):
+        content = b"".join(response.streaming_content)
+        return json.loads(content)
+
+    def streamed_ndjson(self, response):
+        content = b"".join(response.streaming_content).decode()
+        records = []
+        for line in content.splitlines():
+            records.append(json.loads(line))
+        return records
+
+    def create_student_submission(self, homework, index):
+        student = CustomUser.objects.create(
+            username=f"student{index}",
+            email=f"student{index}@example.com",
+        )
+        enrollment = Enrollment.objects.create(
+            student=student,
+            course=self.course,
+        )
+        return Submission.objects.create(
+            homework=homework,
+            student=student,
+            enrollment=enrollment,
+        )
+
     def expected_course_data(self):
         return {
             "id": self.course.id,
@@ -187,7 +216,8 @@ class HomeworkDataAPITestCase(TestCase):
         response = self.client.get(export_url)
 
         self.assertEqual(response.status_code, 200)
-        actual_result = response.json()
+        self.assertEqual(response["Content-Type"], "application/json")
+        actual_result = self.streamed_json(response)
         self.assert_course_data(actual_result)
         self.assert_homework_data(actual_result, homework)
         actual_submission = self.assert_submission_data(
@@ -195,3 +225,62 @@ class HomeworkDataAPITestCase(TestCase):
             submission,
         )
         self.assert_answer_data(actual_submission, question, answer)
+
+    def test_homework_data_view_streams_ndjson(self):
+        homework = self.create_homework()
+        submission = self.create_submission(homework)
+        question = self.create_question(homework)
+        answer = Answer.objects.create(
+            submission=submission,
+            question=question,
+            answer_text="1",
+            is_correct=True,
+        )
+
+        export_url = self.homework_export_url(homework)
+        response = self.client.get(export_url, {"format": "ndjson"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        header, actual_submission = self.streamed_ndjson(response)
+        self.assert_course_data(header)
+        self.assert_homework_data(header, homework)
+        expected_submission = self.expected_submission_data(submission)
+        self.assert_fields(actual_submission, expected_submission)
+        self.assert_answer_data(actual_submission, question, answer)
+
+    def test_homework_data_view_reads_answers_per_chunk(self):
+        homework = self.create_homework()
+        question = self.create_question(homework)
+        submissions = []
+        for index in range(5):
+            submission = self.create_student_submission(homework, index)
+            Answer.objects.create(
+                submission=submission,
+                question=question,
+                answer_text=str(index),
+            )
+            submissions.append(submission)
+
+        export_url = self.homework_export_url(homework)
+        with mock.patch(
+            "api.views.homework_exports.EXPORT_CHUNK_SIZE",
+            2,
+        ):
+            response = self.client.get(export_url)
+            # Three chunks, each one submissions query and one answers query.
+            with self.assertNumQueries(6):
+                actual_result = self.streamed_json(response)
+
+        actual_submissions = actual_result["submissions"]
+        self.assertEqual(len(actual_submissions), 5)
+        for index, submission in enumerate(submissions):
+            actual_submission = actual_submissions[index]
+            self.assertEqual(
+                actual_submission["student_id"],
+                submission.student_id,
+            )
+            self.assertEqual(
+                actual_submission["answers"][0]["answer_text"],
+                str(index),
+            )
@@ -2,6 +2,9 @@ from io import StringIO
 from unittest.mock import patch
 
 from django.core.management import call_command
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.http import HttpResponse
 from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 
 from course_management.observability import record_event
@@ -10,8 +13,18 @@ from course_management.observability.cloudwatch import (
     CloudWatchMetricsEventBackend,
     cloudwatch_metric_payload,
 )
-from course_management.observability.events import AppEvent
-from course_management.middleware import ObservabilityExceptionMiddleware
+from course_management.observability.buffer import (
+    BufferedEventBackend,
+    EventBufferConfig,
+)
+from course_management.observability.events import (
+    AppEvent,
+    configured_event_backends,
+)
+from course_management.middleware import (
+    ObservabilityExceptionMiddleware,
+    RequestMetricsMiddleware,
+)
 
 
 class ObservabilityEventTests(SimpleTestCase):
@@ -110,6 +123,76 @@ class ObservabilityEventTests(SimpleTestCase):
         )
 
 
+    @override_settings(OBSERVABILITY_ENVIRONMENT="test")
+    def test_cloudwatch_metric_payload_publishes_request_metrics(self):
+        event = AppEvent(
+            name="http.request",
+            distinct_id="anonymous",
+            properties={
+                "route": "course_list",
+                "duration_ms": 12.5,
+                "query_count": 3,
+                "query_time_ms": 1.5,
+            },
+        )
+
+        payload = cloudwatch_metric_payload(
+            event,
+            config=CloudWatchMetricsConfig(namespace="CMP/Test"),
+        )
+
+        metrics = payload["_aws"]["CloudWatchMetrics"]
+        self.assertEqual(len(metrics), 2)
+        request_metric = metrics[1]
+        self.assertEqual(request_metric["Dimensions"], [["environment", "route"]])
+        self.assertEqual(
+            request_metric["Metrics"],
+            [
+                {"Name": "RequestDuration", "Unit": "Milliseconds"},
+                {"Name": "RequestQueryCount", "Unit": "Count"},
+                {"Name": "RequestQueryTime", "Unit": "Milliseconds"},
+            ],
+        )
+        self.assertEqual(payload["RequestDuration"], 12.5)
+        self.assertEqual(payload["RequestQueryCount"], 3)
+        self.assertEqual(payload["route"], "course_list")
+
+
+    @override_settings(OBSERVABILITY_ENVIRONMENT="test")
+    def test_cloudwatch_metric_payload_publishes_scoring_duration(self):
+        event = AppEvent(
+            name="project.peer_reviews_assigned",
+            distinct_id="anonymous",
+            properties={
+                "course_slug": "mlops",
+                "duration_ms": 950,
+                "submissions_count": 40,
+                "assigned_count": 120,
+            },
+        )
+
+        payload = cloudwatch_metric_payload(
+            event,
+            config=CloudWatchMetricsConfig(namespace="CMP/Test"),
+        )
+
+        directive = payload["_aws"]["CloudWatchMetrics"][1]
+        self.assertEqual(
+            directive["Dimensions"],
+            [
+                ["environment", "event"],
+                ["environment", "event", "course_slug"],
+            ],
+        )
+        self.assertIn(
+            {"Name": "EventDuration", "Unit": "Milliseconds"},
+            directive["Metrics"],
+        )
+        self.assertEqual(payload["EventDuration"], 950)
+        self.assertEqual(payload["PeerReviewsAssigned"], 120)
+        self.assertEqual(payload["EventSubmissions"], 40)
+
+
 class DatamailerMonitoringCommandTests(TestCase):
     @override_settings(
         OBSERVABILITY_EVENT_BACKENDS=["noop"],
@@ -178,3 +261,152 @@ class ObservabilityExceptionMiddlewareTests(SimpleTestCase):
             logger_mock.exception.call_args.kwargs["extra"],
             {"app_name": "unsafe"},
         )
+
+
+def query_view(request):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.execute("SELECT 2")
+    return HttpResponse("hello")
+
+
+class RequestMetricsMiddlewareTests(TestCase):
+    def metrics_request(self):
+        request = RequestFactory().get("/courses/")
+        request.user = AnonymousUser()
+        return request
+
+    @patch("course_management.middleware.record_event")
+    def test_request_metrics_record_route_queries_and_size(
+        self,
+        record_event_mock,
+    ):
+        middleware = RequestMetricsMiddleware(query_view)
+
+        response = middleware(self.metrics_request())
+
+        self.assertEqual(response.status_code, 200)
+        record_event_mock.assert_called_once()
+        args, kwargs = record_event_mock.call_args
+        self.assertEqual(args[0], "http.request")
+        properties = kwargs["properties"]
+        self.assertEqual(properties["route"], "unresolved")
+        self.assertEqual(properties["status_code"], 200)
+        self.assertEqual(properties["query_count"], 2)
+        self.assertEqual(properties["response_bytes"], len(b"hello"))
+        self.assertIn("duration_ms", properties)
+
+    @override_settings(OBSERVABILITY_REQUEST_SAMPLE_RATE=0)
+    @patch("course_management.middleware.record_event")
+    def test_request_metrics_skip_unsampled_requests(self, record_event_mock):
+        middleware = RequestMetricsMiddleware(query_view)
+
+        middleware(self.metrics_request())
+
+        record_event_mock.assert_not_called()
+
+    @override_settings(
+        OBSERVABILITY_SLOW_REQUEST_MS=0,
+        OBSERVABILITY_SLOW_REQUEST_QUERY_LIMIT=1,
+    )
+    @patch("course_management.middleware.record_event")
+    def test_slow_requests_log_slowest_queries(self, record_event_mock):
+        middleware = RequestMetricsMiddleware(query_view)
+
+        with self.assertLogs(
+            "course_management.middleware",
+            level="WARNING",
+        ) as logs:
+            middleware(self.metrics_request())
+
+        record = logs.records[0]
+        self.assertIn("slow_request", record.getMessage())
+        self.assertEqual(len(record.slowest_queries), 1)
+        self.assertIn("SELECT", record.slowest_queries[0]["sql"])
+
+
+class RecordingEventBackend:
+    def __init__(self):
+        self.events = []
+
+    def record(self, event):
+        self.events.append(event)
+
+
+class BufferedEventBackendTests(SimpleTestCase):
+    def buffered_backend(self, **overrides):
+        recording = RecordingEventBackend()
+        config_values = {
+            "capacity": 10,
+            "flush_interval": 60,
+            "aggregated_events": frozenset({"datamailer.outbox_enqueued"}),
+        } | overrides
+        backend = BufferedEventBackend(
+            [recording],
+            EventBufferConfig(**config_values),
+        )
+        return backend, recording
+
+    def test_buffered_backend_defers_events_until_flush(self):
+        backend, recording = self.buffered_backend()
+
+        backend.record(AppEvent(name="homework.scored", distinct_id="user:1"))
+
+        self.assertEqual(recording.events, [])
+        backend.flush()
+        self.assertEqual(
+            [event.name for event in recording.events],
+            ["homework.scored"],
+        )
+
+    def test_buffered_backend_aggregates_counter_events(self):
+        backend, recording = self.buffered_backend()
+        for event_id in ("evt-1", "evt-2", "evt-3"):
+            backend.record(
+                AppEvent(
+                    name="datamailer.outbox_enqueued",
+                    distinct_id="anonymous",
+                    properties={
+                        "event_id": event_id,
+                        "event_type": "contact.upsert",
+                    },
+                )
+            )
+
+        backend.flush()
+
+        self.assertEqual(len(recording.events), 1)
+        event = recording.events[0]
+        self.assertEqual(event.count, 3)
+        self.assertEqual(event.properties, {"event_type": "contact.upsert"})
+        payload = cloudwatch_metric_payload(
+            event,
+            config=CloudWatchMetricsConfig(namespace="CMP/Test"),
+        )
+        self.assertEqual(payload["AppEventCount"], 3)
+        self.assertEqual(payload["event_count"], 3)
+
+    def test_buffered_backend_drops_oldest_events_when_full(self):
+        backend, recording = self.buffered_backend(capacity=2)
+        for index in range(3):
+            backend.record(AppEvent(name=f"event.{index}", distinct_id="a"))
+
+        backend.flush()
+
+        names = [event.name for event in recording.events]
+        self.assertEqual(
+            names,
+            ["event.1", "event.2", "observability.events_dropped"],
+        )
+        self.assertEqual(recording.events[-1].count, 1)
+
+    @override_settings(
+        OBSERVABILITY_EVENT_BACKENDS=["log"],
+        OBSERVABILITY_EVENT_BUFFER=True,
+    )
+    def test_configured_backends_are_cached_and_buffered(self):
+        backends = configured_event_backends()
+
+        self.assertIs(backends, configured_event_backends())
+        self.assertEqual(len(backends), 1)
+        self.assertIsInstance(backends[0], BufferedEventBackend)
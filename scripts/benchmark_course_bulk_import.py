@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# ruff: noqa: E402
+"""Benchmark importing a course's homeworks and questions.
+
+Compares the per-item create path (one homework create, then one question
+create per question) with the single-transaction ``POST .../bulk/`` path.
+Run from the repository root against the database configured by
+``DATABASE_URL`` (SQLite by default; point it at PostgreSQL to compare):
+
+    uv run python scripts/benchmark_course_bulk_import.py
+    uv run python scripts/benchmark_course_bulk_import.py --homeworks 20 --questions 25
+    DATABASE_URL=postgres://... uv run python scripts/benchmark_course_bulk_import.py
+
+The script creates its own courses and deletes them when it is done.
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+root_path = str(ROOT)
+sys.path.insert(0, root_path)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "course_management.settings")
+
+import django
+
+django.setup()
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.views.course_bulk import course_bulk_response
+from api.views.homework_create import create_homework
+from api.views.question_mutations import questions_create_response
+from courses.models import Course, Homework
+
+COURSE_SLUG_PREFIX = "benchmark-bulk-import"
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    questions: int
+    queries: int
+    seconds: float
+
+    @property
+    def per_second(self):
+        if not self.seconds:
+            return 0.0
+        return self.questions / self.seconds
+
+
+def homework_items(homework_count, question_count):
+    items = []
+    for homework_index in range(homework_count):
+        questions = []
+        for question_index in range(question_count):
+            questions.append(
+                {
+                    "text": f"Question {question_index}",
+                    "question_type": "MC",
+                    "answer_type": "ANY",
+                    "possible_answers": ["A", "B", "C", "D"],
+                    "correct_answer": "1",
+                }
+            )
+        items.append(
+            {
+                "name": f"Homework {homework_index}",
+                "slug": f"hw-{homework_index}",
+                "due_date": "2030-01-01T00:00:00Z",
+                "questions": questions,
+            }
+        )
+    return items
+
+
+def per_item_import(course, items):
+    for item in items:
+        homework_data = dict(item, questions=[])
+        create_homework(course, homework_data)
+        homework = Homework.objects.get(course=course, slug=item["slug"])
+        for question_data in item["questions"]:
+            questions_create_response(homework, question_data)
+
+
+def bulk_import(course, items):
+    response = course_bulk_response(course, {"homeworks": items})
+    if response.status_code != 200:
+        raise RuntimeError(response.content.decode())
+
+
+def run_benchmark(name, import_course, items):
+    course = Course.objects.create(
+        slug=f"{COURSE_SLUG_PREFIX}-{name.replace(' ', '-')}",
+        title=f"Benchmark {name}",
+    )
+    question_count = 0
+    for item in items:
+        question_count += len(item["questions"])
+
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        import_course(course, items)
+    seconds = time.perf_counter() - started
+    return BenchmarkResult(
+        name=name,
+        questions=question_count,
+        queries=len(queries),
+        seconds=seconds,
+    )
+
+
+def delete_fixture():
+    Course.objects.filter(slug__startswith=COURSE_SLUG_PREFIX).delete()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--homeworks", type=int, default=10)
+    parser.add_argument("--questions", type=int, default=50)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    vendor = connection.vendor
+    items = homework_items(options.homeworks, options.questions)
+    delete_fixture()
+    try:
+        results = [
+            run_benchmark("per item", per_item_import, items),
+            run_benchmark("bulk", bulk_import, items),
+        ]
+    finally:
+        delete_fixture()
+
+    print(
+        f"{vendor}: {options.homeworks} homeworks x "
+        f"{options.questions} questions"
+    )
+    for result in results:
+        print(
+            f"{result.name:<10} {result.per_second:10.1f} questions/s "
+            f"({result.seconds:.2f}s, {result.queries} queries)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# ruff: noqa: E402
+"""Benchmark homework answer persistence under concurrent submissions.
+
+Compares the per-question ``update_or_create`` loop with the bulk
+``save_submission_answers`` path. Run from the repository root against the
+database configured by ``DATABASE_URL`` (SQLite by default; point it at
+PostgreSQL to compare):
+
+    uv run python scripts/benchmark_homework_answer_saves.py
+    uv run python scripts/benchmark_homework_answer_saves.py --submissions 2000 --questions 10 --workers 8
+    DATABASE_URL=postgres://... uv run python scripts/benchmark_homework_answer_saves.py
+
+The script creates its own course, users and submissions and deletes them
+when it is done.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+root_path = str(ROOT)
+sys.path.insert(0, root_path)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "course_management.settings")
+
+import django
+
+django.setup()
+
+from django.db import OperationalError, connection, transaction
+from django.utils import timezone
+
+from courses.homework_answers import save_submission_answers
+from courses.models import (
+    Answer,
+    AnswerTypes,
+    Course,
+    Enrollment,
+    Homework,
+    Question,
+    QuestionTypes,
+    Submission,
+    User,
+)
+
+COURSE_SLUG = "benchmark-answer-saves"
+USER_PREFIX = "benchmark-answer-saves-user"
+# SQLite serializes writers, so concurrent saves there hit "database is
+# locked"; each save is retried this many times before it counts as failed.
+SAVE_ATTEMPTS = 5
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    saved: int
+    failed: int
+    seconds: float
+
+    @property
+    def per_second(self):
+        if not self.seconds:
+            return 0.0
+        return self.saved / self.seconds
+
+
+def update_or_create_answers(submission, answers_by_question):
+    for question, answer_text in answers_by_question:
+        Answer.objects.update_or_create(
+            submission=submission,
+            question=question,
+            defaults={"answer_text": answer_text},
+        )
+
+
+def create_fixture(submission_count, question_count):
+    course = Course.objects.create(slug=COURSE_SLUG, title="Benchmark")
+    homework = Homework.objects.create(
+        course=course,
+        slug="hw",
+        title="Benchmark homework",
+        due_date=timezone.now() + timedelta(days=1),
+    )
+    questions = []
+    for index in range(question_count):
+        question = Question(
+            homework=homework,
+            text=f"Question {index}",
+            question_type=QuestionTypes.FREE_FORM.value,
+            answer_type=AnswerTypes.ANY.value,
+        )
+        questions.append(question)
+    Question.objects.bulk_create(questions)
+    questions = list(Question.objects.filter(homework=homework))
+
+    users = []
+    for index in range(submission_count):
+        username = f"{USER_PREFIX}-{index}"
+        user = User(username=username, email=f"{username}@example.com")
+        users.append(user)
+    User.objects.bulk_create(users)
+    users = list(User.objects.filter(username__startswith=USER_PREFIX))
+    enrollments = [Enrollment(student=user, course=course) for user in users]
+    Enrollment.objects.bulk_create(enrollments)
+    enrollments = list(Enrollment.objects.filter(course=course))
+    submissions = [
+        Submission(
+            homework=homework,
+            student_id=enrollment.student_id,
+            enrollment=enrollment,
+        )
+        for enrollment in enrollments
+    ]
+    Submission.objects.bulk_create(submissions)
+    submissions = list(Submission.objects.filter(homework=homework))
+    return questions, submissions
+
+
+def delete_fixture():
+    Course.objects.filter(slug=COURSE_SLUG).delete()
+    User.objects.filter(username__startswith=USER_PREFIX).delete()
+
+
+def save_one(save_answers, submission, questions, revision):
+    answers_by_question = []
+    for question in questions:
+        answer_text = f"{revision}-{question.id}"
+        answers_by_question.append((question, answer_text))
+    try:
+        for attempt in range(SAVE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    save_answers(submission, answers_by_question)
+                return True
+            except OperationalError:
+                time.sleep(0.01 * (attempt + 1))
+        return False
+    finally:
+        connection.close()
+
+
+def run_benchmark(name, save_answers, submissions, questions, options):
+    """Save every submission once with ``options.workers`` threads."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=options.workers) as executor:
+        results = list(
+            executor.map(
+                lambda submission: save_one(
+                    save_answers, submission, questions, name
+                ),
+                submissions,
+            )
+        )
+    seconds = time.perf_counter() - started
+    saved = sum(1 for result in results if result)
+    return BenchmarkResult(
+        name=name,
+        saved=saved,
+        failed=len(results) - saved,
+        seconds=seconds,
+    )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=500)
+    parser.add_argument("--questions", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    vendor = connection.vendor
+    delete_fixture()
+    questions, submissions = create_fixture(
+        options.submissions,
+        options.questions,
+    )
+    benchmarks = [
+        # First pass inserts, second pass updates every answer.
+        ("update_or_create insert", update_or_create_answers),
+        ("update_or_create update", update_or_create_answers),
+    ]
+    try:
+        results = []
+        for name, save_answers in benchmarks:
+            result = run_benchmark(
+                name, save_answers, submissions, questions, options
+            )
+            results.append(result)
+        Answer.objects.filter(submission__in=submissions).delete()
+        for name in ("bulk insert", "bulk update"):
+            result = run_benchmark(
+                name, save_submission_answers, submissions, questions, options
+            )
+            results.append(result)
+    finally:
+        delete_fixture()
+
+    print(
+        f"{vendor}: {options.submissions} submissions x "
+        f"{options.questions} questions, {options.workers} workers"
+    )
+    for result in results:
+        print(
+            f"{result.name:<24} {result.per_second:8.1f} submissions/s "
+            f"({result.seconds:.2f}s, {result.failed} failed)"
+        )
+
+
+if __name__ == "__main__":
+    main()